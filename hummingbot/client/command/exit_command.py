@@ -2,6 +2,7 @@
 
 import asyncio
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.http_session_registry import HTTPSessionRegistry
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
@@ -30,5 +31,6 @@ class ExitCommand:
         self._notify("Winding down notifiers...")
         for notifier in self.notifiers:
             notifier.stop()
+        await HTTPSessionRegistry.get_instance().close()
 
         self.app.exit()
@@ -181,6 +181,13 @@ cdef class ConnectorBase(NetworkIterator):
         """
         raise NotImplementedError
 
+    def is_trading_pair_ready(self, trading_pair: str) -> bool:
+        """
+        Indicates whether the trading pair can be traded. Connectors that initialize their order books one trading
+        pair at a time can tell before the whole connector is ready.
+        """
+        return self.ready
+
     @property
     def in_flight_orders(self) -> Dict[str, InFlightOrderBase]:
         raise NotImplementedError
@@ -26,6 +26,10 @@ from hummingbot.connector.derivative.binance_perpetual.constants import (
     DIFF_STREAM_URL,
     TESTNET_STREAM_URL
 )
+from hummingbot.core.utils.http_session_registry import (
+    HTTPSessionRegistry,
+    shared_client,
+)
 
 # API OrderBook Endpoints
 SNAPSHOT_REST_URL = "{}/fapi/v1/depth"
@@ -60,7 +64,7 @@ class BinancePerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     @classmethod
     async def get_last_traded_price(cls, trading_pair: str, domain=None) -> float:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client() as client:
             url = TESTNET_BASE_URL if domain == "binance_perpetual_testnet" else PERPETUAL_BASE_URL
             resp = await client.get(f"{TICKER_PRICE_CHANGE_URL.format(url)}?symbol={convert_to_exchange_trading_pair(trading_pair)}")
             resp_json = await resp.json()
@@ -99,7 +103,7 @@ class BinancePerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
         try:
             from hummingbot.connector.derivative.binance_perpetual.binance_perpetual_utils import convert_from_exchange_trading_pair
             BASE_URL = TESTNET_BASE_URL if domain == "binance_perpetual_testnet" else PERPETUAL_BASE_URL
-            async with aiohttp.ClientSession() as client:
+            async with shared_client() as client:
                 async with client.get(EXCHANGE_INFO_URL.format(BASE_URL), timeout=10) as response:
                     if response.status == 200:
                         data = await response.json()
@@ -120,7 +124,7 @@ class BinancePerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
         return []
 
     @staticmethod
-    async def get_snapshot(client: aiohttp.ClientSession, trading_pair: str, limit: int = 1000, domain=None) -> Dict[str, Any]:
+    async def get_snapshot(client: HTTPSessionRegistry, trading_pair: str, limit: int = 1000, domain=None) -> Dict[str, Any]:
         params: Dict = {"limit": str(limit), "symbol": convert_to_exchange_trading_pair(trading_pair)} if limit != 0 \
             else {"symbol": convert_to_exchange_trading_pair(trading_pair)}
         async with client.get(SNAPSHOT_REST_URL.format(domain), params=params) as response:
@@ -131,22 +135,24 @@ class BinancePerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
             data: Dict[str, Any] = await response.json()
             return data
 
+    async def get_snapshot_message(self, trading_pair: str) -> OrderBookMessage:
+        snapshot: Dict[str, Any] = await self.get_snapshot(shared_client(), trading_pair, 1000, self._base_url)
+        snapshot_timestamp: float = time.time()
+        return BinancePerpetualOrderBook.snapshot_message_from_exchange(
+            snapshot,
+            snapshot_timestamp,
+            metadata={"trading_pair": trading_pair}
+        )
+
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
-        async with aiohttp.ClientSession() as client:
-            snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair, 1000, self._base_url)
-            snapshot_timestamp: float = time.time()
-            snapshot_msg: OrderBookMessage = BinancePerpetualOrderBook.snapshot_message_from_exchange(
-                snapshot,
-                snapshot_timestamp,
-                metadata={"trading_pair": trading_pair}
-            )
-            order_book = self.order_book_create_function()
-            order_book.apply_snapshot(snapshot_msg.bids, snapshot_msg.asks, snapshot_msg.update_id)
-            return order_book
+        snapshot_msg: OrderBookMessage = await self.get_snapshot_message(trading_pair)
+        order_book = self.order_book_create_function()
+        order_book.apply_snapshot_entries(snapshot_msg.entries)
+        return order_book
 
     """
     async def get_tracking_pairs(self) -> Dict[str, OrderBookTrackerEntry]:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client() as client:
             trading_pairs: List[str] = await self.get_trading_pairs()
             return_val: Dict[str, OrderBookTrackerEntry] = {}
             for trading_pair in trading_pairs:
@@ -230,7 +236,7 @@ class BinancePerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
         while True:
             try:
                 # trading_pairs: List[str] = await self.get_trading_pairs()
-                async with aiohttp.ClientSession() as client:
+                async with shared_client() as client:
                     for trading_pair in self._trading_pairs:
                         try:
                             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair, domain=self._base_url)
@@ -17,15 +17,10 @@ from hummingbot.connector.derivative.binance_perpetual.binance_perpetual_in_flig
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 
 import asyncio
-import hashlib
-import hmac
 import time
 import logging
 from decimal import Decimal
 from typing import Optional, List, Dict, Any, AsyncIterable
-from urllib.parse import urlencode
-
-import aiohttp
 
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.event.events import (
@@ -45,10 +40,16 @@ from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.derivative.binance_perpetual.binance_perpetual_order_book_tracker import BinancePerpetualOrderBookTracker
 from hummingbot.connector.derivative.binance_perpetual.binance_perpetual_user_stream_tracker import BinancePerpetualUserStreamTracker
 from hummingbot.connector.derivative.binance_perpetual.binance_perpetual_utils import convert_from_exchange_trading_pair, convert_to_exchange_trading_pair
+from hummingbot.connector.exchange.binance.binance_rest_client import (
+    BinanceRESTAPIException,
+    BinanceRESTClient,
+)
 from hummingbot.connector.derivative.binance_perpetual.constants import (
     PERPETUAL_BASE_URL,
     TESTNET_BASE_URL,
     DIFF_STREAM_URL,
+    ENDPOINT_WEIGHTS,
+    RATE_LIMITS,
     TESTNET_STREAM_URL
 )
 from hummingbot.connector.derivative_base import DerivativeBase, s_decimal_NaN
@@ -130,7 +131,8 @@ class BinancePerpetualDerivative(DerivativeBase):
         self._user_stream_event_listener_task = None
         self._trading_rules_polling_task = None
         self._last_poll_timestamp = 0
-        self._throttler = Throttler((10.0, 1.0))
+        self._throttler = Throttler(rate_limits=RATE_LIMITS, endpoint_weights=ENDPOINT_WEIGHTS)
+        self._rest_client = BinanceRESTClient(self._api_key, self._api_secret, time_func=time.time)
         self._funding_rate = 0
         self._account_positions = {}
         self._position_mode = None
@@ -147,6 +149,10 @@ class BinancePerpetualDerivative(DerivativeBase):
     def ready(self):
         return all(self.status_dict.values())
 
+    def is_trading_pair_ready(self, trading_pair: str) -> bool:
+        return (all(ready for status, ready in self.status_dict.items() if status != "order_books_initialized") and
+                self._order_book_tracker.is_order_book_ready(trading_pair))
+
     @property
     def in_flight_orders(self) -> Dict[str, BinancePerpetualsInFlightOrder]:
         return self._in_flight_orders
@@ -946,31 +952,20 @@ class BinancePerpetualDerivative(DerivativeBase):
 
     async def request(self, path: str, params: Dict[str, Any] = {}, method: MethodType = MethodType.GET,
                       add_timestamp: bool = False, is_signed: bool = False, request_weight: int = 1, return_err: bool = False):
-        async with self._throttler.weighted_task(request_weight):
+        async with self._throttler.weighted_task(request_weight, endpoint=f"{method.value} {path}"):
             try:
-                # TODO: QUESTION --- SHOULD I ADD AN ASYNC TIMEOUT? (aync with timeout(API_CALL_TIMEOUT)
-                # async with aiohttp.ClientSession() as client:
+                params = dict(params)
                 if add_timestamp:
                     params["timestamp"] = f"{int(time.time()) * 1000}"
                     params["recvWindow"] = f"{20000}"
-                query = urlencode(sorted(params.items()))
-                if is_signed:
-                    secret = bytes(self._api_secret.encode("utf-8"))
-                    signature = hmac.new(secret, query.encode("utf-8"), hashlib.sha256).hexdigest()
-                    query += f"&signature={signature}"
-
-                async with aiohttp.request(
-                        method=method.value,
-                        url=self._base_url + path + "?" + query,
-                        headers={"X-MBX-APIKEY": self._api_key}) as response:
-                    if response.status != 200:
-                        error_response = await response.json()
-                        if return_err:
-                            return error_response
-                        else:
-                            raise IOError(f"Error fetching data from {path}. HTTP status is {response.status}. "
-                                          f"Request Error: {error_response}")
-                    return await response.json()
+                try:
+                    return await self._rest_client.request(method.value, self._base_url + path, params,
+                                                           signed=is_signed)
+                except BinanceRESTAPIException as e:
+                    if return_err:
+                        return e.body
+                    raise IOError(f"Error fetching data from {path}. HTTP status is {e.status_code}. "
+                                  f"Request Error: {e.body}")
             except Exception as e:
                 self.logger().error(f"Error fetching {path}", exc_info=True)
                 self.logger().warning(f"{e}")
@@ -37,6 +37,8 @@ class BinancePerpetualOrderBook(OrderBook):
             data.update(metadata)
         return OrderBookMessage(OrderBookMessageType.DIFF, {
             "trading_pair": binance_perpetual_utils.convert_from_exchange_trading_pair(data["s"]),
+            "first_update_id": data["U"],
+            "previous_update_id": data["pu"],
             "update_id": data["u"],
             "bids": data["b"],
             "asks": data["a"]
@@ -1,18 +1,23 @@
 import logging
 import asyncio
 import time
-from typing import Optional, List, Deque, Dict
-from collections import deque, defaultdict
+from typing import Optional, List
 
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
-from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.derivative.binance_perpetual.binance_perpetual_api_order_book_data_source import \
     BinancePerpetualAPIOrderBookDataSource
 
 
 class BinancePerpetualOrderBookTracker(OrderBookTracker):
+    SEQUENCE_GAP_DETECTION: bool = True
+    # A 1000 level depth snapshot costs 20 of the 2400 request weight per minute, keep some for trading. The Throttler
+    # admits up to 2000 weight per 60.1 second window, i.e. at most 100 snapshots a minute.
+    ORDER_BOOK_INIT_CONCURRENCY: int = 10
+    ORDER_BOOK_INIT_WEIGHT: int = 20
+    ORDER_BOOK_INIT_RATE_LIMIT = (2000, 60.0)
     _bpobt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -22,15 +27,15 @@ class BinancePerpetualOrderBookTracker(OrderBookTracker):
         return cls._bpobt_logger
 
     def __init__(self,
-                 trading_pairs: Optional[List[str]] = None, domain: str = "binance_perpetual"):
+                 trading_pairs: Optional[List[str]] = None, domain: str = "binance_perpetual",
+                 periodic_snapshots: bool = False):
         super().__init__(data_source=BinancePerpetualAPIOrderBookDataSource(trading_pairs=trading_pairs, domain=domain),
-                         trading_pairs=trading_pairs, domain=domain)
+                         trading_pairs=trading_pairs, domain=domain, periodic_snapshots=periodic_snapshots)
 
         self._order_book_diff_stream: asyncio.Queue = asyncio.Queue()
         self._order_book_snapshot_stream: asyncio.Queue = asyncio.Queue()
 
         self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
-        self._saved_messages_queues: Dict[str, Deque[OrderBookMessage]] = defaultdict(lambda: deque(maxlen=1000))
         self._trading_pairs: Optional[List[str]] = trading_pairs
         self._domain = domain
 
@@ -67,7 +72,7 @@ class BinancePerpetualOrderBookTracker(OrderBookTracker):
 
                 if trading_pair not in self._tracking_message_queues:
                     messages_queued += 1
-                    self._saved_messages_queues[trading_pair].append(ob_message)
+                    self._saved_message_queues[trading_pair].append(ob_message)
                     continue
                 message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
                 order_book: OrderBook = self._order_books[trading_pair]
@@ -97,51 +102,3 @@ class BinancePerpetualOrderBookTracker(OrderBookTracker):
                     app_warning_msg="Unexpected error routing order book messages. Retrying after 5 seconds."
                 )
                 await asyncio.sleep(5.0)
-
-    async def _track_single_book(self, trading_pair: str):
-        """
-        Update an order book with changes from the latest batch of received messages
-        """
-        past_diffs_window: Deque[OrderBookMessage] = deque()
-        self._past_diffs_windows[trading_pair] = past_diffs_window
-
-        message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
-        order_book: OrderBook = self._order_books[trading_pair]
-        last_message_timestamp: float = time.time()
-        diff_messages_accepted: int = 0
-
-        while True:
-            try:
-                message: OrderBookMessage = None
-                saved_messages: Deque[OrderBookMessage] = self._saved_messages_queues[trading_pair]
-
-                if len(saved_messages) > 0:
-                    message = saved_messages.popleft()
-                else:
-                    message = await message_queue.get()
-                if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
-                    past_diffs_window.append(message)
-                    while len(past_diffs_window) > self.PAST_DIFF_WINDOW_SIZE:
-                        past_diffs_window.popleft()
-                    diff_messages_accepted += 1
-
-                    now: float = time.time()
-                    if int(now / 60.0) > int(last_message_timestamp / 60.0):
-                        self.logger().debug("Processed %d order book diffs for %s.",
-                                            diff_messages_accepted, trading_pair)
-                        diff_messages_accepted = 0
-                    last_message_timestamp = now
-                elif message.type is OrderBookMessageType.SNAPSHOT:
-                    past_diffs: List[OrderBookMessage] = list(past_diffs_window)
-                    order_book.restore_from_snapshot_and_diffs(message, past_diffs)
-                    self.logger().debug("Processed order book snapshot for %s.", trading_pair)
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                self.logger().network(
-                    f"Unexpected error tracking order book for {trading_pair}.",
-                    exc_info=True,
-                    app_warning_msg="Unexpected error tracking order book. Retrying after 5 seconds."
-                )
-                await asyncio.sleep(5.0)
@@ -10,6 +10,7 @@ from websockets import ConnectionClosed
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.logger import HummingbotLogger
+from hummingbot.core.utils.http_session_registry import shared_client
 
 BINANCE_USER_STREAM_ENDPOINT = "/fapi/v1/listenKey"
 
@@ -37,7 +38,7 @@ class BinancePerpetualUserStreamDataSource(UserStreamTrackerDataSource):
         self._wss_stream_url = stream_url + "/ws/"
 
     async def get_listen_key(self):
-        async with aiohttp.ClientSession() as client:
+        async with shared_client() as client:
             async with client.post(self._http_stream_url,
                                    headers={"X-MBX-APIKEY": self._api_key}) as response:
                 response: aiohttp.ClientResponse = response
@@ -48,7 +49,7 @@ class BinancePerpetualUserStreamDataSource(UserStreamTrackerDataSource):
                 return data["listenKey"]
 
     async def ping_listen_key(self, listen_key: str) -> bool:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client() as client:
             async with client.put(self._http_stream_url,
                                   headers={"X-MBX-APIKEY": self._api_key},
                                   params={"listenKey": listen_key}) as response:
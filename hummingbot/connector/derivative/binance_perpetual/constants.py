@@ -1,5 +1,24 @@
+from hummingbot.core.utils.asyncio_throttle import (
+    RateLimit,
+    REQUEST_WEIGHT,
+)
+
 PERPETUAL_BASE_URL = "https://fapi.binance.com"
 TESTNET_BASE_URL = "https://testnet.binancefuture.com"
 
 DIFF_STREAM_URL = "wss://fstream.binance.com"
 TESTNET_STREAM_URL = "wss://stream.binancefuture.com"
+
+ORDERS = "ORDERS"
+# Binance's USDT futures API rate limits, and the weights of the "<method> <path>" endpoints that don't weigh 1.
+RATE_LIMITS = [
+    RateLimit(2400, 60.0),
+    RateLimit(300, 10.0, ORDERS),
+    RateLimit(1200, 60.0, ORDERS),
+]
+ENDPOINT_WEIGHTS = {
+    "GET /fapi/v2/account": {REQUEST_WEIGHT: 5},
+    "GET /fapi/v2/positionRisk": {REQUEST_WEIGHT: 5},
+    "GET /fapi/v1/userTrades": {REQUEST_WEIGHT: 5},
+    "POST /fapi/v1/order": {REQUEST_WEIGHT: 1, ORDERS: 1},
+}
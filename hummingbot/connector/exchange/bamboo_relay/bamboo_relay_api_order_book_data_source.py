@@ -9,6 +9,7 @@ from typing import (
     Dict,
     List,
     Optional,
+    Union,
 )
 import re
 import time
@@ -30,6 +31,11 @@ from hummingbot.connector.exchange.bamboo_relay.bamboo_relay_constants import (
     BAMBOO_RELAY_REST_WS,
     BAMBOO_RELAY_TEST_WS
 )
+from hummingbot.core.utils.http_session_registry import (
+    HTTPSessionRegistry,
+    shared_client,
+)
+
 TRADING_PAIR_FILTER = re.compile(r"(WETH|DAI|CUSD|USDC|TUSD)$")
 
 
@@ -106,7 +112,7 @@ class BambooRelayAPIOrderBookDataSource(OrderBookTrackerDataSource):
             trading_pairs = set()
             page_count = 1
             while True:
-                async with aiohttp.ClientSession() as client:
+                async with shared_client() as client:
                     async with client.get(f"https://rest.bamboorelay.com/main/0x/markets?perPage=1000&page={page_count}",
                                           timeout=5) as response:
                         if response.status == 200:
@@ -132,7 +138,7 @@ class BambooRelayAPIOrderBookDataSource(OrderBookTrackerDataSource):
         return []
 
     @staticmethod
-    async def get_snapshot(client: aiohttp.ClientSession,
+    async def get_snapshot(client: Union[aiohttp.ClientSession, HTTPSessionRegistry],
                            trading_pair: str,
                            api_endpoint: str = "https://rest.bamboorelay.com/",
                            api_prefix: str = "main/0x") -> Dict[str, any]:
@@ -148,7 +154,7 @@ class BambooRelayAPIOrderBookDataSource(OrderBookTrackerDataSource):
         return await self.fetch_trading_pairs()
 
     async def get_new_order_book(self, trading_pair: str) -> BambooRelayOrderBook:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client() as client:
             snapshot: Dict[str, any] = await self.get_snapshot(client, trading_pair, self._api_endpoint,
                                                                self._api_prefix)
             snapshot_timestamp: float = time.time()
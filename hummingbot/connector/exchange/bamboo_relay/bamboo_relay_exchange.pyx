@@ -1,4 +1,3 @@
-import aiohttp
 import asyncio
 from async_timeout import timeout
 from collections import (
@@ -96,6 +95,7 @@ from hummingbot.connector.exchange.bamboo_relay.bamboo_relay_constants import (
 )
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 from hummingbot.core.utils.estimate_fee import estimate_fee
+from hummingbot.core.utils.http_session_registry import shared_client
 
 brm_logger = None
 s_decimal_0 = Decimal(0)
@@ -942,7 +942,7 @@ cdef class BambooRelayExchange(ExchangeBase):
                            url: str,
                            data: Optional[Dict[str, Any]] = None,
                            headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client() as client:
             async with client.request(http_method,
                                       url=url,
                                       timeout=self.API_CALL_TIMEOUT,
@@ -24,9 +24,14 @@ from hummingbot.core.utils.async_utils import safe_gather
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.threaded_order_book_message_stream import ThreadedOrderBookMessageStream
 from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.exchange.binance.binance_order_book import BinanceOrderBook
 from hummingbot.connector.exchange.binance.binance_utils import convert_to_exchange_trading_pair
+from hummingbot.core.utils.http_session_registry import (
+    HTTPSessionRegistry,
+    shared_client,
+)
 
 TRADING_PAIR_FILTER = re.compile(r"(BTC|ETH|USDT)$")
 
@@ -40,6 +45,8 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     MESSAGE_TIMEOUT = 30.0
     PING_TIMEOUT = 10.0
+    # Receive and parse the diff stream in a dedicated thread, see ThreadedOrderBookMessageStream.
+    THREADED_DIFF_PARSING = False
 
     _baobds_logger: Optional[HummingbotLogger] = None
 
@@ -62,7 +69,7 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     @classmethod
     async def get_last_traded_price(cls, trading_pair: str, domain: str = "com") -> float:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client() as client:
             url = TICKER_PRICE_CHANGE_URL.format(domain)
             resp = await client.get(f"{url}?symbol={convert_to_exchange_trading_pair(trading_pair)}")
             resp_json = await resp.json()
@@ -82,7 +89,7 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
     @async_ttl_cache(ttl=2, maxsize=1)
     async def get_all_mid_prices(domain="com") -> Optional[Decimal]:
         from hummingbot.connector.exchange.binance.binance_utils import convert_from_exchange_trading_pair
-        async with aiohttp.ClientSession() as client:
+        async with shared_client() as client:
             url = "https://api.binance.{}/api/v3/ticker/bookTicker".format(domain)
             resp = await client.get(url)
             resp_json = await resp.json()
@@ -96,7 +103,7 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
     async def fetch_trading_pairs(domain="com") -> List[str]:
         try:
             from hummingbot.connector.exchange.binance.binance_utils import convert_from_exchange_trading_pair
-            async with aiohttp.ClientSession() as client:
+            async with shared_client() as client:
                 url = EXCHANGE_INFO_URL.format(domain)
                 async with client.get(url, timeout=10) as response:
                     if response.status == 200:
@@ -117,7 +124,7 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
         return []
 
     @staticmethod
-    async def get_snapshot(client: aiohttp.ClientSession, trading_pair: str, limit: int = 1000,
+    async def get_snapshot(client: HTTPSessionRegistry, trading_pair: str, limit: int = 1000,
                            domain: str = "com") -> Dict[str, Any]:
         params: Dict = {"limit": str(limit), "symbol": convert_to_exchange_trading_pair(trading_pair)} if limit != 0 \
             else {"symbol": convert_to_exchange_trading_pair(trading_pair)}
@@ -135,18 +142,20 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
             return data
 
+    async def get_snapshot_message(self, trading_pair: str) -> OrderBookMessage:
+        snapshot: Dict[str, Any] = await self.get_snapshot(shared_client(), trading_pair, 1000, self._domain)
+        snapshot_timestamp: float = time.time()
+        return BinanceOrderBook.snapshot_message_from_exchange(
+            snapshot,
+            snapshot_timestamp,
+            metadata={"trading_pair": trading_pair}
+        )
+
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
-        async with aiohttp.ClientSession() as client:
-            snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair, 1000, self._domain)
-            snapshot_timestamp: float = time.time()
-            snapshot_msg: OrderBookMessage = BinanceOrderBook.snapshot_message_from_exchange(
-                snapshot,
-                snapshot_timestamp,
-                metadata={"trading_pair": trading_pair}
-            )
-            order_book = self.order_book_create_function()
-            order_book.apply_snapshot(snapshot_msg.bids, snapshot_msg.asks, snapshot_msg.update_id)
-            return order_book
+        snapshot_msg: OrderBookMessage = await self.get_snapshot_message(trading_pair)
+        order_book = self.order_book_create_function()
+        order_book.apply_snapshot_entries(snapshot_msg.entries)
+        return order_book
 
     async def _inner_messages(self,
                               ws: websockets.WebSocketClientProtocol) -> AsyncIterable[str]:
@@ -199,6 +208,13 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 url = DIFF_STREAM_URL.format(self._domain)
                 stream_url: str = f"{url}/{ws_path}"
 
+                if self.THREADED_DIFF_PARSING:
+                    await ThreadedOrderBookMessageStream(stream_url,
+                                                         self._parse_diff_message,
+                                                         message_timeout=self.MESSAGE_TIMEOUT,
+                                                         ping_timeout=self.PING_TIMEOUT).listen(output)
+                    continue
+
                 async with websockets.connect(stream_url) as ws:
                     ws: websockets.WebSocketClientProtocol = ws
                     async for raw_msg in self._inner_messages(ws):
@@ -213,10 +229,18 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
                                     exc_info=True)
                 await asyncio.sleep(30.0)
 
+    @staticmethod
+    def _parse_diff_message(raw_msg: str) -> OrderBookMessage:
+        order_book_message: OrderBookMessage = BinanceOrderBook.diff_message_from_exchange(
+            ujson.loads(raw_msg), time.time())
+        # Decode the rows into order book entries here, in the stream thread.
+        order_book_message.entries
+        return order_book_message
+
     async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
         while True:
             try:
-                async with aiohttp.ClientSession() as client:
+                async with shared_client() as client:
                     for trading_pair in self._trading_pairs:
                         try:
                             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair,
@@ -7,6 +7,7 @@ cdef class BinanceExchange(ExchangeBase):
     cdef:
         object _user_stream_tracker
         object _binance_client
+        object _binance_rest_client
         object _ev_loop
         object _poll_notifier
         double _last_timestamp
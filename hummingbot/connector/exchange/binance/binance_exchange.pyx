@@ -1,6 +1,5 @@
 from collections import defaultdict
 from libc.stdint cimport int64_t
-import aiohttp
 from aiokafka import (
     AIOKafkaConsumer,
     ConsumerRecord
@@ -27,7 +26,10 @@ from typing import (
 import conf
 from hummingbot.core.utils.asyncio_throttle import Throttler
 from hummingbot.core.utils import async_ttl_cache
-from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler
+from hummingbot.core.utils.async_call_scheduler import (
+    AsyncCallPriority,
+    AsyncCallScheduler,
+)
 from hummingbot.core.clock cimport Clock
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.utils.async_utils import (
@@ -61,12 +63,20 @@ from hummingbot.core.utils.estimate_fee import estimate_fee
 from .binance_order_book_tracker import BinanceOrderBookTracker
 from .binance_user_stream_tracker import BinanceUserStreamTracker
 from .binance_time import BinanceTime
+from .binance_rest_client import (
+    BinanceRESTClient,
+    ENDPOINT_WEIGHTS,
+    OPEN_ORDERS_ALL_SYMBOLS_WEIGHT,
+    RATE_LIMITS,
+)
 from .binance_in_flight_order import BinanceInFlightOrder
 from .binance_utils import (
     convert_from_exchange_trading_pair,
     convert_to_exchange_trading_pair)
 from hummingbot.core.data_type.common import OpenOrder
 from hummingbot.core.data_type.trade import Trade
+from hummingbot.core.utils.http_session_registry import shared_client
+
 s_logger = None
 s_decimal_0 = Decimal(0)
 s_decimal_NaN = Decimal("nan")
@@ -107,8 +117,12 @@ cdef class BinanceExchange(ExchangeBase):
     MARKET_SELL_ORDER_CREATED_EVENT_TAG = MarketEvent.SellOrderCreated.value
 
     API_CALL_TIMEOUT = 10.0
+    API_CALL_CONCURRENCY = 10
     SHORT_POLL_INTERVAL = 5.0
     UPDATE_ORDER_STATUS_MIN_INTERVAL = 10.0
+    # Poll the open orders in bulk and diff them against the tracked orders, instead of polling each order's status
+    # and each trading pair's trades, see _reconcile_open_orders().
+    BULK_ORDER_RECONCILIATION = True
     LONG_POLL_INTERVAL = 120.0
     BINANCE_TRADE_TOPIC_NAME = "binance-trade.serialized"
     BINANCE_USER_STREAM_TOPIC_NAME = "binance-user-stream.serialized"
@@ -135,6 +149,7 @@ cdef class BinanceExchange(ExchangeBase):
         self._trading_required = trading_required
         self._order_book_tracker = BinanceOrderBookTracker(trading_pairs=trading_pairs, domain=domain)
         self._binance_client = BinanceClient(binance_api_key, binance_api_secret, tld=domain)
+        self._binance_rest_client = BinanceRESTClient(binance_api_key, binance_api_secret, tld=domain)
         self._user_stream_tracker = BinanceUserStreamTracker(binance_client=self._binance_client, domain=domain)
         self._ev_loop = asyncio.get_event_loop()
         self._poll_notifier = asyncio.Event()
@@ -148,9 +163,9 @@ cdef class BinanceExchange(ExchangeBase):
         self._status_polling_task = None
         self._user_stream_event_listener_task = None
         self._trading_rules_polling_task = None
-        self._async_scheduler = AsyncCallScheduler(call_interval=0.5)
+        self._async_scheduler = AsyncCallScheduler(call_interval=0.5, max_concurrency=self.API_CALL_CONCURRENCY)
         self._last_poll_timestamp = 0
-        self._throttler = Throttler((10.0, 1.0))
+        self._throttler = Throttler(rate_limits=RATE_LIMITS, endpoint_weights=ENDPOINT_WEIGHTS)
 
     @property
     def name(self) -> str:
@@ -167,6 +182,10 @@ cdef class BinanceExchange(ExchangeBase):
     def binance_client(self) -> BinanceClient:
         return self._binance_client
 
+    @property
+    def binance_rest_client(self) -> BinanceRESTClient:
+        return self._binance_rest_client
+
     @property
     def trading_rules(self) -> Dict[str, TradingRule]:
         return self._trading_rules
@@ -224,12 +243,21 @@ cdef class BinanceExchange(ExchangeBase):
             *args,
             app_warning_msg: str = "Binance API call failed. Check API key and network connection.",
             request_weight: int = 1,
+            priority: AsyncCallPriority = AsyncCallPriority.NORMAL,
             **kwargs) -> Dict[str, any]:
-        async with self._throttler.weighted_task(request_weight=request_weight):
+        async with self._throttler.weighted_task(request_weight=request_weight,
+                                                 endpoint=getattr(func, "__name__", None)):
             try:
+                if asyncio.iscoroutinefunction(func):
+                    return await self._async_scheduler.schedule_async_call(func(*args, **kwargs),
+                                                                           self.API_CALL_TIMEOUT,
+                                                                           app_warning_msg=app_warning_msg,
+                                                                           priority=priority)
+                # Synchronous python-binance client calls run in the executor.
                 return await self._async_scheduler.call_async(partial(func, *args, **kwargs),
                                                               timeout_seconds=self.API_CALL_TIMEOUT,
-                                                              app_warning_msg=app_warning_msg)
+                                                              app_warning_msg=app_warning_msg,
+                                                              priority=priority)
             except Exception as ex:
                 if "Timestamp for this request" in str(ex):
                     self.logger().warning("Got Binance timestamp error. "
@@ -241,7 +269,7 @@ cdef class BinanceExchange(ExchangeBase):
 
     async def query_url(self, url, request_weight: int = 1) -> any:
         async with self._throttler.weighted_task(request_weight=request_weight):
-            async with aiohttp.ClientSession() as client:
+            async with shared_client() as client:
                 async with client.get(url, timeout=self.API_CALL_TIMEOUT) as response:
                     if response.status != 200:
                         raise IOError(f"Error fetching data from {url}. HTTP status is {response.status}.")
@@ -257,7 +285,7 @@ cdef class BinanceExchange(ExchangeBase):
             set remote_asset_names = set()
             set asset_names_to_remove
 
-        account_info = await self.query_api(self._binance_client.get_account)
+        account_info = await self.query_api(self._binance_rest_client.get_account)
         balances = account_info["balances"]
         for balance_entry in balances:
             asset_name = balance_entry["asset"]
@@ -278,7 +306,7 @@ cdef class BinanceExchange(ExchangeBase):
 
         if current_timestamp - self._last_update_trade_fees_timestamp > 60.0 * 60.0 or len(self._trade_fees) < 1:
             try:
-                res = await self.query_api(self._binance_client.get_trade_fee)
+                res = await self.query_api(self._binance_rest_client.get_trade_fee)
                 for fee in res["tradeFee"]:
                     self._trade_fees[fee["symbol"]] = (Decimal(fee["maker"]), Decimal(fee["taker"]))
                 self._last_update_trade_fees_timestamp = current_timestamp
@@ -323,7 +351,7 @@ cdef class BinanceExchange(ExchangeBase):
             int64_t last_tick = <int64_t>(self._last_timestamp / 60.0)
             int64_t current_tick = <int64_t>(self._current_timestamp / 60.0)
         if current_tick > last_tick or len(self._trading_rules) < 1:
-            exchange_info = await self.query_api(self._binance_client.get_exchange_info)
+            exchange_info = await self.query_api(self._binance_rest_client.get_exchange_info)
             trading_rules_list = self._format_trading_rules(exchange_info)
             self._trading_rules.clear()
             for trading_rule in trading_rules_list:
@@ -393,46 +421,54 @@ cdef class BinanceExchange(ExchangeBase):
             int64_t current_tick = <int64_t>(self._current_timestamp / self.UPDATE_ORDER_STATUS_MIN_INTERVAL)
 
         if current_tick > last_tick and len(self._in_flight_orders) > 0:
-            trading_pairs_to_order_map = defaultdict(lambda: {})
-            for o in self._in_flight_orders.values():
-                trading_pairs_to_order_map[o.trading_pair][o.exchange_order_id] = o
-
-            trading_pairs = list(trading_pairs_to_order_map.keys())
-            tasks = [self.query_api(self._binance_client.get_my_trades, symbol=convert_to_exchange_trading_pair(trading_pair))
-                     for trading_pair in trading_pairs]
-            self.logger().debug("Polling for order fills of %d trading pairs.", len(tasks))
-            results = await safe_gather(*tasks, return_exceptions=True)
-            for trades, trading_pair in zip(results, trading_pairs):
-                order_map = trading_pairs_to_order_map[trading_pair]
-                if isinstance(trades, Exception):
-                    self.logger().network(
-                        f"Error fetching trades update for the order {trading_pair}: {trades}.",
-                        app_warning_msg=f"Failed to fetch trade update for {trading_pair}."
-                    )
-                    continue
-                for trade in trades:
-                    order_id = str(trade["orderId"])
-                    if order_id in order_map:
-                        tracked_order = order_map[order_id]
-                        order_type = tracked_order.order_type
-                        applied_trade = order_map[order_id].update_with_trade_update(trade)
-                        if applied_trade:
-                            self.c_trigger_event(self.MARKET_ORDER_FILLED_EVENT_TAG,
-                                                 OrderFilledEvent(
-                                                     self._current_timestamp,
-                                                     tracked_order.client_order_id,
-                                                     tracked_order.trading_pair,
-                                                     tracked_order.trade_type,
-                                                     order_type,
-                                                     Decimal(trade["price"]),
-                                                     Decimal(trade["qty"]),
-                                                     TradeFee(
-                                                         percent=Decimal(0.0),
-                                                         flat_fees=[(trade["commissionAsset"],
-                                                                     Decimal(trade["commission"]))]
-                                                     ),
-                                                     exchange_trade_id=trade["id"]
-                                                 ))
+            await self._update_order_fills(list(self._in_flight_orders.values()))
+
+    async def _update_order_fills(self, tracked_orders: List[BinanceInFlightOrder]):
+        """
+        Fetches the recent trades of the orders' trading pairs and applies the ones missing from the orders.
+        """
+        trading_pairs_to_order_map = defaultdict(lambda: {})
+        for o in tracked_orders:
+            trading_pairs_to_order_map[o.trading_pair][o.exchange_order_id] = o
+
+        trading_pairs = list(trading_pairs_to_order_map.keys())
+        tasks = [self.query_api(self._binance_rest_client.get_my_trades,
+                                symbol=convert_to_exchange_trading_pair(trading_pair),
+                                priority=AsyncCallPriority.LOW)
+                 for trading_pair in trading_pairs]
+        self.logger().debug("Polling for order fills of %d trading pairs.", len(tasks))
+        results = await safe_gather(*tasks, return_exceptions=True)
+        for trades, trading_pair in zip(results, trading_pairs):
+            order_map = trading_pairs_to_order_map[trading_pair]
+            if isinstance(trades, Exception):
+                self.logger().network(
+                    f"Error fetching trades update for the order {trading_pair}: {trades}.",
+                    app_warning_msg=f"Failed to fetch trade update for {trading_pair}."
+                )
+                continue
+            for trade in trades:
+                order_id = str(trade["orderId"])
+                if order_id in order_map:
+                    tracked_order = order_map[order_id]
+                    order_type = tracked_order.order_type
+                    applied_trade = order_map[order_id].update_with_trade_update(trade)
+                    if applied_trade:
+                        self.c_trigger_event(self.MARKET_ORDER_FILLED_EVENT_TAG,
+                                             OrderFilledEvent(
+                                                 self._current_timestamp,
+                                                 tracked_order.client_order_id,
+                                                 tracked_order.trading_pair,
+                                                 tracked_order.trade_type,
+                                                 order_type,
+                                                 Decimal(trade["price"]),
+                                                 Decimal(trade["qty"]),
+                                                 TradeFee(
+                                                     percent=Decimal(0.0),
+                                                     flat_fees=[(trade["commissionAsset"],
+                                                                 Decimal(trade["commission"]))]
+                                                 ),
+                                                 exchange_trade_id=trade["id"]
+                                             ))
 
     async def _update_order_status(self):
         cdef:
@@ -444,93 +480,175 @@ cdef class BinanceExchange(ExchangeBase):
 
         if current_tick > last_tick and len(self._in_flight_orders) > 0:
             tracked_orders = list(self._in_flight_orders.values())
-            tasks = [self.query_api(self._binance_client.get_order,
-                                    symbol=convert_to_exchange_trading_pair(o.trading_pair), origClientOrderId=o.client_order_id)
-                     for o in tracked_orders]
-            self.logger().debug("Polling for order status updates of %d orders.", len(tasks))
-            results = await safe_gather(*tasks, return_exceptions=True)
-            for order_update, tracked_order in zip(results, tracked_orders):
-                client_order_id = tracked_order.client_order_id
-
-                # If the order has already been cancelled or has failed do nothing
-                if client_order_id not in self._in_flight_orders:
-                    continue
+            order_updates = await self._fetch_order_updates(tracked_orders)
+            self._process_order_updates(tracked_orders, order_updates)
+
+    async def _fetch_order_updates(self, tracked_orders: List[BinanceInFlightOrder]) -> List[Any]:
+        tasks = [self.query_api(self._binance_rest_client.get_order,
+                                symbol=convert_to_exchange_trading_pair(o.trading_pair),
+                                origClientOrderId=o.client_order_id,
+                                priority=AsyncCallPriority.LOW)
+                 for o in tracked_orders]
+        self.logger().debug("Polling for order status updates of %d orders.", len(tasks))
+        return await safe_gather(*tasks, return_exceptions=True)
+
+    def _process_order_updates(self, tracked_orders: List[BinanceInFlightOrder], order_updates: List[Any]):
+        for order_update, tracked_order in zip(order_updates, tracked_orders):
+            client_order_id = tracked_order.client_order_id
+
+            # If the order has already been cancelled or has failed do nothing
+            if client_order_id not in self._in_flight_orders:
+                continue
 
-                if isinstance(order_update, Exception):
-                    if order_update.code == 2013 or order_update.message == "Order does not exist.":
-                        self._order_not_found_records[client_order_id] = \
-                            self._order_not_found_records.get(client_order_id, 0) + 1
-                        if self._order_not_found_records[client_order_id] < self.ORDER_NOT_EXIST_CONFIRMATION_COUNT:
-                            # Wait until the order not found error have repeated a few times before actually treating
-                            # it as failed. See: https://github.com/CoinAlpha/hummingbot/issues/601
-                            continue
-                        self.c_trigger_event(
-                            self.MARKET_ORDER_FAILURE_EVENT_TAG,
-                            MarketOrderFailureEvent(self._current_timestamp, client_order_id, tracked_order.order_type)
-                        )
-                        self.c_stop_tracking_order(client_order_id)
-                    else:
-                        self.logger().network(
-                            f"Error fetching status update for the order {client_order_id}: {order_update}.",
-                            app_warning_msg=f"Failed to fetch status update for the order {client_order_id}."
-                        )
-                    continue
+            if isinstance(order_update, Exception):
+                if order_update.code == 2013 or order_update.message == "Order does not exist.":
+                    self._order_not_found_records[client_order_id] = \
+                        self._order_not_found_records.get(client_order_id, 0) + 1
+                    if self._order_not_found_records[client_order_id] < self.ORDER_NOT_EXIST_CONFIRMATION_COUNT:
+                        # Wait until the order not found error have repeated a few times before actually treating
+                        # it as failed. See: https://github.com/CoinAlpha/hummingbot/issues/601
+                        continue
+                    self.c_trigger_event(
+                        self.MARKET_ORDER_FAILURE_EVENT_TAG,
+                        MarketOrderFailureEvent(self._current_timestamp, client_order_id, tracked_order.order_type)
+                    )
+                    self.c_stop_tracking_order(client_order_id)
+                else:
+                    self.logger().network(
+                        f"Error fetching status update for the order {client_order_id}: {order_update}.",
+                        app_warning_msg=f"Failed to fetch status update for the order {client_order_id}."
+                    )
+                continue
 
-                # Update order execution status
-                tracked_order.last_state = order_update["status"]
-                order_type = BinanceExchange.to_hb_order_type(order_update["type"])
-                executed_amount_base = Decimal(order_update["executedQty"])
-                executed_amount_quote = Decimal(order_update["cummulativeQuoteQty"])
-
-                if tracked_order.is_done:
-                    if not tracked_order.is_failure:
-                        if tracked_order.trade_type is TradeType.BUY:
-                            self.logger().info(f"The market buy order {tracked_order.client_order_id} has completed "
-                                               f"according to order status API.")
-                            self.c_trigger_event(self.MARKET_BUY_ORDER_COMPLETED_EVENT_TAG,
-                                                 BuyOrderCompletedEvent(self._current_timestamp,
-                                                                        client_order_id,
-                                                                        tracked_order.base_asset,
-                                                                        tracked_order.quote_asset,
-                                                                        (tracked_order.fee_asset
-                                                                         or tracked_order.base_asset),
-                                                                        executed_amount_base,
-                                                                        executed_amount_quote,
-                                                                        tracked_order.fee_paid,
-                                                                        order_type))
-                        else:
-                            self.logger().info(f"The market sell order {client_order_id} has completed "
-                                               f"according to order status API.")
-                            self.c_trigger_event(self.MARKET_SELL_ORDER_COMPLETED_EVENT_TAG,
-                                                 SellOrderCompletedEvent(self._current_timestamp,
-                                                                         client_order_id,
-                                                                         tracked_order.base_asset,
-                                                                         tracked_order.quote_asset,
-                                                                         (tracked_order.fee_asset
-                                                                          or tracked_order.quote_asset),
-                                                                         executed_amount_base,
-                                                                         executed_amount_quote,
-                                                                         tracked_order.fee_paid,
-                                                                         order_type))
+            # Update order execution status
+            tracked_order.last_state = order_update["status"]
+            order_type = BinanceExchange.to_hb_order_type(order_update["type"])
+            executed_amount_base = Decimal(order_update["executedQty"])
+            executed_amount_quote = Decimal(order_update["cummulativeQuoteQty"])
+
+            if tracked_order.is_done:
+                if not tracked_order.is_failure:
+                    if tracked_order.trade_type is TradeType.BUY:
+                        self.logger().info(f"The market buy order {tracked_order.client_order_id} has completed "
+                                           f"according to order status API.")
+                        self.c_trigger_event(self.MARKET_BUY_ORDER_COMPLETED_EVENT_TAG,
+                                             BuyOrderCompletedEvent(self._current_timestamp,
+                                                                    client_order_id,
+                                                                    tracked_order.base_asset,
+                                                                    tracked_order.quote_asset,
+                                                                    (tracked_order.fee_asset
+                                                                     or tracked_order.base_asset),
+                                                                    executed_amount_base,
+                                                                    executed_amount_quote,
+                                                                    tracked_order.fee_paid,
+                                                                    order_type))
                     else:
-                        # check if its a cancelled order
-                        # if its a cancelled order, issue cancel and stop tracking order
-                        if tracked_order.is_cancelled:
-                            self.logger().info(f"Successfully cancelled order {client_order_id}.")
-                            self.c_trigger_event(self.MARKET_ORDER_CANCELLED_EVENT_TAG,
-                                                 OrderCancelledEvent(
-                                                     self._current_timestamp,
-                                                     client_order_id))
-                        else:
-                            self.logger().info(f"The market order {client_order_id} has failed according to "
-                                               f"order status API.")
-                            self.c_trigger_event(self.MARKET_ORDER_FAILURE_EVENT_TAG,
-                                                 MarketOrderFailureEvent(
-                                                     self._current_timestamp,
-                                                     client_order_id,
-                                                     order_type
-                                                 ))
-                    self.c_stop_tracking_order(client_order_id)
+                        self.logger().info(f"The market sell order {client_order_id} has completed "
+                                           f"according to order status API.")
+                        self.c_trigger_event(self.MARKET_SELL_ORDER_COMPLETED_EVENT_TAG,
+                                             SellOrderCompletedEvent(self._current_timestamp,
+                                                                     client_order_id,
+                                                                     tracked_order.base_asset,
+                                                                     tracked_order.quote_asset,
+                                                                     (tracked_order.fee_asset
+                                                                      or tracked_order.quote_asset),
+                                                                     executed_amount_base,
+                                                                     executed_amount_quote,
+                                                                     tracked_order.fee_paid,
+                                                                     order_type))
+                else:
+                    # check if its a cancelled order
+                    # if its a cancelled order, issue cancel and stop tracking order
+                    if tracked_order.is_cancelled:
+                        self.logger().info(f"Successfully cancelled order {client_order_id}.")
+                        self.c_trigger_event(self.MARKET_ORDER_CANCELLED_EVENT_TAG,
+                                             OrderCancelledEvent(
+                                                 self._current_timestamp,
+                                                 client_order_id))
+                    else:
+                        self.logger().info(f"The market order {client_order_id} has failed according to "
+                                           f"order status API.")
+                        self.c_trigger_event(self.MARKET_ORDER_FAILURE_EVENT_TAG,
+                                             MarketOrderFailureEvent(
+                                                 self._current_timestamp,
+                                                 client_order_id,
+                                                 order_type
+                                             ))
+                self.c_stop_tracking_order(client_order_id)
+
+    async def _fetch_open_orders(self, trading_pairs: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        The open orders of the trading pairs, by client order id, or None for a trading pair whose open orders couldn't
+        be fetched. Fetches the open orders of each trading pair, or of all the trading pairs in one call when that
+        weighs less.
+        """
+        open_orders = {trading_pair: {} for trading_pair in trading_pairs}
+        if len(trading_pairs) < OPEN_ORDERS_ALL_SYMBOLS_WEIGHT:
+            requests = [([trading_pair], self.query_api(self._binance_rest_client.get_open_orders,
+                                                        symbol=convert_to_exchange_trading_pair(trading_pair),
+                                                        priority=AsyncCallPriority.LOW))
+                        for trading_pair in trading_pairs]
+        else:
+            requests = [(trading_pairs, self.query_api(self._binance_rest_client.get_open_orders,
+                                                       request_weight=OPEN_ORDERS_ALL_SYMBOLS_WEIGHT,
+                                                       priority=AsyncCallPriority.LOW))]
+        self.logger().debug("Polling for open orders of %d trading pairs.", len(trading_pairs))
+        results = await safe_gather(*[request for _, request in requests], return_exceptions=True)
+        for (requested_trading_pairs, _), orders in zip(requests, results):
+            if isinstance(orders, Exception):
+                self.logger().network(
+                    f"Error fetching open orders of {', '.join(requested_trading_pairs)}: {orders}.",
+                    app_warning_msg="Failed to fetch open orders."
+                )
+                for trading_pair in requested_trading_pairs:
+                    open_orders[trading_pair] = None
+                continue
+            for order in orders:
+                trading_pair_open_orders = open_orders.get(convert_from_exchange_trading_pair(order["symbol"]))
+                if trading_pair_open_orders is not None:
+                    trading_pair_open_orders[order["clientOrderId"]] = order
+        return open_orders
+
+    async def _reconcile_open_orders(self):
+        cdef:
+            # Like _update_order_status and _update_order_fills_from_trades, a backup measure for Binance's user
+            # stream events, polled at the same interval.
+            int64_t last_tick = <int64_t>(self._last_poll_timestamp / self.UPDATE_ORDER_STATUS_MIN_INTERVAL)
+            int64_t current_tick = <int64_t>(self._current_timestamp / self.UPDATE_ORDER_STATUS_MIN_INTERVAL)
+
+        if current_tick > last_tick and len(self._in_flight_orders) > 0:
+            tracked_orders = list(self._in_flight_orders.values())
+            open_orders = await self._fetch_open_orders(list({o.trading_pair for o in tracked_orders}))
+
+            # The orders that are still open only need their state updated, the ones that are no longer open have
+            # completed, been cancelled or were never placed, and get their status queried.
+            exchange_executed_amounts = {}
+            missing_orders = []
+            for tracked_order in tracked_orders:
+                trading_pair_open_orders = open_orders[tracked_order.trading_pair]
+                if trading_pair_open_orders is None:
+                    continue
+                open_order = trading_pair_open_orders.get(tracked_order.client_order_id)
+                if open_order is None:
+                    missing_orders.append(tracked_order)
+                    continue
+                tracked_order.last_state = open_order["status"]
+                exchange_executed_amounts[tracked_order.client_order_id] = Decimal(open_order["executedQty"])
+
+            order_updates = await self._fetch_order_updates(missing_orders)
+            for tracked_order, order_update in zip(missing_orders, order_updates):
+                if not isinstance(order_update, Exception):
+                    exchange_executed_amounts[tracked_order.client_order_id] = Decimal(order_update["executedQty"])
+
+            # Only the trading pairs with fills that the tracked orders haven't recorded need their trades fetched.
+            # The fills are applied before the completion of the orders is processed.
+            unexplained_trading_pairs = {o.trading_pair for o in tracked_orders
+                                         if exchange_executed_amounts.get(o.client_order_id, s_decimal_0) >
+                                         o.executed_amount_base}
+            if len(unexplained_trading_pairs) > 0:
+                await self._update_order_fills([o for o in tracked_orders
+                                                if o.trading_pair in unexplained_trading_pairs])
+            self._process_order_updates(missing_orders, order_updates)
 
     async def _iter_kafka_messages(self, topic: str) -> AsyncIterable[ConsumerRecord]:
         while True:
@@ -669,11 +787,17 @@ cdef class BinanceExchange(ExchangeBase):
             try:
                 self._poll_notifier = asyncio.Event()
                 await self._poll_notifier.wait()
-                await safe_gather(
-                    self._update_balances(),
-                    self._update_order_fills_from_trades(),
-                    self._update_order_status(),
-                )
+                if self.BULK_ORDER_RECONCILIATION:
+                    await safe_gather(
+                        self._update_balances(),
+                        self._reconcile_open_orders(),
+                    )
+                else:
+                    await safe_gather(
+                        self._update_balances(),
+                        self._update_order_fills_from_trades(),
+                        self._update_order_status(),
+                    )
                 self._last_poll_timestamp = self._current_timestamp
             except asyncio.CancelledError:
                 raise
@@ -710,11 +834,15 @@ cdef class BinanceExchange(ExchangeBase):
     def ready(self) -> bool:
         return all(self.status_dict.values())
 
+    def is_trading_pair_ready(self, trading_pair: str) -> bool:
+        return (all(ready for status, ready in self.status_dict.items() if status != "order_books_initialized") and
+                self._order_book_tracker.is_order_book_ready(trading_pair))
+
     async def server_time(self) -> int:
         """
         :return: The current server time in milliseconds since UNIX epoch.
         """
-        result = await self.query_api(self._binance_client.get_server_time)
+        result = await self.query_api(self._binance_rest_client.get_server_time)
         return result["serverTime"]
 
     cdef c_start(self, Clock clock, double timestamp):
@@ -751,7 +879,7 @@ cdef class BinanceExchange(ExchangeBase):
 
     async def check_network(self) -> NetworkStatus:
         try:
-            await self.query_api(self._binance_client.ping)
+            await self.query_api(self._binance_rest_client.ping)
         except asyncio.CancelledError:
             raise
         except Exception:
@@ -835,7 +963,9 @@ cdef class BinanceExchange(ExchangeBase):
                                     order_type
                                     )
         try:
-            order_result = await self.query_api(self._binance_client.create_order, **api_params)
+            order_result = await self.query_api(self._binance_rest_client.create_order,
+                                                priority=AsyncCallPriority.HIGH,
+                                                **api_params)
             exchange_order_id = str(order_result["orderId"])
             tracked_order = self._in_flight_orders.get(order_id)
             if tracked_order is not None:
@@ -886,9 +1016,10 @@ cdef class BinanceExchange(ExchangeBase):
 
     async def execute_cancel(self, trading_pair: str, order_id: str):
         try:
-            cancel_result = await self.query_api(self._binance_client.cancel_order,
+            cancel_result = await self.query_api(self._binance_rest_client.cancel_order,
                                                  symbol=convert_to_exchange_trading_pair(trading_pair),
-                                                 origClientOrderId=order_id)
+                                                 origClientOrderId=order_id,
+                                                 priority=AsyncCallPriority.HIGH)
         except BinanceAPIException as e:
             if "Unknown order sent" in e.message or e.code == 2011:
                 # The order was never there to begin with. So cancelling it is a no-op but semantically successful.
@@ -1036,7 +1167,8 @@ cdef class BinanceExchange(ExchangeBase):
         return self.c_get_order_book(trading_pair)
 
     async def get_open_orders(self) -> List[OpenOrder]:
-        orders = await self.query_api(self._binance_client.get_open_orders)
+        orders = await self.query_api(self._binance_rest_client.get_open_orders,
+                                      request_weight=OPEN_ORDERS_ALL_SYMBOLS_WEIGHT)
         ret_val = []
         for order in orders:
             if BROKER_ID not in order["clientOrderId"]:
@@ -1060,7 +1192,7 @@ cdef class BinanceExchange(ExchangeBase):
     @async_ttl_cache(ttl=30, maxsize=1000)
     async def get_all_my_trades(self, trading_pair: str) -> List[Trade]:
         # Ths Binance API call rate is 5, so we cache to make sure we don't go over rate limit
-        trades = await self.query_api(self._binance_client.get_my_trades,
+        trades = await self.query_api(self._binance_rest_client.get_my_trades,
                                       symbol=convert_to_exchange_trading_pair(trading_pair))
         from hummingbot.connector.exchange.binance.binance_helper import format_trades
         return format_trades(trades)
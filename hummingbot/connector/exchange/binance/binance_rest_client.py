@@ -0,0 +1,181 @@
+#!/usr/bin/env python
+
+import aiohttp
+from binance.exceptions import (
+    BinanceAPIException,
+    BinanceRequestException,
+    BinanceWithdrawException,
+)
+import hashlib
+import hmac
+import logging
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+)
+from urllib.parse import urlencode
+import ujson
+
+from hummingbot.core.utils.asyncio_throttle import (
+    RateLimit,
+    REQUEST_WEIGHT,
+)
+from hummingbot.core.utils.http_session_registry import shared_client
+from hummingbot.logger import HummingbotLogger
+from .binance_time import BinanceTime
+
+ORDERS = "ORDERS"
+# Binance's spot API rate limits, and the weights of the BinanceRESTClient methods that don't weigh 1.
+RATE_LIMITS = [
+    RateLimit(1200, 60.0),
+    RateLimit(10, 1.0, ORDERS),
+]
+ENDPOINT_WEIGHTS = {
+    "get_account": {REQUEST_WEIGHT: 5},
+    "get_my_trades": {REQUEST_WEIGHT: 5},
+    "create_order": {REQUEST_WEIGHT: 1, ORDERS: 1},
+}
+# get_open_orders weighs 1 with a symbol, and this without one.
+OPEN_ORDERS_ALL_SYMBOLS_WEIGHT = 40
+
+
+class BinanceRESTAPIException(BinanceAPIException):
+    """
+    A BinanceAPIException raised from an aiohttp response, so the existing python-binance error handling (e.code,
+    e.message) applies to both clients.
+    """
+    def __init__(self, status_code: int, body: Any):
+        # BinanceAPIException.__init__() reads a requests response, set the same fields from the parsed body instead.
+        self.status_code: int = status_code
+        self.body: Any = body
+        self.response = None
+        self.request = None
+        if isinstance(body, dict) and "code" in body:
+            self.code = body["code"]
+            self.message = body.get("msg")
+        else:
+            self.code = 0
+            self.message = f"Invalid JSON error message from Binance: {body}"
+
+
+class BinanceRESTClient:
+    """
+    Signed Binance REST client on the shared keep-alive aiohttp sessions, for the endpoints the connectors use. It
+    follows python-binance's Client: the same endpoints, method names and keyword parameters, the same signing and
+    the same exceptions, but the requests run on the event loop instead of in a thread pool.
+
+    Signed requests are timestamped with time_func(), BinanceTime's server adjusted clock by default.
+    """
+    API_URL = "https://api.binance.{}/api"
+    WITHDRAW_API_URL = "https://api.binance.{}/wapi"
+    PUBLIC_API_VERSION = "v1"
+    PRIVATE_API_VERSION = "v3"
+    WITHDRAW_API_VERSION = "v3"
+    REQUEST_TIMEOUT = 10.0
+
+    _brc_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._brc_logger is None:
+            cls._brc_logger = logging.getLogger(__name__)
+        return cls._brc_logger
+
+    def __init__(self,
+                 api_key: Optional[str],
+                 api_secret: Optional[str],
+                 tld: str = "com",
+                 time_func: Optional[Callable[[], float]] = None,
+                 request_timeout: float = REQUEST_TIMEOUT):
+        self.API_URL = self.API_URL.format(tld)
+        self.WITHDRAW_API_URL = self.WITHDRAW_API_URL.format(tld)
+        self._api_key: Optional[str] = api_key
+        self._api_secret: Optional[str] = api_secret
+        self._time_func: Callable[[], float] = time_func or BinanceTime.get_instance().time
+        self._request_timeout: aiohttp.ClientTimeout = aiohttp.ClientTimeout(total=request_timeout)
+
+    @property
+    def api_key(self) -> Optional[str]:
+        return self._api_key
+
+    def _sign(self, query: str) -> str:
+        return hmac.new(self._api_secret.encode("utf-8"), query.encode("utf-8"), hashlib.sha256).hexdigest()
+
+    async def request(self,
+                      method: str,
+                      url: str,
+                      params: Optional[Dict[str, Any]] = None,
+                      signed: bool = False) -> Any:
+        """
+        Sends the parameters, sorted by name and without the None values, as the query string. Signed requests get
+        a timestamp, unless the parameters have one already, and the signature as the last parameter.
+        """
+        params = {key: value for key, value in (params or {}).items() if value is not None}
+        if signed and "timestamp" not in params:
+            params["timestamp"] = int(self._time_func() * 1e3)
+        query: str = urlencode(sorted(params.items()))
+        if signed:
+            query = f"{query}&signature={self._sign(query)}"
+        headers: Dict[str, str] = {"Accept": "application/json"}
+        if self._api_key is not None:
+            headers["X-MBX-APIKEY"] = self._api_key
+
+        async with shared_client().request(method,
+                                           f"{url}?{query}" if len(query) > 0 else url,
+                                           headers=headers,
+                                           timeout=self._request_timeout) as response:
+            response_text: str = await response.text()
+            try:
+                body: Any = ujson.loads(response_text)
+            except ValueError:
+                body = response_text
+            if not 200 <= response.status < 300:
+                raise BinanceRESTAPIException(response.status, body)
+            if body is response_text:
+                raise BinanceRequestException(f"Invalid Response: {response_text}")
+            return body
+
+    def _api_url(self, path: str, signed: bool) -> str:
+        return f"{self.API_URL}/{self.PRIVATE_API_VERSION if signed else self.PUBLIC_API_VERSION}/{path}"
+
+    async def _get(self, path: str, signed: bool = False, **params) -> Any:
+        return await self.request("GET", self._api_url(path, signed), params, signed=signed)
+
+    async def ping(self) -> Dict[str, Any]:
+        return await self._get("ping")
+
+    async def get_server_time(self) -> Dict[str, Any]:
+        return await self._get("time")
+
+    async def get_exchange_info(self) -> Dict[str, Any]:
+        return await self._get("exchangeInfo")
+
+    async def get_account(self, **params) -> Dict[str, Any]:
+        return await self._get("account", True, **params)
+
+    async def get_trade_fee(self, **params) -> Dict[str, Any]:
+        result: Dict[str, Any] = await self.request("GET",
+                                                    f"{self.WITHDRAW_API_URL}/{self.WITHDRAW_API_VERSION}/tradeFee.html",
+                                                    params,
+                                                    signed=True)
+        if not result.get("success"):
+            raise BinanceWithdrawException(result.get("msg"))
+        return result
+
+    async def get_my_trades(self, **params) -> List[Dict[str, Any]]:
+        return await self._get("myTrades", True, **params)
+
+    async def get_order(self, **params) -> Dict[str, Any]:
+        return await self._get("order", True, **params)
+
+    async def get_open_orders(self, **params) -> List[Dict[str, Any]]:
+        return await self._get("openOrders", True, **params)
+
+    async def create_order(self, **params) -> Dict[str, Any]:
+        return await self.request("POST", self._api_url("order", True), params, signed=True)
+
+    async def cancel_order(self, **params) -> Dict[str, Any]:
+        return await self.request("DELETE", self._api_url("order", True), params, signed=True)
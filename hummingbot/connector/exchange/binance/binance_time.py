@@ -1,4 +1,3 @@
-import aiohttp
 import asyncio
 from collections import deque
 import logging
@@ -8,6 +7,7 @@ from typing import Dict, Deque, Optional
 
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.http_session_registry import shared_client
 
 
 class BinanceTime:
@@ -99,7 +99,7 @@ class BinanceTime:
     async def update_server_time_offset(self):
         try:
             local_before_ms: float = time.perf_counter() * 1e3
-            async with aiohttp.ClientSession() as session:
+            async with shared_client() as session:
                 async with session.get(self.BINANCE_TIME_API) as resp:
                     resp_data: Dict[str, float] = await resp.json()
                     binance_server_time_ms: float = float(resp_data["serverTime"])
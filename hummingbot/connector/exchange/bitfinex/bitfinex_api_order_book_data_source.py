@@ -52,6 +52,10 @@ from hummingbot.connector.exchange.bitfinex.bitfinex_order_book_message import \
     BitfinexOrderBookMessage
 from hummingbot.connector.exchange.bitfinex.bitfinex_order_book_tracker_entry import \
     BitfinexOrderBookTrackerEntry
+from hummingbot.core.utils.http_session_registry import (
+    HTTPSessionRegistry,
+    shared_client,
+)
 
 BOOK_RET_TYPE = List[Dict[str, Any]]
 RESPONSE_SUCCESS = 200
@@ -103,7 +107,7 @@ class BitfinexAPIOrderBookDataSource(OrderBookTrackerDataSource):
     @staticmethod
     async def fetch_trading_pairs() -> List[str]:
         try:
-            async with aiohttp.ClientSession() as client:
+            async with shared_client() as client:
                 async with client.get("https://api-pub.bitfinex.com/v2/conf/pub:list:pair:exchange", timeout=10) as response:
                     if response.status == 200:
                         data = await response.json()
@@ -279,7 +283,7 @@ class BitfinexAPIOrderBookDataSource(OrderBookTrackerDataSource):
     @classmethod
     @async_ttl_cache(ttl=REQUEST_TTL, maxsize=CACHE_SIZE)
     async def get_active_exchange_markets(cls) -> pd.DataFrame:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client() as client:
             tickers_response, exchange_conf_response, symbol_details_response = await safe_gather(
                 client.get(f"{BITFINEX_REST_URL}/tickers?symbols=ALL"),
                 client.get(f"{BITFINEX_REST_URL}/conf/pub:info:pair"),
@@ -372,7 +376,7 @@ class BitfinexAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     @classmethod
     async def get_last_traded_price(cls, trading_pair: str) -> float:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client() as client:
             # https://api-pub.bitfinex.com/v2/ticker/tBTCUSD
             ticker_url: str = join_paths(BITFINEX_REST_URL, f"ticker/{convert_to_exchange_trading_pair(trading_pair)}")
             resp = await client.get(ticker_url)
@@ -403,7 +407,7 @@ class BitfinexAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
         return self._trading_pairs
 
-    async def get_snapshot(self, client: aiohttp.ClientSession, trading_pair: str) -> Dict[str, Any]:
+    async def get_snapshot(self, client: HTTPSessionRegistry, trading_pair: str) -> Dict[str, Any]:
         request_url: str = f"{BITFINEX_REST_URL}/book/{convert_to_exchange_trading_pair(trading_pair)}/P0"
         # by default it's = 50, 25 asks + 25 bids.
         # set 100: 100 asks + 100 bids
@@ -422,7 +426,7 @@ class BitfinexAPIOrderBookDataSource(OrderBookTrackerDataSource):
             return self._prepare_snapshot(trading_pair, [BookStructure(*i) for i in raw_data])
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client() as client:
             snapshot: Dict[str, any] = await self.get_snapshot(client, trading_pair)
             snapshot_timestamp: float = time.time()
             snapshot_msg: OrderBookMessage = BitfinexOrderBook.snapshot_message_from_exchange(
@@ -441,7 +445,7 @@ class BitfinexAPIOrderBookDataSource(OrderBookTrackerDataSource):
         trading_pairs: List[str] = await self.get_trading_pairs()
         number_of_pairs: int = len(trading_pairs)
 
-        async with aiohttp.ClientSession() as client:
+        async with shared_client() as client:
             for idx, trading_pair in enumerate(trading_pairs):
                 try:
                     snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair)
@@ -570,7 +574,7 @@ class BitfinexAPIOrderBookDataSource(OrderBookTrackerDataSource):
             trading_pairs: List[str] = await self.get_trading_pairs()
 
             try:
-                async with aiohttp.ClientSession() as client:
+                async with shared_client() as client:
                     for trading_pair in trading_pairs:
                         try:
                             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair)
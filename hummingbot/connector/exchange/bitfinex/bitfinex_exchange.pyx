@@ -8,7 +8,6 @@ import uuid
 from decimal import Decimal
 from typing import Optional, List, Dict, Any, AsyncIterable, Tuple
 
-import aiohttp
 import pandas as pd
 from async_timeout import timeout
 from libc.stdint cimport int64_t
@@ -63,6 +62,10 @@ from hummingbot.connector.exchange.bitfinex.bitfinex_utils import (
     convert_from_exchange_trading_pair,
     convert_to_exchange_trading_pair,
 )
+from hummingbot.core.utils.http_session_registry import (
+    HTTPSessionRegistry,
+    shared_client,
+)
 
 s_logger = None
 s_decimal_0 = Decimal(0)
@@ -505,12 +508,12 @@ cdef class BitfinexExchange(ExchangeBase):
 
         return None
 
-    async def _http_client(self) -> aiohttp.ClientSession:
+    async def _http_client(self) -> HTTPSessionRegistry:
         """
         :returns: Shared client session instance
         """
         if self._shared_client is None:
-            self._shared_client = aiohttp.ClientSession()
+            self._shared_client = shared_client()
         return self._shared_client
 
     cdef object c_get_order_size_quantum(self, str trading_pair, object order_size):
@@ -24,6 +24,10 @@ from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTr
 from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.exchange.bittrex.bittrex_active_order_tracker import BittrexActiveOrderTracker
 from hummingbot.connector.exchange.bittrex.bittrex_order_book import BittrexOrderBook
+from hummingbot.core.utils.http_session_registry import (
+    HTTPSessionRegistry,
+    shared_client,
+)
 
 
 EXCHANGE_NAME = "Bittrex"
@@ -60,7 +64,7 @@ class BittrexAPIOrderBookDataSource(OrderBookTrackerDataSource):
     @classmethod
     async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
         results = dict()
-        async with aiohttp.ClientSession() as client:
+        async with shared_client() as client:
             resp = await client.get(f"{BITTREX_REST_URL}{BITTREX_TICKER_PATH}")
             resp_json = await resp.json()
             for trading_pair in trading_pairs:
@@ -69,7 +73,7 @@ class BittrexAPIOrderBookDataSource(OrderBookTrackerDataSource):
         return results
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client() as client:
             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair)
             snapshot_timestamp: float = time.time()
             snapshot_msg: OrderBookMessage = BittrexOrderBook.snapshot_message_from_exchange(
@@ -118,7 +122,7 @@ class BittrexAPIOrderBookDataSource(OrderBookTrackerDataSource):
     @staticmethod
     async def fetch_trading_pairs() -> List[str]:
         try:
-            async with aiohttp.ClientSession() as client:
+            async with shared_client() as client:
                 async with client.get(f"{BITTREX_REST_URL}{BITTREX_EXCHANGE_INFO_PATH}", timeout=5) as response:
                     if response.status == 200:
                         all_trading_pairs: List[Dict[str, Any]] = await response.json()
@@ -131,7 +135,7 @@ class BittrexAPIOrderBookDataSource(OrderBookTrackerDataSource):
         return []
 
     @staticmethod
-    async def get_snapshot(client: aiohttp.ClientSession, trading_pair: str) -> Dict[str, Any]:
+    async def get_snapshot(client: HTTPSessionRegistry, trading_pair: str) -> Dict[str, Any]:
         # Creates/Reuses connection to obtain a single snapshot of the trading_pair
         params = {"depth": 25}
         async with client.get(f"{BITTREX_REST_URL}{BITTREX_EXCHANGE_INFO_PATH}/{trading_pair}/orderbook", params=params) as response:
@@ -237,7 +241,7 @@ class BittrexAPIOrderBookDataSource(OrderBookTrackerDataSource):
         # Technically this does not listen for snapshot, Instead it periodically queries for snapshots.
         while True:
             try:
-                async with aiohttp.ClientSession() as client:
+                async with shared_client() as client:
                     for trading_pair in self._trading_pairs:
                         try:
                             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair)
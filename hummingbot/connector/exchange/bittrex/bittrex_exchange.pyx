@@ -3,7 +3,6 @@ import logging
 from decimal import Decimal
 from typing import Optional, List, Dict, Any, AsyncIterable
 
-import aiohttp
 import pandas as pd
 from async_timeout import timeout
 from libc.stdint cimport int64_t
@@ -33,6 +32,10 @@ from hummingbot.connector.trading_rule cimport TradingRule
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 from hummingbot.core.utils.estimate_fee import estimate_fee
 from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.core.utils.http_session_registry import (
+    HTTPSessionRegistry,
+    shared_client,
+)
 
 bm_logger = None
 s_decimal_0 = Decimal(0)
@@ -967,9 +970,9 @@ cdef class BittrexExchange(ExchangeBase):
         failed_cancellation = [CancellationResult(oid, False) for oid in order_id_set]
         return successful_cancellation + failed_cancellation
 
-    async def _http_client(self) -> aiohttp.ClientSession:
+    async def _http_client(self) -> HTTPSessionRegistry:
         if self._shared_client is None:
-            self._shared_client = aiohttp.ClientSession()
+            self._shared_client = shared_client()
         return self._shared_client
 
     async def _api_request(self,
@@ -9,7 +9,6 @@ from typing import (
 from decimal import Decimal
 import asyncio
 import json
-import aiohttp
 import math
 import time
 
@@ -42,6 +41,11 @@ from hummingbot.connector.exchange.crypto_com.crypto_com_in_flight_order import
 from hummingbot.connector.exchange.crypto_com import crypto_com_utils
 from hummingbot.connector.exchange.crypto_com import crypto_com_constants as Constants
 from hummingbot.core.data_type.common import OpenOrder
+from hummingbot.core.utils.http_session_registry import (
+    HTTPSessionRegistry,
+    shared_client,
+)
+
 ctce_logger = None
 s_decimal_NaN = Decimal("nan")
 
@@ -226,12 +230,12 @@ class CryptoComExchange(ExchangeBase):
             return NetworkStatus.NOT_CONNECTED
         return NetworkStatus.CONNECTED
 
-    async def _http_client(self) -> aiohttp.ClientSession:
+    async def _http_client(self) -> HTTPSessionRegistry:
         """
         :returns Shared client session instance
         """
         if self._shared_client is None:
-            self._shared_client = aiohttp.ClientSession()
+            self._shared_client = shared_client()
         return self._shared_client
 
     async def _trading_rules_polling_loop(self):
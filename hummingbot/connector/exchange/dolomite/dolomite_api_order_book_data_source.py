@@ -23,6 +23,10 @@ from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTr
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.data_type.order_book_tracker_entry import OrderBookTrackerEntry
 from hummingbot.connector.exchange.dolomite.dolomite_order_book_message import DolomiteOrderBookMessage
+from hummingbot.core.utils.http_session_registry import (
+    HTTPSessionRegistry,
+    shared_client,
+)
 
 
 MARKETS_URL = "/v1/markets"
@@ -59,7 +63,7 @@ class DolomiteAPIOrderBookDataSource(OrderBookTrackerDataSource):
         """
         Returned data frame should have trading pair as index and include usd volume, baseAsset and quoteAsset
         """
-        async with aiohttp.ClientSession() as client:
+        async with shared_client() as client:
             # Hard coded to use the live exchange api for auto completing markets (opposed to using testnet)
             markets_response: aiohttp.ClientResponse = await client.get(
                 f"https://exchange-api.dolomite.io{MARKETS_URL}"
@@ -102,7 +106,7 @@ class DolomiteAPIOrderBookDataSource(OrderBookTrackerDataSource):
     async def fetch_trading_pairs() -> List[str]:
         try:
             from hummingbot.connector.exchange.dolomite.dolomite_utils import convert_from_exchange_trading_pair
-            async with aiohttp.ClientSession() as client:
+            async with shared_client() as client:
                 async with client.get("https://exchange-api.dolomite.io/v1/markets", timeout=10) as response:
                     if response.status == 200:
                         all_trading_pairs: Dict[str, Any] = await response.json()
@@ -131,7 +135,7 @@ class DolomiteAPIOrderBookDataSource(OrderBookTrackerDataSource):
             trading_pairs: List[str] = self._trading_pairs
         return trading_pairs
 
-    async def get_snapshot(self, client: aiohttp.ClientSession, trading_pair: str, level: int = 3) -> Dict[str, any]:
+    async def get_snapshot(self, client: HTTPSessionRegistry, trading_pair: str, level: int = 3) -> Dict[str, any]:
         async with client.get(f"{self.REST_URL}{SNAPSHOT_URL}".replace(":trading_pair", trading_pair)) as response:
             response: aiohttp.ClientResponse = response
             if response.status != 200:
@@ -143,7 +147,7 @@ class DolomiteAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     async def get_tracking_pairs(self) -> Dict[str, OrderBookTrackerEntry]:
         # Get the currently active markets
-        async with aiohttp.ClientSession() as client:
+        async with shared_client() as client:
             trading_pairs: List[str] = await self.get_trading_pairs()
             retval: Dict[str, DolomiteOrderBookTrackerEntry] = {}
             number_of_pairs: int = len(trading_pairs)
@@ -1,4 +1,3 @@
-import aiohttp
 import asyncio
 import binascii
 import json
@@ -54,6 +53,7 @@ from hummingbot.connector.exchange.dolomite.dolomite_util import (
     DolomiteExchangeInfo
 )
 from hummingbot.core.utils.estimate_fee import estimate_fee
+from hummingbot.core.utils.http_session_registry import shared_client
 
 s_logger = None
 s_decimal_0 = Decimal(0)
@@ -754,7 +754,7 @@ cdef class DolomiteExchange(ExchangeBase):
                           headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
 
         if self._shared_client is None:
-            self._shared_client = aiohttp.ClientSession()
+            self._shared_client = shared_client()
 
         if data is not None and http_method == "POST":
             data = json.dumps(data).encode('utf8')
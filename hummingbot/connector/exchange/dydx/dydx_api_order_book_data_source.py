@@ -27,6 +27,10 @@ from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTr
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
+from hummingbot.core.utils.http_session_registry import (
+    HTTPSessionRegistry,
+    shared_client,
+)
 
 
 MARKETS_URL = "/markets"
@@ -77,7 +81,7 @@ class DydxAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     @classmethod
     async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client() as client:
             resp = await client.get(f"{DYDX_V1_API_URL}{TICKER_URL}")
             resp_json = await resp.json()
             retval = {}
@@ -93,7 +97,7 @@ class DydxAPIOrderBookDataSource(OrderBookTrackerDataSource):
     def trading_pairs(self) -> List[str]:
         return self._trading_pairs
 
-    async def get_snapshot(self, client: aiohttp.ClientSession, trading_pair: str, level: int = 0) -> Dict[str, any]:
+    async def get_snapshot(self, client: HTTPSessionRegistry, trading_pair: str, level: int = 0) -> Dict[str, any]:
         async with client.get(f"{DYDX_V1_API_URL}{SNAPSHOT_URL}/{trading_pair}") as response:
             response: aiohttp.ClientResponse = response
             if response.status != 200:
@@ -105,7 +109,7 @@ class DydxAPIOrderBookDataSource(OrderBookTrackerDataSource):
             return data
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client() as client:
             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair, 1000)
             snapshot_timestamp: float = time.time()
             snapshot_msg: OrderBookMessage = DydxOrderBook.snapshot_message_from_exchange(
@@ -158,7 +162,7 @@ class DydxAPIOrderBookDataSource(OrderBookTrackerDataSource):
     @staticmethod
     async def fetch_trading_pairs() -> List[str]:
         try:
-            async with aiohttp.ClientSession() as client:
+            async with shared_client() as client:
                 async with client.get(DYDX_MARKET_INFO_URL.format(""), timeout=5) as response:
                     if response.status == 200:
                         all_trading_pairs: Dict[str, Any] = await response.json()
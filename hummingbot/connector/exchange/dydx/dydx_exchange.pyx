@@ -1,4 +1,3 @@
-import aiohttp
 import asyncio
 import binascii
 import json
@@ -61,6 +60,7 @@ from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.trading_rule cimport TradingRule
 from hummingbot.core.utils.estimate_fee import estimate_fee
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
+from hummingbot.core.utils.http_session_registry import shared_client
 
 s_logger = None
 s_decimal_0 = Decimal(0)
@@ -974,7 +974,7 @@ cdef class DydxExchange(ExchangeBase):
                           secure: bool = False) -> Dict[str, Any]:
 
         if self._shared_client is None:
-            self._shared_client = aiohttp.ClientSession()
+            self._shared_client = shared_client()
 
         if data is not None and http_method == "POST":
             data = json.dumps(data).encode('utf8')
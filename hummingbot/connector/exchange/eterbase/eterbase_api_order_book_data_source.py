@@ -27,6 +27,10 @@ import hummingbot.connector.exchange.eterbase.eterbase_constants as constants
 from hummingbot.connector.exchange.eterbase.eterbase_utils import (
     convert_to_exchange_trading_pair,
     convert_from_exchange_trading_pair)
+from hummingbot.core.utils.http_session_registry import (
+    HTTPSessionRegistry,
+    shared_client,
+)
 
 MAX_RETRIES = 20
 NaN = float("nan")
@@ -53,7 +57,7 @@ class EterbaseAPIOrderBookDataSource(OrderBookTrackerDataSource):
     @classmethod
     async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
         results = dict()
-        async with aiohttp.ClientSession() as client:
+        async with shared_client() as client:
             resp = await client.get(f"{constants.REST_URL}/tickers")
             resp_json = await resp.json()
             for trading_pair in trading_pairs:
@@ -68,7 +72,7 @@ class EterbaseAPIOrderBookDataSource(OrderBookTrackerDataSource):
         *required
         Returns all currently active BTC trading pairs from Eterbase, sorted by volume in descending order.
         """
-        async with aiohttp.ClientSession() as client:
+        async with shared_client() as client:
             async with client.get(f"{constants.REST_URL}/markets") as products_response:
                 products_response: aiohttp.ClientResponse = products_response
                 if products_response.status != 200:
@@ -156,7 +160,7 @@ class EterbaseAPIOrderBookDataSource(OrderBookTrackerDataSource):
         """
         """
         tp_map_mid: Dict[str, str] = {}
-        async with aiohttp.ClientSession() as client:
+        async with shared_client() as client:
             async with client.get(f"{constants.REST_URL}/markets") as products_response:
                 products_response: aiohttp.ClientResponse = products_response
                 if products_response.status != 200:
@@ -171,7 +175,7 @@ class EterbaseAPIOrderBookDataSource(OrderBookTrackerDataSource):
         try:
             from hummingbot.connector.exchange.eterbase.eterbase_utils import convert_from_exchange_trading_pair
 
-            async with aiohttp.ClientSession() as client:
+            async with shared_client() as client:
                 async with client.get("https://api.eterbase.exchange/api/markets", timeout=10) as response:
                     if response.status == 200:
                         markets = await response.json()
@@ -189,7 +193,7 @@ class EterbaseAPIOrderBookDataSource(OrderBookTrackerDataSource):
         return []
 
     @staticmethod
-    async def get_snapshot(client: aiohttp.ClientSession, trading_pair: str) -> Dict[str, any]:
+    async def get_snapshot(client: HTTPSessionRegistry, trading_pair: str) -> Dict[str, any]:
         """
         Fetches order book snapshot for a particular trading pair from the rest API
         :returns: Response from the rest API
@@ -207,7 +211,7 @@ class EterbaseAPIOrderBookDataSource(OrderBookTrackerDataSource):
             return data
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client() as client:
             td_map_id: Dict[str, str] = await self.get_map_marketid()
             snapshot: Dict[str, any] = await self.get_snapshot(client, trading_pair)
             snapshot_timestamp: float = time.time()
@@ -315,7 +319,7 @@ class EterbaseAPIOrderBookDataSource(OrderBookTrackerDataSource):
         while True:
             try:
                 trading_pairs: List[str] = self._trading_pairs
-                async with aiohttp.ClientSession() as client:
+                async with shared_client() as client:
                     for trading_pair in trading_pairs:
                         try:
                             snapshot: Dict[str, any] = await self.get_snapshot(client, trading_pair)
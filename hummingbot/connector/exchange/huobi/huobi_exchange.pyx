@@ -57,6 +57,10 @@ from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.connector.exchange.huobi.huobi_user_stream_tracker import HuobiUserStreamTracker
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 from hummingbot.core.utils.estimate_fee import estimate_fee
+from hummingbot.core.utils.http_session_registry import (
+    HTTPSessionRegistry,
+    shared_client,
+)
 
 hm_logger = None
 s_decimal_0 = Decimal(0)
@@ -178,7 +182,7 @@ cdef class HuobiExchange(ExchangeBase):
         return self._shared_client
 
     @shared_client.setter
-    def shared_client(self, client: aiohttp.ClientSession):
+    def shared_client(self, client: HTTPSessionRegistry):
         self._shared_client = client
 
     async def get_active_exchange_markets(self) -> pd.DataFrame:
@@ -236,9 +240,9 @@ cdef class HuobiExchange(ExchangeBase):
                 self._poll_notifier.set()
         self._last_timestamp = timestamp
 
-    async def _http_client(self) -> aiohttp.ClientSession:
+    async def _http_client(self) -> HTTPSessionRegistry:
         if self._shared_client is None:
-            self._shared_client = aiohttp.ClientSession()
+            self._shared_client = shared_client()
         return self._shared_client
 
     async def _api_request(self,
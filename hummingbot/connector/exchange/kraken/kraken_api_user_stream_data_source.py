@@ -1,7 +1,6 @@
 #!/usr/bin/env python
 
 import asyncio
-import aiohttp
 import logging
 from typing import (
     AsyncIterable,
@@ -16,6 +15,10 @@ from hummingbot.core.data_type.user_stream_tracker_data_source import UserStream
 from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.exchange.kraken.kraken_auth import KrakenAuth
 from hummingbot.connector.exchange.kraken.kraken_order_book import KrakenOrderBook
+from hummingbot.core.utils.http_session_registry import (
+    HTTPSessionRegistry,
+    shared_client,
+)
 
 KRAKEN_WS_URL = "wss://ws-auth.kraken.com/"
 
@@ -38,7 +41,6 @@ class KrakenAPIUserStreamDataSource(UserStreamTrackerDataSource):
 
     def __init__(self, kraken_auth: KrakenAuth):
         self._kraken_auth: KrakenAuth = kraken_auth
-        self._shared_client: Optional[aiohttp.ClientSession] = None
         self._current_auth_token: Optional[str] = None
         self._last_recv_time: float = 0
         super().__init__()
@@ -56,7 +58,7 @@ class KrakenAPIUserStreamDataSource(UserStreamTrackerDataSource):
 
         url: str = KRAKEN_ROOT_API + GET_TOKEN_URI
 
-        client: aiohttp.ClientSession = await self._http_client()
+        client: HTTPSessionRegistry = await self._http_client()
 
         response_coro = client.request(
             method="POST",
@@ -121,10 +123,8 @@ class KrakenAPIUserStreamDataSource(UserStreamTrackerDataSource):
                 self._current_auth_token = None
                 await asyncio.sleep(30.0)
 
-    async def _http_client(self) -> aiohttp.ClientSession:
-        if self._shared_client is None or self._shared_client.closed:
-            self._shared_client = aiohttp.ClientSession()
-        return self._shared_client
+    async def _http_client(self) -> HTTPSessionRegistry:
+        return shared_client()
 
     async def _inner_messages(self,
                               ws: websockets.WebSocketClientProtocol) -> AsyncIterable[str]:
@@ -153,7 +153,3 @@ class KrakenAPIUserStreamDataSource(UserStreamTrackerDataSource):
             return
         finally:
             await ws.close()
-
-    async def stop(self):
-        if self._shared_client is not None and not self._shared_client.closed:
-            await self._shared_client.close()
@@ -1,5 +1,4 @@
 from libc.stdint cimport int64_t, int32_t
-import aiohttp
 import asyncio
 from async_timeout import timeout
 from decimal import Decimal
@@ -13,7 +12,11 @@ from typing import (
     AsyncIterable,
     Optional,
 )
-from hummingbot.core.utils.asyncio_throttle import Throttler
+from hummingbot.core.utils.asyncio_throttle import (
+    RateLimit,
+    REQUEST_WEIGHT,
+    Throttler,
+)
 import copy
 from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler
 from hummingbot.core.clock cimport Clock
@@ -56,6 +59,10 @@ from hummingbot.core.data_type.transaction_tracker import TransactionTracker
 from hummingbot.connector.trading_rule cimport TradingRule
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 from hummingbot.core.utils.estimate_fee import estimate_fee
+from hummingbot.core.utils.http_session_registry import (
+    HTTPSessionRegistry,
+    shared_client,
+)
 
 s_logger = None
 s_decimal_0 = Decimal(0)
@@ -69,6 +76,19 @@ QUERY_ORDERS_URI = "/0/private/QueryOrders"
 ASSET_PAIRS_URI = "https://api.kraken.com/0/public/AssetPairs"
 TIME_URL = "https://api.kraken.com/0/public/Time"
 
+# Kraken's private API call counter, at its starter tier: at most 15, decreasing by 1 every 3 seconds. Placing and
+# cancelling orders doesn't increase the counter.
+API_COUNTER = "API_COUNTER"
+RATE_LIMITS = [
+    RateLimit(10, 1.0),
+    RateLimit(15, 45.0, API_COUNTER),
+]
+ENDPOINT_WEIGHTS = {
+    BALANCE_URI: {REQUEST_WEIGHT: 1, API_COUNTER: 1},
+    OPEN_ORDERS_URI: {REQUEST_WEIGHT: 1, API_COUNTER: 1},
+    QUERY_ORDERS_URI: {REQUEST_WEIGHT: 1, API_COUNTER: 1},
+}
+
 
 cdef class KrakenExchangeTransactionTracker(TransactionTracker):
     cdef:
@@ -134,7 +154,7 @@ cdef class KrakenExchange(ExchangeBase):
         self._user_stream_event_listener_task = None
         self._trading_rules_polling_task = None
         self._async_scheduler = AsyncCallScheduler(call_interval=0.5)
-        self._throttler = Throttler(rate_limit = (10.0, 1.0))
+        self._throttler = Throttler(rate_limits=RATE_LIMITS, endpoint_weights=ENDPOINT_WEIGHTS)
         self._last_pull_timestamp = 0
         self._shared_client = None
         self._asset_pairs = {}
@@ -658,9 +678,9 @@ cdef class KrakenExchange(ExchangeBase):
         self._last_userref += 1
         return self._last_userref
 
-    async def _http_client(self) -> aiohttp.ClientSession:
+    async def _http_client(self) -> HTTPSessionRegistry:
         if self._shared_client is None:
-            self._shared_client = aiohttp.ClientSession()
+            self._shared_client = shared_client()
         return self._shared_client
 
     async def _api_request(self,
@@ -670,7 +690,7 @@ cdef class KrakenExchange(ExchangeBase):
                            data: Optional[Dict[str, Any]] = None,
                            is_auth_required: bool = False,
                            request_weight: int = 1) -> Dict[str, Any]:
-        async with self._throttler.weighted_task(request_weight=request_weight):
+        async with self._throttler.weighted_task(request_weight=request_weight, endpoint=path_url):
             url = KRAKEN_ROOT_API + path_url
 
             client = await self._http_client()
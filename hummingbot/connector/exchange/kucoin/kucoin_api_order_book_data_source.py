@@ -33,6 +33,10 @@ from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.exchange.kucoin.kucoin_order_book import KucoinOrderBook
 from hummingbot.connector.exchange.kucoin.kucoin_active_order_tracker import KucoinActiveOrderTracker
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.http_session_registry import (
+    HTTPSessionRegistry,
+    shared_client,
+)
 
 SNAPSHOT_REST_URL = "https://api.kucoin.com/api/v2/market/orderbook/level2"
 DIFF_STREAM_URL = ""
@@ -95,7 +99,7 @@ class KucoinWSConnectionIterator:
 
     @staticmethod
     async def get_ws_connection_context() -> WSConnectionContext:
-        async with aiohttp.ClientSession() as session:
+        async with shared_client() as session:
             async with session.post('https://api.kucoin.com/api/v1/bullet-public', data=b'') as resp:
                 response: aiohttp.ClientResponse = resp
                 if response.status != 200:
@@ -298,7 +302,7 @@ class KucoinAPIOrderBookDataSource(OrderBookTrackerDataSource):
     @classmethod
     async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
         results = dict()
-        async with aiohttp.ClientSession() as client:
+        async with shared_client() as client:
             resp = await client.get(TICKER_PRICE_CHANGE_URL)
             resp_json = await resp.json()
             for trading_pair in trading_pairs:
@@ -333,7 +337,7 @@ class KucoinAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     @staticmethod
     async def fetch_trading_pairs() -> List[str]:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client() as client:
             async with client.get(EXCHANGE_INFO_URL, timeout=5) as response:
                 if response.status == 200:
                     try:
@@ -346,7 +350,7 @@ class KucoinAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 return []
 
     @staticmethod
-    async def get_snapshot(client: aiohttp.ClientSession, trading_pair: str) -> Dict[str, Any]:
+    async def get_snapshot(client: HTTPSessionRegistry, trading_pair: str) -> Dict[str, Any]:
         params: Dict = {"symbol": trading_pair}
         async with client.get(SNAPSHOT_REST_URL, params=params) as response:
             response: aiohttp.ClientResponse = response
@@ -357,7 +361,7 @@ class KucoinAPIOrderBookDataSource(OrderBookTrackerDataSource):
             return data
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client() as client:
             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair)
             snapshot_timestamp: float = time.time()
             snapshot_msg: OrderBookMessage = KucoinOrderBook.snapshot_message_from_exchange(
@@ -532,7 +536,7 @@ class KucoinAPIOrderBookDataSource(OrderBookTrackerDataSource):
         while True:
             try:
                 trading_pairs: List[str] = await self.get_trading_pairs()
-                async with aiohttp.ClientSession() as client:
+                async with shared_client() as client:
                     for trading_pair in trading_pairs:
                         try:
                             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair)
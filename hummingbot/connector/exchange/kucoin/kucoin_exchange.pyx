@@ -1,4 +1,3 @@
-import aiohttp
 import asyncio
 from decimal import Decimal
 from libc.stdint cimport int64_t
@@ -50,6 +49,10 @@ from hummingbot.connector.trading_rule cimport TradingRule
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 from hummingbot.core.utils.estimate_fee import estimate_fee
+from hummingbot.core.utils.http_session_registry import (
+    HTTPSessionRegistry,
+    shared_client,
+)
 
 km_logger = None
 s_decimal_0 = Decimal(0)
@@ -184,7 +187,7 @@ cdef class KucoinExchange(ExchangeBase):
         return self._shared_client
 
     @shared_client.setter
-    def shared_client(self, client: aiohttp.ClientSession):
+    def shared_client(self, client: HTTPSessionRegistry):
         self._shared_client = client
 
     @property
@@ -373,9 +376,9 @@ cdef class KucoinExchange(ExchangeBase):
                 self.logger().error("Unexpected error in user stream listener loop.", exc_info=True)
                 await asyncio.sleep(5.0)
 
-    async def _http_client(self) -> aiohttp.ClientSession:
+    async def _http_client(self) -> HTTPSessionRegistry:
         if self._shared_client is None:
-            self._shared_client = aiohttp.ClientSession()
+            self._shared_client = shared_client()
         return self._shared_client
 
     async def _api_request(self,
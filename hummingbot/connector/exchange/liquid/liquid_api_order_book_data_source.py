@@ -19,6 +19,10 @@ from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.exchange.liquid.liquid_order_book import LiquidOrderBook
 from hummingbot.connector.exchange.liquid.liquid_order_book_tracker_entry import LiquidOrderBookTrackerEntry
 from hummingbot.connector.exchange.liquid.constants import Constants
+from hummingbot.core.utils.http_session_registry import (
+    HTTPSessionRegistry,
+    shared_client,
+)
 
 
 class LiquidAPIOrderBookDataSource(OrderBookTrackerDataSource):
@@ -40,7 +44,7 @@ class LiquidAPIOrderBookDataSource(OrderBookTrackerDataSource):
     @classmethod
     async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
         results = dict()
-        async with aiohttp.ClientSession() as client:
+        async with shared_client() as client:
             resp = await client.get(Constants.GET_EXCHANGE_MARKETS_URL)
             resp_json = await resp.json()
             for record in resp_json:
@@ -139,7 +143,7 @@ class LiquidAPIOrderBookDataSource(OrderBookTrackerDataSource):
         |-- cfd_enabled: bool
         |-- last_event_timestamp: str
         """
-        async with aiohttp.ClientSession() as client:
+        async with shared_client() as client:
             exchange_markets_response: aiohttp.ClientResponse = await client.get(
                 Constants.GET_EXCHANGE_MARKETS_URL)
 
@@ -179,7 +183,7 @@ class LiquidAPIOrderBookDataSource(OrderBookTrackerDataSource):
     async def fetch_trading_pairs() -> List[str]:
         try:
             # Returns a List of str, representing each active trading pair on the exchange.
-            async with aiohttp.ClientSession() as client:
+            async with shared_client() as client:
                 async with client.get(f"{Constants.BASE_URL}{Constants.PRODUCTS_URI}", timeout=10) as response:
                     if response.status == 200:
                         products: List[Dict[str, Any]] = await response.json()
@@ -225,7 +229,7 @@ class LiquidAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
         return self._trading_pairs
 
-    async def get_snapshot(self, client: aiohttp.ClientSession, trading_pair: str, full: int = 1) -> Dict[str, Any]:
+    async def get_snapshot(self, client: HTTPSessionRegistry, trading_pair: str, full: int = 1) -> Dict[str, Any]:
         """
         Method designed to fetch individual trading_pair corresponded order book, aka snapshot
         param: client - aiohttp client session
@@ -253,7 +257,7 @@ class LiquidAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
         await self.get_trading_pairs()
-        async with aiohttp.ClientSession() as client:
+        async with shared_client() as client:
             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair, 1)
             snapshot_timestamp: float = time.time()
             snapshot_msg: OrderBookMessage = LiquidOrderBook.snapshot_message_from_exchange(
@@ -272,7 +276,7 @@ class LiquidAPIOrderBookDataSource(OrderBookTrackerDataSource):
         active markets
         """
         # Get the currently active markets
-        async with aiohttp.ClientSession() as client:
+        async with shared_client() as client:
 
             trading_pairs: List[str] = await self.get_trading_pairs()
 
@@ -413,7 +417,7 @@ class LiquidAPIOrderBookDataSource(OrderBookTrackerDataSource):
         while True:
             try:
                 trading_pairs: List[str] = await self.get_trading_pairs()
-                async with aiohttp.ClientSession() as client:
+                async with shared_client() as client:
                     for trading_pair in trading_pairs:
                         try:
                             snapshot: Dict[str, any] = await self.get_snapshot(client, trading_pair)
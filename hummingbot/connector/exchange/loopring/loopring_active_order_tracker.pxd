@@ -5,5 +5,6 @@ cdef class LoopringActiveOrderTracker:
     cdef object _token_config
     cdef dict _active_bids
     cdef dict _active_asks
+    cdef dict _amount_multipliers
     cdef tuple c_convert_snapshot_message_to_np_arrays(self, object message)
     cdef tuple c_convert_diff_message_to_np_arrays(self, object message)
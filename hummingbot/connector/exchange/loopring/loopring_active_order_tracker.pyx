@@ -8,6 +8,7 @@ import math
 from decimal import Decimal
 
 from hummingbot.logger import HummingbotLogger
+from hummingbot.core.data_type.order_book_entries import OrderBookEntries
 from hummingbot.core.data_type.order_book_row import ClientOrderBookRow
 from hummingbot.connector.exchange.loopring.loopring_api_token_configuration_data_source import LoopringAPITokenConfigurationDataSource
 
@@ -20,6 +21,7 @@ cdef class LoopringActiveOrderTracker:
         self._token_config: LoopringAPITokenConfigurationDataSource = token_configuration
         self._active_asks = active_asks or {}
         self._active_bids = active_bids or {}
+        self._amount_multipliers = {}
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -144,6 +146,20 @@ cdef class LoopringActiveOrderTracker:
             )
         return bids, asks
 
+    def get_amount_multiplier(self, market) -> float:
+        # Loopring sends amounts padded to the token decimals, unpad them with a single multiplication.
+        if market not in self._amount_multipliers:
+            tokenid = self._token_config.get_tokenid(market.split('-')[0])
+            self._amount_multipliers[market] = float(self._token_config.unpad("1", tokenid))
+        return self._amount_multipliers[market]
+
+    def convert_diff_message_to_entries(self, message) -> OrderBookEntries:
+        content = message.content
+        return OrderBookEntries.from_exchange_rows(content["data"]["bids"],
+                                                   content["data"]["asks"],
+                                                   content["endVersion"],
+                                                   self.get_amount_multiplier(content["topic"]["market"]))
+
     def convert_diff_message_to_order_book_row(self, message):
         np_bids, np_asks = self.c_convert_diff_message_to_np_arrays(message)
         bids_row = [ClientOrderBookRow(price, qty, update_id) for ts, price, qty, update_id in np_bids]
@@ -31,6 +31,10 @@ from hummingbot.logger import HummingbotLogger
 # from hummingbot.connector.exchange.loopring.loopring_order_book_message import LoopringOrderBookMessage
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
+from hummingbot.core.utils.http_session_registry import (
+    HTTPSessionRegistry,
+    shared_client,
+)
 
 
 MARKETS_URL = "/api/v2/exchange/markets"
@@ -64,7 +68,7 @@ class LoopringAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     @classmethod
     async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client() as client:
             resp = await client.get(f"https://api.loopring.io{TICKER_URL}".replace(":markets", ",".join(trading_pairs)))
             resp_json = await resp.json()
             return {x[0]: float(x[7]) for x in resp_json.get("data", [])}
@@ -77,7 +81,7 @@ class LoopringAPIOrderBookDataSource(OrderBookTrackerDataSource):
     def trading_pairs(self) -> List[str]:
         return self._trading_pairs
 
-    async def get_snapshot(self, client: aiohttp.ClientSession, trading_pair: str, level: int = 0) -> Dict[str, any]:
+    async def get_snapshot(self, client: HTTPSessionRegistry, trading_pair: str, level: int = 0) -> Dict[str, any]:
         async with client.get(f"https://api.loopring.io{SNAPSHOT_URL}&level={level}".replace(":trading_pair", trading_pair)) as response:
             response: aiohttp.ClientResponse = response
             if response.status != 200:
@@ -89,7 +93,7 @@ class LoopringAPIOrderBookDataSource(OrderBookTrackerDataSource):
             return data
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client() as client:
             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair, 1000)
             snapshot_timestamp: float = time.time()
             snapshot_msg: OrderBookMessage = LoopringOrderBook.snapshot_message_from_exchange(
@@ -136,7 +140,7 @@ class LoopringAPIOrderBookDataSource(OrderBookTrackerDataSource):
     @staticmethod
     async def fetch_trading_pairs() -> List[str]:
         try:
-            async with aiohttp.ClientSession() as client:
+            async with shared_client() as client:
                 async with client.get(f"https://api.loopring.io{MARKETS_URL}", timeout=5) as response:
                     if response.status == 200:
                         all_trading_pairs: Dict[str, Any] = await response.json()
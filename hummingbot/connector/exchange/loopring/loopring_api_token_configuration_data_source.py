@@ -12,6 +12,7 @@ from typing import (
 
 from hummingbot.core.event.events import TradeType
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.http_session_registry import shared_client
 
 TOKEN_CONFIGURATIONS_URL = '/api/v2/exchange/tokens'
 
@@ -36,7 +37,7 @@ class LoopringAPITokenConfigurationDataSource():
         return configuration_data_source
 
     async def _configure(self):
-        async with aiohttp.ClientSession() as client:
+        async with shared_client() as client:
             response: aiohttp.ClientResponse = await client.get(
                 f"https://api.loopring.io{TOKEN_CONFIGURATIONS_URL}"
             )
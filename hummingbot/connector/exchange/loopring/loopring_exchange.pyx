@@ -1,4 +1,3 @@
-import aiohttp
 import asyncio
 import binascii
 import json
@@ -51,6 +50,7 @@ from hummingbot.connector.exchange.loopring.loopring_in_flight_order cimport Loo
 from hummingbot.connector.trading_rule cimport TradingRule
 from hummingbot.core.utils.estimate_fee import estimate_fee
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
+from hummingbot.core.utils.http_session_registry import shared_client
 
 from ethsnarks_loopring import PoseidonEdDSA
 from ethsnarks_loopring import FQ, SNARK_SCALAR_FIELD
@@ -910,7 +910,7 @@ cdef class LoopringExchange(ExchangeBase):
                           secure: bool = False) -> Dict[str, Any]:
 
         if self._shared_client is None:
-            self._shared_client = aiohttp.ClientSession()
+            self._shared_client = shared_client()
 
         if data is not None and http_method == "POST":
             data = json.dumps(data).encode('utf8')
@@ -85,8 +85,8 @@ class LoopringOrderBookTracker(OrderBookTracker):
                     message = await message_queue.get()
 
                 if message.type is OrderBookMessageType.DIFF:
-                    bids, asks = active_order_tracker.convert_diff_message_to_order_book_row(message)
-                    order_book.apply_diffs(bids, asks, message.content["startVersion"])
+                    entries = active_order_tracker.convert_diff_message_to_entries(message)
+                    order_book.apply_diff_entries(entries)
 
                 elif message.type is OrderBookMessageType.SNAPSHOT:
                     s_bids, s_asks = active_order_tracker.convert_snapshot_message_to_order_book_row(message)
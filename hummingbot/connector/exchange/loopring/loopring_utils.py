@@ -3,6 +3,7 @@ from typing import Dict, Any
 
 from hummingbot.client.config.config_var import ConfigVar
 from hummingbot.client.config.config_methods import using_exchange
+from hummingbot.core.utils.http_session_registry import shared_client
 
 CENTRALIZED = True
 
@@ -52,7 +53,7 @@ def convert_to_exchange_trading_pair(hb_trading_pair: str) -> str:
 
 
 async def get_ws_api_key():
-    async with aiohttp.ClientSession() as client:
+    async with shared_client() as client:
         response: aiohttp.ClientResponse = await client.get(
             f"{LOOPRING_ROOT_API}{LOOPRING_WS_KEY_PATH}"
         )
@@ -34,6 +34,10 @@ from hummingbot.connector.exchange.okex.constants import (
 )
 
 from hummingbot.connector.exchange.okex.okex_utils import inflate
+from hummingbot.core.utils.http_session_registry import (
+    HTTPSessionRegistry,
+    shared_client,
+)
 
 from dateutil.parser import parse as dataparse
 
@@ -68,7 +72,7 @@ class OkexAPIOrderBookDataSource(OrderBookTrackerDataSource):
         Refer to Calling a Class method for an example on how to test this particular function.
         Returned data frame should have trading pair as index and include usd volume, baseAsset and quoteAsset
         """
-        async with aiohttp.ClientSession() as client:
+        async with shared_client() as client:
             async with client.get(OKEX_SYMBOLS_URL) as products_response:
 
                 products_response: aiohttp.ClientResponse = products_response
@@ -94,7 +98,7 @@ class OkexAPIOrderBookDataSource(OrderBookTrackerDataSource):
     @staticmethod
     async def fetch_trading_pairs() -> List[str]:
         # Returns a List of str, representing each active trading pair on the exchange.
-        async with aiohttp.ClientSession() as client:
+        async with shared_client() as client:
             async with client.get(OKEX_SYMBOLS_URL) as products_response:
 
                 products_response: aiohttp.ClientResponse = products_response
@@ -111,7 +115,7 @@ class OkexAPIOrderBookDataSource(OrderBookTrackerDataSource):
         return trading_pairs
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client() as client:
             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair)
 
             snapshot_msg: OrderBookMessage = OkexOrderBook.snapshot_message_from_exchange(
@@ -126,7 +130,7 @@ class OkexAPIOrderBookDataSource(OrderBookTrackerDataSource):
     # Move this to OrderBookTrackerDataSource or this needs a whole refactor?
     @classmethod
     async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client() as client:
             async with client.get(OKEX_SYMBOLS_URL) as products_response:
 
                 products_response: aiohttp.ClientResponse = products_response
@@ -159,7 +163,7 @@ class OkexAPIOrderBookDataSource(OrderBookTrackerDataSource):
         return self._trading_pairs
 
     @staticmethod
-    async def get_snapshot(client: aiohttp.ClientSession, trading_pair: str) -> Dict[str, Any]:
+    async def get_snapshot(client: HTTPSessionRegistry, trading_pair: str) -> Dict[str, Any]:
         """Fetches order book snapshot for a particular trading pair from the exchange REST API."""
         params = {}  # default {'size':?, 'depth':?}
         async with client.get(OKEX_DEPTH_URL.format(trading_pair=trading_pair), params=params) as response:
@@ -279,7 +283,7 @@ class OkexAPIOrderBookDataSource(OrderBookTrackerDataSource):
         while True:
             try:
                 trading_pairs: List[str] = await self.get_trading_pairs()
-                async with aiohttp.ClientSession() as client:
+                async with shared_client() as client:
                     for trading_pair in trading_pairs:
                         try:
                             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair)
@@ -1,4 +1,3 @@
-import aiohttp
 import asyncio
 from urllib.parse import urlencode
 from async_timeout import timeout
@@ -64,6 +63,10 @@ from hummingbot.client.config.fee_overrides_config_map import fee_overrides_conf
 from hummingbot.core.utils.estimate_fee import estimate_fee
 
 from hummingbot.connector.exchange.okex.constants import *
+from hummingbot.core.utils.http_session_registry import (
+    HTTPSessionRegistry,
+    shared_client,
+)
 
 
 hm_logger = None
@@ -194,7 +197,7 @@ cdef class OkexExchange(ExchangeBase):
         return self._user_stream_tracker
 
     @shared_client.setter
-    def shared_client(self, client: aiohttp.ClientSession):
+    def shared_client(self, client: HTTPSessionRegistry):
         self._shared_client = client
 
     async def get_active_exchange_markets(self) -> pd.DataFrame:
@@ -261,9 +264,9 @@ cdef class OkexExchange(ExchangeBase):
                 self._poll_notifier.set()
         self._last_timestamp = timestamp
 
-    async def _http_client(self) -> aiohttp.ClientSession:
+    async def _http_client(self) -> HTTPSessionRegistry:
         if self._shared_client is None:
-            self._shared_client = aiohttp.ClientSession()
+            self._shared_client = shared_client()
         return self._shared_client
 
     async def _api_request(self,
@@ -20,6 +20,8 @@ ctypedef pair[string, SingleTradingPairLimitOrders] LimitOrdersPair
 ctypedef unordered_map[string, SingleTradingPairLimitOrders] LimitOrders
 ctypedef cpp_set[CPPLimitOrder].iterator SingleTradingPairLimitOrdersIterator
 ctypedef cpp_set[CPPLimitOrder].reverse_iterator SingleTradingPairLimitOrdersRIterator
+ctypedef unordered_map[string, double] CrossingCheckPrices
+ctypedef unordered_map[string, double].iterator CrossingCheckPricesIterator
 ctypedef cpp_set[CPPOrderExpirationEntry] LimitOrderExpirationSet
 ctypedef cpp_set[CPPOrderExpirationEntry].iterator LimitOrderExpirationSetIterator
 
@@ -28,6 +30,10 @@ cdef class PaperTradeExchange(ExchangeBase):
     cdef:
         LimitOrders _bid_limit_orders
         LimitOrders _ask_limit_orders
+        CrossingCheckPrices _bid_crossing_check_prices
+        CrossingCheckPrices _ask_crossing_check_prices
+        set _crossing_check_trading_pairs
+        dict _order_book_top_of_book_listeners
         bint _paper_trade_market_initialized
         dict _trading_pairs
         object _config
@@ -71,6 +77,7 @@ cdef class PaperTradeExchange(ExchangeBase):
                                                          LimitOrders *limit_orders_map_ptr,
                                                          LimitOrdersIterator *map_it_ptr)
     cdef c_process_crossed_limit_orders(self)
+    cdef c_process_crossed_limit_orders_by_trading_pair(self, str trading_pair, bint process_bids, bint process_asks)
     cdef c_match_trade_to_limit_orders(self, object order_book_trade_event)
     cdef object c_cancel_order_from_orders_map(self,
                                                LimitOrders *orders_map,
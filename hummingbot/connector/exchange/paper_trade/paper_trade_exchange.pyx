@@ -157,6 +157,39 @@ cdef class OrderBookMarketOrderFillListener(EventListener):
         order_book.record_filled_order(event_object)
 
 
+cdef class OrderBookTopOfBookListener(EventListener):
+    cdef:
+        PaperTradeExchange _market
+        str _trading_pair
+        double _best_bid_price
+        double _best_bid_amount
+        double _best_ask_price
+        double _best_ask_amount
+
+    def __init__(self, market: PaperTradeExchange, trading_pair: str):
+        super().__init__()
+        self._market = market
+        self._trading_pair = trading_pair
+        self._best_bid_price = self._best_ask_price = float("NaN")
+        self._best_bid_amount = self._best_ask_amount = 0
+
+    cdef c_call(self, object event_object):
+        # Limit bids can only be crossed by a change on the ask side, and limit asks by a change on the bid side.
+        cdef:
+            bint bid_changed = (event_object.best_bid_price != self._best_bid_price or
+                                event_object.best_bid_amount != self._best_bid_amount)
+            bint ask_changed = (event_object.best_ask_price != self._best_ask_price or
+                                event_object.best_ask_amount != self._best_ask_amount)
+        self._best_bid_price = event_object.best_bid_price
+        self._best_bid_amount = event_object.best_bid_amount
+        self._best_ask_price = event_object.best_ask_price
+        self._best_ask_amount = event_object.best_ask_amount
+        try:
+            self._market.c_process_crossed_limit_orders_by_trading_pair(self._trading_pair, ask_changed, bid_changed)
+        except Exception as e:
+            self.logger().error("Error call top of book listener.", exc_info=True)
+
+
 cdef class PaperTradeExchange(ExchangeBase):
     TRADE_EXECUTION_DELAY = 5.0
     ORDER_FILLED_EVENT_TAG = MarketEvent.OrderFilled.value
@@ -165,6 +198,7 @@ cdef class PaperTradeExchange(ExchangeBase):
     MARKET_ORDER_CANCELLED_EVENT_TAG = MarketEvent.OrderCancelled.value
     MARKET_ORDER_FAILURE_EVENT_TAG = MarketEvent.OrderFailure.value
     ORDER_BOOK_TRADE_EVENT_TAG = OrderBookEvent.TradeEvent.value
+    ORDER_BOOK_TOP_OF_BOOK_EVENT_TAG = OrderBookEvent.TopOfBookChangedEvent.value
     MARKET_SELL_ORDER_CREATED_EVENT_TAG = MarketEvent.SellOrderCreated.value
     MARKET_BUY_ORDER_CREATED_EVENT_TAG = MarketEvent.BuyOrderCreated.value
 
@@ -180,6 +214,8 @@ cdef class PaperTradeExchange(ExchangeBase):
         self._queued_orders = deque()
         self._quantization_params = {}
         self._order_book_trade_listener = OrderBookTradeListener(self)
+        self._order_book_top_of_book_listeners = {}
+        self._crossing_check_trading_pairs = set()
         self._target_market = target_market
         self._market_order_filled_listener = OrderBookMarketOrderFillListener(self)
         self.c_add_listener(self.ORDER_FILLED_EVENT_TAG, self._market_order_filled_listener)
@@ -198,6 +234,14 @@ cdef class PaperTradeExchange(ExchangeBase):
                 self.ORDER_BOOK_TRADE_EVENT_TAG,
                 self._order_book_trade_listener
             )
+            # Limit orders are matched when the top of the order book changes, instead of on every tick.
+            top_of_book_listener = OrderBookTopOfBookListener(
+                self, self._target_market.convert_from_exchange_trading_pair(trading_pair_str))
+            self._order_book_top_of_book_listeners[trading_pair_str] = top_of_book_listener
+            (<CompositeOrderBook>order_book).c_add_listener(
+                self.ORDER_BOOK_TOP_OF_BOOK_EVENT_TAG,
+                top_of_book_listener
+            )
 
     def split_trading_pair(self, trading_pair: str) -> Tuple[str, str]:
         return self._target_market.split_trading_pair(trading_pair)
@@ -317,7 +361,15 @@ cdef class PaperTradeExchange(ExchangeBase):
     cdef c_tick(self, double timestamp):
         ExchangeBase.c_tick(self, timestamp)
         self.c_process_market_orders()
-        self.c_process_crossed_limit_orders()
+        if self._paper_trade_market_initialized:
+            # Order book changes are handled by the top of book listeners, only new limit orders are left to check.
+            # Fill event listeners may place new orders, which are checked on the next tick.
+            trading_pairs = self._crossing_check_trading_pairs
+            self._crossing_check_trading_pairs = set()
+            for trading_pair in trading_pairs:
+                self.c_process_crossed_limit_orders_by_trading_pair(trading_pair, True, True)
+        else:
+            self.c_process_crossed_limit_orders()
 
     cdef str c_buy(self,
                    str trading_pair_str,
@@ -355,6 +407,8 @@ cdef class PaperTradeExchange(ExchangeBase):
                                                                               SingleTradingPairLimitOrders()))
                 map_it = insert_result.first
             limit_orders_collection_ptr = address(deref(map_it).second)
+            self._bid_crossing_check_prices.erase(cpp_trading_pair_str)
+            self._crossing_check_trading_pairs.add(trading_pair_str)
             limit_orders_collection_ptr.insert(CPPLimitOrder(
                 cpp_order_id,
                 cpp_trading_pair_str,
@@ -410,6 +464,8 @@ cdef class PaperTradeExchange(ExchangeBase):
                                                                               SingleTradingPairLimitOrders()))
                 map_it = insert_result.first
             limit_orders_collection_ptr = address(deref(map_it).second)
+            self._ask_crossing_check_prices.erase(cpp_trading_pair_str)
+            self._crossing_check_trading_pairs.add(trading_pair_str)
             limit_orders_collection_ptr.insert(CPPLimitOrder(
                 cpp_order_id,
                 cpp_trading_pair_str,
@@ -721,18 +777,36 @@ cdef class PaperTradeExchange(ExchangeBase):
         :param map_it_ptr: limit orders map iterator, which implies the trading pair being processed
         """
         cdef:
-            str trading_pair = deref(deref(map_it_ptr)).first.decode("utf8")
-            object opposite_order_book_price = self.c_get_price(trading_pair, is_buy)
+            string cpp_trading_pair = deref(deref(map_it_ptr)).first
+            str trading_pair = cpp_trading_pair.decode("utf8")
+            CrossingCheckPrices *crossing_check_prices_ptr = (address(self._bid_crossing_check_prices)
+                                                              if is_buy
+                                                              else address(self._ask_crossing_check_prices))
+            CrossingCheckPricesIterator crossing_check_it = crossing_check_prices_ptr.find(cpp_trading_pair)
+            OrderBook order_book
+            double top_price
+            double opposite_order_book_price
             SingleTradingPairLimitOrders *orders_collection_ptr = address(deref(deref(map_it_ptr)).second)
             SingleTradingPairLimitOrdersIterator orders_it = orders_collection_ptr.begin()
             SingleTradingPairLimitOrdersRIterator orders_rit = orders_collection_ptr.rbegin()
             vector[SingleTradingPairLimitOrdersIterator] process_order_its
             const CPPLimitOrder *cpp_limit_order_ptr = NULL
 
+        try:
+            order_book = self.c_get_order_book(trading_pair)
+            top_price = order_book.c_get_price(is_buy)
+        except (EnvironmentError, StopIteration):
+            return
+
+        # The limit orders were all checked against this top of book already, and none of them crossed it.
+        if crossing_check_it != crossing_check_prices_ptr.end() and deref(crossing_check_it).second == top_price:
+            return
+
+        opposite_order_book_price = float(self.c_quantize_order_price(trading_pair, Decimal(top_price)))
         if is_buy:
             while orders_rit != orders_collection_ptr.rend():
                 cpp_limit_order_ptr = address(deref(orders_rit))
-                if opposite_order_book_price > <object>cpp_limit_order_ptr.getPrice():
+                if opposite_order_book_price > cpp_limit_order_ptr.getPriceValue():
                     break
                 process_order_its.push_back(getIteratorFromReverseIterator(
                     <reverse_iterator[SingleTradingPairLimitOrdersIterator]>orders_rit))
@@ -740,11 +814,15 @@ cdef class PaperTradeExchange(ExchangeBase):
         else:
             while orders_it != orders_collection_ptr.end():
                 cpp_limit_order_ptr = address(deref(orders_it))
-                if opposite_order_book_price < <object>cpp_limit_order_ptr.getPrice():
+                if opposite_order_book_price < cpp_limit_order_ptr.getPriceValue():
                     break
                 process_order_its.push_back(orders_it)
                 inc(orders_it)
 
+        if process_order_its.empty():
+            deref(crossing_check_prices_ptr)[cpp_trading_pair] = top_price
+            return
+
         for orders_it in process_order_its:
             self.c_process_limit_order(is_buy, limit_orders_map_ptr, map_it_ptr, orders_it)
 
@@ -766,6 +844,23 @@ cdef class PaperTradeExchange(ExchangeBase):
             if map_it != limit_orders_ptr.end():
                 inc(map_it)
 
+    cdef c_process_crossed_limit_orders_by_trading_pair(self, str trading_pair, bint process_bids, bint process_asks):
+        cdef:
+            string cpp_trading_pair = trading_pair.encode("utf8")
+            LimitOrders *limit_orders_ptr
+            LimitOrdersIterator map_it
+
+        if process_bids:
+            limit_orders_ptr = address(self._bid_limit_orders)
+            map_it = limit_orders_ptr.find(cpp_trading_pair)
+            if map_it != limit_orders_ptr.end():
+                self.c_process_crossed_limit_orders_for_trading_pair(True, limit_orders_ptr, address(map_it))
+        if process_asks:
+            limit_orders_ptr = address(self._ask_limit_orders)
+            map_it = limit_orders_ptr.find(cpp_trading_pair)
+            if map_it != limit_orders_ptr.end():
+                self.c_process_crossed_limit_orders_for_trading_pair(False, limit_orders_ptr, address(map_it))
+
     # <editor-fold desc="Event listener functions">
     cdef c_match_trade_to_limit_orders(self, object order_book_trade_event):
         """
@@ -776,8 +871,7 @@ cdef class PaperTradeExchange(ExchangeBase):
         cdef:
             string cpp_trading_pair = order_book_trade_event.trading_pair.encode("utf8")
             bint is_maker_buy = order_book_trade_event.type is TradeType.SELL
-            object trade_price = order_book_trade_event.price
-            object trade_quantity = order_book_trade_event.amount
+            double trade_price = order_book_trade_event.price
             LimitOrders *limit_orders_map_ptr = (address(self._bid_limit_orders)
                                                  if is_maker_buy
                                                  else address(self._ask_limit_orders))
@@ -796,7 +890,7 @@ cdef class PaperTradeExchange(ExchangeBase):
             orders_rit = orders_collection_ptr.rbegin()
             while orders_rit != orders_collection_ptr.rend():
                 cpp_limit_order_ptr = address(deref(orders_rit))
-                if <object>cpp_limit_order_ptr.getPrice() <= trade_price:
+                if cpp_limit_order_ptr.getPriceValue() <= trade_price:
                     break
                 process_order_its.push_back(getIteratorFromReverseIterator(
                     <reverse_iterator[SingleTradingPairLimitOrdersIterator]>orders_rit))
@@ -805,7 +899,7 @@ cdef class PaperTradeExchange(ExchangeBase):
             orders_it = orders_collection_ptr.begin()
             while orders_it != orders_collection_ptr.end():
                 cpp_limit_order_ptr = address(deref(orders_it))
-                if <object>cpp_limit_order_ptr.getPrice() >= trade_price:
+                if cpp_limit_order_ptr.getPriceValue() >= trade_price:
                     break
                 process_order_its.push_back(orders_it)
                 inc(orders_it)
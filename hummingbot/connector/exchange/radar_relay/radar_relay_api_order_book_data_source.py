@@ -24,6 +24,10 @@ from hummingbot.core.utils import async_ttl_cache
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
+from hummingbot.core.utils.http_session_registry import (
+    HTTPSessionRegistry,
+    shared_client,
+)
 
 TRADING_PAIR_FILTER = re.compile(r"(WETH|DAI)$")
 
@@ -39,7 +43,7 @@ class RadarRelayAPIOrderBookDataSource(OrderBookTrackerDataSource):
     PING_TIMEOUT = 10.0
 
     _rraobds_logger: Optional[HummingbotLogger] = None
-    _client: Optional[aiohttp.ClientSession] = None
+    _client: Optional[HTTPSessionRegistry] = None
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -52,11 +56,11 @@ class RadarRelayAPIOrderBookDataSource(OrderBookTrackerDataSource):
         self.order_book_create_function = lambda: RadarRelayOrderBook()
 
     @classmethod
-    def http_client(cls) -> aiohttp.ClientSession:
+    def http_client(cls) -> HTTPSessionRegistry:
         if cls._client is None:
             if not asyncio.get_event_loop().is_running():
                 raise EnvironmentError("Event loop must be running to start HTTP client session.")
-            cls._client = aiohttp.ClientSession()
+            cls._client = shared_client()
         return cls._client
 
     @classmethod
@@ -64,7 +68,7 @@ class RadarRelayAPIOrderBookDataSource(OrderBookTrackerDataSource):
         """
         Returns all token information
         """
-        client: aiohttp.ClientSession = cls.http_client()
+        client: HTTPSessionRegistry = cls.http_client()
         async with client.get(TOKENS_URL) as response:
             response: aiohttp.ClientResponse = response
             if response.status != 200:
@@ -78,7 +82,7 @@ class RadarRelayAPIOrderBookDataSource(OrderBookTrackerDataSource):
         """
         Returned data frame should have trading pair as index and include usd volume, baseAsset and quoteAsset
         """
-        client: aiohttp.ClientSession = cls.http_client()
+        client: HTTPSessionRegistry = cls.http_client()
         async with client.get(f"{MARKETS_URL}?include=ticker,stats") as response:
             response: aiohttp.ClientResponse = response
             if response.status != 200:
@@ -104,7 +108,7 @@ class RadarRelayAPIOrderBookDataSource(OrderBookTrackerDataSource):
             trading_pairs = set()
             page_count = 1
             while True:
-                async with aiohttp.ClientSession() as client:
+                async with shared_client() as client:
                     async with client.get(f"{MARKETS_URL}?perPage=100&page={page_count}", timeout=10) \
                             as response:
                         if response.status == 200:
@@ -128,7 +132,7 @@ class RadarRelayAPIOrderBookDataSource(OrderBookTrackerDataSource):
         return []
 
     @staticmethod
-    async def get_snapshot(client: aiohttp.ClientSession, trading_pair: str) -> Dict[str, any]:
+    async def get_snapshot(client: HTTPSessionRegistry, trading_pair: str) -> Dict[str, any]:
         async with client.get(f"{REST_BASE_URL}/markets/{trading_pair}/book") as response:
             response: aiohttp.ClientResponse = response
             if response.status != 200:
@@ -137,7 +141,7 @@ class RadarRelayAPIOrderBookDataSource(OrderBookTrackerDataSource):
             return await response.json()
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client() as client:
             snapshot: Dict[str, any] = await self.get_snapshot(client, trading_pair)
             snapshot_timestamp: float = time.time()
             snapshot_msg: RadarRelayOrderBookMessage = RadarRelayOrderBook.snapshot_message_from_exchange(
@@ -210,7 +214,7 @@ class RadarRelayAPIOrderBookDataSource(OrderBookTrackerDataSource):
         while True:
             try:
                 trading_pairs: List[str] = self._trading_pairs
-                client: aiohttp.ClientSession = self.http_client()
+                client: HTTPSessionRegistry = self.http_client()
                 for trading_pair in trading_pairs:
                     try:
                         snapshot: Dict[str, any] = await self.get_snapshot(client, trading_pair)
@@ -0,0 +1,143 @@
+#include "FlatOrderBookSide.h"
+#include <algorithm>
+
+FlatOrderBookSide::FlatOrderBookSide() {
+    this->bidSide = true;
+}
+
+FlatOrderBookSide::FlatOrderBookSide(bool bidSide) {
+    this->bidSide = bidSide;
+}
+
+FlatOrderBookSide::FlatOrderBookSide(const FlatOrderBookSide &other) {
+    this->entries = other.entries;
+    this->bidSide = other.bidSide;
+}
+
+FlatOrderBookSide &FlatOrderBookSide::operator=(const FlatOrderBookSide &other) {
+    this->entries = other.entries;
+    this->bidSide = other.bidSide;
+    return *this;
+}
+
+bool FlatOrderBookSide::isWorse(int64_t priceKey, int64_t otherPriceKey) const {
+    return this->bidSide ? (priceKey < otherPriceKey) : (priceKey > otherPriceKey);
+}
+
+size_t FlatOrderBookSide::lowerBound(int64_t priceKey) const {
+    // Index of the first level that is not worse than the given price, compared by price key like the set sides.
+    size_t low = 0;
+    size_t high = this->entries.size();
+    while (low < high) {
+        size_t middle = low + (high - low) / 2;
+        if (this->isWorse(this->entries[middle].getPriceKey(), priceKey)) {
+            low = middle + 1;
+        } else {
+            high = middle;
+        }
+    }
+    return low;
+}
+
+bool FlatOrderBookSide::isBidSide() const {
+    return this->bidSide;
+}
+
+size_t FlatOrderBookSide::size() const {
+    return this->entries.size();
+}
+
+bool FlatOrderBookSide::empty() const {
+    return this->entries.empty();
+}
+
+size_t FlatOrderBookSide::capacity() const {
+    return this->entries.capacity();
+}
+
+void FlatOrderBookSide::clear() {
+    this->entries.clear();
+}
+
+void FlatOrderBookSide::reserve(size_t numLevels) {
+    this->entries.reserve(numLevels);
+}
+
+void FlatOrderBookSide::assignSnapshot(const std::vector<OrderBookEntry> &snapshotEntries) {
+    const bool bidSide = this->bidSide;
+    this->entries.assign(snapshotEntries.begin(), snapshotEntries.end());
+
+    // Same semantics as inserting into std::set<OrderBookEntry>: for duplicated prices, the first entry wins.
+    std::stable_sort(this->entries.begin(), this->entries.end(),
+                     [bidSide](const OrderBookEntry &a, const OrderBookEntry &b) {
+                         return bidSide ? (a.getPriceKey() < b.getPriceKey()) : (a.getPriceKey() > b.getPriceKey());
+                     });
+    this->entries.erase(
+        std::unique(this->entries.begin(), this->entries.end(),
+                    [](const OrderBookEntry &a, const OrderBookEntry &b) {
+                        return a.getPriceKey() == b.getPriceKey();
+                    }),
+        this->entries.end()
+    );
+}
+
+void FlatOrderBookSide::applyDiff(const OrderBookEntry &entry) {
+    // Diffs with 0 amounts mean deletion.
+    size_t index = this->lowerBound(entry.getPriceKey());
+    bool found = index < this->entries.size() && this->entries[index].getPriceKey() == entry.getPriceKey();
+    if (found) {
+        if (entry.getAmount() > 0) {
+            this->entries[index] = entry;
+        } else {
+            this->entries.erase(this->entries.begin() + index);
+        }
+    } else if (entry.getAmount() > 0) {
+        this->entries.insert(this->entries.begin() + index, entry);
+    }
+}
+
+const OrderBookEntry &FlatOrderBookSide::best() const {
+    return this->entries.back();
+}
+
+const OrderBookEntry &FlatOrderBookSide::worst() const {
+    return this->entries.front();
+}
+
+const OrderBookEntry &FlatOrderBookSide::levelAt(size_t levelIndex) const {
+    // Level 0 is the top of the book.
+    return this->entries[this->entries.size() - 1 - levelIndex];
+}
+
+void FlatOrderBookSide::popBest() {
+    this->entries.pop_back();
+}
+
+void FlatOrderBookSide::truncate(size_t numLevels) {
+    // Keeps the numLevels levels closest to the top of the book.
+    if (this->entries.size() > numLevels) {
+        this->entries.erase(this->entries.begin(), this->entries.end() - numLevels);
+    }
+}
+
+void truncateFlatOverlapEntries(FlatOrderBookSide &bidBook, FlatOrderBookSide &askBook, const int &dex) {
+    // Same rules as truncateOverlapEntries() in OrderBookEntry.cpp.
+    while (!bidBook.empty() && !askBook.empty()) {
+        const OrderBookEntry &topBid = bidBook.best();
+        const OrderBookEntry &topAsk = askBook.best();
+        if (topBid.getPrice() < topAsk.getPrice()) {
+            break;
+        }
+        bool bidWins;
+        if (dex != 0) {
+            bidWins = topBid.getAmount() * topBid.getPrice() > topAsk.getAmount() * topAsk.getPrice();
+        } else {
+            bidWins = topBid.getUpdateId() > topAsk.getUpdateId();
+        }
+        if (bidWins) {
+            askBook.popBest();
+        } else {
+            bidBook.popBest();
+        }
+    }
+}
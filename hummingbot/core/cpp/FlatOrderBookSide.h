@@ -0,0 +1,48 @@
+#ifndef _FLAT_ORDER_BOOK_SIDE_H
+#define _FLAT_ORDER_BOOK_SIDE_H
+
+#include <stdint.h>
+#include <stddef.h>
+#include <vector>
+#include "OrderBookEntry.h"
+
+/**
+ * One side of an order book, stored as a contiguous array of price levels.
+ *
+ * Levels are kept sorted from the worst price to the best price, so the top of book always sits at the back of the
+ * array. Updates near the top of the book - which is where almost all of the diffs land - only ever move a handful
+ * of entries, and lookups are binary searches over contiguous memory instead of red-black tree walks.
+ */
+class FlatOrderBookSide {
+    std::vector<OrderBookEntry> entries;
+    bool bidSide;
+
+    bool isWorse(int64_t priceKey, int64_t otherPriceKey) const;
+    size_t lowerBound(int64_t priceKey) const;
+
+    public:
+        FlatOrderBookSide();
+        FlatOrderBookSide(bool bidSide);
+        FlatOrderBookSide(const FlatOrderBookSide &other);
+        FlatOrderBookSide &operator=(const FlatOrderBookSide &other);
+
+        bool isBidSide() const;
+        size_t size() const;
+        bool empty() const;
+        size_t capacity() const;
+        void clear();
+        void reserve(size_t numLevels);
+
+        void assignSnapshot(const std::vector<OrderBookEntry> &snapshotEntries);
+        void applyDiff(const OrderBookEntry &entry);
+
+        const OrderBookEntry &best() const;
+        const OrderBookEntry &worst() const;
+        const OrderBookEntry &levelAt(size_t levelIndex) const;
+        void popBest();
+        void truncate(size_t numLevels);
+};
+
+void truncateFlatOverlapEntries(FlatOrderBookSide &bidBook, FlatOrderBookSide &askBook, const int &dex);
+
+#endif
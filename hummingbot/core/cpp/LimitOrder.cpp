@@ -1,5 +1,17 @@
 #include "LimitOrder.h"
 
+static double getNativePrice(PyObject *price) {
+    if (price == NULL) {
+        return 0;
+    }
+    double value = PyFloat_AsDouble(price);
+    if (value == -1.0 && PyErr_Occurred()) {
+        PyErr_Clear();
+        return Py_NAN;
+    }
+    return value;
+}
+
 LimitOrder::LimitOrder() {
     this->clientOrderID = "";
     this->tradingPair = "";
@@ -8,6 +20,7 @@ LimitOrder::LimitOrder() {
     this->quoteCurrency = "";
     this->price = NULL;
     this->quantity = NULL;
+    this->priceValue = 0;
 }
 
 LimitOrder::LimitOrder(std::string clientOrderID,
@@ -24,6 +37,7 @@ LimitOrder::LimitOrder(std::string clientOrderID,
     this->quoteCurrency = quoteCurrency;
     this->price = price;
     this->quantity = quantity;
+    this->priceValue = getNativePrice(price);
     Py_XINCREF(price);
     Py_XINCREF(quantity);
 }
@@ -36,6 +50,7 @@ LimitOrder::LimitOrder(const LimitOrder &other) {
     this->quoteCurrency = other.quoteCurrency;
     this->price = other.price;
     this->quantity = other.quantity;
+    this->priceValue = other.priceValue;
     Py_XINCREF(this->price);
     Py_XINCREF(this->quantity);
 }
@@ -55,6 +70,7 @@ LimitOrder &LimitOrder::operator=(const LimitOrder &other) {
     this->quoteCurrency = other.quoteCurrency;
     this->price = other.price;
     this->quantity = other.quantity;
+    this->priceValue = other.priceValue;
     Py_XINCREF(this->price);
     Py_XINCREF(this->quantity);
 
@@ -62,6 +78,10 @@ LimitOrder &LimitOrder::operator=(const LimitOrder &other) {
 }
 
 bool operator<(LimitOrder const &a, LimitOrder const &b) {
+    if (a.priceValue != b.priceValue) {
+        return a.priceValue < b.priceValue;
+    }
+    // Only prices that convert to the same double need the exact comparison.
     return (bool)(PyObject_RichCompareBool(a.price, b.price, Py_LT));
 }
 
@@ -89,6 +109,10 @@ PyObject *LimitOrder::getPrice() const {
     return this->price;
 }
 
+double LimitOrder::getPriceValue() const {
+    return this->priceValue;
+}
+
 PyObject *LimitOrder::getQuantity() const {
     return this->quantity;
 }
@@ -12,6 +12,7 @@ class LimitOrder {
     std::string quoteCurrency;
     PyObject *price;
     PyObject *quantity;
+    double priceValue;
 
     public:
         LimitOrder();
@@ -33,6 +34,7 @@ class LimitOrder {
         std::string getBaseCurrency() const;
         std::string getQuoteCurrency() const;
         PyObject *getPrice() const;
+        double getPriceValue() const;
         PyObject *getQuantity() const;
 };
 
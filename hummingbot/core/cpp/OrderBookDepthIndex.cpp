@@ -0,0 +1,96 @@
+#include "OrderBookDepthIndex.h"
+#include <algorithm>
+#include <cmath>
+#include <functional>
+
+OrderBookDepthIndex::OrderBookDepthIndex() {
+    this->bidSide = true;
+}
+
+OrderBookDepthIndex::OrderBookDepthIndex(bool bidSide) {
+    this->bidSide = bidSide;
+}
+
+OrderBookDepthIndex::OrderBookDepthIndex(const OrderBookDepthIndex &other) {
+    this->prices = other.prices;
+    this->cumulativeBase = other.cumulativeBase;
+    this->cumulativeQuote = other.cumulativeQuote;
+    this->bidSide = other.bidSide;
+}
+
+OrderBookDepthIndex &OrderBookDepthIndex::operator=(const OrderBookDepthIndex &other) {
+    this->prices = other.prices;
+    this->cumulativeBase = other.cumulativeBase;
+    this->cumulativeQuote = other.cumulativeQuote;
+    this->bidSide = other.bidSide;
+    return *this;
+}
+
+void OrderBookDepthIndex::clear() {
+    this->prices.clear();
+    this->cumulativeBase.clear();
+    this->cumulativeQuote.clear();
+}
+
+void OrderBookDepthIndex::reserve(size_t numLevels) {
+    this->prices.reserve(numLevels);
+    this->cumulativeBase.reserve(numLevels);
+    this->cumulativeQuote.reserve(numLevels);
+}
+
+void OrderBookDepthIndex::append(double price, double amount) {
+    // Levels must be appended starting from the top of the book.
+    this->prices.push_back(price);
+    this->cumulativeBase.push_back(this->getTotalBase() + amount);
+    this->cumulativeQuote.push_back(this->getTotalQuote() + amount * price);
+}
+
+size_t OrderBookDepthIndex::size() const {
+    return this->prices.size();
+}
+
+double OrderBookDepthIndex::getPrice(size_t levelIndex) const {
+    return this->prices[levelIndex];
+}
+
+double OrderBookDepthIndex::getCumulativeBase(size_t levelIndex) const {
+    return this->cumulativeBase[levelIndex];
+}
+
+double OrderBookDepthIndex::getCumulativeQuote(size_t levelIndex) const {
+    return this->cumulativeQuote[levelIndex];
+}
+
+double OrderBookDepthIndex::getTotalBase() const {
+    return this->cumulativeBase.empty() ? 0 : this->cumulativeBase.back();
+}
+
+double OrderBookDepthIndex::getTotalQuote() const {
+    return this->cumulativeQuote.empty() ? 0 : this->cumulativeQuote.back();
+}
+
+size_t OrderBookDepthIndex::findLevelForBase(double baseVolume) const {
+    // Index of the first level at which the cumulative base volume reaches baseVolume, or size() if it never does.
+    if (std::isnan(baseVolume)) {
+        return this->cumulativeBase.size();
+    }
+    return std::lower_bound(this->cumulativeBase.begin(), this->cumulativeBase.end(), baseVolume) -
+        this->cumulativeBase.begin();
+}
+
+size_t OrderBookDepthIndex::findLevelForQuote(double quoteVolume) const {
+    if (std::isnan(quoteVolume)) {
+        return this->cumulativeQuote.size();
+    }
+    return std::lower_bound(this->cumulativeQuote.begin(), this->cumulativeQuote.end(), quoteVolume) -
+        this->cumulativeQuote.begin();
+}
+
+size_t OrderBookDepthIndex::countLevelsWithinPrice(double price) const {
+    // Number of levels from the top of the book that are at or better than the given price.
+    if (this->bidSide) {
+        return std::upper_bound(this->prices.begin(), this->prices.end(), price, std::greater<double>()) -
+            this->prices.begin();
+    }
+    return std::upper_bound(this->prices.begin(), this->prices.end(), price) - this->prices.begin();
+}
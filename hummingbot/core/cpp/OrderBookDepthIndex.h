@@ -0,0 +1,40 @@
+#ifndef _ORDER_BOOK_DEPTH_INDEX_H
+#define _ORDER_BOOK_DEPTH_INDEX_H
+
+#include <stddef.h>
+#include <vector>
+
+/**
+ * Cumulative base and quote volumes of one order book side, ordered from the top of the book.
+ *
+ * Since amounts are never negative, both cumulative arrays are sorted, and depth queries become binary searches.
+ */
+class OrderBookDepthIndex {
+    std::vector<double> prices;
+    std::vector<double> cumulativeBase;
+    std::vector<double> cumulativeQuote;
+    bool bidSide;
+
+    public:
+        OrderBookDepthIndex();
+        OrderBookDepthIndex(bool bidSide);
+        OrderBookDepthIndex(const OrderBookDepthIndex &other);
+        OrderBookDepthIndex &operator=(const OrderBookDepthIndex &other);
+
+        void clear();
+        void reserve(size_t numLevels);
+        void append(double price, double amount);
+
+        size_t size() const;
+        double getPrice(size_t levelIndex) const;
+        double getCumulativeBase(size_t levelIndex) const;
+        double getCumulativeQuote(size_t levelIndex) const;
+        double getTotalBase() const;
+        double getTotalQuote() const;
+
+        size_t findLevelForBase(double baseVolume) const;
+        size_t findLevelForQuote(double quoteVolume) const;
+        size_t countLevelsWithinPrice(double price) const;
+};
+
+#endif
@@ -1,32 +1,53 @@
 #include "OrderBookEntry.h"
+#include <cstdint>
+#include <cstring>
 #include <iostream>
 
 OrderBookEntry::OrderBookEntry() {
     this->price = this->amount = 0;
     this->updateId = 0;
+    this->priceKey = priceToKey(0);
 }
 
 OrderBookEntry::OrderBookEntry(double price, double amount, int64_t updateId) {
     this->price = price;
     this->amount = amount;
     this->updateId = updateId;
+    this->priceKey = priceToKey(price);
+}
+
+OrderBookEntry::OrderBookEntry(int64_t priceTicks, double price, double amount, int64_t updateId) {
+    this->price = price;
+    this->amount = amount;
+    this->updateId = updateId;
+    this->priceKey = priceTicks;
 }
 
 OrderBookEntry::OrderBookEntry(const OrderBookEntry &other) {
     this->price = other.price;
     this->amount = other.amount;
     this->updateId = other.updateId;
+    this->priceKey = other.priceKey;
 }
 
 OrderBookEntry &OrderBookEntry::operator=(const OrderBookEntry &other) {
     this->price = other.price;
     this->amount = other.amount;
     this->updateId = other.updateId;
+    this->priceKey = other.priceKey;
     return *this;
 }
 
 bool operator<(OrderBookEntry const &a, OrderBookEntry const &b) {
-    return a.price < b.price;
+    return a.priceKey < b.priceKey;
+}
+
+int64_t OrderBookEntry::priceToKey(double price) {
+    // IEEE 754 doubles order like sign-magnitude integers. Flipping the magnitude bits of negative values gives a
+    // two's complement integer with the same ordering as the double.
+    int64_t bits;
+    std::memcpy(&bits, &price, sizeof(bits));
+    return bits >= 0 ? bits : bits ^ INT64_MAX;
 }
 
 void truncateOverlapEntries(std::set<OrderBookEntry> &bidBook, std::set<OrderBookEntry> &askBook, const int &dex) {
@@ -90,3 +111,7 @@ double OrderBookEntry::getAmount() const {
 int64_t OrderBookEntry::getUpdateId() const {
     return this->updateId;
 }
+
+int64_t OrderBookEntry::getPriceKey() const {
+    return this->priceKey;
+}
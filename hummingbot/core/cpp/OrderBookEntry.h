@@ -9,10 +9,14 @@ class OrderBookEntry {
     double price;
     double amount;
     int64_t updateId;
+    // Integer sort key of the price level: the tick count for entries quantized by TickSize, or else an integer with
+    // the same ordering as the price itself.
+    int64_t priceKey;
 
     public:
         OrderBookEntry();
         OrderBookEntry(double price, double amount, int64_t updateId);
+        OrderBookEntry(int64_t priceTicks, double price, double amount, int64_t updateId);
         OrderBookEntry(const OrderBookEntry &other);
         OrderBookEntry &operator=(const OrderBookEntry &other);
         friend bool operator<(OrderBookEntry const &a, OrderBookEntry const &b);
@@ -23,6 +27,9 @@ class OrderBookEntry {
         double getPrice() const;
         double getAmount() const;
         int64_t getUpdateId() const;
+        int64_t getPriceKey() const;
+
+        static int64_t priceToKey(double price);
 };
 
 #endif
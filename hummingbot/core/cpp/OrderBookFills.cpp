@@ -0,0 +1,113 @@
+#include "OrderBookFills.h"
+
+typedef std::map<int64_t, OrderBookEntry> FillMap;
+
+template <typename BookIterator, typename FillIterator>
+static size_t composeLevels(BookIterator bookIt, BookIterator bookEnd, FillIterator fillIt, FillIterator fillEnd,
+                            bool bidSide, size_t maxLevels, std::vector<int64_t> &staleKeys,
+                            std::vector<OrderBookEntry> &output) {
+    size_t numLevels = 0;
+    while (bookIt != bookEnd && numLevels < maxLevels) {
+        const OrderBookEntry &level = *bookIt;
+        int64_t levelKey = level.getPriceKey();
+
+        // Fills better than the current level are at prices that have left the order book.
+        while (fillIt != fillEnd && (bidSide ? fillIt->first > levelKey : fillIt->first < levelKey)) {
+            staleKeys.push_back(fillIt->first);
+            ++fillIt;
+        }
+
+        double amount = level.getAmount();
+        if (fillIt != fillEnd && fillIt->first == levelKey) {
+            OrderBookEntry &fill = fillIt->second;
+            amount -= fill.getAmount();
+            if (amount <= 0) {
+                fill = OrderBookEntry(levelKey, fill.getPrice(), level.getAmount(), fill.getUpdateId());
+            }
+            ++fillIt;
+        }
+        if (amount > 0) {
+            output.push_back(OrderBookEntry(levelKey, level.getPrice(), amount, level.getUpdateId()));
+            ++numLevels;
+        }
+        ++bookIt;
+    }
+    return numLevels;
+}
+
+OrderBookFills::OrderBookFills() {
+    this->bidSide = true;
+}
+
+OrderBookFills::OrderBookFills(bool bidSide) {
+    this->bidSide = bidSide;
+}
+
+OrderBookFills::OrderBookFills(const OrderBookFills &other) {
+    this->fills = other.fills;
+    this->bidSide = other.bidSide;
+}
+
+OrderBookFills &OrderBookFills::operator=(const OrderBookFills &other) {
+    this->fills = other.fills;
+    this->bidSide = other.bidSide;
+    return *this;
+}
+
+bool OrderBookFills::isBidSide() const {
+    return this->bidSide;
+}
+
+size_t OrderBookFills::size() const {
+    return this->fills.size();
+}
+
+bool OrderBookFills::empty() const {
+    return this->fills.empty();
+}
+
+void OrderBookFills::clear() {
+    this->fills.clear();
+}
+
+void OrderBookFills::recordFill(const OrderBookEntry &fill) {
+    int64_t priceKey = fill.getPriceKey();
+    FillMap::iterator it = this->fills.find(priceKey);
+    if (it == this->fills.end()) {
+        this->fills.insert(std::make_pair(priceKey, fill));
+        return;
+    }
+    // Fills at the same level add up, the level keeps the update ID of the last one.
+    it->second = OrderBookEntry(priceKey, fill.getPrice(), it->second.getAmount() + fill.getAmount(),
+                                fill.getUpdateId());
+}
+
+void OrderBookFills::getFills(std::vector<OrderBookEntry> &output) const {
+    output.reserve(output.size() + this->fills.size());
+    if (this->bidSide) {
+        for (FillMap::const_reverse_iterator it = this->fills.rbegin(); it != this->fills.rend(); ++it) {
+            output.push_back(it->second);
+        }
+    } else {
+        for (FillMap::const_iterator it = this->fills.begin(); it != this->fills.end(); ++it) {
+            output.push_back(it->second);
+        }
+    }
+}
+
+size_t OrderBookFills::compose(const std::set<OrderBookEntry> &book, size_t maxLevels,
+                               std::vector<OrderBookEntry> &output) {
+    std::vector<int64_t> staleKeys;
+    size_t numLevels;
+    if (this->bidSide) {
+        numLevels = composeLevels(book.rbegin(), book.rend(), this->fills.rbegin(), this->fills.rend(), true,
+                                  maxLevels, staleKeys, output);
+    } else {
+        numLevels = composeLevels(book.begin(), book.end(), this->fills.begin(), this->fills.end(), false,
+                                  maxLevels, staleKeys, output);
+    }
+    for (int64_t priceKey : staleKeys) {
+        this->fills.erase(priceKey);
+    }
+    return numLevels;
+}
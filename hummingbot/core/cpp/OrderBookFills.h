@@ -0,0 +1,38 @@
+#ifndef _ORDER_BOOK_FILLS_H
+#define _ORDER_BOOK_FILLS_H
+
+#include <stdint.h>
+#include <stddef.h>
+#include <map>
+#include <set>
+#include <vector>
+#include "OrderBookEntry.h"
+
+/**
+ * The simulated fills recorded against one side of a composite order book, keyed by the price key of their level.
+ *
+ * compose() walks the order book side and the fills together from the top of the book and produces the composite
+ * levels, i.e. the order book amounts minus the filled amounts. Fills at levels that are no longer in the order book
+ * are dropped, and fills larger than their level are capped to the level's amount, on the way.
+ */
+class OrderBookFills {
+    std::map<int64_t, OrderBookEntry> fills;
+    bool bidSide;
+
+    public:
+        OrderBookFills();
+        OrderBookFills(bool bidSide);
+        OrderBookFills(const OrderBookFills &other);
+        OrderBookFills &operator=(const OrderBookFills &other);
+
+        bool isBidSide() const;
+        size_t size() const;
+        bool empty() const;
+        void clear();
+
+        void recordFill(const OrderBookEntry &fill);
+        void getFills(std::vector<OrderBookEntry> &output) const;
+        size_t compose(const std::set<OrderBookEntry> &book, size_t maxLevels, std::vector<OrderBookEntry> &output);
+};
+
+#endif
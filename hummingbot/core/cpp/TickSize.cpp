@@ -0,0 +1,83 @@
+#include "TickSize.h"
+#include <cmath>
+
+static double unitsPerIncrement(double increment) {
+    if (increment <= 0) {
+        return 0;
+    }
+    double inverse = std::round(1.0 / increment);
+    return std::fabs(inverse * increment - 1.0) < 1e-9 ? inverse : 0;
+}
+
+TickSize::TickSize() {
+    this->priceIncrement = this->amountIncrement = 0;
+    this->ticksPerUnit = this->lotsPerUnit = 0;
+}
+
+TickSize::TickSize(double priceIncrement, double amountIncrement) {
+    this->priceIncrement = priceIncrement > 0 ? priceIncrement : 0;
+    this->amountIncrement = amountIncrement > 0 ? amountIncrement : 0;
+    this->ticksPerUnit = unitsPerIncrement(this->priceIncrement);
+    this->lotsPerUnit = unitsPerIncrement(this->amountIncrement);
+}
+
+TickSize::TickSize(const TickSize &other) {
+    *this = other;
+}
+
+TickSize &TickSize::operator=(const TickSize &other) {
+    this->priceIncrement = other.priceIncrement;
+    this->amountIncrement = other.amountIncrement;
+    this->ticksPerUnit = other.ticksPerUnit;
+    this->lotsPerUnit = other.lotsPerUnit;
+    return *this;
+}
+
+bool TickSize::isEnabled() const {
+    return this->priceIncrement > 0;
+}
+
+double TickSize::getPriceIncrement() const {
+    return this->priceIncrement;
+}
+
+double TickSize::getAmountIncrement() const {
+    return this->amountIncrement;
+}
+
+int64_t TickSize::toPriceTicks(double price) const {
+    if (this->ticksPerUnit > 0) {
+        return std::llround(price * this->ticksPerUnit);
+    }
+    return std::llround(price / this->priceIncrement);
+}
+
+double TickSize::fromPriceTicks(int64_t priceTicks) const {
+    if (this->ticksPerUnit > 0) {
+        return priceTicks / this->ticksPerUnit;
+    }
+    return priceTicks * this->priceIncrement;
+}
+
+double TickSize::roundAmount(double amount) const {
+    if (this->lotsPerUnit > 0) {
+        return std::round(amount * this->lotsPerUnit) / this->lotsPerUnit;
+    } else if (this->amountIncrement > 0) {
+        return std::round(amount / this->amountIncrement) * this->amountIncrement;
+    }
+    return amount;
+}
+
+OrderBookEntry TickSize::quantize(const OrderBookEntry &entry) const {
+    int64_t priceTicks = this->toPriceTicks(entry.getPrice());
+    return OrderBookEntry(priceTicks, this->fromPriceTicks(priceTicks), this->roundAmount(entry.getAmount()),
+                          entry.getUpdateId());
+}
+
+void TickSize::quantize(const std::vector<OrderBookEntry> &entries, std::vector<OrderBookEntry> &output) const {
+    output.clear();
+    output.reserve(entries.size());
+    for (const OrderBookEntry &entry : entries) {
+        output.push_back(this->quantize(entry));
+    }
+}
@@ -0,0 +1,40 @@
+#ifndef _TICK_SIZE_H
+#define _TICK_SIZE_H
+
+#include <stdint.h>
+#include <vector>
+#include "OrderBookEntry.h"
+
+/**
+ * Price tick and amount lot sizes of a trading pair.
+ *
+ * Quantized entries are keyed by their integer tick count, so the same price level always compares equal no matter
+ * how its decimal string was parsed, and their prices and amounts are snapped to exact multiples of the tick and lot
+ * sizes. A zero increment disables the quantization of prices or amounts respectively.
+ */
+class TickSize {
+    double priceIncrement;
+    double amountIncrement;
+    // For decimal increments like 0.01, dividing by 100 is exact where multiplying by 0.01 is not.
+    double ticksPerUnit;
+    double lotsPerUnit;
+
+    public:
+        TickSize();
+        TickSize(double priceIncrement, double amountIncrement);
+        TickSize(const TickSize &other);
+        TickSize &operator=(const TickSize &other);
+
+        bool isEnabled() const;
+        double getPriceIncrement() const;
+        double getAmountIncrement() const;
+
+        int64_t toPriceTicks(double price) const;
+        double fromPriceTicks(int64_t priceTicks) const;
+        double roundAmount(double amount) const;
+
+        OrderBookEntry quantize(const OrderBookEntry &entry) const;
+        void quantize(const std::vector<OrderBookEntry> &entries, std::vector<OrderBookEntry> &output) const;
+};
+
+#endif
@@ -0,0 +1,27 @@
+# distutils: language=c++
+
+from libcpp cimport bool
+from libcpp.vector cimport vector
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+
+cdef extern from "../cpp/FlatOrderBookSide.h":
+    cdef cppclass FlatOrderBookSide:
+        FlatOrderBookSide()
+        FlatOrderBookSide(bool bidSide)
+        FlatOrderBookSide(const FlatOrderBookSide &other)
+        FlatOrderBookSide &operator=(const FlatOrderBookSide &other)
+        bool isBidSide() const
+        size_t size() const
+        bool empty() const
+        size_t capacity() const
+        void clear()
+        void reserve(size_t numLevels)
+        void assignSnapshot(const vector[OrderBookEntry] &snapshotEntries)
+        void applyDiff(const OrderBookEntry &entry)
+        const OrderBookEntry &best() const
+        const OrderBookEntry &worst() const
+        const OrderBookEntry &levelAt(size_t levelIndex) const
+        void popBest()
+        void truncate(size_t numLevels)
+
+    void truncateFlatOverlapEntries(FlatOrderBookSide &bid_book, FlatOrderBookSide &ask_book, const bint &dex)
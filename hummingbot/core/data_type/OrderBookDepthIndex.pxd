@@ -0,0 +1,22 @@
+# distutils: language=c++
+
+from libcpp cimport bool
+
+cdef extern from "../cpp/OrderBookDepthIndex.h":
+    cdef cppclass OrderBookDepthIndex:
+        OrderBookDepthIndex()
+        OrderBookDepthIndex(bool bidSide)
+        OrderBookDepthIndex(const OrderBookDepthIndex &other)
+        OrderBookDepthIndex &operator=(const OrderBookDepthIndex &other)
+        void clear()
+        void reserve(size_t numLevels)
+        void append(double price, double amount)
+        size_t size() const
+        double getPrice(size_t levelIndex) const
+        double getCumulativeBase(size_t levelIndex) const
+        double getCumulativeQuote(size_t levelIndex) const
+        double getTotalBase() const
+        double getTotalQuote() const
+        size_t findLevelForBase(double baseVolume) const
+        size_t findLevelForQuote(double quoteVolume) const
+        size_t countLevelsWithinPrice(double price) const
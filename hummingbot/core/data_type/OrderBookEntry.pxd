@@ -7,10 +7,12 @@ cdef extern from "../cpp/OrderBookEntry.h":
     cdef cppclass OrderBookEntry:
         OrderBookEntry()
         OrderBookEntry(double price, double amount, int64_t updateId)
+        OrderBookEntry(int64_t priceTicks, double price, double amount, int64_t updateId)
         OrderBookEntry(const OrderBookEntry &other)
         OrderBookEntry &operator=(const OrderBookEntry &other)
         double getPrice() const
         double getAmount() const
         int64_t getUpdateId() const
+        int64_t getPriceKey() const
 
     void truncateOverlapEntries(set[OrderBookEntry] &bid_book, set[OrderBookEntry] &ask_book, const bint &dex)
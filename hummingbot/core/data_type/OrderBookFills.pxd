@@ -0,0 +1,21 @@
+# distutils: language=c++
+
+from libc.stdint cimport int64_t
+from libcpp cimport bool
+from libcpp.set cimport set
+from libcpp.vector cimport vector
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+
+cdef extern from "../cpp/OrderBookFills.h":
+    cdef cppclass OrderBookFills:
+        OrderBookFills()
+        OrderBookFills(bool bidSide)
+        OrderBookFills(const OrderBookFills &other)
+        OrderBookFills &operator=(const OrderBookFills &other)
+        bool isBidSide() const
+        size_t size() const
+        bool empty() const
+        void clear()
+        void recordFill(const OrderBookEntry &fill)
+        void getFills(vector[OrderBookEntry] &output) const
+        size_t compose(const set[OrderBookEntry] &book, size_t maxLevels, vector[OrderBookEntry] &output)
@@ -0,0 +1,20 @@
+# distutils: language=c++
+
+from libc.stdint cimport int64_t
+from libcpp.vector cimport vector
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+
+cdef extern from "../cpp/TickSize.h":
+    cdef cppclass TickSize:
+        TickSize()
+        TickSize(double priceIncrement, double amountIncrement)
+        TickSize(const TickSize &other)
+        TickSize &operator=(const TickSize &other)
+        bint isEnabled() const
+        double getPriceIncrement() const
+        double getAmountIncrement() const
+        int64_t toPriceTicks(double price) const
+        double fromPriceTicks(int64_t priceTicks) const
+        double roundAmount(double amount) const
+        OrderBookEntry quantize(const OrderBookEntry &entry) const
+        void quantize(const vector[OrderBookEntry] &entries, vector[OrderBookEntry] &output) const
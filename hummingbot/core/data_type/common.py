@@ -1,3 +1,4 @@
+from enum import Enum
 from typing import NamedTuple
 from decimal import Decimal
 from hummingbot.core.event.events import OrderType
@@ -14,3 +15,12 @@ class OpenOrder(NamedTuple):
     is_buy: bool
     time: int
     exchange_order_id: str
+
+
+class OrderBookEngine(Enum):
+    """
+    Storage backend of an OrderBook.
+    SET keeps one std::set node per price level, FLAT keeps each side in a contiguous sorted array.
+    """
+    SET = 1
+    FLAT = 2
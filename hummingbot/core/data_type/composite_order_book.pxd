@@ -1,8 +1,16 @@
 # distutils: language=c++
+from libcpp.vector cimport vector
 from hummingbot.core.data_type.order_book cimport OrderBook
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+from hummingbot.core.data_type.OrderBookFills cimport OrderBookFills
 
 cdef class CompositeOrderBook(OrderBook):
     cdef:
-        OrderBook _traded_order_book
+        OrderBookFills _bid_fills
+        OrderBookFills _ask_fills
 
+    cdef size_t c_compose_entries(self, bint is_buy, size_t max_levels, vector[OrderBookEntry] &output)
+
+    cdef c_rebuild_depth_index(self, bint is_buy)
+    cdef Py_ssize_t c_fill_numpy_entries(self, bint is_buy, double[:, ::1] output, size_t max_levels) except -1
     cdef double c_get_price(self, bint is_buy) except? -1
@@ -1,10 +1,13 @@
 # distutils: language=c++
-# distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
+# distutils: sources=['hummingbot/core/cpp/OrderBookEntry.cpp', 'hummingbot/core/cpp/OrderBookDepthIndex.cpp', 'hummingbot/core/cpp/OrderBookFills.cpp', 'hummingbot/core/cpp/TickSize.cpp']
 
-from typing import Iterator
+from typing import (
+    Dict,
+    Iterator,
+)
+from libc.stdint cimport int64_t
 from libcpp.set cimport set
 from cython.operator cimport(
-    postincrement as inc,
     dereference as deref,
     address as ref
 )
@@ -13,6 +16,8 @@ from libcpp.vector cimport vector
 from hummingbot.core.event.events import TradeType
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+from hummingbot.core.data_type.OrderBookDepthIndex cimport OrderBookDepthIndex
+from hummingbot.core.data_type.OrderBookFills cimport OrderBookFills
 
 
 cdef class CompositeOrderBook(OrderBook):
@@ -23,58 +28,57 @@ cdef class CompositeOrderBook(OrderBook):
     """
     def __init__(self, order_book: OrderBook = None):
         super().__init__()
-        self._traded_order_book = OrderBook()
+        self._bid_fills = OrderBookFills(True)
+        self._ask_fills = OrderBookFills(False)
 
     @property
     def traded_order_book(self) -> OrderBook:
-        return self._traded_order_book
+        """
+        The recorded fills, as a separate order book. This is a copy, updating it doesn't affect the composite book.
+        """
+        cdef:
+            vector[OrderBookEntry] bids
+            vector[OrderBookEntry] asks
+            OrderBook traded_order_book = OrderBook()
+        self._bid_fills.getFills(bids)
+        self._ask_fills.getFills(asks)
+        # Bid and ask fills may cross each other, so they're inserted without the snapshot's overlap truncation.
+        traded_order_book._bid_book.insert(bids.begin(), bids.end())
+        traded_order_book._ask_book.insert(asks.begin(), asks.end())
+        return traded_order_book
 
     def clear_traded_order_book(self):
-        self._traded_order_book._bid_book.clear()
-        self._traded_order_book._ask_book.clear()
+        self._bid_fills.clear()
+        self._ask_fills.clear()
+        self.c_invalidate_depth_index()
 
     def record_filled_order(self, order_fill_event):
         cdef:
-            vector[OrderBookEntry] cpp_bids
-            vector[OrderBookEntry] cpp_asks
-            set[OrderBookEntry].reverse_iterator bid_order_it = self._traded_order_book._bid_book.rbegin()
-            set[OrderBookEntry].iterator ask_order_it = self._traded_order_book._ask_book.begin()
-            OrderBookEntry entry
-
-        price = order_fill_event.price
-        amount = float(order_fill_event.amount)
-        timestamp = order_fill_event.timestamp
+            OrderBookEntry fill = OrderBookEntry(order_fill_event.price,
+                                                 float(order_fill_event.amount),
+                                                 order_fill_event.timestamp)
 
+        if self._tick_size.isEnabled():
+            fill = self._tick_size.quantize(fill)
+        # Buys are filled against the asks, and sells against the bids.
         if order_fill_event.trade_type is TradeType.BUY:
-            while ask_order_it != self._traded_order_book._ask_book.end():
-                entry = deref(ask_order_it)
-                # price is in the order book, sum the amount
-                if entry.getPrice() == price:
-                    amount += entry.getAmount()
-                    break
-                # price is outside of the ask price range, break and insert the new filled ask order into the ask book
-                elif entry.getPrice() > price:
-                    break
-                # price is further up the ask price range, continue searching
-                elif entry.getPrice() < price:
-                    inc(ask_order_it)
-            cpp_asks.push_back(OrderBookEntry(price, amount, timestamp))
-
+            self._ask_fills.recordFill(fill)
         elif order_fill_event.trade_type is TradeType.SELL:
-            while bid_order_it != self._traded_order_book._bid_book.rend():
-                entry = deref(bid_order_it)
-                if entry.getPrice() == price:
-                    amount += entry.getAmount()
-                    break
-                # price is further down the bid price range, continue searching
-                elif entry.getPrice() > price:
-                    inc(bid_order_it)
-                # price is outside of the bid price range, break and insert the new filled order into the bid book
-                elif entry.getPrice() < price:
-                    break
-            cpp_bids.push_back(OrderBookEntry(price, amount, timestamp))
-
-        self._traded_order_book.c_apply_diffs(cpp_bids, cpp_asks, timestamp)
+            self._bid_fills.recordFill(fill)
+        self.c_invalidate_depth_index()
+
+    def memory_usage(self) -> Dict[str, int]:
+        cdef:
+            dict memory_usage = super().memory_usage()
+        # Fill map nodes hold the key next to the entry, on top of the tree node pointers.
+        memory_usage["fill_bytes"] = ((self._bid_fills.size() + self._ask_fills.size()) *
+                                      (sizeof(int64_t) + sizeof(OrderBookEntry) + 4 * sizeof(void *)))
+        return memory_usage
+
+    cdef size_t c_compose_entries(self, bint is_buy, size_t max_levels, vector[OrderBookEntry] &output):
+        if is_buy:
+            return self._ask_fills.compose(self._ask_book, max_levels, output)
+        return self._bid_fills.compose(self._bid_book, max_levels, output)
 
     def original_bid_entries(self) -> Iterator[OrderBookRow]:
         return super().bid_entries()
@@ -84,115 +88,51 @@ cdef class CompositeOrderBook(OrderBook):
 
     def bid_entries(self) -> Iterator[OrderBookRow]:
         cdef:
-            set[OrderBookEntry].reverse_iterator order_it = self._bid_book.rbegin()
-            set[OrderBookEntry].reverse_iterator traded_order_it = self._traded_order_book._bid_book.rbegin()
-            OrderBookEntry traded_order_entry
-            OrderBookEntry original_order_entry
-            vector[OrderBookEntry] cpp_asks_changes
-            vector[OrderBookEntry] cpp_bids_changes
-
-        while order_it != self._bid_book.rend():
-            original_order_entry = deref(order_it)
-            original_order_price = original_order_entry.getPrice()
-            original_order_amount = original_order_entry.getAmount()
-            original_order_update_id = original_order_entry.getUpdateId()
-
-            while traded_order_it != self._traded_order_book._bid_book.rend():
-                traded_order_entry = deref(traded_order_it)
-                traded_order_price = traded_order_entry.getPrice()
-                traded_order_amount = traded_order_entry.getAmount()
-                traded_order_update_id = traded_order_entry.getUpdateId()
-
-                # Found matching price for the recorded filled order, return composite order book row
-                if traded_order_price == original_order_price:
-                    composite_amount = original_order_amount - traded_order_amount
-                    if composite_amount > 0:
-                        yield OrderBookRow(original_order_price, composite_amount, original_order_update_id)
-                    else:
-                        cpp_bids_changes.push_back(OrderBookEntry(original_order_price,
-                                                                  min(original_order_amount, traded_order_amount),
-                                                                  traded_order_update_id))
-                    inc(traded_order_it)
-                    # continue to next original order book row
-                    break
-                # Recorded filled order price is outside of the bid price range
-                elif traded_order_price > original_order_price:
-                    # Remove the recorded entry and increment the pointer
-                    cpp_bids_changes.push_back(OrderBookEntry(traded_order_price, 0, traded_order_update_id))
-                    inc(traded_order_it)
-                # Recorded filled order price is within lower end of the bid price range, yield original bid entry
-                elif traded_order_price < original_order_price:
-                    yield OrderBookRow(original_order_price, original_order_amount, original_order_update_id)
-                    break
-            else:
-                yield OrderBookRow(original_order_price, original_order_amount, original_order_update_id)
-
-            inc(order_it)
-
-        self._traded_order_book.c_apply_diffs(cpp_bids_changes, cpp_asks_changes, self._last_diff_uid)
+            vector[OrderBookEntry] entries
+            OrderBookEntry entry
+        self.c_compose_entries(False, self._bid_book.size(), entries)
+        for entry in entries:
+            yield OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId())
 
     def ask_entries(self) -> Iterator[OrderBookRow]:
         cdef:
-            set[OrderBookEntry].iterator order_it = self._ask_book.begin()
-            set[OrderBookEntry].iterator traded_order_it = self._traded_order_book._ask_book.begin()
-            OrderBookEntry original_order_entry
-            OrderBookEntry traded_order_entry
-            vector[OrderBookEntry] cpp_asks_changes
-            vector[OrderBookEntry] cpp_bids_changes
-
-        while order_it != self._ask_book.end():
-            original_order_entry = deref(order_it)
-            original_order_price = original_order_entry.getPrice()
-            original_order_amount = original_order_entry.getAmount()
-            original_order_update_id = original_order_entry.getUpdateId()
-
-            while traded_order_it != self._traded_order_book._ask_book.end():
-                traded_order_entry = deref(traded_order_it)
-                traded_order_price = traded_order_entry.getPrice()
-                traded_order_amount = traded_order_entry.getAmount()
-                traded_order_update_id = traded_order_entry.getUpdateId()
-
-                if traded_order_price == original_order_price:
-                    composite_amount = original_order_amount - traded_order_amount
-                    if composite_amount > 0:
-                        yield OrderBookRow(original_order_price, composite_amount, original_order_update_id)
-                    else:
-                        cpp_asks_changes.push_back(OrderBookEntry(original_order_price,
-                                                                  min(original_order_amount, traded_order_amount),
-                                                                  traded_order_update_id))
-                    inc(traded_order_it)
-                    # continue to next original order book row
-                    break
-                # Recorded filled order price is within upper end of the ask price range, yield original ask entry
-                elif traded_order_price > original_order_price:
-                    yield OrderBookRow(original_order_price, original_order_amount, original_order_update_id)
-                    break
-                # Recorded filled order price is outside of the ask price range, remove the recorded ask order
-                elif traded_order_price < original_order_price:
-                    cpp_asks_changes.push_back(OrderBookEntry(traded_order_price, 0, traded_order_update_id))
-                    inc(traded_order_it)
-
-            else:
-                yield OrderBookRow(original_order_price, original_order_amount, original_order_update_id)
-
-            inc(order_it)
-
-        self._traded_order_book.c_apply_diffs(cpp_bids_changes, cpp_asks_changes, self._last_diff_uid)
+            vector[OrderBookEntry] entries
+            OrderBookEntry entry
+        self.c_compose_entries(True, self._ask_book.size(), entries)
+        for entry in entries:
+            yield OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId())
+
+    cdef c_rebuild_depth_index(self, bint is_buy):
+        # The depth queries must see the composite entries, i.e. the order book minus the recorded fills.
+        cdef:
+            OrderBookDepthIndex *depth_index = ref(self._ask_depth_index) if is_buy else ref(self._bid_depth_index)
+            vector[OrderBookEntry] entries
+            size_t i
+
+        self.c_compose_entries(is_buy, self._ask_book.size() if is_buy else self._bid_book.size(), entries)
+        deref(depth_index).clear()
+        for i in range(entries.size()):
+            deref(depth_index).append(entries[i].getPrice(), entries[i].getAmount())
+
+    cdef Py_ssize_t c_fill_numpy_entries(self, bint is_buy, double[:, ::1] output, size_t max_levels) except -1:
+        cdef:
+            vector[OrderBookEntry] entries
+            size_t level
+
+        self.c_compose_entries(is_buy, max_levels, entries)
+        for level in range(entries.size()):
+            output[level, 0] = entries[level].getPrice()
+            output[level, 1] = entries[level].getAmount()
+            output[level, 2] = entries[level].getUpdateId()
+        return entries.size()
 
     cdef double c_get_price(self, bint is_buy) except? -1:
         cdef:
             set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
+            vector[OrderBookEntry] entries
         if deref(book).size() < 1:
             raise EnvironmentError("Order book is empty - no price quote is possible.")
 
-        ask_it = self.ask_entries()
-        bid_it = self.bid_entries()
-        try:
-            if is_buy:
-                best_ask = next(ask_it)
-                return best_ask.price
-            else:
-                best_bid = next(bid_it)
-                return best_bid.price
-        except Exception:
-            raise
+        if self.c_compose_entries(is_buy, 1, entries) < 1:
+            raise StopIteration
+        return entries[0].getPrice()
@@ -4,6 +4,11 @@ from libc.stdint cimport int64_t
 from libcpp.set cimport set
 from libcpp.vector cimport vector
 from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+from hummingbot.core.data_type.FlatOrderBookSide cimport FlatOrderBookSide
+from hummingbot.core.data_type.OrderBookDepthIndex cimport OrderBookDepthIndex
+from hummingbot.core.data_type.TickSize cimport TickSize
+from hummingbot.core.data_type.trade_tape cimport TradeTape
+from hummingbot.core.data_type.order_book_metrics cimport OrderBookMetrics
 from hummingbot.core.pubsub cimport PubSub
 from .order_book_query_result cimport OrderBookQueryResult
 cimport numpy as np
@@ -12,24 +17,63 @@ cimport numpy as np
 cdef class OrderBook(PubSub):
     cdef set[OrderBookEntry] _bid_book
     cdef set[OrderBookEntry] _ask_book
+    cdef FlatOrderBookSide _flat_bid_book
+    cdef FlatOrderBookSide _flat_ask_book
+    cdef bint _use_flat_book
+    cdef TickSize _tick_size
+    cdef OrderBookDepthIndex _bid_depth_index
+    cdef OrderBookDepthIndex _ask_depth_index
+    cdef bint _bid_depth_index_dirty
+    cdef bint _ask_depth_index_dirty
+    cdef size_t _depth_cap
+    cdef size_t _depth_cap_buffer
+    cdef bint _bid_depth_truncated
+    cdef bint _ask_depth_truncated
+    cdef double _bid_depth_limit_price
+    cdef double _ask_depth_limit_price
+    cdef bint _depth_resync_required
     cdef int64_t _snapshot_uid
     cdef int64_t _last_diff_uid
     cdef double _best_bid
     cdef double _best_ask
+    cdef double _top_bid_price
+    cdef double _top_bid_amount
+    cdef double _top_ask_price
+    cdef double _top_ask_amount
     cdef double _last_trade_price
     cdef double _last_applied_trade
     cdef double _last_trade_price_rest_updated
+    cdef TradeTape _trade_tape
+    cdef OrderBookMetrics _metrics
     cdef bint _dex
 
-    cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
-    cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
+    cdef c_apply_diffs(self, vector[OrderBookEntry] &bids, vector[OrderBookEntry] &asks, int64_t update_id)
+    cdef c_apply_book_diffs(self, vector[OrderBookEntry] &bids, vector[OrderBookEntry] &asks, int64_t update_id)
+    cdef c_apply_set_diffs(self, vector[OrderBookEntry] &bids, vector[OrderBookEntry] &asks)
+    cdef c_apply_flat_diffs(self, vector[OrderBookEntry] &bids, vector[OrderBookEntry] &asks)
+    cdef c_truncate_depth(self)
+    cdef c_check_depth(self)
+    cdef c_apply_snapshot(self, vector[OrderBookEntry] &bids, vector[OrderBookEntry] &asks, int64_t update_id)
+    cdef c_apply_book_snapshot(self, vector[OrderBookEntry] &bids, vector[OrderBookEntry] &asks, int64_t update_id)
     cdef c_apply_trade(self, object trade_event)
+    cdef c_update_top_of_book(self, int64_t update_id)
+    cdef bint c_diffs_near_top(self, vector[OrderBookEntry] &entries, bint is_bid)
+    cdef c_update_side_depth(self, bint is_bid)
+    cdef c_update_metrics(self, int64_t update_id, bint bid_depth_changed, bint ask_depth_changed)
+    cdef OrderBookMetrics c_get_metrics(self)
     cdef c_apply_numpy_diffs(self,
                              np.ndarray[np.float64_t, ndim=2] bids_array,
                              np.ndarray[np.float64_t, ndim=2] asks_array)
     cdef c_apply_numpy_snapshot(self,
                                 np.ndarray[np.float64_t, ndim=2] bids_array,
                                 np.ndarray[np.float64_t, ndim=2] asks_array)
+    cdef c_invalidate_depth_index(self)
+    cdef c_rebuild_depth_index(self, bint is_buy)
+    cdef OrderBookDepthIndex *c_get_depth_index(self, bint is_buy) except NULL
+    cdef size_t c_get_num_levels(self, bint is_buy)
+    cdef size_t c_get_side_bytes(self, bint is_buy)
+    cdef np.ndarray c_entries_to_numpy(self, bint is_buy, int64_t depth, object out)
+    cdef Py_ssize_t c_fill_numpy_entries(self, bint is_buy, double[:, ::1] output, size_t max_levels) except -1
     cdef double c_get_price(self, bint is_buy) except? -1
     cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume)
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume)
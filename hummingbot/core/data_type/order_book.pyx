@@ -1,14 +1,23 @@
 # distutils: language=c++
-# distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
+# distutils: sources=['hummingbot/core/cpp/OrderBookEntry.cpp', 'hummingbot/core/cpp/FlatOrderBookSide.cpp', 'hummingbot/core/cpp/OrderBookDepthIndex.cpp', 'hummingbot/core/cpp/TickSize.cpp']
 from cython.operator cimport(
     postincrement as inc,
+    predecrement as dec,
     dereference as deref,
     address as ref
 )
 from hummingbot.core.data_type.OrderBookEntry cimport truncateOverlapEntries
+from hummingbot.core.data_type.FlatOrderBookSide cimport truncateFlatOverlapEntries
+from hummingbot.core.data_type.TickSize cimport TickSize
+from hummingbot.core.data_type.order_book_entries cimport OrderBookEntries
+from hummingbot.core.data_type.trade_tape cimport TradeTape
+from hummingbot.core.data_type.order_book_metrics cimport OrderBookMetrics
+from hummingbot.core.data_type.common import OrderBookEngine
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.event.events import (
     OrderBookEvent,
+    OrderBookMetricsEvent,
+    OrderBookTopOfBookEvent,
     OrderBookTradeEvent
 )
 from typing import (
@@ -31,10 +40,16 @@ import logging
 cimport numpy as np
 ob_logger = None
 NaN = float("nan")
+cdef int64_t TOP_OF_BOOK_EVENT_TAG = OrderBookEvent.TopOfBookChangedEvent.value
+cdef int64_t METRICS_EVENT_TAG = OrderBookEvent.MetricsChangedEvent.value
+# Red-black tree nodes hold the color and the parent, left and right pointers besides the entry.
+cdef size_t SET_NODE_OVERHEAD = 4 * sizeof(void *)
 
 
 cdef class OrderBook(PubSub):
     ORDER_BOOK_TRADE_EVENT_TAG = OrderBookEvent.TradeEvent.value
+    ORDER_BOOK_TOP_OF_BOOK_EVENT_TAG = OrderBookEvent.TopOfBookChangedEvent.value
+    ORDER_BOOK_METRICS_EVENT_TAG = OrderBookEvent.MetricsChangedEvent.value
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -43,17 +58,75 @@ cdef class OrderBook(PubSub):
             ob_logger = logging.getLogger(__name__)
         return ob_logger
 
-    def __init__(self, dex=False):
+    def __init__(self, dex=False, engine=OrderBookEngine.SET, depth_cap=0, depth_cap_buffer=10,
+                 trade_tape_capacity=1000):
+        """
+        :param dex: whether overlapping bid and ask entries are resolved by size (DEX) or by update ID
+        :param engine: storage backend of the book sides
+        :param depth_cap: if positive, only keep this many levels per side (plus depth_cap_buffer levels), and drop
+                          diffs beyond the kept levels. depth_resync_required is set once a side shrinks below the
+                          cap, since the levels that were dropped may be needed again.
+        :param trade_tape_capacity: number of recent trades kept on the trade tape
+        """
         super().__init__()
+        self._depth_cap = max(depth_cap, 0)
+        self._depth_cap_buffer = max(depth_cap_buffer, 0)
+        self._bid_depth_truncated = self._ask_depth_truncated = False
+        self._bid_depth_limit_price = self._ask_depth_limit_price = float("NaN")
+        self._depth_resync_required = False
+        self._use_flat_book = engine is OrderBookEngine.FLAT
+        self._flat_bid_book = FlatOrderBookSide(True)
+        self._flat_ask_book = FlatOrderBookSide(False)
+        self._bid_depth_index = OrderBookDepthIndex(True)
+        self._ask_depth_index = OrderBookDepthIndex(False)
+        self._bid_depth_index_dirty = self._ask_depth_index_dirty = True
         self._snapshot_uid = 0
         self._last_diff_uid = 0
         self._best_bid = self._best_ask = float("NaN")
+        self._top_bid_price = self._top_ask_price = float("NaN")
+        self._top_bid_amount = self._top_ask_amount = 0
         self._last_trade_price = float("NaN")
         self._last_applied_trade = -1000.0
         self._last_trade_price_rest_updated = -1000
+        self._trade_tape = TradeTape(trade_tape_capacity)
+        self._metrics = None
         self._dex = dex
 
-    cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
+    cdef c_apply_diffs(self, vector[OrderBookEntry] &bids, vector[OrderBookEntry] &asks, int64_t update_id):
+        cdef:
+            vector[OrderBookEntry] quantized_bids
+            vector[OrderBookEntry] quantized_asks
+        if self._tick_size.isEnabled():
+            self._tick_size.quantize(bids, quantized_bids)
+            self._tick_size.quantize(asks, quantized_asks)
+            self.c_apply_book_diffs(quantized_bids, quantized_asks, update_id)
+        else:
+            self.c_apply_book_diffs(bids, asks, update_id)
+
+    cdef c_apply_book_diffs(self, vector[OrderBookEntry] &bids, vector[OrderBookEntry] &asks, int64_t update_id):
+        cdef:
+            bint bid_depth_changed = False
+            bint ask_depth_changed = False
+        if self._metrics is not None:
+            bid_depth_changed = self.c_diffs_near_top(bids, True)
+            ask_depth_changed = self.c_diffs_near_top(asks, False)
+
+        if self._use_flat_book:
+            self.c_apply_flat_diffs(bids, asks)
+        else:
+            self.c_apply_set_diffs(bids, asks)
+        if self._depth_cap > 0:
+            self.c_truncate_depth()
+            self.c_check_depth()
+        self.c_invalidate_depth_index()
+
+        # Remember the last diff update ID.
+        self._last_diff_uid = update_id
+        self.c_update_top_of_book(update_id)
+        if self._metrics is not None:
+            self.c_update_metrics(update_id, bid_depth_changed, ask_depth_changed)
+
+    cdef c_apply_set_diffs(self, vector[OrderBookEntry] &bids, vector[OrderBookEntry] &asks):
         cdef:
             set[OrderBookEntry].iterator bid_book_end = self._bid_book.end()
             set[OrderBookEntry].iterator ask_book_end = self._ask_book.end()
@@ -65,12 +138,16 @@ cdef class OrderBook(PubSub):
 
         # Apply the diffs. Diffs with 0 amounts mean deletion.
         for bid in bids:
+            if self._bid_depth_truncated and bid.getPrice() < self._bid_depth_limit_price:
+                continue
             result = self._bid_book.find(bid)
             if result != bid_book_end:
                 self._bid_book.erase(result)
             if bid.getAmount() > 0:
                 self._bid_book.insert(bid)
         for ask in asks:
+            if self._ask_depth_truncated and ask.getPrice() > self._ask_depth_limit_price:
+                continue
             result = self._ask_book.find(ask)
             if result != ask_book_end:
                 self._ask_book.erase(result)
@@ -90,10 +167,40 @@ cdef class OrderBook(PubSub):
             top_ask = deref(ask_iterator)
             self._best_ask = top_ask.getPrice()
 
-        # Remember the last diff update ID.
-        self._last_diff_uid = update_id
+    cdef c_apply_flat_diffs(self, vector[OrderBookEntry] &bids, vector[OrderBookEntry] &asks):
+        # Apply the diffs. Diffs with 0 amounts mean deletion.
+        for bid in bids:
+            if self._bid_depth_truncated and bid.getPrice() < self._bid_depth_limit_price:
+                continue
+            self._flat_bid_book.applyDiff(bid)
+        for ask in asks:
+            if self._ask_depth_truncated and ask.getPrice() > self._ask_depth_limit_price:
+                continue
+            self._flat_ask_book.applyDiff(ask)
+
+        # Same overlap rules as the set based book, see FlatOrderBookSide.cpp
+        truncateFlatOverlapEntries(self._flat_bid_book, self._flat_ask_book, self._dex)
 
-    cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
+        # Record the current best prices, for faster c_get_price() calls.
+        if not self._flat_bid_book.empty():
+            self._best_bid = self._flat_bid_book.best().getPrice()
+        if not self._flat_ask_book.empty():
+            self._best_ask = self._flat_ask_book.best().getPrice()
+
+    cdef c_apply_snapshot(self, vector[OrderBookEntry] &bids, vector[OrderBookEntry] &asks, int64_t update_id):
+        cdef:
+            vector[OrderBookEntry] quantized_bids
+            vector[OrderBookEntry] quantized_asks
+        if self._tick_size.isEnabled():
+            self._tick_size.quantize(bids, quantized_bids)
+            self._tick_size.quantize(asks, quantized_asks)
+            self.c_apply_book_snapshot(quantized_bids, quantized_asks, update_id)
+        else:
+            self.c_apply_book_snapshot(bids, asks, update_id)
+        if self._metrics is not None:
+            self.c_update_metrics(update_id, True, True)
+
+    cdef c_apply_book_snapshot(self, vector[OrderBookEntry] &bids, vector[OrderBookEntry] &asks, int64_t update_id):
         cdef:
             double best_bid_price = float("NaN")
             double best_ask_price = float("NaN")
@@ -102,6 +209,28 @@ cdef class OrderBook(PubSub):
             OrderBookEntry top_bid
             OrderBookEntry top_ask
 
+        self._bid_depth_truncated = self._ask_depth_truncated = False
+        self._depth_resync_required = False
+
+        if self._use_flat_book:
+            self._flat_bid_book.assignSnapshot(bids)
+            self._flat_ask_book.assignSnapshot(asks)
+            if self._dex:
+                truncateFlatOverlapEntries(self._flat_bid_book, self._flat_ask_book, self._dex)
+            if self._depth_cap > 0:
+                self.c_truncate_depth()
+            # Record the current best prices, for faster c_get_price() calls.
+            if not self._flat_bid_book.empty():
+                best_bid_price = self._flat_bid_book.best().getPrice()
+            if not self._flat_ask_book.empty():
+                best_ask_price = self._flat_ask_book.best().getPrice()
+            self._best_bid = best_bid_price
+            self._best_ask = best_ask_price
+            self._snapshot_uid = update_id
+            self.c_invalidate_depth_index()
+            self.c_update_top_of_book(update_id)
+            return
+
         # Start with an empty order book, and then insert all entries.
         self._bid_book.clear()
         self._ask_book.clear()
@@ -126,16 +255,202 @@ cdef class OrderBook(PubSub):
                 top_ask = deref(ask_iterator)
                 best_ask_price = top_ask.getPrice()
 
+        if self._depth_cap > 0:
+            self.c_truncate_depth()
+
         # Record the current best prices, for faster c_get_price() calls.
         self._best_bid = best_bid_price
         self._best_ask = best_ask_price
 
         # Remember the last snapshot update ID.
         self._snapshot_uid = update_id
+        self.c_invalidate_depth_index()
+        self.c_update_top_of_book(update_id)
+
+    cdef c_truncate_depth(self):
+        """
+        Keeps at most depth_cap + depth_cap_buffer levels per side. Once a side is truncated, diffs beyond its worst
+        kept price are ignored, since the levels in between are not known anymore.
+        """
+        cdef:
+            size_t max_levels = self._depth_cap + self._depth_cap_buffer
+            set[OrderBookEntry].iterator ask_iterator
+
+        if self._use_flat_book:
+            if self._flat_bid_book.size() > max_levels:
+                self._flat_bid_book.truncate(max_levels)
+                self._bid_depth_truncated = True
+                self._bid_depth_limit_price = self._flat_bid_book.worst().getPrice()
+            if self._flat_ask_book.size() > max_levels:
+                self._flat_ask_book.truncate(max_levels)
+                self._ask_depth_truncated = True
+                self._ask_depth_limit_price = self._flat_ask_book.worst().getPrice()
+            return
+
+        if self._bid_book.size() > max_levels:
+            while self._bid_book.size() > max_levels:
+                self._bid_book.erase(self._bid_book.begin())
+            self._bid_depth_truncated = True
+            self._bid_depth_limit_price = deref(self._bid_book.begin()).getPrice()
+        if self._ask_book.size() > max_levels:
+            while self._ask_book.size() > max_levels:
+                ask_iterator = self._ask_book.end()
+                dec(ask_iterator)
+                self._ask_book.erase(ask_iterator)
+            ask_iterator = self._ask_book.end()
+            dec(ask_iterator)
+            self._ask_depth_truncated = True
+            self._ask_depth_limit_price = deref(ask_iterator).getPrice()
+
+    cdef c_check_depth(self):
+        # A truncated side that shrank below the cap can't be trusted anymore, the book must be resynced.
+        if ((self._bid_depth_truncated and self.c_get_num_levels(False) < self._depth_cap) or
+                (self._ask_depth_truncated and self.c_get_num_levels(True) < self._depth_cap)):
+            self._depth_resync_required = True
+
+    cdef c_update_top_of_book(self, int64_t update_id):
+        """
+        Emits a TopOfBookChangedEvent if the best bid or ask price or size differs from the last update. Empty sides are
+        reported with a NaN price and a 0 amount.
+        """
+        cdef:
+            double bid_price = NaN
+            double bid_amount = 0
+            double ask_price = NaN
+            double ask_amount = 0
+            set[OrderBookEntry].reverse_iterator bid_iterator
+            set[OrderBookEntry].iterator ask_iterator
+
+        if self._use_flat_book:
+            if not self._flat_bid_book.empty():
+                bid_price = self._flat_bid_book.best().getPrice()
+                bid_amount = self._flat_bid_book.best().getAmount()
+            if not self._flat_ask_book.empty():
+                ask_price = self._flat_ask_book.best().getPrice()
+                ask_amount = self._flat_ask_book.best().getAmount()
+        else:
+            bid_iterator = self._bid_book.rbegin()
+            ask_iterator = self._ask_book.begin()
+            if bid_iterator != self._bid_book.rend():
+                bid_price = deref(bid_iterator).getPrice()
+                bid_amount = deref(bid_iterator).getAmount()
+            if ask_iterator != self._ask_book.end():
+                ask_price = deref(ask_iterator).getPrice()
+                ask_amount = deref(ask_iterator).getAmount()
+
+        # NaN prices only compare equal through the amounts, which are 0 for empty sides.
+        if ((bid_price == self._top_bid_price or (bid_price != bid_price and self._top_bid_price != self._top_bid_price))
+                and bid_amount == self._top_bid_amount
+                and (ask_price == self._top_ask_price or
+                     (ask_price != ask_price and self._top_ask_price != self._top_ask_price))
+                and ask_amount == self._top_ask_amount):
+            return
+
+        self._top_bid_price = bid_price
+        self._top_bid_amount = bid_amount
+        self._top_ask_price = ask_price
+        self._top_ask_amount = ask_amount
+        if self._events.find(TOP_OF_BOOK_EVENT_TAG) != self._events.end():
+            self.c_trigger_event(TOP_OF_BOOK_EVENT_TAG,
+                                 OrderBookTopOfBookEvent(update_id, bid_price, bid_amount, ask_price, ask_amount))
+
+    cdef bint c_diffs_near_top(self, vector[OrderBookEntry] &entries, bint is_bid):
+        cdef:
+            size_t i
+        for i in range(entries.size()):
+            if self._metrics.c_is_near_top(is_bid, entries[i].getPrice()):
+                return True
+        return False
+
+    cdef c_update_side_depth(self, bint is_bid):
+        """
+        Sums up the amounts of the top metrics depth levels of one side.
+        """
+        cdef:
+            size_t depth = self._metrics.depth
+            size_t level = 0
+            double volume = 0
+            double boundary_price = NaN
+            FlatOrderBookSide *flat_side
+            set[OrderBookEntry].reverse_iterator bid_iterator = self._bid_book.rbegin()
+            set[OrderBookEntry].iterator ask_iterator = self._ask_book.begin()
+
+        if self._use_flat_book:
+            flat_side = ref(self._flat_bid_book) if is_bid else ref(self._flat_ask_book)
+            while level < depth and level < flat_side.size():
+                volume += flat_side.levelAt(level).getAmount()
+                boundary_price = flat_side.levelAt(level).getPrice()
+                level += 1
+        elif is_bid:
+            while level < depth and bid_iterator != self._bid_book.rend():
+                volume += deref(bid_iterator).getAmount()
+                boundary_price = deref(bid_iterator).getPrice()
+                inc(bid_iterator)
+                level += 1
+        else:
+            while level < depth and ask_iterator != self._ask_book.end():
+                volume += deref(ask_iterator).getAmount()
+                boundary_price = deref(ask_iterator).getPrice()
+                inc(ask_iterator)
+                level += 1
+        if level < depth:
+            boundary_price = NaN
+        self._metrics.c_set_side_depth(is_bid, volume, boundary_price)
+
+    cdef c_update_metrics(self, int64_t update_id, bint bid_depth_changed, bint ask_depth_changed):
+        """
+        Updates the metrics after the book has changed, only walking the sides whose top levels may have changed.
+        The overlap truncation always removes the best levels of a side, so a changed best price counts as well.
+        """
+        cdef:
+            OrderBookMetrics metrics = self._metrics
+        bid_depth_changed = bid_depth_changed or self._top_bid_price != metrics.best_bid_price
+        ask_depth_changed = ask_depth_changed or self._top_ask_price != metrics.best_ask_price
+        if not (bid_depth_changed or ask_depth_changed):
+            return
+        if bid_depth_changed:
+            self.c_update_side_depth(True)
+        if ask_depth_changed:
+            self.c_update_side_depth(False)
+        metrics.c_update(update_id, self._top_bid_price, self._top_bid_amount, self._top_ask_price,
+                         self._top_ask_amount)
+        if self._events.find(METRICS_EVENT_TAG) != self._events.end():
+            self.c_trigger_event(METRICS_EVENT_TAG, metrics.to_event())
+
+    cdef OrderBookMetrics c_get_metrics(self):
+        return self._metrics
+
+    def enable_metrics(self, depth: int = 5):
+        """
+        Starts keeping OrderBookMetrics (mid price, microprice, spread and the imbalance of the top `depth` levels) up
+        to date on every diff and snapshot. A MetricsChangedEvent is emitted whenever they change.
+        """
+        self._metrics = OrderBookMetrics(depth)
+        self.c_update_metrics(max(self._snapshot_uid, self._last_diff_uid), True, True)
+
+    def disable_metrics(self):
+        self._metrics = None
+
+    @property
+    def metrics(self) -> Optional[OrderBookMetrics]:
+        return self._metrics
+
+    def enable_depth_cap(self, depth_cap: int, depth_cap_buffer: int = 10):
+        """
+        Caps an existing order book to depth_cap levels per side (plus depth_cap_buffer levels), the same as creating
+        it with these parameters. The levels beyond the cap are dropped right away.
+        """
+        self._depth_cap = max(depth_cap, 0)
+        self._depth_cap_buffer = max(depth_cap_buffer, 0)
+        if self._depth_cap > 0:
+            self.c_truncate_depth()
+            self.c_invalidate_depth_index()
 
     cdef c_apply_trade(self, object trade_event):
         self._last_trade_price = trade_event.price
         self._last_applied_trade = time.perf_counter()
+        self._trade_tape.c_append(trade_event.timestamp, trade_event.price, trade_event.amount,
+                                  trade_event.type.value)
         self.c_trigger_event(self.ORDER_BOOK_TRADE_EVENT_TAG, trade_event)
 
     @property
@@ -146,6 +461,13 @@ cdef class OrderBook(PubSub):
     def last_trade_price(self, value: float):
         self._last_trade_price = value
 
+    @property
+    def trade_tape(self) -> TradeTape:
+        """
+        Ring buffer of the most recent trades applied to the order book, shared by all of its consumers.
+        """
+        return self._trade_tape
+
     @property
     def last_applied_trade(self) -> float:
         return self._last_applied_trade
@@ -158,6 +480,50 @@ cdef class OrderBook(PubSub):
     def last_trade_price_rest_updated(self, value: float):
         self._last_trade_price_rest_updated = value
 
+    @property
+    def engine(self) -> OrderBookEngine:
+        return OrderBookEngine.FLAT if self._use_flat_book else OrderBookEngine.SET
+
+    @property
+    def top_of_book(self) -> Tuple[float, float, float, float]:
+        """
+        (best bid price, best bid amount, best ask price, best ask amount) as of the last applied diff or snapshot.
+        """
+        return self._top_bid_price, self._top_bid_amount, self._top_ask_price, self._top_ask_amount
+
+    def set_tick_size(self, price_increment: float, amount_increment: float = 0):
+        """
+        Switches the order book to tick mode, e.g. with a trading rule's min_price_increment and
+        min_base_amount_increment. Levels are then keyed by their integer tick count, and prices and amounts are
+        snapped to multiples of the increments when they are applied. A price increment of 0 switches tick mode off.
+        The current levels are converted right away.
+        """
+        cdef:
+            vector[OrderBookEntry] bids
+            vector[OrderBookEntry] asks
+            int64_t snapshot_uid = self._snapshot_uid
+        self._tick_size = TickSize(float(price_increment), float(amount_increment))
+        for price, amount, update_id in self.bid_entries():
+            bids.push_back(OrderBookEntry(price, amount, update_id))
+        for price, amount, update_id in self.ask_entries():
+            asks.push_back(OrderBookEntry(price, amount, update_id))
+        self.c_apply_snapshot(bids, asks, snapshot_uid)
+
+    @property
+    def tick_size(self) -> Tuple[float, float]:
+        """
+        (price increment, amount increment), zeros when tick mode is off.
+        """
+        return self._tick_size.getPriceIncrement(), self._tick_size.getAmountIncrement()
+
+    @property
+    def depth_cap(self) -> int:
+        return self._depth_cap
+
+    @property
+    def depth_resync_required(self) -> bool:
+        return self._depth_resync_required
+
     @property
     def snapshot_uid(self) -> int:
         return self._snapshot_uid
@@ -166,14 +532,111 @@ cdef class OrderBook(PubSub):
     def last_diff_uid(self) -> int:
         return self._last_diff_uid
 
+    cdef size_t c_get_side_bytes(self, bint is_buy):
+        cdef:
+            FlatOrderBookSide *flat_side = ref(self._flat_ask_book) if is_buy else ref(self._flat_bid_book)
+        if self._use_flat_book:
+            return flat_side.capacity() * sizeof(OrderBookEntry)
+        return self.c_get_num_levels(is_buy) * (sizeof(OrderBookEntry) + SET_NODE_OVERHEAD)
+
+    def memory_usage(self) -> Dict[str, int]:
+        """
+        Estimated bytes held by the C++ containers and the trade tape of the order book. Set sides are counted per
+        tree node, flat sides by their reserved capacity.
+        """
+        return {
+            "bid_levels": self.c_get_num_levels(False),
+            "ask_levels": self.c_get_num_levels(True),
+            "bid_bytes": self.c_get_side_bytes(False),
+            "ask_bytes": self.c_get_side_bytes(True),
+            "depth_index_bytes": (self._bid_depth_index.size() + self._ask_depth_index.size()) * 3 * sizeof(double),
+            "trade_tape_bytes": self._trade_tape._buffer.nbytes,
+        }
+
     @property
     def snapshot(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
-        bids_rows = list(self.bid_entries())
-        asks_rows = list(self.ask_entries())
-        bids_df = pd.DataFrame(data=bids_rows, columns=OrderBookRow._fields, dtype="float64")
-        asks_df = pd.DataFrame(data=asks_rows, columns=OrderBookRow._fields, dtype="float64")
+        bids_array, asks_array = self.get_numpy_snapshot()
+        bids_df = pd.DataFrame(data=bids_array, columns=OrderBookRow._fields, dtype="float64")
+        asks_df = pd.DataFrame(data=asks_array, columns=OrderBookRow._fields, dtype="float64")
         return bids_df, asks_df
 
+    def get_numpy_snapshot(self,
+                           depth: int = -1,
+                           bids_out: Optional[np.ndarray] = None,
+                           asks_out: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the bids and asks as [price, amount, update_id] float64 arrays, see bid_entries_numpy().
+        """
+        return self.c_entries_to_numpy(False, depth, bids_out), self.c_entries_to_numpy(True, depth, asks_out)
+
+    def bid_entries_numpy(self, depth: int = -1, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Returns the bid levels from the top of the book, as a float64 array with 3 columns [price, amount, update_id],
+        i.e. the layout apply_numpy_snapshot() takes.
+
+        :param depth: maximum number of levels to return, negative for the full depth
+        :param out: optional C-contiguous float64 array of shape (rows, 3) to write the levels into. At most `rows`
+                    levels are written and a view of the filled rows is returned, so repeated snapshots can reuse
+                    the same buffer.
+        """
+        return self.c_entries_to_numpy(False, depth, out)
+
+    def ask_entries_numpy(self, depth: int = -1, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Returns the ask levels from the top of the book, see bid_entries_numpy().
+        """
+        return self.c_entries_to_numpy(True, depth, out)
+
+    cdef np.ndarray c_entries_to_numpy(self, bint is_buy, int64_t depth, object out):
+        cdef:
+            size_t max_levels = self.c_get_num_levels(is_buy)
+            Py_ssize_t num_rows
+
+        if depth >= 0:
+            max_levels = min(max_levels, <size_t>depth)
+        if out is None:
+            out = np.empty((max_levels, 3), dtype="float64")
+        else:
+            if out.ndim != 2 or out.shape[1] != 3 or out.dtype != np.float64:
+                raise ValueError("Output array must be a float64 array with 3 columns [price, amount, update_id].")
+            max_levels = min(max_levels, <size_t>out.shape[0])
+        num_rows = self.c_fill_numpy_entries(is_buy, out, max_levels)
+        return out[:num_rows]
+
+    cdef Py_ssize_t c_fill_numpy_entries(self, bint is_buy, double[:, ::1] output, size_t max_levels) except -1:
+        cdef:
+            FlatOrderBookSide *flat_book = ref(self._flat_ask_book) if is_buy else ref(self._flat_bid_book)
+            set[OrderBookEntry].iterator ask_iterator = self._ask_book.begin()
+            set[OrderBookEntry].reverse_iterator bid_iterator = self._bid_book.rbegin()
+            OrderBookEntry entry
+            size_t level = 0
+
+        if self._use_flat_book:
+            max_levels = min(max_levels, deref(flat_book).size())
+            while level < max_levels:
+                entry = deref(flat_book).levelAt(level)
+                output[level, 0] = entry.getPrice()
+                output[level, 1] = entry.getAmount()
+                output[level, 2] = entry.getUpdateId()
+                level += 1
+        elif is_buy:
+            while level < max_levels and ask_iterator != self._ask_book.end():
+                entry = deref(ask_iterator)
+                output[level, 0] = entry.getPrice()
+                output[level, 1] = entry.getAmount()
+                output[level, 2] = entry.getUpdateId()
+                level += 1
+                inc(ask_iterator)
+        else:
+            while level < max_levels and bid_iterator != self._bid_book.rend():
+                entry = deref(bid_iterator)
+                output[level, 0] = entry.getPrice()
+                output[level, 1] = entry.getAmount()
+                output[level, 2] = entry.getUpdateId()
+                level += 1
+                inc(bid_iterator)
+        return level
+
     def apply_diffs(self, bids: List[OrderBookRow], asks: List[OrderBookRow], update_id: int):
         cdef:
             vector[OrderBookEntry] cpp_bids
@@ -194,6 +657,12 @@ cdef class OrderBook(PubSub):
             cpp_asks.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
         self.c_apply_snapshot(cpp_bids, cpp_asks, update_id)
 
+    def apply_diff_entries(self, OrderBookEntries entries):
+        self.c_apply_diffs(entries._bids, entries._asks, entries._update_id)
+
+    def apply_snapshot_entries(self, OrderBookEntries entries):
+        self.c_apply_snapshot(entries._bids, entries._asks, entries._update_id)
+
     def apply_trade(self, trade: OrderBookTradeEvent):
         self.c_apply_trade(trade)
 
@@ -263,6 +732,13 @@ cdef class OrderBook(PubSub):
         cdef:
             set[OrderBookEntry].reverse_iterator it = self._bid_book.rbegin()
             OrderBookEntry entry
+            size_t level = 0
+        if self._use_flat_book:
+            while level < self._flat_bid_book.size():
+                entry = self._flat_bid_book.levelAt(level)
+                yield OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId())
+                level += 1
+            return
         while it != self._bid_book.rend():
             entry = deref(it)
             yield OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId())
@@ -272,6 +748,13 @@ cdef class OrderBook(PubSub):
         cdef:
             set[OrderBookEntry].iterator it = self._ask_book.begin()
             OrderBookEntry entry
+            size_t level = 0
+        if self._use_flat_book:
+            while level < self._flat_ask_book.size():
+                entry = self._flat_ask_book.levelAt(level)
+                yield OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId())
+                level += 1
+            return
         while it != self._ask_book.end():
             entry = deref(it)
             yield OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId())
@@ -305,152 +788,152 @@ cdef class OrderBook(PubSub):
                 break
         return retval
 
+    cdef size_t c_get_num_levels(self, bint is_buy):
+        if self._use_flat_book:
+            return self._flat_ask_book.size() if is_buy else self._flat_bid_book.size()
+        return self._ask_book.size() if is_buy else self._bid_book.size()
+
     cdef double c_get_price(self, bint is_buy) except? -1:
-        cdef:
-            set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
-        if deref(book).size() < 1:
+        if self.c_get_num_levels(is_buy) < 1:
             raise EnvironmentError("Order book is empty - no price quote is possible.")
         return self._best_ask if is_buy else self._best_bid
 
     def get_price(self, is_buy: bool) -> float:
         return self.c_get_price(is_buy)
 
+    cdef c_invalidate_depth_index(self):
+        self._bid_depth_index_dirty = self._ask_depth_index_dirty = True
+
+    cdef c_rebuild_depth_index(self, bint is_buy):
+        cdef:
+            OrderBookDepthIndex *depth_index = ref(self._ask_depth_index) if is_buy else ref(self._bid_depth_index)
+            FlatOrderBookSide *flat_book = ref(self._flat_ask_book) if is_buy else ref(self._flat_bid_book)
+            set[OrderBookEntry].iterator ask_iterator = self._ask_book.begin()
+            set[OrderBookEntry].reverse_iterator bid_iterator = self._bid_book.rbegin()
+            OrderBookEntry entry
+            size_t level
+
+        deref(depth_index).clear()
+        if self._use_flat_book:
+            deref(depth_index).reserve(deref(flat_book).size())
+            for level in range(deref(flat_book).size()):
+                entry = deref(flat_book).levelAt(level)
+                deref(depth_index).append(entry.getPrice(), entry.getAmount())
+        elif is_buy:
+            deref(depth_index).reserve(self._ask_book.size())
+            while ask_iterator != self._ask_book.end():
+                entry = deref(ask_iterator)
+                deref(depth_index).append(entry.getPrice(), entry.getAmount())
+                inc(ask_iterator)
+        else:
+            deref(depth_index).reserve(self._bid_book.size())
+            while bid_iterator != self._bid_book.rend():
+                entry = deref(bid_iterator)
+                deref(depth_index).append(entry.getPrice(), entry.getAmount())
+                inc(bid_iterator)
+
+    cdef OrderBookDepthIndex *c_get_depth_index(self, bint is_buy) except NULL:
+        """
+        Returns the cumulative volume index of the side consumed by a buy (asks) or a sell (bids), rebuilding it first
+        if the book has changed since it was last built.
+        """
+        if is_buy:
+            if self._ask_depth_index_dirty:
+                self.c_rebuild_depth_index(True)
+                self._ask_depth_index_dirty = False
+            return ref(self._ask_depth_index)
+        if self._bid_depth_index_dirty:
+            self.c_rebuild_depth_index(False)
+            self._bid_depth_index_dirty = False
+        return ref(self._bid_depth_index)
+
     cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume):
         cdef:
-            double cumulative_volume = 0
+            OrderBookDepthIndex *depth_index = self.c_get_depth_index(is_buy)
+            size_t level = deref(depth_index).findLevelForBase(volume)
+            double cumulative_volume = deref(depth_index).getTotalBase()
             double result_price = NaN
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount
-                if cumulative_volume >= volume:
-                    result_price = order_book_row.price
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount
-                if cumulative_volume >= volume:
-                    result_price = order_book_row.price
-                    break
+        if level < deref(depth_index).size():
+            cumulative_volume = deref(depth_index).getCumulativeBase(level)
+            result_price = deref(depth_index).getPrice(level)
 
         return OrderBookQueryResult(NaN, volume, result_price, min(cumulative_volume, volume))
 
     cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume):
         cdef:
+            OrderBookDepthIndex *depth_index = self.c_get_depth_index(is_buy)
+            size_t level = deref(depth_index).findLevelForBase(volume)
             double total_cost = 0
-            double total_volume = 0
+            double total_volume = deref(depth_index).getTotalBase()
+            double incremental_amount
             double result_vwap = NaN
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
-                    break
+
+        if level < deref(depth_index).size():
+            # Everything above the level is fully consumed, the level itself only partially.
+            total_volume = 0
+            if level > 0:
+                total_cost = deref(depth_index).getCumulativeQuote(level - 1)
+                total_volume = deref(depth_index).getCumulativeBase(level - 1)
+            incremental_amount = volume - total_volume
+            total_cost += incremental_amount * deref(depth_index).getPrice(level)
+            total_volume += incremental_amount
+            result_vwap = total_cost / total_volume
 
         return OrderBookQueryResult(NaN, volume, result_vwap, min(total_volume, volume))
 
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume):
         cdef:
-            double cumulative_volume = 0
+            OrderBookDepthIndex *depth_index = self.c_get_depth_index(is_buy)
+            size_t level = deref(depth_index).findLevelForQuote(quote_volume)
+            double cumulative_volume = deref(depth_index).getTotalQuote()
             double result_price = NaN
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
-                    break
+        if level < deref(depth_index).size():
+            cumulative_volume = deref(depth_index).getCumulativeQuote(level)
+            result_price = deref(depth_index).getPrice(level)
 
         return OrderBookQueryResult(NaN, quote_volume, result_price, min(cumulative_volume, quote_volume))
 
     cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount):
         cdef:
-            double cumulative_volume = 0
+            OrderBookDepthIndex *depth_index = self.c_get_depth_index(is_buy)
+            size_t level = deref(depth_index).findLevelForBase(base_amount)
+            double cumulative_volume = deref(depth_index).getTotalQuote()
             double cumulative_base_amount = 0
-            double row_amount = 0
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                row_amount = order_book_row.amount
-                if row_amount + cumulative_base_amount >= base_amount:
-                    row_amount = base_amount - cumulative_base_amount
-                cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
-                if cumulative_base_amount >= base_amount:
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                row_amount = order_book_row.amount
-                if row_amount + cumulative_base_amount >= base_amount:
-                    row_amount = base_amount - cumulative_base_amount
-                cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
-                if cumulative_base_amount >= base_amount:
-                    break
+        if level < deref(depth_index).size():
+            cumulative_volume = 0
+            if level > 0:
+                cumulative_volume = deref(depth_index).getCumulativeQuote(level - 1)
+                cumulative_base_amount = deref(depth_index).getCumulativeBase(level - 1)
+            cumulative_volume += (base_amount - cumulative_base_amount) * deref(depth_index).getPrice(level)
 
         return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
 
     cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price):
         cdef:
+            OrderBookDepthIndex *depth_index = self.c_get_depth_index(is_buy)
+            size_t num_levels = deref(depth_index).countLevelsWithinPrice(price)
             double cumulative_volume = 0
             double result_price = NaN
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
-                    break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
-        else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
-                    break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
+        if num_levels > 0:
+            cumulative_volume = deref(depth_index).getCumulativeBase(num_levels - 1)
+            result_price = deref(depth_index).getPrice(num_levels - 1)
 
         return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
 
     cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price):
         cdef:
+            OrderBookDepthIndex *depth_index = self.c_get_depth_index(is_buy)
+            size_t num_levels = deref(depth_index).countLevelsWithinPrice(price)
             double cumulative_volume = 0
             double result_price = NaN
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
-                    break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
-        else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
-                    break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
+        if num_levels > 0:
+            cumulative_volume = deref(depth_index).getCumulativeQuote(num_levels - 1)
+            result_price = deref(depth_index).getPrice(num_levels - 1)
 
         return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
 
@@ -495,6 +978,6 @@ cdef class OrderBook(PubSub):
     def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: List[OrderBookMessage]):
         replay_position = bisect.bisect_right(diffs, snapshot)
         replay_diffs = diffs[replay_position:]
-        self.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
+        self.apply_snapshot_entries(snapshot.entries)
         for diff in replay_diffs:
-            self.apply_diffs(diff.bids, diff.asks, diff.update_id)
+            self.apply_diff_entries(diff.entries)
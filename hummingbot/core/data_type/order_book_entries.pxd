@@ -0,0 +1,16 @@
+# distutils: language=c++
+
+from libc.stdint cimport int64_t
+from libcpp.vector cimport vector
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+
+
+cdef class OrderBookEntries:
+    cdef:
+        vector[OrderBookEntry] _bids
+        vector[OrderBookEntry] _asks
+        int64_t _update_id
+
+
+cdef double c_parse_double(object value) except? -1
+cdef c_parse_exchange_rows(object rows, int64_t update_id, double amount_multiplier, vector[OrderBookEntry] &output)
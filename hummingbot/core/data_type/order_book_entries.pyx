@@ -0,0 +1,127 @@
+# distutils: language=c++
+# distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
+
+from cython.operator cimport dereference as deref
+from libc.stdint cimport int64_t
+from libcpp.unordered_map cimport unordered_map
+from libcpp.vector cimport vector
+from typing import List
+
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+cdef extern from "Python.h":
+    const char *PyUnicode_AsUTF8(object unicode) except NULL
+    double PyOS_string_to_double(const char *s, char **endptr, object overflow_exception) except? -1.0
+
+
+cdef double c_parse_double(object value) except? -1:
+    # Exchanges send prices and amounts as decimal strings, parse them without creating intermediate float objects.
+    if type(value) is str:
+        return PyOS_string_to_double(PyUnicode_AsUTF8(value), NULL, None)
+    return value
+
+
+cdef c_parse_exchange_rows(object rows, int64_t update_id, double amount_multiplier, vector[OrderBookEntry] &output):
+    output.reserve(output.size() + len(rows))
+    for row in rows:
+        output.push_back(OrderBookEntry(c_parse_double(row[0]),
+                                        c_parse_double(row[1]) * amount_multiplier,
+                                        update_id))
+
+
+cdef c_merge_entries(const vector[OrderBookEntry] &entries,
+                     unordered_map[double, size_t] &level_indices,
+                     vector[OrderBookEntry] &output):
+    # The last diff at a price level fully determines that level, so later entries replace earlier ones in place.
+    cdef:
+        unordered_map[double, size_t].iterator level_iterator
+        size_t i
+    for i in range(entries.size()):
+        level_iterator = level_indices.find(entries[i].getPrice())
+        if level_iterator == level_indices.end():
+            level_indices[entries[i].getPrice()] = output.size()
+            output.push_back(entries[i])
+        else:
+            output[deref(level_iterator).second] = entries[i]
+
+
+cdef class OrderBookEntries:
+    """
+    Bids and asks of an order book message, decoded once into the C++ entry vectors consumed by
+    OrderBook.c_apply_diffs() and OrderBook.c_apply_snapshot().
+    """
+
+    @classmethod
+    def from_exchange_rows(cls,
+                           bids: List[List[str]],
+                           asks: List[List[str]],
+                           update_id: int,
+                           amount_multiplier: float = 1.0) -> "OrderBookEntries":
+        """
+        Decodes raw exchange depth rows, i.e. [[price, amount, *trash], ...] where price and amount are decimal strings
+        or numbers. Amounts are multiplied by `amount_multiplier`, for exchanges that send amounts in base units.
+        """
+        cdef:
+            OrderBookEntries entries = OrderBookEntries.__new__(OrderBookEntries)
+        entries._update_id = update_id
+        c_parse_exchange_rows(bids, update_id, amount_multiplier, entries._bids)
+        c_parse_exchange_rows(asks, update_id, amount_multiplier, entries._asks)
+        return entries
+
+    @classmethod
+    def from_rows(cls, bids: List[OrderBookRow], asks: List[OrderBookRow], update_id: int) -> "OrderBookEntries":
+        cdef:
+            OrderBookEntries entries = OrderBookEntries.__new__(OrderBookEntries)
+        entries._update_id = update_id
+        entries._bids.reserve(len(bids))
+        entries._asks.reserve(len(asks))
+        for row in bids:
+            entries._bids.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
+        for row in asks:
+            entries._asks.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
+        return entries
+
+    @classmethod
+    def merge(cls, entries_list: List["OrderBookEntries"]) -> "OrderBookEntries":
+        """
+        Merges consecutive diffs into a single net diff with one entry per price level, so a backlog of diff messages
+        can be applied to an order book in one go. The merged update ID is the one of the last diff.
+        """
+        cdef:
+            OrderBookEntries entries = OrderBookEntries.__new__(OrderBookEntries)
+            OrderBookEntries diff_entries
+            unordered_map[double, size_t] bid_indices
+            unordered_map[double, size_t] ask_indices
+        for diff_entries in entries_list:
+            c_merge_entries(diff_entries._bids, bid_indices, entries._bids)
+            c_merge_entries(diff_entries._asks, ask_indices, entries._asks)
+            entries._update_id = diff_entries._update_id
+        return entries
+
+    @property
+    def update_id(self) -> int:
+        return self._update_id
+
+    @property
+    def num_bids(self) -> int:
+        return self._bids.size()
+
+    @property
+    def num_asks(self) -> int:
+        return self._asks.size()
+
+    @property
+    def nbytes(self) -> int:
+        return (self._bids.capacity() + self._asks.capacity()) * sizeof(OrderBookEntry)
+
+    @property
+    def bids(self) -> List[OrderBookRow]:
+        return [OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId()) for entry in self._bids]
+
+    @property
+    def asks(self) -> List[OrderBookRow]:
+        return [OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId()) for entry in self._asks]
+
+    def __repr__(self) -> str:
+        return f"OrderBookEntries(update_id={self._update_id}, num_bids={self.num_bids}, num_asks={self.num_asks})"
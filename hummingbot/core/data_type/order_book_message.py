@@ -9,6 +9,7 @@ from typing import (
     Optional,
 )
 
+from hummingbot.core.data_type.order_book_entries import OrderBookEntries
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
 
@@ -70,6 +71,22 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
             OrderBookRow(float(price), float(amount), self.update_id) for price, amount, *trash in self.content["bids"]
         ]
 
+    @property
+    def entries(self) -> OrderBookEntries:
+        """
+        Bids and asks decoded into C++ order book entries, for OrderBook.apply_diff_entries() and
+        OrderBook.apply_snapshot_entries(). The content is decoded on first access only.
+        """
+        entries: Optional[OrderBookEntries] = self.__dict__.get("_entries")
+        if entries is None:
+            message_class = type(self)
+            if message_class.bids is OrderBookMessage.bids and message_class.asks is OrderBookMessage.asks:
+                entries = OrderBookEntries.from_exchange_rows(self.content["bids"], self.content["asks"], self.update_id)
+            else:
+                entries = OrderBookEntries.from_rows(self.bids, self.asks, self.update_id)
+            self.__dict__["_entries"] = entries
+        return entries
+
     @property
     def has_update_id(self) -> bool:
         return self.type in {OrderBookMessageType.DIFF, OrderBookMessageType.SNAPSHOT}
@@ -0,0 +1,31 @@
+# distutils: language=c++
+
+from libc.stdint cimport int64_t
+
+
+cdef class OrderBookMetrics:
+    cdef:
+        readonly size_t depth
+        readonly int64_t update_id
+        readonly double best_bid_price
+        readonly double best_bid_amount
+        readonly double best_ask_price
+        readonly double best_ask_amount
+        readonly double mid_price
+        readonly double microprice
+        readonly double spread
+        readonly double bid_depth
+        readonly double ask_depth
+        readonly double depth_imbalance
+        # Price of the depth-th level of each side, NaN while the side has fewer levels.
+        double _bid_boundary_price
+        double _ask_boundary_price
+
+    cdef bint c_is_near_top(self, bint is_bid, double price)
+    cdef c_update(self,
+                  int64_t update_id,
+                  double best_bid_price,
+                  double best_bid_amount,
+                  double best_ask_price,
+                  double best_ask_amount)
+    cdef c_set_side_depth(self, bint is_bid, double volume, double boundary_price)
@@ -0,0 +1,81 @@
+# distutils: language=c++
+
+from libc.stdint cimport int64_t
+
+from hummingbot.core.event.events import OrderBookMetricsEvent
+
+NaN = float("nan")
+
+
+cdef class OrderBookMetrics:
+    """
+    Microstructure metrics of an order book, kept up to date by the order book itself as diffs are applied. See
+    OrderBook.enable_metrics().
+
+    mid_price, microprice and spread are NaN while either side of the book is empty. bid_depth and ask_depth are the
+    base amounts of the top `depth` levels of each side, depth_imbalance is (bid_depth - ask_depth) /
+    (bid_depth + ask_depth), between -1 and 1.
+    """
+
+    def __init__(self, depth: int):
+        if depth <= 0:
+            raise ValueError(f"The metrics depth must be positive, got {depth}.")
+        self.depth = depth
+        self.update_id = 0
+        self.best_bid_price = self.best_ask_price = NaN
+        self.best_bid_amount = self.best_ask_amount = 0
+        self.mid_price = self.microprice = self.spread = NaN
+        self.bid_depth = self.ask_depth = 0
+        self.depth_imbalance = NaN
+        self._bid_boundary_price = self._ask_boundary_price = NaN
+
+    cdef bint c_is_near_top(self, bint is_bid, double price):
+        """
+        Whether a change at the given price can affect the top `depth` levels of a side.
+        """
+        cdef:
+            double boundary_price = self._bid_boundary_price if is_bid else self._ask_boundary_price
+        if boundary_price != boundary_price:
+            return True
+        return price >= boundary_price if is_bid else price <= boundary_price
+
+    cdef c_set_side_depth(self, bint is_bid, double volume, double boundary_price):
+        if is_bid:
+            self.bid_depth = volume
+            self._bid_boundary_price = boundary_price
+        else:
+            self.ask_depth = volume
+            self._ask_boundary_price = boundary_price
+
+    cdef c_update(self,
+                  int64_t update_id,
+                  double best_bid_price,
+                  double best_bid_amount,
+                  double best_ask_price,
+                  double best_ask_amount):
+        cdef:
+            double top_amount = best_bid_amount + best_ask_amount
+            double total_depth = self.bid_depth + self.ask_depth
+
+        self.update_id = update_id
+        self.best_bid_price = best_bid_price
+        self.best_bid_amount = best_bid_amount
+        self.best_ask_price = best_ask_price
+        self.best_ask_amount = best_ask_amount
+        # NaN prices of empty sides propagate.
+        self.mid_price = (best_bid_price + best_ask_price) / 2
+        self.spread = best_ask_price - best_bid_price
+        if top_amount > 0:
+            # The microprice leans towards the side with less size, which is more likely to be taken out first.
+            self.microprice = (best_bid_price * best_ask_amount + best_ask_price * best_bid_amount) / top_amount
+        else:
+            self.microprice = self.mid_price
+        self.depth_imbalance = (self.bid_depth - self.ask_depth) / total_depth if total_depth > 0 else NaN
+
+    def to_event(self) -> OrderBookMetricsEvent:
+        return OrderBookMetricsEvent(self.update_id, self.mid_price, self.microprice, self.spread,
+                                     self.depth_imbalance)
+
+    def __repr__(self) -> str:
+        return (f"OrderBookMetrics(depth={self.depth}, update_id={self.update_id}, mid_price={self.mid_price}, "
+                f"microprice={self.microprice}, spread={self.spread}, depth_imbalance={self.depth_imbalance})")
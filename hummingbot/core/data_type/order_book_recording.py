@@ -0,0 +1,296 @@
+#!/usr/bin/env python
+
+"""
+Append-only binary recordings of order book messages, one file per trading pair.
+
+Every order book level, and every trade, is stored as one fixed width RECORD_DTYPE record, so a recording can be
+memory-mapped as a NumPy record array. The levels of a diff or snapshot message share the message's timestamp and
+update IDs, and the last record of each message carries the END_OF_MESSAGE flag. Messages without any levels are
+stored as a single record with side NO_SIDE.
+
+Each recording has an index file next to it, with the timestamp and record offset of every snapshot, so replays can
+start from any point in time without scanning the recording.
+"""
+
+import asyncio
+import logging
+import os
+from typing import (
+    BinaryIO,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+)
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType,
+)
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.event.events import TradeType
+from hummingbot.core.utils.async_utils import (
+    safe_ensure_future,
+    safe_gather,
+)
+from hummingbot.logger import HummingbotLogger
+
+RECORDING_FILE_EXTENSION = ".obr"
+INDEX_FILE_EXTENSION = ".obr.idx"
+
+RECORD_DTYPE = np.dtype([
+    ("timestamp", "<f8"),
+    ("update_id", "<i8"),
+    ("first_update_id", "<i8"),
+    ("price", "<f8"),
+    ("amount", "<f8"),
+    ("trade_id", "<i8"),
+    ("message_type", "u1"),
+    ("side", "u1"),
+    ("flags", "u1"),
+    ("reserved", "V5"),
+])
+INDEX_DTYPE = np.dtype([
+    ("timestamp", "<f8"),
+    ("offset", "<i8"),
+])
+
+NO_SIDE = 0
+BID_SIDE = 1
+ASK_SIDE = 2
+END_OF_MESSAGE = 1
+
+
+def recording_path(directory: str, trading_pair: str) -> str:
+    return os.path.join(directory, f"{trading_pair}{RECORDING_FILE_EXTENSION}")
+
+
+def index_path(directory: str, trading_pair: str) -> str:
+    return os.path.join(directory, f"{trading_pair}{INDEX_FILE_EXTENSION}")
+
+
+def message_to_records(message: OrderBookMessage) -> np.ndarray:
+    """
+    Converts a diff, snapshot or trade message into RECORD_DTYPE records.
+    """
+    if message.type is OrderBookMessageType.TRADE:
+        records: np.ndarray = np.zeros(1, dtype=RECORD_DTYPE)
+        content: Dict[str, any] = message.content
+        records["price"] = float(content["price"])
+        records["amount"] = float(content["amount"])
+        records["update_id"] = message.update_id
+        records["trade_id"] = message.trade_id if isinstance(message.trade_id, int) else -1
+        records["side"] = (ASK_SIDE if float(content["trade_type"]) == float(TradeType.SELL.value) else BID_SIDE)
+    else:
+        bids: List[OrderBookRow] = message.entries.bids
+        asks: List[OrderBookRow] = message.entries.asks
+        records: np.ndarray = np.zeros(max(len(bids) + len(asks), 1), dtype=RECORD_DTYPE)
+        if len(bids) + len(asks) > 0:
+            records["price"] = [row.price for row in bids] + [row.price for row in asks]
+            records["amount"] = [row.amount for row in bids] + [row.amount for row in asks]
+            records["side"][:len(bids)] = BID_SIDE
+            records["side"][len(bids):] = ASK_SIDE
+        records["update_id"] = message.update_id
+        records["first_update_id"] = (message.first_update_id if message.type is OrderBookMessageType.DIFF
+                                      else message.update_id)
+        records["trade_id"] = -1
+    records["timestamp"] = message.timestamp
+    records["message_type"] = message.type.value
+    records["flags"][-1] = END_OF_MESSAGE
+    return records
+
+
+def records_to_message(trading_pair: str, records: np.ndarray) -> OrderBookMessage:
+    """
+    Converts the records of one message, as written by message_to_records(), back into an order book message.
+    """
+    message_type: OrderBookMessageType = OrderBookMessageType(int(records["message_type"][0]))
+    timestamp: float = float(records["timestamp"][0])
+    update_id: int = int(records["update_id"][0])
+    if message_type is OrderBookMessageType.TRADE:
+        return OrderBookMessage(message_type, {
+            "trading_pair": trading_pair,
+            "trade_type": float(TradeType.SELL.value if records["side"][0] == ASK_SIDE else TradeType.BUY.value),
+            "trade_id": int(records["trade_id"][0]),
+            "update_id": update_id,
+            "price": float(records["price"][0]),
+            "amount": float(records["amount"][0]),
+        }, timestamp=timestamp)
+
+    levels: np.ndarray = np.stack([records["price"], records["amount"]], axis=1)
+    content: Dict[str, any] = {
+        "trading_pair": trading_pair,
+        "update_id": update_id,
+        "bids": levels[records["side"] == BID_SIDE].tolist(),
+        "asks": levels[records["side"] == ASK_SIDE].tolist(),
+    }
+    if message_type is OrderBookMessageType.DIFF:
+        content["first_update_id"] = int(records["first_update_id"][0])
+    return OrderBookMessage(message_type, content, timestamp=timestamp)
+
+
+class OrderBookRecordingWriter:
+    """
+    Appends order book messages of one trading pair to its recording and snapshot index files.
+    """
+
+    def __init__(self, directory: str, trading_pair: str):
+        os.makedirs(directory, exist_ok=True)
+        self._trading_pair: str = trading_pair
+        self._recording_file: BinaryIO = open(recording_path(directory, trading_pair), "ab")
+        self._index_file: BinaryIO = open(index_path(directory, trading_pair), "ab")
+        # Ignore a partial record left over by an interrupted write.
+        self._num_records: int = self._recording_file.tell() // RECORD_DTYPE.itemsize
+        self._recording_file.truncate(self._num_records * RECORD_DTYPE.itemsize)
+        self._recording_file.seek(0, os.SEEK_END)
+
+    @property
+    def trading_pair(self) -> str:
+        return self._trading_pair
+
+    @property
+    def num_records(self) -> int:
+        return self._num_records
+
+    def write(self, message: OrderBookMessage):
+        records: np.ndarray = message_to_records(message)
+        self._recording_file.write(records.tobytes())
+        if message.type is OrderBookMessageType.SNAPSHOT:
+            # The records must be on disk before the index points at them.
+            self._recording_file.flush()
+            self._index_file.write(np.array([(message.timestamp, self._num_records)], dtype=INDEX_DTYPE).tobytes())
+            self._index_file.flush()
+        self._num_records += len(records)
+
+    def flush(self):
+        self._recording_file.flush()
+        self._index_file.flush()
+
+    def close(self):
+        self._recording_file.close()
+        self._index_file.close()
+
+
+class OrderBookRecordingReader:
+    """
+    Memory-mapped, read only view of a trading pair's recording.
+    """
+
+    def __init__(self, directory: str, trading_pair: str):
+        self._trading_pair: str = trading_pair
+        self._records: np.ndarray = self._map(recording_path(directory, trading_pair), RECORD_DTYPE)
+        self._index: np.ndarray = self._map(index_path(directory, trading_pair), INDEX_DTYPE)
+        # Only index entries whose snapshot has been fully written.
+        self._index = self._index[self._index["offset"] < len(self._records)]
+
+    @staticmethod
+    def _map(path: str, dtype: np.dtype) -> np.ndarray:
+        num_items: int = os.path.getsize(path) // dtype.itemsize if os.path.exists(path) else 0
+        if num_items == 0:
+            return np.zeros(0, dtype=dtype)
+        return np.memmap(path, dtype=dtype, mode="r", shape=(num_items,))
+
+    @property
+    def trading_pair(self) -> str:
+        return self._trading_pair
+
+    @property
+    def records(self) -> np.ndarray:
+        return self._records
+
+    @property
+    def snapshot_index(self) -> np.ndarray:
+        return self._index
+
+    def find_snapshot_offset(self, timestamp: float) -> int:
+        """
+        Record offset of the last snapshot at or before the given timestamp, or of the first snapshot if there's none.
+        Returns -1 if the recording has no snapshots.
+        """
+        if len(self._index) == 0:
+            return -1
+        position: int = int(np.searchsorted(self._index["timestamp"], timestamp, side="right")) - 1
+        return int(self._index["offset"][max(position, 0)])
+
+    def iter_messages(self, start_offset: int = 0) -> Iterator[OrderBookMessage]:
+        """
+        Yields the messages recorded from the given record offset on.
+        """
+        end_positions: np.ndarray = np.flatnonzero(self._records["flags"][start_offset:] & END_OF_MESSAGE)
+        message_start: int = start_offset
+        for end_position in end_positions:
+            message_end: int = start_offset + int(end_position) + 1
+            yield records_to_message(self._trading_pair, self._records[message_start:message_end])
+            message_start = message_end
+
+
+class OrderBookRecorder:
+    """
+    Records the diffs, snapshots and trades of any order book tracker data source, starting with a snapshot of every
+    trading pair.
+    """
+    FLUSH_INTERVAL = 5.0
+
+    _obr_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._obr_logger is None:
+            cls._obr_logger = logging.getLogger(__name__)
+        return cls._obr_logger
+
+    def __init__(self, data_source: OrderBookTrackerDataSource, trading_pairs: List[str], directory: str):
+        self._data_source: OrderBookTrackerDataSource = data_source
+        self._trading_pairs: List[str] = trading_pairs
+        self._directory: str = directory
+        self._writers: Dict[str, OrderBookRecordingWriter] = {}
+        self._message_queue: asyncio.Queue = asyncio.Queue()
+        self._tasks: List[asyncio.Task] = []
+
+    def start(self):
+        self.stop()
+        self._writers = {trading_pair: OrderBookRecordingWriter(self._directory, trading_pair)
+                         for trading_pair in self._trading_pairs}
+        ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+        self._tasks = [
+            safe_ensure_future(self._data_source.listen_for_order_book_diffs(ev_loop, self._message_queue)),
+            safe_ensure_future(self._data_source.listen_for_order_book_snapshots(ev_loop, self._message_queue)),
+            safe_ensure_future(self._data_source.listen_for_trades(ev_loop, self._message_queue)),
+            safe_ensure_future(self._record_initial_snapshots()),
+            safe_ensure_future(self._record_messages_loop()),
+            safe_ensure_future(self._flush_loop()),
+        ]
+
+    def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        self._tasks = []
+        for writer in self._writers.values():
+            writer.close()
+        self._writers = {}
+
+    async def _record_initial_snapshots(self):
+        async def record_snapshot(trading_pair: str):
+            self._message_queue.put_nowait(await self._data_source.get_snapshot_message(trading_pair))
+        await safe_gather(*[record_snapshot(trading_pair) for trading_pair in self._trading_pairs])
+
+    async def _record_messages_loop(self):
+        while True:
+            try:
+                message: OrderBookMessage = await self._message_queue.get()
+                writer: Optional[OrderBookRecordingWriter] = self._writers.get(message.trading_pair)
+                if writer is not None:
+                    writer.write(message)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().error("Unexpected error recording order book message.", exc_info=True)
+
+    async def _flush_loop(self):
+        while True:
+            await asyncio.sleep(self.FLUSH_INTERVAL)
+            for writer in self._writers.values():
+                writer.flush()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+
+import asyncio
+import heapq
+import logging
+import time
+from typing import (
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType,
+)
+from hummingbot.core.data_type.order_book_recording import OrderBookRecordingReader
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.logger import HummingbotLogger
+
+
+class OrderBookReplayDataSource(OrderBookTrackerDataSource):
+    """
+    Feeds recordings made by OrderBookRecorder back into an order book tracker.
+
+    Every trading pair starts from its last recorded snapshot at or before `start_timestamp`. The messages recorded
+    between that snapshot and `start_timestamp` are fast-forwarded, later messages are replayed at `speed` times the
+    recorded pace, or as fast as the tracker consumes them if `speed` is None.
+    """
+    # Yield to the event loop after this many messages when replaying at maximum speed.
+    MAX_SPEED_BATCH_SIZE = 100
+
+    _orbds_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._orbds_logger is None:
+            cls._orbds_logger = logging.getLogger(__name__)
+        return cls._orbds_logger
+
+    def __init__(self,
+                 trading_pairs: List[str],
+                 directory: str,
+                 start_timestamp: float = 0.0,
+                 speed: Optional[float] = None):
+        super().__init__(trading_pairs)
+        self._readers: Dict[str, OrderBookRecordingReader] = {
+            trading_pair: OrderBookRecordingReader(directory, trading_pair) for trading_pair in trading_pairs
+        }
+        self._start_timestamp: float = start_timestamp
+        self._speed: Optional[float] = speed
+        self._last_snapshots: Dict[str, OrderBookMessage] = {}
+        self._outputs: Dict[OrderBookMessageType, asyncio.Queue] = {}
+        self._replay_task: Optional[asyncio.Task] = None
+        self._replay_finished: asyncio.Event = asyncio.Event()
+
+        for trading_pair, reader in self._readers.items():
+            start_offset: int = reader.find_snapshot_offset(start_timestamp)
+            if start_offset < 0:
+                raise ValueError(f"The recording of {trading_pair} does not contain any order book snapshot.")
+            self._last_snapshots[trading_pair] = next(reader.iter_messages(start_offset))
+
+    @staticmethod
+    async def fetch_trading_pairs() -> List[str]:
+        return []
+
+    @property
+    def replay_finished(self) -> asyncio.Event:
+        return self._replay_finished
+
+    async def get_new_order_book(self, trading_pair: str) -> OrderBook:
+        order_book: OrderBook = self.order_book_create_function()
+        order_book.apply_snapshot_entries(self._last_snapshots[trading_pair].entries)
+        return order_book
+
+    async def get_snapshot_message(self, trading_pair: str) -> OrderBookMessage:
+        return self._last_snapshots[trading_pair]
+
+    def _iter_replay_messages(self) -> Iterator[Tuple[float, int, OrderBookMessage]]:
+        """
+        Messages of all trading pairs in timestamp order, after the snapshots the order books were created from.
+        """
+        sequence: Iterator[int] = iter(range(2 ** 62))
+
+        def pair_messages(reader: OrderBookRecordingReader) -> Iterator[Tuple[float, int, OrderBookMessage]]:
+            messages: Iterator[OrderBookMessage] = reader.iter_messages(
+                reader.find_snapshot_offset(self._start_timestamp))
+            next(messages)
+            for message in messages:
+                # The sequence number keeps messages with identical timestamps in recording order.
+                yield message.timestamp, next(sequence), message
+
+        return heapq.merge(*[pair_messages(reader) for reader in self._readers.values()])
+
+    async def _replay(self):
+        replay_start_time: Optional[float] = None
+        replay_start_timestamp: float = 0.0
+        num_messages: int = 0
+
+        for timestamp, _, message in self._iter_replay_messages():
+            if self._speed is not None and timestamp >= self._start_timestamp:
+                if replay_start_time is None:
+                    replay_start_time = time.time()
+                    replay_start_timestamp = timestamp
+                delay: float = (replay_start_time + (timestamp - replay_start_timestamp) / self._speed) - time.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            else:
+                num_messages += 1
+                if num_messages % self.MAX_SPEED_BATCH_SIZE == 0:
+                    await asyncio.sleep(0)
+
+            if message.type is OrderBookMessageType.SNAPSHOT:
+                self._last_snapshots[message.trading_pair] = message
+            output: Optional[asyncio.Queue] = self._outputs.get(message.type)
+            if output is not None:
+                output.put_nowait(message)
+
+        self._replay_finished.set()
+        self.logger().info("Order book replay finished.")
+
+    async def _listen(self, message_type: OrderBookMessageType, output: asyncio.Queue):
+        # The tracker starts all of its listeners at once, so they are registered before the replay begins. Messages
+        # without a listener, e.g. snapshots when the tracker doesn't sweep snapshots, are skipped.
+        self._outputs[message_type] = output
+        if self._replay_task is None:
+            self._replay_task = asyncio.ensure_future(self._replay())
+        try:
+            await asyncio.shield(self._replay_task)
+            # Keep the listener alive like the exchange data sources do, after the recording is exhausted.
+            await asyncio.Event().wait()
+        finally:
+            self._outputs.pop(message_type, None)
+            if len(self._outputs) == 0 and not self._replay_task.done():
+                self._replay_task.cancel()
+
+    async def listen_for_order_book_diffs(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        await self._listen(OrderBookMessageType.DIFF, output)
+
+    async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        await self._listen(OrderBookMessageType.SNAPSHOT, output)
+
+    async def listen_for_trades(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        await self._listen(OrderBookMessageType.TRADE, output)
@@ -1,22 +1,34 @@
 #!/usr/bin/env python
 import asyncio
 from abc import ABC
-from collections import deque
+from collections import (
+    defaultdict,
+    deque,
+)
 from enum import Enum
 import logging
+import numpy as np
 import pandas as pd
 import re
+import sys
 from typing import (
+    Any,
     Dict,
     Deque,
     Optional,
+    Set,
     Tuple,
     List)
 import time
 from hummingbot.core.event.events import OrderBookTradeEvent, TradeType
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.data_type.order_book import OrderBook
-from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.data_type.order_book_entries import OrderBookEntries
+from hummingbot.core.utils.async_utils import (
+    safe_ensure_future,
+    safe_gather,
+)
+from hummingbot.core.utils.asyncio_throttle import Throttler
 from .order_book_message import (
     OrderBookMessageType,
     OrderBookMessage,
@@ -26,6 +38,26 @@ from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTr
 TRADING_PAIR_FILTER = re.compile(r"(BTC|ETH|USDT)$")
 
 
+def _estimate_size(obj: Any, seen: Set[int]) -> int:
+    """
+    Rough deep size of messages and active order tracker dictionaries. Objects already counted, and enum members,
+    which are shared, count as 0.
+    """
+    if id(obj) in seen or isinstance(obj, Enum):
+        return 0
+    seen.add(id(obj))
+    size: int = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(_estimate_size(key, seen) + _estimate_size(value, seen) for key, value in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset, deque)):
+        size += sum(_estimate_size(item, seen) for item in obj)
+    elif isinstance(obj, OrderBookEntries):
+        size += obj.nbytes
+    if hasattr(obj, "__dict__"):
+        size += _estimate_size(obj.__dict__, seen)
+    return size
+
+
 class OrderBookTrackerDataSourceType(Enum):
     # LOCAL_CLUSTER = 1 deprecated
     REMOTE_API = 2
@@ -34,6 +66,29 @@ class OrderBookTrackerDataSourceType(Enum):
 
 class OrderBookTracker(ABC):
     PAST_DIFF_WINDOW_SIZE: int = 32
+    # Whether diff messages carry contiguous first_update_id / update_id ranges, see _is_sequence_gap().
+    SEQUENCE_GAP_DETECTION: bool = False
+    # Failed resync snapshot fetches are retried after this many seconds, doubled up to the maximum on every failure.
+    ORDER_BOOK_RESYNC_RETRY_INTERVAL: float = 5.0
+    ORDER_BOOK_RESYNC_MAX_RETRY_INTERVAL: float = 60.0
+    # Order books are initialized concurrently, within a request weight budget of ORDER_BOOK_INIT_RATE_LIMIT
+    # (weight, seconds) where each get_new_order_book() call costs ORDER_BOOK_INIT_WEIGHT. The Throttler lets the
+    # whole budget through in every sliding window of the period plus its safety margin, the default is one order
+    # book per 1.1 seconds.
+    ORDER_BOOK_INIT_CONCURRENCY: int = 1
+    ORDER_BOOK_INIT_WEIGHT: int = 1
+    ORDER_BOOK_INIT_RATE_LIMIT: Tuple[int, float] = (1, 1.0)
+    # If positive, the order books keep OrderBookMetrics over this many levels, see OrderBook.enable_metrics().
+    ORDER_BOOK_METRICS_DEPTH: int = 0
+    # If positive, the order books only keep ORDER_BOOK_DEPTH_CAP + ORDER_BOOK_DEPTH_CAP_BUFFER levels per side, and
+    # are resynced from a snapshot once a side shrinks below ORDER_BOOK_DEPTH_CAP, see OrderBook.enable_depth_cap().
+    ORDER_BOOK_DEPTH_CAP: int = 0
+    ORDER_BOOK_DEPTH_CAP_BUFFER: int = 10
+    # Apply the diffs right in the diff router, in batches of up to DIRECT_DIFF_ROUTING_BATCH_SIZE messages, instead
+    # of through a message queue and a tracking task per trading pair, see _direct_diff_router(). Only for trackers
+    # that use the base _track_single_book().
+    DIRECT_DIFF_ROUTING: bool = False
+    DIRECT_DIFF_ROUTING_BATCH_SIZE: int = 1000
     _obt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -42,15 +97,30 @@ class OrderBookTracker(ABC):
             cls._obt_logger = logging.getLogger(__name__)
         return cls._obt_logger
 
-    def __init__(self, data_source: OrderBookTrackerDataSource, trading_pairs: List[str], domain: Optional[str] = None):
+    def __init__(self,
+                 data_source: OrderBookTrackerDataSource,
+                 trading_pairs: List[str],
+                 domain: Optional[str] = None,
+                 periodic_snapshots: bool = True):
         self._domain: Optional[str] = domain
+        self._periodic_snapshots: bool = periodic_snapshots
         self._data_source: OrderBookTrackerDataSource = data_source
         self._trading_pairs: List[str] = trading_pairs
         self._order_books_initialized: asyncio.Event = asyncio.Event()
+        self._order_book_ready_events: Dict[str, asyncio.Event] = defaultdict(asyncio.Event)
+        self._saved_message_queues: Dict[str, Deque[OrderBookMessage]] = defaultdict(lambda: deque(maxlen=1000))
         self._tracking_tasks: Dict[str, asyncio.Task] = {}
         self._order_books: Dict[str, OrderBook] = {}
         self._tracking_message_queues: Dict[str, asyncio.Queue] = {}
         self._past_diffs_windows: Dict[str, Deque] = {}
+        # Exchange specific active order trackers per trading pair, for the exchanges that keep them.
+        self._active_order_trackers: Dict[str, Any] = {}
+        self._pending_messages: Dict[str, List[OrderBookMessage]] = {}
+        self._order_book_resync_tasks: Dict[str, asyncio.Task] = {}
+        self._diff_messages_received: Dict[str, int] = defaultdict(int)
+        self._diff_batches_applied: Dict[str, int] = defaultdict(int)
+        self._max_tracking_queue_sizes: Dict[str, int] = defaultdict(int)
+        self._sequence_gaps: Dict[str, int] = defaultdict(int)
         self._order_book_diff_stream: asyncio.Queue = asyncio.Queue()
         self._order_book_snapshot_stream: asyncio.Queue = asyncio.Queue()
         self._order_book_trade_stream: asyncio.Queue = asyncio.Queue()
@@ -77,6 +147,21 @@ class OrderBookTracker(ABC):
     def ready(self) -> bool:
         return self._order_books_initialized.is_set()
 
+    @property
+    def ready_trading_pairs(self) -> List[str]:
+        """
+        Trading pairs whose order book is initialized and tracked, while the others are still initializing.
+        """
+        return [trading_pair for trading_pair in self._trading_pairs
+                if self._order_book_ready_events[trading_pair].is_set()]
+
+    def is_order_book_ready(self, trading_pair: str) -> bool:
+        return self._order_book_ready_events[trading_pair].is_set()
+
+    async def wait_for_order_book(self, trading_pair: str) -> OrderBook:
+        await self._order_book_ready_events[trading_pair].wait()
+        return self._order_books[trading_pair]
+
     @property
     def snapshot(self) -> Dict[str, Tuple[pd.DataFrame, pd.DataFrame]]:
         return {
@@ -84,6 +169,80 @@ class OrderBookTracker(ABC):
             for trading_pair, order_book in self._order_books.items()
         }
 
+    def get_numpy_snapshot(self, depth: int = -1) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+        """
+        Same as snapshot, but with [price, amount, update_id] float64 arrays instead of data frames.
+        """
+        return {
+            trading_pair: order_book.get_numpy_snapshot(depth)
+            for trading_pair, order_book in self._order_books.items()
+        }
+
+    @property
+    def tracking_metrics(self) -> Dict[str, Dict[str, float]]:
+        """
+        Per trading pair message queue statistics:
+            queue_size: messages currently waiting in the tracking queue
+            max_queue_size: largest backlog drained from the tracking queue at once
+            diff_messages: diff messages received
+            diff_applies: diff batches applied to the order book
+            coalescing_ratio: diff messages per applied batch, 1.0 means no backlog has been coalesced
+            sequence_gaps: missed diff ranges that triggered a snapshot resync
+        """
+        return {
+            trading_pair: {
+                "queue_size": self._tracking_queue_size(trading_pair),
+                "max_queue_size": self._max_tracking_queue_sizes[trading_pair],
+                "diff_messages": self._diff_messages_received[trading_pair],
+                "diff_applies": self._diff_batches_applied[trading_pair],
+                "coalescing_ratio": (self._diff_messages_received[trading_pair] /
+                                     max(self._diff_batches_applied[trading_pair], 1)),
+                "sequence_gaps": self._sequence_gaps[trading_pair],
+            }
+            for trading_pair in self._order_books.keys()
+        }
+
+    def memory_usage(self) -> Dict[str, Dict[str, int]]:
+        """
+        Per trading pair memory footprint estimates:
+            bid_levels / ask_levels: price levels in the order book
+            bid_bytes / ask_bytes: bytes held by the C++ order book sides
+            other_book_bytes: depth indexes, trade tape and composite fills of the order book
+            past_diffs: diff messages retained in the past diffs window
+            past_diffs_bytes: deep size of these messages
+            active_orders: orders in the exchange's active order tracker, if it keeps one
+            active_orders_bytes: deep size of the active order tracker dictionaries
+        """
+        retval: Dict[str, Dict[str, int]] = {}
+        seen: Set[int]
+        for trading_pair, order_book in self._order_books.items():
+            book_usage: Dict[str, int] = order_book.memory_usage()
+            past_diffs: Deque = self._past_diffs_windows.get(trading_pair, deque())
+            active_order_tracker: Any = self._active_order_trackers.get(trading_pair)
+            active_sides: List[Dict] = ([active_order_tracker.active_bids, active_order_tracker.active_asks]
+                                        if hasattr(active_order_tracker, "active_bids") else [])
+            seen = set()
+            retval[trading_pair] = {
+                "bid_levels": book_usage["bid_levels"],
+                "ask_levels": book_usage["ask_levels"],
+                "bid_bytes": book_usage["bid_bytes"],
+                "ask_bytes": book_usage["ask_bytes"],
+                "other_book_bytes": sum(value for key, value in book_usage.items()
+                                        if key.endswith("_bytes") and key not in ("bid_bytes", "ask_bytes")),
+                "past_diffs": len(past_diffs),
+                "past_diffs_bytes": _estimate_size(past_diffs, seen),
+                # Active order trackers map prices to either an order or a dictionary of orders by order ID.
+                "active_orders": sum(len(orders) if isinstance(orders, dict) else 1
+                                     for side in active_sides for orders in side.values()),
+                "active_orders_bytes": sum(_estimate_size(side, seen) for side in active_sides),
+            }
+        return retval
+
+    def _tracking_queue_size(self, trading_pair: str) -> int:
+        if trading_pair in self._tracking_message_queues:
+            return self._tracking_message_queues[trading_pair].qsize()
+        return len(self._pending_messages.get(trading_pair, ()))
+
     def start(self):
         self.stop()
         self._init_order_books_task = safe_ensure_future(
@@ -98,11 +257,12 @@ class OrderBookTracker(ABC):
         self._order_book_trade_listener_task = safe_ensure_future(
             self._data_source.listen_for_trades(self._ev_loop, self._order_book_trade_stream)
         )
-        self._order_book_snapshot_listener_task = safe_ensure_future(
-            self._data_source.listen_for_order_book_snapshots(self._ev_loop, self._order_book_snapshot_stream)
-        )
+        if self._periodic_snapshots:
+            self._order_book_snapshot_listener_task = safe_ensure_future(
+                self._data_source.listen_for_order_book_snapshots(self._ev_loop, self._order_book_snapshot_stream)
+            )
         self._order_book_diff_router_task = safe_ensure_future(
-            self._order_book_diff_router()
+            self._direct_diff_router() if self.DIRECT_DIFF_ROUTING else self._order_book_diff_router()
         )
         self._order_book_snapshot_router_task = safe_ensure_future(
             self._order_book_snapshot_router()
@@ -141,14 +301,21 @@ class OrderBookTracker(ABC):
             for _, task in self._tracking_tasks.items():
                 task.cancel()
             self._tracking_tasks.clear()
+        if len(self._order_book_resync_tasks) > 0:
+            for _, task in self._order_book_resync_tasks.items():
+                task.cancel()
+            self._order_book_resync_tasks.clear()
+        self._pending_messages.clear()
+        for ready_event in self._order_book_ready_events.values():
+            ready_event.clear()
         self._order_books_initialized.clear()
 
     async def _update_last_trade_prices_loop(self):
         '''
         Updates last trade price for all order books through REST API, it is to initiate last_trade_price and as
-        fall-back mechanism for when the web socket update channel fails.
+        fall-back mechanism for when the web socket update channel fails. Only the order books that are already
+        tracked are updated, the others are picked up once they are initialized.
         '''
-        await self._order_books_initialized.wait()
         while True:
             try:
                 outdateds = [t_pair for t_pair, o_book in self._order_books.items()
@@ -161,6 +328,8 @@ class OrderBookTracker(ABC):
                     last_prices = await self._data_source.get_last_traded_prices(**args)
                     for trading_pair, last_price in last_prices.items():
                         self._order_books[trading_pair].last_trade_price = last_price
+                    # The pairs without a price in the response are retried with the others, not right away.
+                    for trading_pair in outdateds:
                         self._order_books[trading_pair].last_trade_price_rest_updated = time.perf_counter()
                 else:
                     await asyncio.sleep(1)
@@ -172,17 +341,60 @@ class OrderBookTracker(ABC):
 
     async def _init_order_books(self):
         """
-        Initialize order books
+        Initialize order books, each pair is tracked as soon as its own order book is ready.
         """
-        for index, trading_pair in enumerate(self._trading_pairs):
-            self._order_books[trading_pair] = await self._data_source.get_new_order_book(trading_pair)
-            self._tracking_message_queues[trading_pair] = asyncio.Queue()
-            self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
+        throttler: Throttler = Throttler(rate_limit=self.ORDER_BOOK_INIT_RATE_LIMIT)
+        concurrency_limit: asyncio.Semaphore = asyncio.Semaphore(self.ORDER_BOOK_INIT_CONCURRENCY)
+        initialized_pairs: List[str] = []
+
+        async def init_order_book(trading_pair: str):
+            while True:
+                try:
+                    async with concurrency_limit:
+                        async with throttler.weighted_task(self.ORDER_BOOK_INIT_WEIGHT):
+                            pass
+                        order_book: OrderBook = await self._data_source.get_new_order_book(trading_pair)
+                    break
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    self.logger().network(f"Unexpected error initializing order book for {trading_pair}.",
+                                          exc_info=True,
+                                          app_warning_msg=f"Could not fetch the order book for {trading_pair}. "
+                                                          f"Retrying after 5 seconds.")
+                    await asyncio.sleep(5.0)
+            self._start_tracking_order_book(trading_pair, order_book)
+            initialized_pairs.append(trading_pair)
             self.logger().info(f"Initialized order book for {trading_pair}. "
-                               f"{index + 1}/{len(self._trading_pairs)} completed.")
-            await asyncio.sleep(1)
+                               f"{len(initialized_pairs)}/{len(self._trading_pairs)} completed.")
+
+        await safe_gather(*[init_order_book(trading_pair) for trading_pair in self._trading_pairs])
         self._order_books_initialized.set()
 
+    def _start_tracking_order_book(self, trading_pair: str, order_book: OrderBook):
+        """
+        Starts tracking an initialized order book, with the diffs received while its snapshot was being fetched.
+        """
+        saved_messages: Deque[OrderBookMessage] = self._saved_message_queues[trading_pair]
+        messages: List[OrderBookMessage] = [message for message in saved_messages
+                                            if message.update_id >= order_book.snapshot_uid]
+        saved_messages.clear()
+        if self.ORDER_BOOK_METRICS_DEPTH > 0 and order_book.metrics is None:
+            order_book.enable_metrics(self.ORDER_BOOK_METRICS_DEPTH)
+        if self.ORDER_BOOK_DEPTH_CAP > 0 and order_book.depth_cap == 0:
+            order_book.enable_depth_cap(self.ORDER_BOOK_DEPTH_CAP, self.ORDER_BOOK_DEPTH_CAP_BUFFER)
+        self._order_books[trading_pair] = order_book
+        if self.DIRECT_DIFF_ROUTING:
+            self._past_diffs_windows[trading_pair] = deque()
+            self._apply_tracking_messages(trading_pair, messages)
+        else:
+            message_queue: asyncio.Queue = asyncio.Queue()
+            for message in messages:
+                message_queue.put_nowait(message)
+            self._tracking_message_queues[trading_pair] = message_queue
+            self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
+        self._order_book_ready_events[trading_pair].set()
+
     async def _order_book_diff_router(self):
         """
         Route the real-time order book diff messages to the correct order book.
@@ -190,14 +402,17 @@ class OrderBookTracker(ABC):
         last_message_timestamp: float = time.time()
         messages_accepted: int = 0
         messages_rejected: int = 0
-        await self._order_books_initialized.wait()
         while True:
             try:
                 ob_message: OrderBookMessage = await self._order_book_diff_stream.get()
                 trading_pair: str = ob_message.trading_pair
 
                 if trading_pair not in self._tracking_message_queues:
-                    messages_rejected += 1
+                    if trading_pair in self._trading_pairs:
+                        # Save diff messages received before the order book is ready.
+                        self._saved_message_queues[trading_pair].append(ob_message)
+                    else:
+                        messages_rejected += 1
                     continue
                 message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
                 # Check the order book's initial update ID. If it's larger, don't bother.
@@ -223,25 +438,225 @@ class OrderBookTracker(ABC):
                 self.logger().error("Unknown error. Retrying after 5 seconds.", exc_info=True)
                 await asyncio.sleep(5.0)
 
+    async def _direct_diff_router(self):
+        """
+        Applies the diff messages to the order books right away, without going through per trading pair queues and
+        tasks. Everything the data source has queued up is taken at once, grouped by trading pair, and applied as one
+        batch per order book. The diffs of an order book that waits for a resync snapshot are held back until the
+        snapshot arrives, see _route_snapshot_message().
+        """
+        last_message_timestamp: float = time.time()
+        messages_accepted: int = 0
+        messages_rejected: int = 0
+        while True:
+            try:
+                message: OrderBookMessage = await self._order_book_diff_stream.get()
+                batch: Dict[str, List[OrderBookMessage]] = defaultdict(list)
+                batch[message.trading_pair].append(message)
+                num_messages: int = 1
+                while num_messages < self.DIRECT_DIFF_ROUTING_BATCH_SIZE and not self._order_book_diff_stream.empty():
+                    message = self._order_book_diff_stream.get_nowait()
+                    batch[message.trading_pair].append(message)
+                    num_messages += 1
+
+                for trading_pair, messages in batch.items():
+                    if trading_pair not in self._order_books:
+                        if trading_pair in self._trading_pairs:
+                            # Save diff messages received before the order book is ready.
+                            self._saved_message_queues[trading_pair].extend(messages)
+                        else:
+                            messages_rejected += len(messages)
+                        continue
+                    snapshot_uid: int = self._order_books[trading_pair].snapshot_uid
+                    messages = [message for message in messages if message.update_id >= snapshot_uid]
+                    messages_rejected += len(batch[trading_pair]) - len(messages)
+                    if trading_pair in self._order_book_resync_tasks:
+                        self._pending_messages.setdefault(trading_pair, []).extend(messages)
+                        continue
+                    messages = self._pending_messages.pop(trading_pair, []) + messages
+                    try:
+                        self._apply_tracking_messages(trading_pair, messages)
+                        messages_accepted += len(messages)
+                    except Exception:
+                        self.logger().error(f"Unexpected error applying order book messages for {trading_pair}.",
+                                            exc_info=True)
+
+                # Log some statistics.
+                now: float = time.time()
+                if int(now / 60.0) > int(last_message_timestamp / 60.0):
+                    self.logger().debug(f"Diff messages processed: {messages_accepted}, rejected: {messages_rejected}")
+                    messages_accepted = 0
+                    messages_rejected = 0
+
+                last_message_timestamp = now
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().error("Unknown error. Retrying after 5 seconds.", exc_info=True)
+                await asyncio.sleep(5.0)
+
+    def _apply_tracking_messages(self, trading_pair: str, messages: List[OrderBookMessage]):
+        if len(messages) > self._max_tracking_queue_sizes[trading_pair]:
+            self._max_tracking_queue_sizes[trading_pair] = len(messages)
+        self._apply_messages(trading_pair, self._order_books[trading_pair], messages,
+                             self._past_diffs_windows[trading_pair])
+
+    def _route_snapshot_message(self, trading_pair: str, snapshot_message: OrderBookMessage):
+        """
+        Hands a snapshot to the tracking queue of its order book, or applies it right away, followed by the diffs
+        held back while it was being fetched, with DIRECT_DIFF_ROUTING.
+        """
+        if self.DIRECT_DIFF_ROUTING:
+            # Diffs the snapshot already contains are dropped.
+            pending_messages: List[OrderBookMessage] = [
+                message for message in self._pending_messages.pop(trading_pair, [])
+                if message.update_id > snapshot_message.update_id
+            ]
+            self._apply_tracking_messages(trading_pair, [snapshot_message] + pending_messages)
+        else:
+            self._tracking_message_queues[trading_pair].put_nowait(snapshot_message)
+
     async def _order_book_snapshot_router(self):
         """
         Route the real-time order book snapshot messages to the correct order book.
         """
-        await self._order_books_initialized.wait()
         while True:
             try:
                 ob_message: OrderBookMessage = await self._order_book_snapshot_stream.get()
                 trading_pair: str = ob_message.trading_pair
-                if trading_pair not in self._tracking_message_queues:
+                if trading_pair not in self._order_books:
+                    # The order book is still being initialized from a snapshot of its own.
                     continue
-                message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
-                await message_queue.put(ob_message)
+                self._route_snapshot_message(trading_pair, ob_message)
             except asyncio.CancelledError:
                 raise
             except Exception:
                 self.logger().error("Unknown error. Retrying after 5 seconds.", exc_info=True)
                 await asyncio.sleep(5.0)
 
+    def _check_order_book_resync(self, trading_pair: str, order_book: OrderBook):
+        """
+        Schedules a snapshot fetch when a depth-capped order book has run out of levels on one side.
+        """
+        if order_book.depth_resync_required:
+            self._request_order_book_resync(trading_pair)
+
+    def _request_order_book_resync(self, trading_pair: str):
+        """
+        Fetches a snapshot for a single trading pair, unless one is already being fetched. The snapshot goes through
+        the tracking queue and is applied with restore_from_snapshot_and_diffs().
+        """
+        if trading_pair not in self._order_book_resync_tasks:
+            self._order_book_resync_tasks[trading_pair] = safe_ensure_future(self._resync_order_book(trading_pair))
+
+    def _is_sequence_gap(self, last_update_id: int, message: OrderBookMessage) -> bool:
+        """
+        Whether diff messages were missed between the last applied update ID and the given diff. Diffs that carry a
+        previous_update_id (e.g. Binance futures) must continue from exactly that ID, others must start at or before
+        the next update ID.
+        """
+        previous_update_id: Optional[int] = message.content.get("previous_update_id")
+        if previous_update_id is not None and previous_update_id == last_update_id:
+            return False
+        return message.first_update_id > last_update_id + 1
+
+    async def _resync_order_book(self, trading_pair: str):
+        """
+        Fetches a snapshot until one is routed, with a growing delay between the attempts. The diffs after a sequence
+        gap are contiguous again, nothing would request the resync again if the fetch was given up.
+        """
+        retry_interval: float = self.ORDER_BOOK_RESYNC_RETRY_INTERVAL
+        try:
+            while True:
+                try:
+                    snapshot_message: OrderBookMessage = await self._data_source.get_snapshot_message(trading_pair)
+                    break
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    self.logger().network(f"Unexpected error fetching order book snapshot for {trading_pair}. "
+                                          f"Retrying after {retry_interval:.1f} seconds.",
+                                          exc_info=True)
+                    await asyncio.sleep(retry_interval)
+                    retry_interval = min(retry_interval * 2, self.ORDER_BOOK_RESYNC_MAX_RETRY_INTERVAL)
+            # Replaying the diffs after the snapshot may detect another gap, which must be able to request a resync.
+            self._order_book_resync_tasks.pop(trading_pair, None)
+            self._route_snapshot_message(trading_pair, snapshot_message)
+            self.logger().debug("Resyncing order book for %s.", trading_pair)
+        finally:
+            if self._order_book_resync_tasks.get(trading_pair) is asyncio.current_task():
+                self._order_book_resync_tasks.pop(trading_pair)
+
+    def _drain_message_queue(self, trading_pair: str, message_queue: asyncio.Queue,
+                             message: OrderBookMessage) -> List[OrderBookMessage]:
+        """
+        Returns the given message followed by everything else already waiting in the tracking queue.
+        """
+        messages: List[OrderBookMessage] = [message]
+        while not message_queue.empty():
+            messages.append(message_queue.get_nowait())
+        if len(messages) > self._max_tracking_queue_sizes[trading_pair]:
+            self._max_tracking_queue_sizes[trading_pair] = len(messages)
+        return messages
+
+    def _apply_diff_messages(self,
+                             trading_pair: str,
+                             order_book: OrderBook,
+                             diff_messages: List[OrderBookMessage],
+                             past_diffs_window: Deque[OrderBookMessage]):
+        """
+        Applies consecutive diff messages as a single net diff per price level.
+        """
+        if len(diff_messages) == 1:
+            order_book.apply_diff_entries(diff_messages[0].entries)
+        else:
+            order_book.apply_diff_entries(OrderBookEntries.merge([message.entries for message in diff_messages]))
+        self._check_order_book_resync(trading_pair, order_book)
+        past_diffs_window.extend(diff_messages)
+        while len(past_diffs_window) > self.PAST_DIFF_WINDOW_SIZE:
+            past_diffs_window.popleft()
+        self._diff_messages_received[trading_pair] += len(diff_messages)
+        self._diff_batches_applied[trading_pair] += 1
+
+    def _apply_messages(self,
+                        trading_pair: str,
+                        order_book: OrderBook,
+                        messages: List[OrderBookMessage],
+                        past_diffs_window: Deque[OrderBookMessage]) -> int:
+        """
+        Applies a batch of tracking messages in order, coalescing the diffs between snapshots.
+        Returns the number of diff messages applied.
+        """
+        diff_messages: List[OrderBookMessage] = []
+        num_diffs: int = 0
+        last_update_id: int = max(order_book.snapshot_uid, order_book.last_diff_uid)
+        for message in messages:
+            if message.type is OrderBookMessageType.DIFF:
+                if self.SEQUENCE_GAP_DETECTION:
+                    if message.update_id <= last_update_id:
+                        # Already contained in the order book.
+                        continue
+                    if self._is_sequence_gap(last_update_id, message):
+                        self.logger().debug("Missed order book diffs for %s between update IDs %d and %d.",
+                                            trading_pair, last_update_id, message.first_update_id)
+                        self._sequence_gaps[trading_pair] += 1
+                        self._request_order_book_resync(trading_pair)
+                    last_update_id = message.update_id
+                diff_messages.append(message)
+            elif message.type is OrderBookMessageType.SNAPSHOT:
+                if len(diff_messages) > 0:
+                    self._apply_diff_messages(trading_pair, order_book, diff_messages, past_diffs_window)
+                    num_diffs += len(diff_messages)
+                    diff_messages = []
+                past_diffs: List[OrderBookMessage] = list(past_diffs_window)
+                order_book.restore_from_snapshot_and_diffs(message, past_diffs)
+                last_update_id = max(order_book.snapshot_uid, order_book.last_diff_uid)
+                self.logger().debug("Processed order book snapshot for %s.", trading_pair)
+        if len(diff_messages) > 0:
+            self._apply_diff_messages(trading_pair, order_book, diff_messages, past_diffs_window)
+            num_diffs += len(diff_messages)
+        return num_diffs
+
     async def _track_single_book(self, trading_pair: str):
         past_diffs_window: Deque[OrderBookMessage] = deque()
         self._past_diffs_windows[trading_pair] = past_diffs_window
@@ -254,24 +669,16 @@ class OrderBookTracker(ABC):
         while True:
             try:
                 message: OrderBookMessage = await message_queue.get()
-                if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
-                    past_diffs_window.append(message)
-                    while len(past_diffs_window) > self.PAST_DIFF_WINDOW_SIZE:
-                        past_diffs_window.popleft()
-                    diff_messages_accepted += 1
-
-                    # Output some statistics periodically.
-                    now: float = time.time()
-                    if int(now / 60.0) > int(last_message_timestamp / 60.0):
-                        self.logger().debug("Processed %d order book diffs for %s.",
-                                            diff_messages_accepted, trading_pair)
-                        diff_messages_accepted = 0
-                    last_message_timestamp = now
-                elif message.type is OrderBookMessageType.SNAPSHOT:
-                    past_diffs: List[OrderBookMessage] = list(past_diffs_window)
-                    order_book.restore_from_snapshot_and_diffs(message, past_diffs)
-                    self.logger().debug("Processed order book snapshot for %s.", trading_pair)
+                messages: List[OrderBookMessage] = self._drain_message_queue(trading_pair, message_queue, message)
+                diff_messages_accepted += self._apply_messages(trading_pair, order_book, messages, past_diffs_window)
+
+                # Output some statistics periodically.
+                now: float = time.time()
+                if int(now / 60.0) > int(last_message_timestamp / 60.0):
+                    self.logger().debug("Processed %d order book diffs for %s.",
+                                        diff_messages_accepted, trading_pair)
+                    diff_messages_accepted = 0
+                last_message_timestamp = now
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -282,12 +689,12 @@ class OrderBookTracker(ABC):
         last_message_timestamp: float = time.time()
         messages_accepted: int = 0
         messages_rejected: int = 0
-        await self._order_books_initialized.wait()
         while True:
             try:
                 trade_message: OrderBookMessage = await self._order_book_trade_stream.get()
                 trading_pair: str = trade_message.trading_pair
 
+                # Trades are applied to each order book as soon as it is tracked, the trades before are dropped.
                 if trading_pair not in self._order_books:
                     messages_rejected += 1
                     continue
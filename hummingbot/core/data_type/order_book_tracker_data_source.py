@@ -5,12 +5,17 @@ from abc import (
     abstractmethod
 )
 import asyncio
+import time
 from typing import (
     Callable,
     Dict,
     List,
 )
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType,
+)
 
 
 class OrderBookTrackerDataSource(metaclass=ABCMeta):
@@ -51,6 +56,20 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
         raise NotImplementedError
 
+    async def get_snapshot_message(self, trading_pair: str) -> OrderBookMessage:
+        """
+        Fetches a fresh snapshot of the order book, for resyncing a book that is already being tracked.
+        Data sources with a cheaper snapshot endpoint may override this.
+        """
+        order_book: OrderBook = await self.get_new_order_book(trading_pair)
+        bids, asks = order_book.get_numpy_snapshot()
+        return OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": trading_pair,
+            "update_id": order_book.snapshot_uid,
+            "bids": bids[:, :2].tolist(),
+            "asks": asks[:, :2].tolist(),
+        }, timestamp=time.time())
+
     @abstractmethod
     async def listen_for_order_book_diffs(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
         """
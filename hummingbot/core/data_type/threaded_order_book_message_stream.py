@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+
+import asyncio
+from collections import deque
+import logging
+import threading
+from typing import (
+    Callable,
+    Deque,
+    List,
+    Optional,
+)
+import websockets
+from websockets.exceptions import ConnectionClosed
+
+from hummingbot.core.data_type.order_book_message import OrderBookMessage
+from hummingbot.logger import HummingbotLogger
+
+
+class ThreadedOrderBookMessageStream:
+    """
+    Receives and parses the order book messages of one websocket connection in a dedicated thread, which runs its own
+    event loop. Parsed messages are handed to the main event loop in batches: the thread only schedules a delivery
+    callback with call_soon_threadsafe() when none is pending, so all the messages that arrive while the main event
+    loop is busy are put on the output queue with a single wakeup.
+
+    parse_message() is called in the stream thread. It takes the raw websocket message and returns an order book
+    message, or None for messages that should be skipped. Reading the message's entries there decodes the rows into
+    C++ order book entries in the thread as well.
+
+    Usage:
+
+        stream = ThreadedOrderBookMessageStream(stream_url, parse_message)
+        await stream.listen(output)
+
+    listen() returns when the connection is closed or the server stops answering pings, like the websocket loops of
+    the order book data sources, and raises the errors of the stream thread.
+    """
+    MESSAGE_TIMEOUT = 30.0
+    PING_TIMEOUT = 10.0
+
+    _tobms_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._tobms_logger is None:
+            cls._tobms_logger = logging.getLogger(__name__)
+        return cls._tobms_logger
+
+    def __init__(self,
+                 url: str,
+                 parse_message: Callable[[str], Optional[OrderBookMessage]],
+                 subscribe_messages: Optional[List[str]] = None,
+                 message_timeout: float = MESSAGE_TIMEOUT,
+                 ping_timeout: float = PING_TIMEOUT):
+        self._url: str = url
+        self._parse_message: Callable[[str], Optional[OrderBookMessage]] = parse_message
+        self._subscribe_messages: List[str] = subscribe_messages or []
+        self._message_timeout: float = message_timeout
+        self._ping_timeout: float = ping_timeout
+        self._pending_messages: Deque[OrderBookMessage] = deque()
+        self._delivery_scheduled: bool = False
+        self._messages_received: int = 0
+        self._batches_delivered: int = 0
+
+    @property
+    def messages_received(self) -> int:
+        return self._messages_received
+
+    @property
+    def batches_delivered(self) -> int:
+        return self._batches_delivered
+
+    async def listen(self, output: asyncio.Queue):
+        ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        stream_loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+        stream_task: asyncio.Task = stream_loop.create_task(self._receive_messages(ev_loop, output))
+        stream_done: asyncio.Future = ev_loop.create_future()
+
+        def run_stream_loop():
+            asyncio.set_event_loop(stream_loop)
+            error: Optional[BaseException] = None
+            try:
+                stream_loop.run_until_complete(stream_task)
+            except asyncio.CancelledError:
+                pass
+            except BaseException as e:
+                error = e
+            finally:
+                stream_loop.close()
+            try:
+                ev_loop.call_soon_threadsafe(self._set_stream_done, stream_done, error)
+            except RuntimeError:
+                # The main event loop is closed already.
+                pass
+
+        thread: threading.Thread = threading.Thread(target=run_stream_loop,
+                                                    name=f"{self.__class__.__name__}-{self._url}",
+                                                    daemon=True)
+        thread.start()
+        try:
+            await asyncio.shield(stream_done)
+        finally:
+            if not stream_done.done():
+                try:
+                    stream_loop.call_soon_threadsafe(stream_task.cancel)
+                except RuntimeError:
+                    # The stream thread has just finished.
+                    pass
+            # Hand over whatever was parsed before the stream ended.
+            self._deliver_messages(output)
+
+    @staticmethod
+    def _set_stream_done(stream_done: asyncio.Future, error: Optional[BaseException]):
+        if stream_done.done():
+            return
+        if error is not None:
+            stream_done.set_exception(error)
+        else:
+            stream_done.set_result(None)
+
+    async def _receive_messages(self, ev_loop: asyncio.AbstractEventLoop, output: asyncio.Queue):
+        """
+        Runs in the stream thread.
+        """
+        async with websockets.connect(self._url) as ws:
+            ws: websockets.WebSocketClientProtocol = ws
+            for subscribe_message in self._subscribe_messages:
+                await ws.send(subscribe_message)
+            while True:
+                try:
+                    raw_msg: str = await asyncio.wait_for(ws.recv(), timeout=self._message_timeout)
+                except asyncio.TimeoutError:
+                    try:
+                        pong_waiter = await ws.ping()
+                        await asyncio.wait_for(pong_waiter, timeout=self._ping_timeout)
+                    except asyncio.TimeoutError:
+                        self.logger().warning("WebSocket ping timed out. Going to reconnect...")
+                        return
+                    continue
+                except ConnectionClosed:
+                    return
+
+                message: Optional[OrderBookMessage] = self._parse_message(raw_msg)
+                if message is None:
+                    continue
+                self._messages_received += 1
+                self._pending_messages.append(message)
+                if not self._delivery_scheduled:
+                    self._delivery_scheduled = True
+                    ev_loop.call_soon_threadsafe(self._deliver_messages, output)
+
+    def _deliver_messages(self, output: asyncio.Queue):
+        """
+        Runs in the main event loop. The flag is cleared before draining, so a message appended after the last
+        popleft() always schedules another delivery.
+        """
+        self._delivery_scheduled = False
+        if len(self._pending_messages) == 0:
+            return
+        self._batches_delivered += 1
+        while len(self._pending_messages) > 0:
+            output.put_nowait(self._pending_messages.popleft())
@@ -0,0 +1,14 @@
+# distutils: language=c++
+
+cimport numpy as np
+
+
+cdef class TradeTape:
+    cdef:
+        np.ndarray _buffer
+        double[:, ::1] _columns
+        Py_ssize_t _capacity
+        Py_ssize_t _head
+        Py_ssize_t _count
+
+    cdef c_append(self, double timestamp, double price, double amount, double side)
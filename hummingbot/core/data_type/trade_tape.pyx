@@ -0,0 +1,116 @@
+# distutils: language=c++
+
+import numpy as np
+import time
+from typing import (
+    Optional,
+    Tuple,
+)
+
+from hummingbot.core.event.events import TradeType
+
+cimport numpy as np
+
+DEF TIMESTAMP_COLUMN = 0
+DEF PRICE_COLUMN = 1
+DEF AMOUNT_COLUMN = 2
+DEF SIDE_COLUMN = 3
+
+BUY_SIDE = float(TradeType.BUY.value)
+SELL_SIDE = float(TradeType.SELL.value)
+
+
+cdef class TradeTape:
+    """
+    Fixed capacity ring buffer of the most recent trades of an order book, with vectorized rolling queries.
+
+    Trades are stored column-wise as (timestamp, price, amount, side) in one preallocated NumPy array, where side is
+    the TradeType value of the taker. Appending a trade overwrites the oldest one once the tape is full, and doesn't
+    allocate any Python objects.
+
+    The rolling queries cover the trades with timestamp in (now - seconds, now]. `now` defaults to the current time.
+    """
+
+    def __init__(self, capacity: int = 1000):
+        if capacity <= 0:
+            raise ValueError(f"The trade tape capacity must be positive, got {capacity}.")
+        self._buffer = np.zeros((4, capacity), dtype=np.float64)
+        self._columns = self._buffer
+        self._capacity = capacity
+        self._head = 0
+        self._count = 0
+
+    cdef c_append(self, double timestamp, double price, double amount, double side):
+        self._columns[TIMESTAMP_COLUMN, self._head] = timestamp
+        self._columns[PRICE_COLUMN, self._head] = price
+        self._columns[AMOUNT_COLUMN, self._head] = amount
+        self._columns[SIDE_COLUMN, self._head] = side
+        self._head += 1
+        if self._head == self._capacity:
+            self._head = 0
+        if self._count < self._capacity:
+            self._count += 1
+
+    def append(self, timestamp: float, price: float, amount: float, trade_type: TradeType):
+        self.c_append(timestamp, price, amount, trade_type.value)
+
+    def clear(self):
+        self._head = 0
+        self._count = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def __len__(self) -> int:
+        return self._count
+
+    def to_numpy(self) -> np.ndarray:
+        """
+        Copy of the trades on the tape as a (n, 4) array of (timestamp, price, amount, side) rows, oldest first.
+        """
+        if self._count < self._capacity:
+            return self._buffer[:, :self._count].T.copy()
+        return np.concatenate([self._buffer[:, self._head:], self._buffer[:, :self._head]], axis=1).T
+
+    def _window(self, seconds: float, now: Optional[float]) -> np.ndarray:
+        # The order of the trades doesn't matter to any of the queries, so the filled part of the buffer is filtered
+        # as is.
+        if now is None:
+            now = time.time()
+        columns: np.ndarray = self._buffer[:, :self._count]
+        timestamps: np.ndarray = columns[TIMESTAMP_COLUMN]
+        return columns[:, (timestamps > now - seconds) & (timestamps <= now)]
+
+    def trade_count(self, seconds: float, now: Optional[float] = None) -> int:
+        return self._window(seconds, now).shape[1]
+
+    def vwap(self, seconds: float, now: Optional[float] = None) -> float:
+        """
+        Volume weighted average trade price, NaN if there were no trades.
+        """
+        window: np.ndarray = self._window(seconds, now)
+        volume: float = window[AMOUNT_COLUMN].sum()
+        if volume <= 0:
+            return float("NaN")
+        return float(np.dot(window[PRICE_COLUMN], window[AMOUNT_COLUMN]) / volume)
+
+    def buy_sell_volumes(self, seconds: float, now: Optional[float] = None) -> Tuple[float, float]:
+        """
+        Base asset volumes of the trades with a buying and with a selling taker.
+        """
+        window: np.ndarray = self._window(seconds, now)
+        is_buy: np.ndarray = window[SIDE_COLUMN] == BUY_SIDE
+        return float(window[AMOUNT_COLUMN][is_buy].sum()), float(window[AMOUNT_COLUMN][~is_buy].sum())
+
+    def volume_imbalance(self, seconds: float, now: Optional[float] = None) -> float:
+        """
+        (buy volume - sell volume) / (buy volume + sell volume), between -1 and 1. NaN if there were no trades.
+        """
+        buy_volume, sell_volume = self.buy_sell_volumes(seconds, now)
+        if buy_volume + sell_volume <= 0:
+            return float("NaN")
+        return (buy_volume - sell_volume) / (buy_volume + sell_volume)
+
+    def __repr__(self) -> str:
+        return f"TradeTape(capacity={self._capacity}, num_trades={self._count})"
@@ -51,6 +51,8 @@ class ERC20WatcherEvent(Enum):
 
 class OrderBookEvent(Enum):
     TradeEvent = 901
+    TopOfBookChangedEvent = 902
+    MetricsChangedEvent = 903
 
 
 class ZeroExEvent(Enum):
@@ -284,6 +286,22 @@ class OrderBookTradeEvent(NamedTuple):
     amount: Decimal
 
 
+class OrderBookTopOfBookEvent(NamedTuple):
+    update_id: int
+    best_bid_price: float
+    best_bid_amount: float
+    best_ask_price: float
+    best_ask_amount: float
+
+
+class OrderBookMetricsEvent(NamedTuple):
+    update_id: int
+    mid_price: float
+    microprice: float
+    spread: float
+    depth_imbalance: float
+
+
 class OrderFilledEvent(NamedTuple):
     timestamp: float
     order_id: str
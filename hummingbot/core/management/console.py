@@ -41,8 +41,9 @@ class MergedNamespace(MutableMappingABC):
 
 
 def add_diagnosis_tools(local_vars: MutableMapping):
-    from .diagnosis import active_tasks
+    from .diagnosis import active_tasks, order_book_memory
     local_vars["active_tasks"] = active_tasks
+    local_vars["order_book_memory"] = order_book_memory
 
 
 async def start_management_console(local_vars: MutableMapping,
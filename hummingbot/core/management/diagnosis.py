@@ -5,8 +5,11 @@ Debug console diagnosis tools.
 """
 
 import asyncio
+import gc
 import pandas as pd
-from typing import Coroutine, Generator, Union, List
+from typing import Coroutine, Generator, Union, List, Optional
+
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 
 
 def get_coro_name(coro: Union[Coroutine, Generator]) -> str:
@@ -35,3 +38,28 @@ def active_tasks() -> pd.DataFrame:
                                         columns=["func_name", "coroutine", "task"]).set_index("func_name")
     retval.sort_index(inplace=True)
     return retval
+
+
+def order_book_memory(trackers: Optional[List[OrderBookTracker]] = None) -> pd.DataFrame:
+    """
+    Memory footprint of the order books of the given order book trackers, or of all the live ones, one row per
+    trading pair sorted by total bytes. The totals are printed, and appended as the last row.
+    """
+    if trackers is None:
+        trackers = [o for o in gc.get_objects() if isinstance(o, OrderBookTracker)]
+    rows: List[dict] = [{"tracker": type(tracker).__name__, "trading_pair": trading_pair, **usage}
+                        for tracker in trackers
+                        for trading_pair, usage in tracker.memory_usage().items()]
+    retval: pd.DataFrame = pd.DataFrame(rows, columns=["tracker", "trading_pair", "bid_levels", "ask_levels",
+                                                       "bid_bytes", "ask_bytes", "other_book_bytes", "past_diffs",
+                                                       "past_diffs_bytes", "active_orders", "active_orders_bytes"])
+    retval["total_bytes"] = retval[[column for column in retval.columns if column.endswith("_bytes")]].sum(axis=1)
+    retval = retval.set_index(["tracker", "trading_pair"]).sort_values("total_bytes", ascending=False)
+    totals: pd.Series = retval.sum()
+    print(f"{len(retval)} order books in {len(trackers)} trackers: "
+          f"{totals['total_bytes'] / 1e6:.2f} MB total, "
+          f"{(totals['bid_bytes'] + totals['ask_bytes']) / 1e6:.2f} MB order book sides, "
+          f"{totals['past_diffs_bytes'] / 1e6:.2f} MB past diffs, "
+          f"{totals['active_orders_bytes'] / 1e6:.2f} MB active order trackers.")
+    retval.loc[("total", ""), :] = totals
+    return retval
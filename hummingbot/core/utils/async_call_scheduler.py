@@ -2,8 +2,15 @@
 
 import asyncio
 from async_timeout import timeout
+from enum import IntEnum
+import itertools
 import logging
+import time
 from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
     Optional,
     Coroutine,
     NamedTuple,
@@ -14,15 +21,83 @@ import hummingbot
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.utils.async_utils import safe_ensure_future
 
+DEFAULT_LANE = "default"
+
+
+class AsyncCallPriority(IntEnum):
+    HIGH = 0
+    NORMAL = 1
+    LOW = 2
+
 
 class AsyncCallSchedulerItem(NamedTuple):
     future: asyncio.Future
     coroutine: Coroutine
     timeout_seconds: float
     app_warning_msg: str = "API call error."
+    priority: AsyncCallPriority = AsyncCallPriority.NORMAL
+    queued_timestamp: float = 0.0
+
+
+class AsyncCallSchedulerLane:
+    """
+    The calls of one lane, e.g. one exchange or one RPC endpoint. Up to max_concurrency calls of a lane run at the
+    same time, and each of its workers waits call_interval after a call before it picks the next one. Queued calls
+    are picked by priority first, and in scheduling order within a priority.
+    """
+    def __init__(self, name: str, max_concurrency: int, call_interval: float):
+        self.name: str = name
+        self.max_concurrency: int = max_concurrency
+        self.call_interval: float = call_interval
+        self.queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        self.worker_tasks: List[asyncio.Task] = []
+        self.running: int = 0
+        self.calls: int = 0
+        self.errors: int = 0
+        self.timeouts: int = 0
+        self.total_execution_time: float = 0.0
+        self.max_execution_time: float = 0.0
+        self.waits: Dict[AsyncCallPriority, int] = {priority: 0 for priority in AsyncCallPriority}
+        self.total_queue_wait: Dict[AsyncCallPriority, float] = {priority: 0.0 for priority in AsyncCallPriority}
+        self.max_queue_wait: float = 0.0
+
+    def record_queue_wait(self, priority: AsyncCallPriority, queue_wait: float):
+        self.waits[priority] += 1
+        self.total_queue_wait[priority] += queue_wait
+        self.max_queue_wait = max(self.max_queue_wait, queue_wait)
+
+    def record_execution_time(self, execution_time: float):
+        self.calls += 1
+        self.total_execution_time += execution_time
+        self.max_execution_time = max(self.max_execution_time, execution_time)
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        num_waits: int = sum(self.waits.values())
+        return {
+            "queued": self.queue.qsize(),
+            "running": self.running,
+            "max_concurrency": self.max_concurrency,
+            "calls": self.calls,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "avg_queue_wait": sum(self.total_queue_wait.values()) / num_waits if num_waits > 0 else 0.0,
+            "max_queue_wait": self.max_queue_wait,
+            "avg_queue_wait_by_priority": {
+                priority.name: self.total_queue_wait[priority] / self.waits[priority]
+                for priority in AsyncCallPriority if self.waits[priority] > 0
+            },
+            "avg_execution_time": self.total_execution_time / self.calls if self.calls > 0 else 0.0,
+            "max_execution_time": self.max_execution_time,
+        }
 
 
 class AsyncCallScheduler:
+    """
+    Runs scheduled calls in named lanes. Lanes are created with the scheduler's max_concurrency and call_interval
+    the first time they are used, unless configure_lane() sets them up differently, so calls of one lane never wait
+    behind the calls of another. With the default max_concurrency of 1, the calls of a lane run one at a time.
+    """
     _acs_shared_instance: Optional["AsyncCallScheduler"] = None
     _acs_logger: Optional[HummingbotLogger] = None
 
@@ -38,44 +113,98 @@ class AsyncCallScheduler:
             cls._acs_logger = logging.getLogger(__name__)
         return cls._acs_logger
 
-    def __init__(self, call_interval: float = 0.01):
-        self._coro_queue: asyncio.Queue = asyncio.Queue()
-        self._coro_scheduler_task: Optional[asyncio.Task] = None
+    def __init__(self, call_interval: float = 0.01, max_concurrency: int = 1):
         self._call_interval: float = call_interval
+        self._max_concurrency: int = max_concurrency
+        self._lanes: Dict[str, AsyncCallSchedulerLane] = {}
+        self._call_counter: Iterator[int] = itertools.count()
+        self._started: bool = False
         self._ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
 
     @property
-    def coro_queue(self) -> asyncio.Queue:
-        return self._coro_queue
+    def coro_queue(self) -> asyncio.PriorityQueue:
+        return self._get_lane(DEFAULT_LANE).queue
 
     @property
     def coro_scheduler_task(self) -> Optional[asyncio.Task]:
-        return self._coro_scheduler_task
+        lane: Optional[AsyncCallSchedulerLane] = self._lanes.get(DEFAULT_LANE)
+        if lane is None or len(lane.worker_tasks) == 0:
+            return None
+        return lane.worker_tasks[0]
 
     @property
     def started(self) -> bool:
-        return self._coro_scheduler_task is not None
+        return self._started
+
+    @property
+    def lanes(self) -> Dict[str, AsyncCallSchedulerLane]:
+        return self._lanes
+
+    @property
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Queue wait and execution time statistics per lane, in seconds.
+        """
+        return {name: lane.stats for name, lane in self._lanes.items()}
+
+    def configure_lane(self,
+                       lane: str,
+                       max_concurrency: Optional[int] = None,
+                       call_interval: Optional[float] = None) -> AsyncCallSchedulerLane:
+        scheduler_lane: AsyncCallSchedulerLane = self._get_lane(lane)
+        if max_concurrency is not None:
+            if max_concurrency < 1:
+                raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}.")
+            scheduler_lane.max_concurrency = max_concurrency
+        if call_interval is not None:
+            scheduler_lane.call_interval = call_interval
+        if self._started:
+            self._start_lane_workers(scheduler_lane)
+        return scheduler_lane
+
+    def _get_lane(self, lane: str) -> AsyncCallSchedulerLane:
+        scheduler_lane: Optional[AsyncCallSchedulerLane] = self._lanes.get(lane)
+        if scheduler_lane is None:
+            scheduler_lane = AsyncCallSchedulerLane(lane, self._max_concurrency, self._call_interval)
+            self._lanes[lane] = scheduler_lane
+        return scheduler_lane
+
+    def _start_lane_workers(self, lane: AsyncCallSchedulerLane):
+        # Workers beyond a lowered max_concurrency exit on their own after their next call.
+        lane.worker_tasks = [task for task in lane.worker_tasks if not task.done()]
+        while len(lane.worker_tasks) < lane.max_concurrency:
+            lane.worker_tasks.append(safe_ensure_future(self._coro_scheduler(lane)))
 
     def start(self):
-        if self._coro_scheduler_task is not None:
+        if self._started:
             self.stop()
-        self._coro_scheduler_task = safe_ensure_future(
-            self._coro_scheduler(
-                self._coro_queue,
-                self._call_interval
-            )
-        )
+        self._started = True
+        for lane in self._lanes.values():
+            self._start_lane_workers(lane)
 
     def stop(self):
-        if self._coro_scheduler_task is not None:
-            self._coro_scheduler_task.cancel()
-            self._coro_scheduler_task = None
+        for lane in self._lanes.values():
+            for task in lane.worker_tasks:
+                task.cancel()
+            lane.worker_tasks = []
+        self._started = False
 
-    async def _coro_scheduler(self, coro_queue: asyncio.Queue, interval: float = 0.01):
+    async def _coro_scheduler(self, lane: AsyncCallSchedulerLane):
         while True:
             app_warning_msg = "API call error."
+            fut: Optional[asyncio.Future] = None
+            start_time: Optional[float] = None
             try:
-                fut, coro, timeout_seconds, app_warning_msg = await coro_queue.get()
+                _, _, item = await lane.queue.get()
+                fut, coro, timeout_seconds, app_warning_msg, priority, queued_timestamp = item
+                if fut.done():
+                    # The caller has stopped waiting, e.g. it was cancelled or timed out.
+                    if asyncio.iscoroutine(coro):
+                        coro.close()
+                    continue
+                start_time = time.perf_counter()
+                lane.record_queue_wait(priority, start_time - queued_timestamp)
+                lane.running += 1
                 async with timeout(timeout_seconds):
                     fut.set_result(await coro)
             except asyncio.CancelledError:
@@ -88,41 +217,70 @@ class AsyncCallScheduler:
                 # The future is already cancelled from outside. Ignore.
                 pass
             except Exception as e:
+                if isinstance(e, asyncio.TimeoutError):
+                    lane.timeouts += 1
+                else:
+                    lane.errors += 1
                 # Add exception information.
                 app_warning_msg += f" [[Got exception: {str(e)}]]"
                 self.logger().debug(app_warning_msg,
                                     exc_info=True,
                                     app_warning_msg=app_warning_msg)
                 try:
-                    fut.set_exception(e)
+                    # Drop the worker's own frame from the traceback. Clearing the frames of the traceback, like
+                    # assertRaises() does, would close the suspended worker coroutine otherwise.
+                    fut.set_exception(e.with_traceback(e.__traceback__.tb_next))
                 except Exception:
                     pass
+            finally:
+                if start_time is not None:
+                    lane.running -= 1
+                    lane.record_execution_time(time.perf_counter() - start_time)
 
             try:
-                await asyncio.sleep(interval)
+                await asyncio.sleep(lane.call_interval)
             except asyncio.CancelledError:
                 raise
             except Exception:
                 self.logger().error("Scheduler sleep interrupted.", exc_info=True)
 
+            if len(lane.worker_tasks) > lane.max_concurrency:
+                current_task: asyncio.Task = asyncio.current_task()
+                if current_task in lane.worker_tasks:
+                    lane.worker_tasks.remove(current_task)
+                    return
+
     async def schedule_async_call(self,
                                   coro: Coroutine,
                                   timeout_seconds: float,
-                                  app_warning_msg: str = "API call error.") -> any:
+                                  app_warning_msg: str = "API call error.",
+                                  lane: str = DEFAULT_LANE,
+                                  priority: AsyncCallPriority = AsyncCallPriority.NORMAL) -> any:
         fut: asyncio.Future = self._ev_loop.create_future()
-        self._coro_queue.put_nowait(AsyncCallSchedulerItem(fut, coro, timeout_seconds,
-                                                           app_warning_msg=app_warning_msg))
-        if self._coro_scheduler_task is None:
+        scheduler_lane: AsyncCallSchedulerLane = self._get_lane(lane)
+        scheduler_lane.queue.put_nowait((priority, next(self._call_counter),
+                                         AsyncCallSchedulerItem(fut, coro, timeout_seconds,
+                                                                app_warning_msg=app_warning_msg,
+                                                                priority=priority,
+                                                                queued_timestamp=time.perf_counter())))
+        if not self._started:
             self.start()
+        elif len(scheduler_lane.worker_tasks) == 0:
+            self._start_lane_workers(scheduler_lane)
         return await fut
 
     async def call_async(self,
                          func: Callable, *args,
                          timeout_seconds: float = 5.0,
-                         app_warning_msg: str = "API call error.") -> any:
-        coro: Coroutine = self._ev_loop.run_in_executor(
-            hummingbot.get_executor(),
-            func,
-            *args,
-        )
-        return await self.schedule_async_call(coro, timeout_seconds, app_warning_msg=app_warning_msg)
+                         app_warning_msg: str = "API call error.",
+                         lane: str = DEFAULT_LANE,
+                         priority: AsyncCallPriority = AsyncCallPriority.NORMAL) -> any:
+        # The executor call only starts once a worker of the lane picks it up.
+        async def run_in_executor() -> any:
+            return await self._ev_loop.run_in_executor(
+                hummingbot.get_executor(),
+                func,
+                *args,
+            )
+        return await self.schedule_async_call(run_in_executor(), timeout_seconds, app_warning_msg=app_warning_msg,
+                                              lane=lane, priority=priority)
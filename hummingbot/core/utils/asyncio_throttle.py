@@ -3,6 +3,9 @@ import time
 import asyncio
 from collections import deque
 from typing import (
+    Dict,
+    List,
+    NamedTuple,
     Optional,
     Tuple,
     Deque
@@ -13,29 +16,165 @@ Seconds = float
 Timestamp_s = float
 TaskLog = Tuple[Timestamp_s, RequestWeight]
 
+# The limit that weighted_task(request_weight) is counted against.
+REQUEST_WEIGHT = "REQUEST_WEIGHT"
+
+
+class RateLimit(NamedTuple):
+    """
+    At most `limit` weight of the limit's name within any `period` seconds, e.g. RateLimit(1200, 60.0) for an IP
+    weight limit, or RateLimit(10, 1.0, "ORDERS") for an order count limit.
+    """
+    limit: RequestWeight
+    period: Seconds
+    name: str = REQUEST_WEIGHT
+
+
+class RateLimitWindow:
+    """
+    The sliding window of one rate limit. The weight in the window is kept as a running sum, updated as tasks are
+    logged and as their logs expire.
+    """
+    def __init__(self, rate_limit: RateLimit, period_safety_margin: Seconds):
+        self.rate_limit: RateLimit = rate_limit
+        self.window: Seconds = rate_limit.period + period_safety_margin
+        self.task_logs: Deque[TaskLog] = deque()
+        self.used_weight: RequestWeight = 0
+
+    def flush(self, now: Timestamp_s):
+        while self.task_logs and now - self.task_logs[0][0] >= self.window:
+            self.used_weight -= self.task_logs.popleft()[1]
+
+    def wait_time(self, request_weight: RequestWeight, now: Timestamp_s) -> Seconds:
+        """
+        Seconds until request_weight fits in the window, 0 if it fits now.
+        """
+        self.flush(now)
+        excess_weight: RequestWeight = self.used_weight + request_weight - self.rate_limit.limit
+        if excess_weight <= 0:
+            return 0.0
+        for task_ts, weight in self.task_logs:
+            excess_weight -= weight
+            if excess_weight <= 0:
+                return task_ts + self.window - now
+        return self.window
+
+    def log(self, request_weight: RequestWeight, now: Timestamp_s):
+        self.task_logs.append((now, request_weight))
+        self.used_weight += request_weight
+
 
 class Throttler:
+    """
+    Throttles tasks within one or more rate limits. A task's weights are counted against every rate limit of the
+    same name: weighted_task(request_weight) counts against the REQUEST_WEIGHT limits, weighted_task(endpoint=...)
+    against the weights listed for the endpoint in endpoint_weights, e.g.
+
+        Throttler(rate_limits=[RateLimit(1200, 60.0), RateLimit(10, 1.0, "ORDERS")],
+                  endpoint_weights={"create_order": {REQUEST_WEIGHT: 1, "ORDERS": 1}})
+
+    Tasks that have to wait are served in FIFO order. Instead of polling, the first waiter is woken up when the task
+    logs it waits for expire.
+    """
     def __init__(self,
-                 rate_limit: Tuple[RequestWeight, Seconds],
+                 rate_limit: Optional[Tuple[RequestWeight, Seconds]] = None,
                  period_safety_margin: Seconds = 0.1,
-                 retry_interval: Seconds = 0.1):
+                 rate_limits: Optional[List[RateLimit]] = None,
+                 endpoint_weights: Optional[Dict[str, Dict[str, RequestWeight]]] = None):
+        """
+        :param rate_limit: Max REQUEST_WEIGHT allowed in the given period
+        :param period_safety_margin: Added to every period, as an estimate for the network latency
+        :param rate_limits: Rate limits, in addition to rate_limit
+        :param endpoint_weights: Weights per rate limit name of each endpoint
         """
-        :param rate_limit: Max weight allowed in the given period
-        :param retry_interval: Time between each limit check
+        all_rate_limits: List[RateLimit] = list(rate_limits or [])
+        if rate_limit is not None:
+            all_rate_limits.append(RateLimit(rate_limit[0], rate_limit[1]))
+        self._windows: Dict[str, List[RateLimitWindow]] = {}
+        for limit in all_rate_limits:
+            self._windows.setdefault(limit.name, []).append(RateLimitWindow(limit, period_safety_margin))
+        self._endpoint_weights: Dict[str, Dict[str, RequestWeight]] = endpoint_weights or {}
+        self._waiters: Deque[Tuple[Dict[str, RequestWeight], asyncio.Future]] = deque()
+        self._wakeup_handle: Optional[asyncio.TimerHandle] = None
+
+    @property
+    def rate_limits(self) -> List[RateLimit]:
+        return [window.rate_limit for windows in self._windows.values() for window in windows]
+
+    @property
+    def waiting_tasks(self) -> int:
+        return len(self._waiters)
+
+    def used_weight(self, name: str = REQUEST_WEIGHT) -> List[RequestWeight]:
         """
-        self._rate_limit_weight: int = rate_limit[0]
-        self._period: float = rate_limit[1]
-        self._retry_interval: float = retry_interval
-        self._period_safety_margin = period_safety_margin
-        self._task_logs: Deque[TaskLog] = deque()
+        The weight in the window of each rate limit of the name.
+        """
+        now: float = time.monotonic()
+        for window in self._windows.get(name, []):
+            window.flush(now)
+        return [window.used_weight for window in self._windows.get(name, [])]
 
     def weighted_task(self,
-                      request_weight):
-        return ThrottlerContextManager(
-            rate_limit=self._rate_limit_weight,
-            period=self._period,
-            request_weight=request_weight,
-            task_logs=self._task_logs)
+                      request_weight: RequestWeight = 1,
+                      endpoint: Optional[str] = None) -> "ThrottlerContextManager":
+        weights: Optional[Dict[str, RequestWeight]] = self._endpoint_weights.get(endpoint)
+        if weights is None:
+            weights = {REQUEST_WEIGHT: request_weight}
+        return ThrottlerContextManager(self, weights)
+
+    def _wait_time(self, weights: Dict[str, RequestWeight], now: Timestamp_s) -> Seconds:
+        return max([window.wait_time(weight, now)
+                    for name, weight in weights.items()
+                    for window in self._windows.get(name, [])] + [0.0])
+
+    def _log(self, weights: Dict[str, RequestWeight], now: Timestamp_s):
+        for name, weight in weights.items():
+            if weight > 0:
+                for window in self._windows.get(name, []):
+                    window.log(weight, now)
+
+    async def acquire(self, weights: Dict[str, RequestWeight]):
+        for name, weight in weights.items():
+            for window in self._windows.get(name, []):
+                if weight > window.rate_limit.limit:
+                    raise ValueError(f"Weight {weight} is above the rate limit {window.rate_limit}.")
+
+        now: float = time.monotonic()
+        if len(self._waiters) == 0 and self._wait_time(weights, now) == 0:
+            self._log(weights, now)
+            return
+
+        waiter: Tuple[Dict[str, RequestWeight], asyncio.Future] = (weights, asyncio.get_event_loop().create_future())
+        self._waiters.append(waiter)
+        if len(self._waiters) == 1:
+            self._wake_up_waiters()
+        try:
+            await waiter[1]
+        except asyncio.CancelledError:
+            if not waiter[1].done() or waiter[1].cancelled():
+                # Let the tasks behind the cancelled one go ahead.
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                self._wake_up_waiters()
+            raise
+
+    def _wake_up_waiters(self):
+        if self._wakeup_handle is not None:
+            self._wakeup_handle.cancel()
+            self._wakeup_handle = None
+        now: float = time.monotonic()
+        while self._waiters:
+            weights, future = self._waiters[0]
+            if future.done():
+                self._waiters.popleft()
+                continue
+            wait_time: float = self._wait_time(weights, now)
+            if wait_time > 0:
+                self._wakeup_handle = future.get_loop().call_later(wait_time, self._wake_up_waiters)
+                return
+            self._log(weights, now)
+            self._waiters.popleft()
+            future.set_result(None)
 
 
 class ThrottlerContextManager:
@@ -48,54 +187,17 @@ class ThrottlerContextManager:
         return cls.throttler_logger
 
     def __init__(self,
-                 task_logs: Deque[TaskLog],
-                 rate_limit: RequestWeight,
-                 request_weight: RequestWeight = 1,
-                 period_safety_margin: Seconds = 0.1,
-                 period: Seconds = 1.0,
-                 retry_interval: Seconds = 0.1):
-        """
-        :param task_logs: Shared task logs
-        :param rate_limit: Max weight allowed in the given period
-        :param request_weight: Weight of the request of the added task
-        :param period_safety_margin: estimate for the network latency
-        :param period: Time interval of the rate limit
-        :param retry_interval: Time between each limit check
-        """
-        self._period_safety_margin = period_safety_margin
-        self._lock = asyncio.Lock()
-        self._request_weight: RequestWeight = request_weight
-        self._rate_limit: int = rate_limit
-        self._period: float = period
-        self._retry_interval: float = retry_interval
-        self._task_logs: Deque[TaskLog] = task_logs
-
-    def flush(self):
+                 throttler: Throttler,
+                 weights: Dict[str, RequestWeight]):
         """
-        Remove task logs that have passed rate limit periods
-        :return:
+        :param throttler: The throttler to acquire the capacity from
+        :param weights: Weight of the task per rate limit name
         """
-        now: float = time.time()
-        while self._task_logs:
-            task_ts, _ = self._task_logs[0]
-            elapsed: float = now - task_ts
-            if elapsed > self._period - self._period_safety_margin:
-                self._task_logs.popleft()
-            else:
-                break
-
-    async def acquire(self):
-        while True:
-            self.flush()
-            current_capacity: int = self._rate_limit - sum(weight for (ts, weight) in self._task_logs)
-            if current_capacity - self._request_weight > 0:
-                break
-            await asyncio.sleep(self._retry_interval)
-        self._task_logs.append((time.time(), self._request_weight))
+        self._throttler: Throttler = throttler
+        self._weights: Dict[str, RequestWeight] = weights
 
     async def __aenter__(self):
-        async with self._lock:
-            await self.acquire()
+        await self._throttler.acquire(self._weights)
 
     async def __aexit__(self, exc_type, exc, tb):
         pass
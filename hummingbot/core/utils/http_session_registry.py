@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+
+import aiohttp
+import asyncio
+import logging
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+from yarl import URL
+
+from hummingbot.logger import HummingbotLogger
+
+HostKey = Tuple[str, str, Optional[int]]
+
+
+class HTTPSessionRegistry:
+    """
+    Process-wide aiohttp sessions, one per host. The REST requests of all connectors and data sources to a host go
+    through the same keep-alive connection pool, instead of opening a session, and paying for the TCP and TLS
+    handshakes, per request.
+
+    The registry is used like a ClientSession: requests are sent through the session of the URL's host, and
+    `async with shared_client() as client:` leaves the sessions open when the block exits. close() closes all the
+    sessions, when the application exits.
+    """
+    CONNECTION_LIMIT_PER_HOST = 100
+    DNS_CACHE_TTL = 300
+    KEEPALIVE_TIMEOUT = 30.0
+
+    _hsr_logger: Optional[HummingbotLogger] = None
+    _hsr_shared_instance: Optional["HTTPSessionRegistry"] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._hsr_logger is None:
+            cls._hsr_logger = logging.getLogger(__name__)
+        return cls._hsr_logger
+
+    @classmethod
+    def get_instance(cls) -> "HTTPSessionRegistry":
+        if cls._hsr_shared_instance is None:
+            cls._hsr_shared_instance = HTTPSessionRegistry()
+        return cls._hsr_shared_instance
+
+    def __init__(self):
+        self._sessions: Dict[HostKey, Tuple[asyncio.AbstractEventLoop, aiohttp.ClientSession]] = {}
+        # Sessions of other event loops, waiting for close() to run on their event loop.
+        self._replaced_sessions: List[Tuple[asyncio.AbstractEventLoop, aiohttp.ClientSession]] = []
+
+    @property
+    def sessions(self) -> Dict[HostKey, aiohttp.ClientSession]:
+        return {key: session for key, (_, session) in self._sessions.items()}
+
+    def session(self, url: Union[str, URL]) -> aiohttp.ClientSession:
+        """
+        The session of the URL's scheme, host and port, created on the first request to the host. Sessions are bound
+        to the event loop they were created on, a session of another event loop is replaced, see _retire().
+        """
+        url = URL(url)
+        key: HostKey = (url.scheme, url.host, url.port)
+        ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        session_loop, session = self._sessions.get(key, (None, None))
+        if session is None or session.closed or session_loop is not ev_loop:
+            if session is not None and session_loop is not ev_loop:
+                self._retire(session_loop, session)
+            connector: aiohttp.TCPConnector = aiohttp.TCPConnector(limit=self.CONNECTION_LIMIT_PER_HOST,
+                                                                   ttl_dns_cache=self.DNS_CACHE_TTL,
+                                                                   keepalive_timeout=self.KEEPALIVE_TIMEOUT)
+            session = aiohttp.ClientSession(connector=connector)
+            self._sessions[key] = (ev_loop, session)
+        return session
+
+    def request(self, method: str, url: Union[str, URL], **kwargs: Any) -> Any:
+        return self.session(url).request(method, url, **kwargs)
+
+    def get(self, url: Union[str, URL], **kwargs: Any) -> Any:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: Union[str, URL], **kwargs: Any) -> Any:
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: Union[str, URL], **kwargs: Any) -> Any:
+        return self.request("PUT", url, **kwargs)
+
+    def delete(self, url: Union[str, URL], **kwargs: Any) -> Any:
+        return self.request("DELETE", url, **kwargs)
+
+    async def __aenter__(self) -> "HTTPSessionRegistry":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        pass
+
+    def _retire(self, session_loop: asyncio.AbstractEventLoop, session: aiohttp.ClientSession):
+        """
+        A session can only be closed on its own event loop: right away if that loop is running in another thread,
+        otherwise by the next close() on it.
+        """
+        if session.closed or session_loop.is_closed():
+            return
+        if session_loop.is_running():
+            asyncio.run_coroutine_threadsafe(session.close(), session_loop)
+        else:
+            self._replaced_sessions.append((session_loop, session))
+
+    async def close(self):
+        """
+        Closes the sessions of the current event loop. The sessions of other event loops are retired, see _retire().
+        """
+        sessions = list(self._sessions.values()) + self._replaced_sessions
+        self._sessions.clear()
+        self._replaced_sessions = []
+        ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        for session_loop, session in sessions:
+            if session_loop is not ev_loop:
+                self._retire(session_loop, session)
+                continue
+            if session.closed:
+                continue
+            try:
+                await session.close()
+            except Exception:
+                self.logger().error("Error closing HTTP session.", exc_info=True)
+
+
+def shared_client() -> HTTPSessionRegistry:
+    return HTTPSessionRegistry.get_instance()
@@ -1,4 +1,3 @@
-import aiohttp
 import asyncio
 import logging
 from typing import (
@@ -8,6 +7,7 @@ from typing import (
 from hummingbot.data_feed.data_feed_base import DataFeedBase
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.http_session_registry import HTTPSessionRegistry
 
 
 class CoinGeckoDataFeed(DataFeedBase):
@@ -65,7 +65,7 @@ class CoinGeckoDataFeed(DataFeedBase):
 
     async def update_asset_prices(self):
         try:
-            client: aiohttp.ClientSession = await self._http_client()
+            client: HTTPSessionRegistry = await self._http_client()
             price_url: str = f"{self.BASE_URL}/coins/markets"
             price_dict: Dict[str, float] = {}
 
@@ -1,10 +1,13 @@
 import asyncio
-import aiohttp
 import logging
 from typing import Optional
 from hummingbot.core.network_base import NetworkBase, NetworkStatus
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.http_session_registry import (
+    HTTPSessionRegistry,
+    shared_client,
+)
 from decimal import Decimal
 
 
@@ -20,7 +23,7 @@ class CustomAPIDataFeed(NetworkBase):
     def __init__(self, api_url, update_interval: float = 5.0):
         super().__init__()
         self._ready_event = asyncio.Event()
-        self._shared_client: Optional[aiohttp.ClientSession] = None
+        self._shared_client: Optional[HTTPSessionRegistry] = None
         self._api_url = api_url
         self._check_network_interval = 30.0
         self._ev_loop = asyncio.get_event_loop()
@@ -36,9 +39,9 @@ class CustomAPIDataFeed(NetworkBase):
     def health_check_endpoint(self):
         return self._api_url
 
-    def _http_client(self) -> aiohttp.ClientSession:
+    def _http_client(self) -> HTTPSessionRegistry:
         if self._shared_client is None:
-            self._shared_client = aiohttp.ClientSession()
+            self._shared_client = shared_client()
         return self._shared_client
 
     async def check_network(self) -> NetworkStatus:
@@ -1,4 +1,3 @@
-import aiohttp
 import logging
 import asyncio
 from typing import (
@@ -8,6 +7,10 @@ from typing import (
 
 from hummingbot.core.network_base import NetworkBase, NetworkStatus
 from hummingbot.logger import HummingbotLogger
+from hummingbot.core.utils.http_session_registry import (
+    HTTPSessionRegistry,
+    shared_client,
+)
 
 
 class DataFeedBase(NetworkBase):
@@ -22,7 +25,7 @@ class DataFeedBase(NetworkBase):
     def __init__(self):
         super().__init__()
         self._ready_event = asyncio.Event()
-        self._shared_client: Optional[aiohttp.ClientSession] = None
+        self._shared_client: Optional[HTTPSessionRegistry] = None
 
     @property
     def name(self):
@@ -39,9 +42,9 @@ class DataFeedBase(NetworkBase):
     def get_price(self, asset: str) -> float:
         raise NotImplementedError
 
-    async def _http_client(self) -> aiohttp.ClientSession:
+    async def _http_client(self) -> HTTPSessionRegistry:
         if self._shared_client is None:
-            self._shared_client = aiohttp.ClientSession()
+            self._shared_client = shared_client()
         return self._shared_client
 
     async def get_ready(self):
@@ -62,7 +65,7 @@ class DataFeedBase(NetworkBase):
 
     async def check_network(self) -> NetworkStatus:
         try:
-            async with aiohttp.ClientSession() as session:
+            async with shared_client() as session:
                 async with session.get(self.health_check_endpoint) as resp:
                     status_text = await resp.text()
                     if resp.status != 200:
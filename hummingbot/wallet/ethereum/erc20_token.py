@@ -20,7 +20,10 @@ from hummingbot.client.config.global_config_map import global_config_map
 from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler
 from hummingbot.core.utils.async_utils import safe_gather
 from hummingbot.logger import HummingbotLogger
-from hummingbot.wallet.ethereum.ethereum_chain import EthereumChain
+from hummingbot.wallet.ethereum.ethereum_chain import (
+    ETHEREUM_RPC_LANE,
+    EthereumChain,
+)
 
 
 with open(os.path.join(os.path.dirname(__file__), 'token_abi/erc20_abi.json')) as erc20_abi:
@@ -136,7 +139,7 @@ class ERC20Token:
             return
 
         tasks: List[Coroutine] = [
-            AsyncCallScheduler.shared_instance().call_async(func, *args)
+            AsyncCallScheduler.shared_instance().call_async(func, *args, lane=ETHEREUM_RPC_LANE)
             for func, args in [
                 (self.get_name_from_contract, [self._contract]),
                 (self.get_symbol_from_contract, [self._contract]),
@@ -1,5 +1,8 @@
 from enum import Enum
 
+# The AsyncCallScheduler lane of Ethereum RPC calls.
+ETHEREUM_RPC_LANE = "ethereum_rpc"
+
 
 class EthereumChain(Enum):
     MAIN_NET = 1
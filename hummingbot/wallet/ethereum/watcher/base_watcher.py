@@ -9,6 +9,7 @@ from web3 import Web3
 
 from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler
 from hummingbot.core.pubsub import PubSub
+from hummingbot.wallet.ethereum.ethereum_chain import ETHEREUM_RPC_LANE
 
 
 class BaseWatcher(PubSub):
@@ -19,10 +20,12 @@ class BaseWatcher(PubSub):
 
     @staticmethod
     async def schedule_async_call(coro: Coroutine, timeout_seconds: float, **kwargs) -> any:
+        kwargs.setdefault("lane", ETHEREUM_RPC_LANE)
         return await AsyncCallScheduler.shared_instance().schedule_async_call(coro, timeout_seconds, **kwargs)
 
     @staticmethod
     async def call_async(func: Callable, *args, **kwargs):
+        kwargs.setdefault("lane", ETHEREUM_RPC_LANE)
         return await AsyncCallScheduler.shared_instance().call_async(func, *args, **kwargs)
 
     async def start_network(self):
@@ -32,6 +32,7 @@ from hummingbot.core.event.events import (
 )
 from hummingbot.core.event.event_forwarder import EventForwarder
 from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler
+from hummingbot.wallet.ethereum.ethereum_chain import ETHEREUM_RPC_LANE
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from .base_watcher import BaseWatcher
 # from .new_blocks_watcher import NewBlocksWatcher
@@ -159,7 +160,8 @@ class ZeroExFillWatcher(BaseWatcher):
                     )
                     break
                 logs = await async_scheduler.call_async(
-                    functools.partial(self._w3.eth.getLogs, event_filter_params)
+                    functools.partial(self._w3.eth.getLogs, event_filter_params),
+                    lane=ETHEREUM_RPC_LANE
                 )
                 break
             except asyncio.CancelledError:
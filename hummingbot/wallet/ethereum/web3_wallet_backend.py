@@ -27,8 +27,14 @@ from web3.exceptions import (
     TransactionNotFound
 )
 
-from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler
-from hummingbot.wallet.ethereum.ethereum_chain import EthereumChain
+from hummingbot.core.utils.async_call_scheduler import (
+    AsyncCallPriority,
+    AsyncCallScheduler,
+)
+from hummingbot.wallet.ethereum.ethereum_chain import (
+    ETHEREUM_RPC_LANE,
+    EthereumChain,
+)
 from hummingbot.core.event.event_forwarder import EventForwarder
 from hummingbot.core.event.events import (
     WalletEvent,
@@ -67,6 +73,7 @@ s_decimal_0 = Decimal(0)
 class Web3WalletBackend(PubSub):
     DEFAULT_GAS_PRICE = 1e9  # 1 gwei = 1e9 wei
     TRANSACTION_RECEIPT_POLLING_TICK = 10.0
+    RPC_CALL_CONCURRENCY = 4
 
     _w3wb_logger: Optional[HummingbotLogger] = None
 
@@ -88,6 +95,8 @@ class Web3WalletBackend(PubSub):
         self._chain: EthereumChain = chain
         self._account: LocalAccount = Account.privateKeyToAccount(private_key)
         self._ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        AsyncCallScheduler.shared_instance().configure_lane(ETHEREUM_RPC_LANE,
+                                                            max_concurrency=self.RPC_CALL_CONCURRENCY)
 
         # Initialize ERC20 tokens data structures.
         self._erc20_token_list: List[ERC20Token] = [
@@ -229,7 +238,8 @@ class Web3WalletBackend(PubSub):
 
         # Fetch blockchain data.
         self._local_nonce = await async_scheduler.call_async(
-            lambda: self.get_remote_nonce()
+            lambda: self.get_remote_nonce(),
+            lane=ETHEREUM_RPC_LANE
         )
 
         # Create event watchers.
@@ -389,7 +399,8 @@ class Web3WalletBackend(PubSub):
         """
         async_scheduler: AsyncCallScheduler = AsyncCallScheduler.shared_instance()
         try:
-            return await async_scheduler.call_async(self._w3.eth.getTransactionReceipt, tx_hash)
+            return await async_scheduler.call_async(self._w3.eth.getTransactionReceipt, tx_hash,
+                                                    lane=ETHEREUM_RPC_LANE)
         except TransactionNotFound as e:
             now: float = time.time()
             if now - timestamp > 120:
@@ -408,7 +419,7 @@ class Web3WalletBackend(PubSub):
         transaction_receipts: List[AttributeDict] = [tr for tr in await safe_gather(*tasks)
                                                      if (tr is not None and tr.get("blockHash") is not None)]
         block_hash_set: Set[HexBytes] = set(tr.blockHash for tr in transaction_receipts)
-        fetch_block_tasks = [async_scheduler.call_async(self._w3.eth.getBlock, block_hash)
+        fetch_block_tasks = [async_scheduler.call_async(self._w3.eth.getBlock, block_hash, lane=ETHEREUM_RPC_LANE)
                              for block_hash in block_hash_set]
         blocks: Dict[HexBytes, AttributeDict] = dict((block.hash, block)
                                                      for block
@@ -448,7 +459,8 @@ class Web3WalletBackend(PubSub):
             signed_transaction: AttributeDict = await self._outgoing_transactions_queue.get()
             tx_hash: str = signed_transaction.hash.hex()
             try:
-                await async_scheduler.call_async(self._w3.eth.sendRawTransaction, signed_transaction.rawTransaction)
+                await async_scheduler.call_async(self._w3.eth.sendRawTransaction, signed_transaction.rawTransaction,
+                                                 lane=ETHEREUM_RPC_LANE, priority=AsyncCallPriority.HIGH)
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -635,7 +647,8 @@ class Web3WalletBackend(PubSub):
 
         # Get currently approved amounts
         get_approved_amounts_tasks: List[Coroutine] = [
-            async_scheduler.call_async(erc20_token.contract.functions.allowance(self.address, spender).call)
+            async_scheduler.call_async(erc20_token.contract.functions.allowance(self.address, spender).call,
+                                       lane=ETHEREUM_RPC_LANE)
             for erc20_token in self._erc20_token_list
         ]
         approved_amounts: List[int] = await safe_gather(*get_approved_amounts_tasks)
@@ -678,7 +691,8 @@ class Web3WalletBackend(PubSub):
 
     async def _update_gas_price(self):
         async_scheduler: AsyncCallScheduler = AsyncCallScheduler.shared_instance()
-        new_gas_price: int = await async_scheduler.call_async(getattr, self._w3.eth, "gasPrice")
+        new_gas_price: int = await async_scheduler.call_async(getattr, self._w3.eth, "gasPrice",
+                                                              lane=ETHEREUM_RPC_LANE)
         self._gas_price = new_gas_price
 
     def get_remote_nonce(self):
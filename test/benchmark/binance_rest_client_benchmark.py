@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+
+"""
+Compares the order round trips of the python-binance client, called in the executor like BinanceExchange.query_api()
+used to, against BinanceRESTClient on the event loop, with a local mock Binance server running in a separate
+process. Reports the sequential round trip latency and the wall and CPU time of concurrent bursts of orders.
+
+    python test/benchmark/binance_rest_client_benchmark.py --requests 500 --concurrency 10 --server-delay-ms 0,20
+"""
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
+
+from aiohttp import web
+import argparse
+import asyncio
+from binance.client import Client as BinanceClient
+import multiprocessing
+import statistics
+import time
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+)
+from unittest.mock import patch
+
+import hummingbot
+from hummingbot.connector.exchange.binance.binance_rest_client import BinanceRESTClient
+from hummingbot.core.utils.http_session_registry import HTTPSessionRegistry
+
+API_KEY = "benchmark-api-key"
+API_SECRET = "benchmark-api-secret"
+
+
+def run_mock_server(port_queue: multiprocessing.Queue, delay: float):
+    async def handle_order(request: web.Request) -> web.Response:
+        if delay > 0:
+            await asyncio.sleep(delay)
+        params: Dict[str, str] = dict(request.query)
+        if request.method == "POST" and len(params) == 0:
+            params = dict(await request.post())
+        return web.json_response({"symbol": params.get("symbol"), "orderId": 1,
+                                  "clientOrderId": params.get("newClientOrderId"), "status": "NEW"})
+
+    async def start():
+        app: web.Application = web.Application()
+        app.router.add_route("*", "/api/v3/order", handle_order)
+        runner: web.AppRunner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        site: web.TCPSite = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port_queue.put(site._server.sockets[0].getsockname()[1])
+
+    ev_loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+    asyncio.set_event_loop(ev_loop)
+    ev_loop.run_until_complete(start())
+    ev_loop.run_forever()
+
+
+def order_params(i: int) -> Dict[str, Any]:
+    return {"symbol": "ETHUSDT", "side": "BUY", "type": "LIMIT", "timeInForce": "GTC", "quantity": "0.5",
+            "price": "100.25", "newClientOrderId": f"x-benchmark-{i}"}
+
+
+async def measure(create_order: Callable[[int], Awaitable[Any]], args: argparse.Namespace) -> Dict[str, float]:
+    # Warm up the connections.
+    await asyncio.gather(*[create_order(i) for i in range(args.concurrency)])
+
+    latencies: List[float] = []
+    for i in range(args.requests):
+        start_time: float = time.perf_counter()
+        await create_order(i)
+        latencies.append(time.perf_counter() - start_time)
+    latencies.sort()
+
+    start_time: float = time.perf_counter()
+    start_cpu: float = time.process_time()
+    for position in range(0, args.requests, args.concurrency):
+        burst_end: int = min(position + args.concurrency, args.requests)
+        await asyncio.gather(*[create_order(i) for i in range(position, burst_end)])
+    elapsed: float = time.perf_counter() - start_time
+    cpu: float = time.process_time() - start_cpu
+    return {
+        "p50_ms": statistics.median(latencies) * 1e3,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1e3,
+        "burst_requests_per_sec": args.requests / elapsed,
+        "cpu_us_per_request": cpu / args.requests * 1e6,
+    }
+
+
+async def run_executor_client(port: int, args: argparse.Namespace) -> Dict[str, float]:
+    # The python-binance client pings the live API on construction.
+    with patch.object(BinanceClient, "ping"):
+        client: BinanceClient = BinanceClient(API_KEY, API_SECRET)
+    client.API_URL = f"http://127.0.0.1:{port}/api"
+    ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+
+    async def create_order(i: int) -> Any:
+        return await ev_loop.run_in_executor(hummingbot.get_executor(), lambda: client.create_order(**order_params(i)))
+
+    return await measure(create_order, args)
+
+
+async def run_rest_client(port: int, args: argparse.Namespace) -> Dict[str, float]:
+    client: BinanceRESTClient = BinanceRESTClient(API_KEY, API_SECRET, time_func=time.time)
+    client.API_URL = f"http://127.0.0.1:{port}/api"
+    try:
+        return await measure(lambda i: client.create_order(**order_params(i)), args)
+    finally:
+        await HTTPSessionRegistry.get_instance().close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Binance REST client latency benchmark.")
+    parser.add_argument("--requests", type=int, default=500, help="Orders per measurement.")
+    parser.add_argument("--concurrency", type=int, default=10, help="Orders in flight per burst.")
+    parser.add_argument("--server-delay-ms", default="0,20", help="Comma separated mock server response delays.")
+    args = parser.parse_args()
+
+    print(f"{'delay ms':>9}{'client':>10}{'p50 ms':>9}{'p99 ms':>9}{'burst req/s':>13}{'cpu us/req':>12}")
+    for delay_ms in [float(value) for value in args.server_delay_ms.split(",")]:
+        port_queue: multiprocessing.Queue = multiprocessing.Queue()
+        server: multiprocessing.Process = multiprocessing.Process(target=run_mock_server,
+                                                                  args=(port_queue, delay_ms / 1e3),
+                                                                  daemon=True)
+        server.start()
+        try:
+            port: int = port_queue.get(timeout=10)
+            for name, run in (("executor", run_executor_client), ("aiohttp", run_rest_client)):
+                result: Dict[str, float] = asyncio.get_event_loop().run_until_complete(run(port, args))
+                print(f"{delay_ms:>9.0f}{name:>10}{result['p50_ms']:>9.2f}{result['p99_ms']:>9.2f}"
+                      f"{result['burst_requests_per_sec']:>13,.0f}{result['cpu_us_per_request']:>12.1f}")
+        finally:
+            server.terminate()
+            server.join()
+
+
+if __name__ == "__main__":
+    main()
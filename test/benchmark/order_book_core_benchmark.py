@@ -0,0 +1,350 @@
+#!/usr/bin/env python
+
+"""
+Offline micro-benchmark suite of the order book core: applying diffs and snapshots, restoring from a snapshot and
+diffs, the depth queries, overlap truncation, message parsing and the active order tracker conversions.
+
+Every case runs for each book depth (and diff size, where it applies), on exchange style string payloads like the
+ones recorded by OrderBookRecorder, or on an actual recording with --recording. Results are reported as ops/s and
+Python allocations per op, as a table or as machine readable JSON / CSV so runs can be compared:
+
+    python test/benchmark/order_book_core_benchmark.py --depths 50,1000,5000 --format json --output before.json
+
+Allocations are measured in a separate, shorter pass under tracemalloc: alloc_peak_bytes is the peak of Python heap
+memory allocated within a single op, retained_blocks the number of Python memory blocks still held after the op.
+Allocations of the C++ containers are not included.
+"""
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
+
+import argparse
+import csv
+from decimal import Decimal
+import gc
+import json
+import platform
+import random
+import time
+import tracemalloc
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+)
+
+from hummingbot.connector.exchange.loopring.loopring_active_order_tracker import LoopringActiveOrderTracker
+from hummingbot.connector.exchange.loopring.loopring_order_book_message import LoopringOrderBookMessage
+from hummingbot.core.data_type.common import OrderBookEngine
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_entries import OrderBookEntries
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType,
+)
+from hummingbot.core.data_type.order_book_recording import OrderBookRecordingReader
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+MID_PRICE = 1000.0
+TICK_SIZE = 0.01
+LOOPRING_DECIMALS = 18
+NUM_QUERY_VOLUMES = 64
+
+# An op is called with its sequence number.
+Op = Callable[[int], Any]
+
+
+class LoopringTokenConfiguration:
+    """
+    Offline replacement of LoopringAPITokenConfigurationDataSource, with the same unpadding rule.
+    """
+    def get_tokenid(self, symbol: str) -> int:
+        return 0
+
+    def unpad(self, volume: str, tokenid: int) -> Decimal:
+        return Decimal(volume) * Decimal(f"1e-{LOOPRING_DECIMALS}")
+
+
+def price_at(level: int, is_bid: bool) -> str:
+    return f"{MID_PRICE - (level + 1) * TICK_SIZE if is_bid else MID_PRICE + (level + 1) * TICK_SIZE:.2f}"
+
+
+def snapshot_payload(depth: int, update_id: int = 1) -> Dict[str, Any]:
+    return {
+        "trading_pair": "ETH-USDT",
+        "update_id": update_id,
+        "bids": [[price_at(level, True), f"{1.0 + level % 7:.8f}"] for level in range(depth)],
+        "asks": [[price_at(level, False), f"{1.0 + level % 5:.8f}"] for level in range(depth)],
+    }
+
+
+def diff_payloads(num_diffs: int, depth: int, rows_per_diff: int, seed: int) -> List[Dict[str, Any]]:
+    """
+    Most changes land close to the top of the book, about a third of them are deletions.
+    """
+    rng = random.Random(seed)
+    payloads = []
+    for update_id in range(2, num_diffs + 2):
+        rows: Dict[bool, List[List[str]]] = {True: [], False: []}
+        for _ in range(rows_per_diff):
+            is_bid: bool = rng.random() < 0.5
+            level: int = min(int(rng.expovariate(1 / 10.0)), depth - 1)
+            amount: float = 0.0 if rng.random() < 0.33 else rng.uniform(0.1, 10)
+            rows[is_bid].append([price_at(level, is_bid), f"{amount:.8f}"])
+        payloads.append({"trading_pair": "ETH-USDT", "first_update_id": update_id, "update_id": update_id,
+                         "bids": rows[True], "asks": rows[False]})
+    return payloads
+
+
+def loopring_payloads(payloads: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def loopring_row(row: List[str]) -> List[str]:
+        amount: str = str(int(float(row[1]) * 10 ** 8) * 10 ** (LOOPRING_DECIMALS - 8))
+        return [row[0], amount, amount, "1"]
+
+    return [{"topic": {"market": "LRC-ETH"}, "startVersion": payload["update_id"], "endVersion": payload["update_id"],
+             "data": {"bids": [loopring_row(row) for row in payload["bids"]],
+                      "asks": [loopring_row(row) for row in payload["asks"]]}}
+            for payload in payloads]
+
+
+def recorded_payloads(directory: str, trading_pair: str, limit: int) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """
+    The first snapshot of a recording, and up to `limit` diffs after it.
+    """
+    reader: OrderBookRecordingReader = OrderBookRecordingReader(directory, trading_pair)
+    messages: Iterator[OrderBookMessage] = reader.iter_messages(reader.find_snapshot_offset(0))
+    snapshot: Dict[str, Any] = next(messages).content
+    diffs: List[Dict[str, Any]] = []
+    for message in messages:
+        if message.type is OrderBookMessageType.DIFF:
+            diffs.append(message.content)
+            if len(diffs) >= limit:
+                break
+    return snapshot, diffs
+
+
+def diff_messages(payloads: List[Dict[str, Any]]) -> List[OrderBookMessage]:
+    return [OrderBookMessage(OrderBookMessageType.DIFF, payload, timestamp=1.0) for payload in payloads]
+
+
+def new_book(engine: OrderBookEngine, snapshot: OrderBookMessage, dex: bool = False) -> OrderBook:
+    order_book: OrderBook = OrderBook(dex=dex, engine=engine)
+    order_book.apply_snapshot_entries(snapshot.entries)
+    return order_book
+
+
+def book_cases(engine: OrderBookEngine,
+               snapshot: OrderBookMessage,
+               diffs: List[OrderBookMessage]) -> Dict[str, Tuple[Op, int]]:
+    """
+    Order book cases, as name: (op, number of distinct inputs).
+    """
+    row_diffs = [(message.bids, message.asks, message.update_id) for message in diffs]
+    snapshot_rows = (snapshot.bids, snapshot.asks)
+    for message in diffs:
+        message.entries
+    rows_book: OrderBook = new_book(engine, snapshot)
+    entries_book: OrderBook = new_book(engine, snapshot)
+    query_book: OrderBook = new_book(engine, snapshot)
+    restore_book: OrderBook = OrderBook(engine=engine)
+    best_volume: float = float(snapshot.bids[0].amount)
+    volumes: List[float] = [best_volume * (1 + i) for i in range(NUM_QUERY_VOLUMES)]
+    best_bid: float = float(snapshot.bids[0].price)
+    restore_diffs: List[OrderBookMessage] = diffs[:100]
+
+    def apply_diffs(i: int):
+        bids, asks, update_id = row_diffs[i % len(row_diffs)]
+        rows_book.apply_diffs(bids, asks, update_id)
+
+    def apply_diff_then_query(i: int):
+        entries_book.apply_diff_entries(diffs[i % len(diffs)].entries)
+        entries_book.get_vwap_for_volume(True, volumes[i % NUM_QUERY_VOLUMES])
+
+    cases: Dict[str, Tuple[Op, int]] = {
+        "apply_snapshot": (lambda i: rows_book.apply_snapshot(snapshot_rows[0], snapshot_rows[1], 1), 1),
+        "apply_snapshot_entries": (lambda i: entries_book.apply_snapshot_entries(snapshot.entries), 1),
+        "apply_diffs": (apply_diffs, len(diffs)),
+        "apply_diff_entries": (lambda i: entries_book.apply_diff_entries(diffs[i % len(diffs)].entries), len(diffs)),
+        "restore_from_snapshot_and_diffs": (
+            lambda i: restore_book.restore_from_snapshot_and_diffs(snapshot, restore_diffs), 1),
+        "get_price_for_volume": (lambda i: query_book.get_price_for_volume(i & 1, volumes[i % NUM_QUERY_VOLUMES]),
+                                 NUM_QUERY_VOLUMES),
+        "get_vwap_for_volume": (lambda i: query_book.get_vwap_for_volume(i & 1, volumes[i % NUM_QUERY_VOLUMES]),
+                                NUM_QUERY_VOLUMES),
+        "get_volume_for_price": (lambda i: query_book.get_volume_for_price(i & 1, best_bid + (i % 100 - 50) * 0.1),
+                                 100),
+        "apply_diff_then_query": (apply_diff_then_query, len(diffs)),
+    }
+
+    for dex in (False, True):
+        crossing_book: OrderBook = new_book(engine, snapshot, dex)
+        best_ask = crossing_book.get_price(True)
+
+        def cross_and_restore(i: int, crossing_book=crossing_book, best_ask=best_ask):
+            # A bid through the best ask truncates the asks, the next diff puts the book back.
+            update_id: int = 2 * i + 2
+            crossing_book.apply_diffs([OrderBookRow(best_ask, 1.0, update_id)], [], update_id)
+            crossing_book.apply_diffs([OrderBookRow(best_ask, 0.0, update_id + 1)],
+                                      [OrderBookRow(best_ask, 1.0, update_id + 1)],
+                                      update_id + 1)
+
+        cases["truncate_overlap_dex" if dex else "truncate_overlap_cex"] = (cross_and_restore, 1)
+    return cases
+
+
+def parse_cases(snapshot_content: Dict[str, Any], payloads: List[Dict[str, Any]]) -> Dict[str, Tuple[Op, int]]:
+    tracker: LoopringActiveOrderTracker = LoopringActiveOrderTracker(LoopringTokenConfiguration())
+    loopring_messages: List[LoopringOrderBookMessage] = [
+        LoopringOrderBookMessage(OrderBookMessageType.DIFF, payload, timestamp=1.0)
+        for payload in loopring_payloads(payloads)
+    ]
+
+    def message_rows(i: int):
+        message: OrderBookMessage = OrderBookMessage(OrderBookMessageType.DIFF, payloads[i % len(payloads)], 1.0)
+        return message.bids, message.asks
+
+    def message_entries(i: int):
+        payload: Dict[str, Any] = payloads[i % len(payloads)]
+        return OrderBookEntries.from_exchange_rows(payload["bids"], payload["asks"], payload["update_id"])
+
+    return {
+        "parse_snapshot_rows": (
+            lambda i: OrderBookMessage(OrderBookMessageType.SNAPSHOT, snapshot_content, 1.0).bids, 1),
+        "parse_snapshot_entries": (
+            lambda i: OrderBookEntries.from_exchange_rows(snapshot_content["bids"], snapshot_content["asks"], 1), 1),
+        "parse_diff_rows": (message_rows, len(payloads)),
+        "parse_diff_entries": (message_entries, len(payloads)),
+        "loopring_diff_to_rows": (
+            lambda i: tracker.convert_diff_message_to_order_book_row(loopring_messages[i % len(payloads)]),
+            len(payloads)),
+        "loopring_diff_to_entries": (
+            lambda i: tracker.convert_diff_message_to_entries(loopring_messages[i % len(payloads)]), len(payloads)),
+    }
+
+
+def measure(op: Op, num_inputs: int, min_seconds: float, alloc_ops: int) -> Dict[str, float]:
+    # Ops run in batches covering all the distinct inputs, until the minimum run time is reached.
+    batch_size: int = max(num_inputs, 10)
+    # Warm up, e.g. the depth index of the query cases.
+    for i in range(10):
+        op(i)
+
+    gc.collect()
+    gc.disable()
+    try:
+        blocks_before: int = sys.getallocatedblocks()
+        num_ops: int = 0
+        start: float = time.perf_counter()
+        while True:
+            for i in range(num_ops, num_ops + batch_size):
+                op(i)
+            num_ops += batch_size
+            elapsed: float = time.perf_counter() - start
+            if elapsed >= min_seconds:
+                break
+        retained_blocks: int = sys.getallocatedblocks() - blocks_before
+    finally:
+        gc.enable()
+
+    peak_bytes: int = 0
+    for i in range(alloc_ops):
+        # Restarting tracemalloc resets its peak, so every op is measured on its own.
+        tracemalloc.start()
+        op(i)
+        peak_bytes += tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return {
+        "ops": num_ops,
+        "seconds": elapsed,
+        "ops_per_sec": num_ops / elapsed,
+        "alloc_peak_bytes_per_op": peak_bytes / alloc_ops if alloc_ops > 0 else float("nan"),
+        "retained_blocks_per_op": retained_blocks / num_ops,
+    }
+
+
+def parse_int_list(value: str) -> List[int]:
+    return [int(item) for item in value.split(",") if item]
+
+
+def print_table(results: List[Dict[str, Any]], output: TextIO):
+    print(f"{'case':<34}{'engine':<7}{'depth':>7}{'rows':>6}{'ops/s':>14}{'alloc B/op':>12}{'blocks/op':>11}", file=output)
+    for result in results:
+        print(f"{result['case']:<34}{result['engine'] or '-':<7}{result['depth']:>7}"
+              f"{result['rows_per_diff'] or '-':>6}{result['ops_per_sec']:>14,.0f}"
+              f"{result['alloc_peak_bytes_per_op']:>12,.0f}{result['retained_blocks_per_op']:>11.2f}", file=output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Order book core micro-benchmark suite.")
+    parser.add_argument("--depths", type=parse_int_list, default=[50, 1000, 5000],
+                        help="Comma separated levels per side of the synthetic books.")
+    parser.add_argument("--rows-per-diff", type=parse_int_list, default=[2, 10, 50],
+                        help="Comma separated price levels changed per diff message.")
+    parser.add_argument("--diffs", type=int, default=2000, help="Distinct diff messages per diff size.")
+    parser.add_argument("--engines", default="set,flat", help="Comma separated order book engines.")
+    parser.add_argument("--cases", default="", help="Comma separated case names to run, all by default.")
+    parser.add_argument("--min-seconds", type=float, default=0.5, help="Minimum run time per case.")
+    parser.add_argument("--alloc-ops", type=int, default=100, help="Ops measured in the allocation pass.")
+    parser.add_argument("--recording", help="Directory of an OrderBookRecorder recording to use instead of "
+                                            "synthetic payloads.")
+    parser.add_argument("--trading-pair", help="Trading pair of the recording.")
+    parser.add_argument("--format", choices=["table", "json", "csv"], default="table")
+    parser.add_argument("--output", help="Write the results to this file instead of stdout.")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    engines: List[OrderBookEngine] = [OrderBookEngine[name.upper()] for name in args.engines.split(",")]
+    selected_cases: List[str] = [name for name in args.cases.split(",") if name]
+    results: List[Dict[str, Any]] = []
+
+    def run_cases(cases: Dict[str, Tuple[Op, int]], engine: Optional[OrderBookEngine], depth: int,
+                  rows_per_diff: Optional[int]):
+        for name, (op, num_inputs) in cases.items():
+            if selected_cases and name not in selected_cases:
+                continue
+            result: Dict[str, Any] = {"case": name, "engine": engine.name.lower() if engine else None,
+                                      "depth": depth, "rows_per_diff": rows_per_diff}
+            result.update(measure(op, num_inputs, args.min_seconds, args.alloc_ops))
+            results.append(result)
+            print(f"{name} engine={result['engine']} depth={depth} rows_per_diff={rows_per_diff}: "
+                  f"{result['ops_per_sec']:,.0f} ops/s", file=sys.stderr)
+
+    if args.recording is not None:
+        snapshot_content, payloads = recorded_payloads(args.recording, args.trading_pair, args.diffs)
+        workloads = [(len(snapshot_content["bids"]), None, snapshot_content, payloads)]
+    else:
+        workloads = [(depth, rows_per_diff, snapshot_payload(depth),
+                      diff_payloads(args.diffs, depth, rows_per_diff, args.seed))
+                     for depth in args.depths for rows_per_diff in args.rows_per_diff]
+
+    for depth, rows_per_diff, snapshot_content, payloads in workloads:
+        snapshot: OrderBookMessage = OrderBookMessage(OrderBookMessageType.SNAPSHOT, snapshot_content, 1.0)
+        for engine in engines:
+            run_cases(book_cases(engine, snapshot, diff_messages(payloads)), engine, depth, rows_per_diff)
+        run_cases(parse_cases(snapshot_content, payloads), None, depth, rows_per_diff)
+
+    output: TextIO = open(args.output, "w") if args.output is not None else sys.stdout
+    try:
+        if args.format == "json":
+            json.dump({"python": platform.python_version(), "machine": platform.machine(), "results": results},
+                      output, indent=2)
+            output.write("\n")
+        elif args.format == "csv":
+            writer = csv.DictWriter(output, fieldnames=list(results[0].keys()) if results else ["case"])
+            writer.writeheader()
+            writer.writerows(results)
+        else:
+            print_table(results, output)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+
+"""
+Compares the std::set based order book engine against the flat array engine.
+
+    python test/benchmark/order_book_engine_benchmark.py --depth 1000 --diffs 20000
+"""
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
+
+import argparse
+import random
+import time
+from typing import (
+    List,
+    Tuple,
+)
+
+from hummingbot.core.data_type.common import OrderBookEngine
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+TICK_SIZE = 0.01
+
+
+def make_snapshot(depth: int, mid_price: float) -> Tuple[List[OrderBookRow], List[OrderBookRow]]:
+    bids = [OrderBookRow(round(mid_price - (i + 1) * TICK_SIZE, 2), 1.0 + i % 7, 1) for i in range(depth)]
+    asks = [OrderBookRow(round(mid_price + (i + 1) * TICK_SIZE, 2), 1.0 + i % 5, 1) for i in range(depth)]
+    return bids, asks
+
+
+def make_diffs(num_diffs: int,
+               depth: int,
+               mid_price: float,
+               rows_per_diff: int,
+               seed: int) -> List[Tuple[List[OrderBookRow], List[OrderBookRow], int]]:
+    """
+    Synthetic diff stream. Most changes land close to the top of the book, about a third of them are deletions.
+    """
+    rng = random.Random(seed)
+    diffs = []
+    for update_id in range(2, num_diffs + 2):
+        bids = []
+        asks = []
+        for _ in range(rows_per_diff):
+            level = min(int(rng.expovariate(1 / 10.0)), depth - 1)
+            amount = 0.0 if rng.random() < 0.33 else rng.uniform(0.1, 10)
+            if rng.random() < 0.5:
+                bids.append(OrderBookRow(round(mid_price - (level + 1) * TICK_SIZE, 2), amount, update_id))
+            else:
+                asks.append(OrderBookRow(round(mid_price + (level + 1) * TICK_SIZE, 2), amount, update_id))
+        diffs.append((bids, asks, update_id))
+    return diffs
+
+
+def bench_apply_diffs(engine: OrderBookEngine, snapshot, diffs) -> float:
+    order_book = OrderBook(engine=engine)
+    order_book.apply_snapshot(snapshot[0], snapshot[1], 1)
+    start = time.perf_counter()
+    for bids, asks, update_id in diffs:
+        order_book.apply_diffs(bids, asks, update_id)
+    return len(diffs) / (time.perf_counter() - start)
+
+
+def bench_apply_snapshot(engine: OrderBookEngine, snapshot, iterations: int) -> float:
+    order_book = OrderBook(engine=engine)
+    start = time.perf_counter()
+    for update_id in range(iterations):
+        order_book.apply_snapshot(snapshot[0], snapshot[1], update_id)
+    return iterations / (time.perf_counter() - start)
+
+
+def bench_top_of_book(engine: OrderBookEngine, snapshot, iterations: int) -> float:
+    order_book = OrderBook(engine=engine)
+    order_book.apply_snapshot(snapshot[0], snapshot[1], 1)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        next(order_book.bid_entries())
+        next(order_book.ask_entries())
+        order_book.get_price(True)
+        order_book.get_price(False)
+    return iterations / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Order book engine micro-benchmark.")
+    parser.add_argument("--depth", type=int, default=1000, help="Levels per side in the initial snapshot.")
+    parser.add_argument("--diffs", type=int, default=20000, help="Number of diff messages to apply.")
+    parser.add_argument("--rows-per-diff", type=int, default=10, help="Price levels changed per diff message.")
+    parser.add_argument("--iterations", type=int, default=100000, help="Iterations of the top of book benchmark.")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    mid_price = 100.0
+    snapshot = make_snapshot(args.depth, mid_price)
+    diffs = make_diffs(args.diffs, args.depth, mid_price, args.rows_per_diff, args.seed)
+    snapshot_iterations = max(10, 1000000 // max(args.depth, 1) // 10)
+
+    print(f"depth={args.depth} diffs={args.diffs} rows_per_diff={args.rows_per_diff}")
+    print(f"{'engine':<8}{'diffs/s':>16}{'snapshots/s':>16}{'top of book/s':>16}")
+    for engine in OrderBookEngine:
+        print(f"{engine.name:<8}"
+              f"{bench_apply_diffs(engine, snapshot, diffs):>16,.0f}"
+              f"{bench_apply_snapshot(engine, snapshot, snapshot_iterations):>16,.0f}"
+              f"{bench_top_of_book(engine, snapshot, args.iterations):>16,.0f}")
+
+
+if __name__ == "__main__":
+    main()
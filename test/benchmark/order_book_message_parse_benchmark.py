@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+
+"""
+Compares applying order book messages through OrderBookRow lists against decoding them once into C++ entry
+vectors (OrderBookMessage.entries / OrderBook.apply_diff_entries), on Binance and Loopring style depth payloads.
+
+    python test/benchmark/order_book_message_parse_benchmark.py --diffs 20000
+"""
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
+
+import argparse
+from decimal import Decimal
+import random
+import time
+from typing import (
+    Any,
+    Dict,
+    List,
+)
+
+from hummingbot.connector.exchange.loopring.loopring_active_order_tracker import LoopringActiveOrderTracker
+from hummingbot.connector.exchange.loopring.loopring_order_book_message import LoopringOrderBookMessage
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType,
+)
+
+LOOPRING_DECIMALS = 18
+
+
+class LoopringTokenConfiguration:
+    """
+    Offline replacement of LoopringAPITokenConfigurationDataSource, with the same unpadding rule.
+    """
+    def get_tokenid(self, symbol: str) -> int:
+        return 0
+
+    def unpad(self, volume: str, tokenid: int) -> Decimal:
+        return Decimal(volume) * Decimal(f"1e-{LOOPRING_DECIMALS}")
+
+
+def binance_diff_payloads(num_diffs: int, rows_per_diff: int, seed: int) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    payloads = []
+    for update_id in range(2, num_diffs + 2):
+        payloads.append({
+            "trading_pair": "ETH-USDT",
+            "first_update_id": update_id,
+            "update_id": update_id,
+            "bids": [[f"{1000 - rng.randint(1, 200) * 0.01:.8f}", f"{rng.choice([0, rng.uniform(0.01, 50)]):.8f}"]
+                     for _ in range(rows_per_diff // 2)],
+            "asks": [[f"{1000 + rng.randint(1, 200) * 0.01:.8f}", f"{rng.choice([0, rng.uniform(0.01, 50)]):.8f}"]
+                     for _ in range(rows_per_diff // 2)],
+        })
+    return payloads
+
+
+def loopring_diff_payloads(num_diffs: int, rows_per_diff: int, seed: int) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+
+    def row(price: float) -> List[str]:
+        amount = rng.choice([0, rng.randint(1, 10 ** 6) * 10 ** (LOOPRING_DECIMALS - 4)])
+        return [f"{price:.2f}", str(amount), str(amount), "1"]
+
+    payloads = []
+    for version in range(2, num_diffs + 2):
+        payloads.append({
+            "topic": {"market": "LRC-ETH"},
+            "startVersion": version,
+            "endVersion": version,
+            "data": {
+                "bids": [row(1000 - rng.randint(1, 200) * 0.01) for _ in range(rows_per_diff // 2)],
+                "asks": [row(1000 + rng.randint(1, 200) * 0.01) for _ in range(rows_per_diff // 2)],
+            }
+        })
+    return payloads
+
+
+def run(label: str, apply_function, messages: List[OrderBookMessage]):
+    order_book = OrderBook()
+    start = time.perf_counter()
+    for message in messages:
+        apply_function(order_book, message)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<40}{len(messages) / elapsed:>16,.0f}")
+    return order_book
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Order book message parsing micro-benchmark.")
+    parser.add_argument("--diffs", type=int, default=20000, help="Number of diff messages per payload type.")
+    parser.add_argument("--rows-per-diff", type=int, default=20, help="Price levels per diff message.")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{'payload / path':<40}{'diffs/s':>16}")
+
+    def binance_messages() -> List[OrderBookMessage]:
+        return [OrderBookMessage(OrderBookMessageType.DIFF, payload, timestamp=1.0)
+                for payload in binance_diff_payloads(args.diffs, args.rows_per_diff, args.seed)]
+
+    rows_book = run("binance / OrderBookRow",
+                    lambda ob, msg: ob.apply_diffs(msg.bids, msg.asks, msg.update_id),
+                    binance_messages())
+    entries_book = run("binance / entries",
+                       lambda ob, msg: ob.apply_diff_entries(msg.entries),
+                       binance_messages())
+    assert list(rows_book.bid_entries()) == list(entries_book.bid_entries())
+
+    tracker = LoopringActiveOrderTracker(LoopringTokenConfiguration())
+    loopring_messages = [LoopringOrderBookMessage(OrderBookMessageType.DIFF, payload, timestamp=1.0)
+                         for payload in loopring_diff_payloads(args.diffs, args.rows_per_diff, args.seed)]
+
+    def apply_loopring_rows(order_book: OrderBook, message: LoopringOrderBookMessage):
+        bids, asks = tracker.convert_diff_message_to_order_book_row(message)
+        order_book.apply_diffs(bids, asks, message.content["startVersion"])
+
+    run("loopring / ClientOrderBookRow", apply_loopring_rows, loopring_messages)
+    run("loopring / entries",
+        lambda ob, msg: ob.apply_diff_entries(tracker.convert_diff_message_to_entries(msg)),
+        loopring_messages)
+
+
+if __name__ == "__main__":
+    main()
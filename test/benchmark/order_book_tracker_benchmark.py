@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+
+"""
+Compares the queue and task per trading pair OrderBookTracker against DIRECT_DIFF_ROUTING, where the diff router
+applies the diffs itself, on an in-memory data source that emits websocket style bursts of diffs over many pairs.
+
+    python test/benchmark/order_book_tracker_benchmark.py --pairs 50,300,1000 --diffs-per-pair 200
+"""
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
+
+import argparse
+import asyncio
+import random
+import time
+from typing import (
+    Any,
+    Dict,
+    List,
+)
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType,
+)
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+
+DEPTH = 100
+MID_PRICE = 100.0
+
+
+def price_at(level: int, is_bid: bool) -> str:
+    return f"{MID_PRICE - (level + 1) * 0.01 if is_bid else MID_PRICE + (level + 1) * 0.01:.2f}"
+
+
+class InMemoryDataSource(OrderBookTrackerDataSource):
+    def __init__(self, trading_pairs: List[str], diffs_per_pair: int, burst_size: int, rows_per_diff: int,
+                 seed: int):
+        super().__init__(trading_pairs)
+        self.start_event: asyncio.Event = asyncio.Event()
+        self.emitted_all: asyncio.Event = asyncio.Event()
+        rng = random.Random(seed)
+        self._messages: List[OrderBookMessage] = []
+        update_ids: Dict[str, int] = {trading_pair: 1 for trading_pair in trading_pairs}
+        for _ in range(diffs_per_pair * len(trading_pairs)):
+            trading_pair: str = rng.choice(trading_pairs)
+            update_ids[trading_pair] += 1
+            self._messages.append(OrderBookMessage(OrderBookMessageType.DIFF, {
+                "trading_pair": trading_pair,
+                "first_update_id": update_ids[trading_pair],
+                "update_id": update_ids[trading_pair],
+                "bids": [[price_at(int(rng.expovariate(0.2)), True), f"{rng.choice([0, rng.uniform(1, 5)]):.4f}"]
+                         for _ in range(rows_per_diff // 2)],
+                "asks": [[price_at(int(rng.expovariate(0.2)), False), f"{rng.choice([0, rng.uniform(1, 5)]):.4f}"]
+                         for _ in range(rows_per_diff // 2)],
+            }, timestamp=1.0))
+        self.last_update_ids: Dict[str, int] = update_ids
+        self._burst_size: int = burst_size
+
+    @property
+    def num_messages(self) -> int:
+        return len(self._messages)
+
+    @staticmethod
+    async def fetch_trading_pairs() -> List[str]:
+        return []
+
+    async def get_last_traded_prices(self, trading_pairs: List[str], **kwargs) -> Dict[str, float]:
+        await asyncio.sleep(1.0)
+        return {}
+
+    async def get_new_order_book(self, trading_pair: str) -> OrderBook:
+        order_book: OrderBook = self.order_book_create_function()
+        order_book.apply_snapshot_entries(OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": trading_pair,
+            "update_id": 1,
+            "bids": [[price_at(level, True), "1"] for level in range(DEPTH)],
+            "asks": [[price_at(level, False), "1"] for level in range(DEPTH)],
+        }, timestamp=1.0).entries)
+        return order_book
+
+    async def listen_for_order_book_diffs(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        await self.start_event.wait()
+        for position in range(0, len(self._messages), self._burst_size):
+            for message in self._messages[position:position + self._burst_size]:
+                output.put_nowait(message)
+            # Let the tracker run between websocket reads.
+            await asyncio.sleep(0)
+        self.emitted_all.set()
+        await asyncio.Event().wait()
+
+    async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        await asyncio.Event().wait()
+
+    async def listen_for_trades(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        await asyncio.Event().wait()
+
+
+class BenchmarkOrderBookTracker(OrderBookTracker):
+    ORDER_BOOK_INIT_CONCURRENCY = 1000
+    ORDER_BOOK_INIT_RATE_LIMIT = (100000, 1.0)
+
+    @property
+    def exchange_name(self) -> str:
+        return "benchmark"
+
+
+async def run(num_pairs: int, direct: bool, args: argparse.Namespace) -> Dict[str, Any]:
+    trading_pairs: List[str] = [f"T{i}-USDT" for i in range(num_pairs)]
+    data_source: InMemoryDataSource = InMemoryDataSource(trading_pairs, args.diffs_per_pair, args.burst_size,
+                                                         args.rows_per_diff, args.seed)
+    tracker: BenchmarkOrderBookTracker = BenchmarkOrderBookTracker(data_source, trading_pairs,
+                                                                   periodic_snapshots=False)
+    tracker.DIRECT_DIFF_ROUTING = direct
+    tracker.start()
+    try:
+        while not tracker.ready:
+            await asyncio.sleep(0.01)
+        num_tasks: int = len(asyncio.all_tasks())
+
+        start_time: float = time.perf_counter()
+        start_cpu: float = time.process_time()
+        data_source.start_event.set()
+        order_books: Dict[str, OrderBook] = tracker.order_books
+        while not (data_source.emitted_all.is_set() and
+                   all(order_books[trading_pair].last_diff_uid == last_update_id
+                       for trading_pair, last_update_id in data_source.last_update_ids.items())):
+            await asyncio.sleep(0.005)
+        elapsed: float = time.perf_counter() - start_time
+        cpu: float = time.process_time() - start_cpu
+    finally:
+        tracker.stop()
+    return {
+        "mode": "direct" if direct else "queues",
+        "pairs": num_pairs,
+        "tasks": num_tasks,
+        "messages": data_source.num_messages,
+        "messages_per_sec": data_source.num_messages / elapsed,
+        "cpu_us_per_message": cpu / data_source.num_messages * 1e6,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Order book tracker routing benchmark.")
+    parser.add_argument("--pairs", default="50,300,1000", help="Comma separated numbers of trading pairs.")
+    parser.add_argument("--diffs-per-pair", type=int, default=200, help="Diff messages per trading pair.")
+    parser.add_argument("--burst-size", type=int, default=50, help="Diff messages emitted between event loop yields.")
+    parser.add_argument("--rows-per-diff", type=int, default=4, help="Price levels changed per diff message.")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{'pairs':>6}{'mode':>8}{'tasks':>8}{'messages':>10}{'msg/s':>12}{'cpu us/msg':>12}")
+    for num_pairs in [int(value) for value in args.pairs.split(",")]:
+        for direct in (False, True):
+            result: Dict[str, Any] = asyncio.get_event_loop().run_until_complete(run(num_pairs, direct, args))
+            print(f"{result['pairs']:>6}{result['mode']:>8}{result['tasks']:>8}{result['messages']:>10}"
+                  f"{result['messages_per_sec']:>12,.0f}{result['cpu_us_per_message']:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
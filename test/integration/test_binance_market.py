@@ -114,6 +114,8 @@ class BinanceExchangeUnitTest(unittest.TestCase):
                                         FixtureBinance.LISTEN_KEY)
             cls.web_app.update_response("put", cls.base_api_url, "/api/v1/userDataStream",
                                         FixtureBinance.LISTEN_KEY)
+            # Order reconciliation then queries the tracked orders' status with the mocked /api/v3/order responses.
+            cls.web_app.update_response("get", cls.base_api_url, "/api/v3/openOrders", [])
             cls.web_app.update_response("get", cls.base_api_url, "/api/v1/depth",
                                         FixtureBinance.LINKETH_SNAP, params={'symbol': 'LINKETH'})
             cls.web_app.update_response("get", cls.base_api_url, "/api/v1/depth",
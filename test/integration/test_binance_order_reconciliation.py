@@ -0,0 +1,227 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
+
+import asyncio
+from binance.client import Client
+from decimal import Decimal
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+import unittest
+from unittest.mock import patch
+
+from hummingbot.connector.exchange.binance.binance_exchange import BinanceExchange
+from hummingbot.connector.exchange.binance.binance_rest_client import (
+    BinanceRESTAPIException,
+    OPEN_ORDERS_ALL_SYMBOLS_WEIGHT,
+)
+from hummingbot.connector.exchange.binance.binance_utils import convert_to_exchange_trading_pair
+from hummingbot.core.clock import (
+    Clock,
+    ClockMode,
+)
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import (
+    BuyOrderCompletedEvent,
+    MarketEvent,
+    OrderCancelledEvent,
+    OrderFilledEvent,
+)
+from hummingbot.core.utils.asyncio_throttle import Throttler
+
+
+class MockBinanceRESTClient:
+    """
+    Serves the open orders, order statuses and trades of the test, and records the calls made.
+    """
+    def __init__(self):
+        self.calls: List[Tuple[str, Optional[str]]] = []
+        self.open_orders: Dict[str, List[Dict[str, Any]]] = {}
+        self.failing_symbols: List[str] = []
+        self.orders: Dict[str, Dict[str, Any]] = {}
+        self.trades: Dict[str, List[Dict[str, Any]]] = {}
+
+    async def get_open_orders(self, **params) -> List[Dict[str, Any]]:
+        symbol: Optional[str] = params.get("symbol")
+        self.calls.append(("get_open_orders", symbol))
+        if symbol in self.failing_symbols:
+            raise BinanceRESTAPIException(503, {"code": -1001, "msg": "Internal error."})
+        if symbol is None:
+            return [order for orders in self.open_orders.values() for order in orders]
+        return self.open_orders.get(symbol, [])
+
+    async def get_order(self, **params) -> Dict[str, Any]:
+        self.calls.append(("get_order", params["origClientOrderId"]))
+        if params["origClientOrderId"] not in self.orders:
+            raise BinanceRESTAPIException(400, {"code": -2013, "msg": "Order does not exist."})
+        return self.orders[params["origClientOrderId"]]
+
+    async def get_my_trades(self, **params) -> List[Dict[str, Any]]:
+        self.calls.append(("get_my_trades", params["symbol"]))
+        return self.trades.get(params["symbol"], [])
+
+
+class BinanceOrderReconciliationUnitTest(unittest.TestCase):
+    events: List[MarketEvent] = [
+        MarketEvent.BuyOrderCompleted,
+        MarketEvent.SellOrderCompleted,
+        MarketEvent.OrderFilled,
+        MarketEvent.OrderCancelled,
+        MarketEvent.OrderFailure,
+    ]
+
+    def setUp(self):
+        self.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+        with patch.object(Client, "ping"):
+            self.market: BinanceExchange = BinanceExchange("XXX", "YYY", trading_pairs=["ETH-USDT", "BTC-USDT"])
+        self.rest_client: MockBinanceRESTClient = MockBinanceRESTClient()
+        for name in ("get_open_orders", "get_order", "get_my_trades"):
+            setattr(self.market.binance_rest_client, name, getattr(self.rest_client, name))
+        self.market_logger: EventLogger = EventLogger()
+        for event_tag in self.events:
+            self.market.add_listener(event_tag, self.market_logger)
+        # Order reconciliation runs once per UPDATE_ORDER_STATUS_MIN_INTERVAL.
+        self.clock: Clock = Clock(ClockMode.BACKTEST, 1.0, 0.0, 100.0)
+        self.clock.add_iterator(self.market)
+        self.clock.__enter__()
+        self.clock.backtest_til(20.0)
+
+    def tearDown(self):
+        self.clock.__exit__(None, None, None)
+
+    def track_order(self, client_order_id: str, trading_pair: str, exchange_order_id: int, trade_type: str = "BUY",
+                    executed_amount_base: str = "0"):
+        self.market.restore_tracking_states({client_order_id: {
+            "client_order_id": client_order_id,
+            "exchange_order_id": str(exchange_order_id),
+            "trading_pair": trading_pair,
+            "order_type": "LIMIT",
+            "trade_type": trade_type,
+            "price": "100",
+            "amount": "1",
+            "last_state": "NEW",
+            "executed_amount_base": executed_amount_base,
+            "executed_amount_quote": str(Decimal(executed_amount_base) * 100),
+            "fee_asset": None,
+            "fee_paid": "0",
+        }})
+
+    @staticmethod
+    def open_order(client_order_id: str, trading_pair: str, executed_qty: str = "0") -> Dict[str, Any]:
+        return {"symbol": convert_to_exchange_trading_pair(trading_pair), "clientOrderId": client_order_id,
+                "status": "NEW" if Decimal(executed_qty) == 0 else "PARTIALLY_FILLED", "executedQty": executed_qty}
+
+    def reconcile(self):
+        self.ev_loop.run_until_complete(self.market._reconcile_open_orders())
+
+    def calls(self, name: str) -> List[Optional[str]]:
+        return [argument for call_name, argument in self.rest_client.calls if call_name == name]
+
+    def test_open_orders_are_not_queried(self):
+        self.track_order("buy-1", "ETH-USDT", 1)
+        self.track_order("buy-2", "BTC-USDT", 2)
+        self.rest_client.open_orders = {
+            "ETHUSDT": [self.open_order("buy-1", "ETH-USDT")],
+            "BTCUSDT": [self.open_order("buy-2", "BTC-USDT")],
+        }
+        self.reconcile()
+
+        self.assertEqual(["BTCUSDT", "ETHUSDT"], sorted(self.calls("get_open_orders")))
+        self.assertEqual([], self.calls("get_order"))
+        self.assertEqual([], self.calls("get_my_trades"))
+        self.assertEqual([], self.market_logger.event_log)
+        self.assertEqual({"buy-1", "buy-2"}, set(self.market.in_flight_orders.keys()))
+
+    def test_vanished_order_is_queried_once(self):
+        self.track_order("buy-1", "ETH-USDT", 1)
+        self.track_order("buy-2", "ETH-USDT", 2)
+        self.rest_client.open_orders = {"ETHUSDT": [self.open_order("buy-2", "ETH-USDT")]}
+        self.rest_client.orders["buy-1"] = {"status": "CANCELED", "type": "LIMIT", "executedQty": "0",
+                                            "cummulativeQuoteQty": "0"}
+        self.reconcile()
+
+        self.assertEqual(["buy-1"], self.calls("get_order"))
+        self.assertEqual([], self.calls("get_my_trades"))
+        self.assertEqual(1, len(self.market_logger.event_log))
+        cancelled_event: OrderCancelledEvent = self.market_logger.event_log[0]
+        self.assertIsInstance(cancelled_event, OrderCancelledEvent)
+        self.assertEqual("buy-1", cancelled_event.order_id)
+        self.assertEqual({"buy-2"}, set(self.market.in_flight_orders.keys()))
+
+    def test_unexplained_fills(self):
+        self.track_order("buy-1", "ETH-USDT", 1)
+        self.track_order("buy-2", "BTC-USDT", 2)
+        self.track_order("buy-3", "BTC-USDT", 3, executed_amount_base="0.5")
+        self.rest_client.open_orders = {"BTCUSDT": [self.open_order("buy-2", "BTC-USDT"),
+                                                    self.open_order("buy-3", "BTC-USDT", "0.5")]}
+        self.rest_client.orders["buy-1"] = {"status": "FILLED", "type": "LIMIT", "executedQty": "1",
+                                            "cummulativeQuoteQty": "100"}
+        self.rest_client.trades["ETHUSDT"] = [
+            {"id": 11, "orderId": 1, "qty": "0.4", "quoteQty": "40", "price": "100", "commission": "0.0004",
+             "commissionAsset": "ETH"},
+            {"id": 12, "orderId": 1, "qty": "0.6", "quoteQty": "60", "price": "100", "commission": "0.0006",
+             "commissionAsset": "ETH"},
+        ]
+        self.reconcile()
+
+        # The BTC-USDT orders have recorded all their fills already.
+        self.assertEqual(["ETHUSDT"], self.calls("get_my_trades"))
+        self.assertEqual(["buy-1"], self.calls("get_order"))
+        self.assertEqual([OrderFilledEvent, OrderFilledEvent, BuyOrderCompletedEvent],
+                         [type(event) for event in self.market_logger.event_log])
+        self.assertEqual([11, 12], [event.exchange_trade_id for event in self.market_logger.event_log[:2]])
+        self.assertTrue(all(event.order_id == "buy-1" for event in self.market_logger.event_log))
+        self.assertEqual({"buy-2", "buy-3"}, set(self.market.in_flight_orders.keys()))
+
+    def test_all_symbols_open_orders(self):
+        trading_pairs: List[str] = [f"COIN{i}-USDT" for i in range(OPEN_ORDERS_ALL_SYMBOLS_WEIGHT)]
+        for i, trading_pair in enumerate(trading_pairs):
+            self.track_order(f"buy-{i}", trading_pair, i)
+        self.rest_client.open_orders = {
+            convert_to_exchange_trading_pair(trading_pair): [self.open_order(f"buy-{i}", trading_pair)]
+            for i, trading_pair in enumerate(trading_pairs)
+        }
+        request_weights: List[Tuple[Optional[str], int]] = []
+        weighted_task = Throttler.weighted_task
+
+        def record_weighted_task(throttler: Throttler, request_weight: int = 1, endpoint: Optional[str] = None,
+                                 **kwargs):
+            request_weights.append((endpoint, request_weight))
+            return weighted_task(throttler, request_weight=request_weight, endpoint=endpoint, **kwargs)
+
+        with patch.object(Throttler, "weighted_task", record_weighted_task):
+            self.reconcile()
+
+        self.assertEqual([None], self.calls("get_open_orders"))
+        self.assertEqual([OPEN_ORDERS_ALL_SYMBOLS_WEIGHT],
+                         [weight for endpoint, weight in request_weights if endpoint == "get_open_orders"])
+        self.assertEqual([], self.calls("get_order"))
+        self.assertEqual(len(trading_pairs), len(self.market.in_flight_orders))
+
+    def test_failed_open_orders(self):
+        self.track_order("buy-1", "ETH-USDT", 1, executed_amount_base="0.5")
+        self.track_order("buy-2", "BTC-USDT", 2)
+        self.rest_client.failing_symbols = ["ETHUSDT"]
+        self.rest_client.orders["buy-1"] = {"status": "FILLED", "type": "LIMIT", "executedQty": "1",
+                                            "cummulativeQuoteQty": "100"}
+        self.rest_client.orders["buy-2"] = {"status": "CANCELED", "type": "LIMIT", "executedQty": "0",
+                                            "cummulativeQuoteQty": "0"}
+        self.reconcile()
+
+        # The ETH-USDT order is left as it is until its trading pair's open orders can be fetched again.
+        self.assertEqual(["buy-2"], self.calls("get_order"))
+        self.assertEqual([], self.calls("get_my_trades"))
+        self.assertEqual(["buy-2"], [event.order_id for event in self.market_logger.event_log])
+        self.assertEqual({"buy-1"}, set(self.market.in_flight_orders.keys()))
+        self.assertEqual("NEW", self.market.in_flight_orders["buy-1"].last_state)
+        self.assertEqual(Decimal("0.5"), self.market.in_flight_orders["buy-1"].executed_amount_base)
+
+
+if __name__ == "__main__":
+    unittest.main()
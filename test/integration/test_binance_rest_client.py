@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
+
+from aiohttp import web
+import asyncio
+from binance.exceptions import BinanceAPIException
+import hashlib
+import hmac
+from typing import (
+    Any,
+    Dict,
+    List,
+)
+import unittest
+
+from hummingbot.connector.exchange.binance.binance_rest_client import BinanceRESTClient
+from hummingbot.core.utils.http_session_registry import HTTPSessionRegistry
+
+API_KEY = "test-api-key"
+API_SECRET = "test-api-secret"
+
+
+class BinanceRESTClientUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+        self.requests: List[Dict[str, Any]] = []
+
+    async def handle_request(self, request: web.Request) -> web.Response:
+        query: str = request.query_string
+        self.requests.append({"method": request.method, "path": request.path, "query": dict(request.query),
+                              "api_key": request.headers.get("X-MBX-APIKEY")})
+        if "signature" in request.query:
+            unsigned_query, signature = query.rsplit("&signature=", 1)
+            expected: str = hmac.new(API_SECRET.encode("utf-8"), unsigned_query.encode("utf-8"),
+                                     hashlib.sha256).hexdigest()
+            if signature != expected:
+                return web.json_response({"code": -1022, "msg": "Signature for this request is not valid."},
+                                         status=400)
+        if request.method == "DELETE":
+            return web.json_response({"code": -2011, "msg": "Unknown order sent."}, status=400)
+        if request.path.endswith("/time"):
+            return web.json_response({"serverTime": 1600000000000})
+        return web.json_response({"orderId": 1, **request.query})
+
+    async def run_client(self, calls) -> List[Any]:
+        app: web.Application = web.Application()
+        app.router.add_route("*", "/{tail:.*}", self.handle_request)
+        runner: web.AppRunner = web.AppRunner(app)
+        await runner.setup()
+        site: web.TCPSite = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port: int = site._server.sockets[0].getsockname()[1]
+        client: BinanceRESTClient = BinanceRESTClient(API_KEY, API_SECRET, time_func=lambda: 1600000000.0)
+        client.API_URL = f"http://127.0.0.1:{port}/api"
+        try:
+            return [await call(client) for call in calls]
+        finally:
+            await HTTPSessionRegistry.get_instance().close()
+            await runner.cleanup()
+
+    def test_signed_requests(self):
+        server_time, order = self.ev_loop.run_until_complete(self.run_client([
+            lambda client: client.get_server_time(),
+            lambda client: client.create_order(symbol="ETHUSDT", side="BUY", type="LIMIT", quantity="1.5",
+                                               price="100.1", newClientOrderId="x-1", icebergQty=None),
+        ]))
+        self.assertEqual({"serverTime": 1600000000000}, server_time)
+        self.assertEqual(("GET", "/api/v1/time", {}), tuple(self.requests[0][key] for key in ("method", "path", "query")))
+
+        self.assertEqual("POST", self.requests[1]["method"])
+        self.assertEqual("/api/v3/order", self.requests[1]["path"])
+        self.assertEqual(API_KEY, self.requests[1]["api_key"])
+        self.assertEqual(1, order["orderId"])
+        self.assertEqual("1600000000000", order["timestamp"])
+        self.assertEqual("100.1", order["price"])
+        self.assertNotIn("icebergQty", order)
+
+    def test_api_errors(self):
+        with self.assertRaises(BinanceAPIException) as context:
+            self.ev_loop.run_until_complete(self.run_client([
+                lambda client: client.cancel_order(symbol="ETHUSDT", origClientOrderId="x-1")
+            ]))
+        self.assertEqual(-2011, context.exception.code)
+        self.assertEqual("Unknown order sent.", context.exception.message)
+        self.assertEqual(400, context.exception.status_code)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -22,6 +22,8 @@ from hummingbot.core.event.events import (
     TradeType,
 )
 from hummingbot.core.event.event_listener import EventListener
+from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
 
 
 class CompositeOrderBookTestStrategy(UnitTestStrategy):
@@ -251,5 +253,33 @@ class CompositeOrderBookTest(unittest.TestCase):
         self.verify_composite_order_book_adjustment(self.market.get_order_book("WETH-DAI"))
 
 
+class CompositeOrderBookFillsTest(unittest.TestCase):
+    def record_fill(self, order_book, trade_type, price, amount, timestamp):
+        order_book.record_filled_order(OrderFilledEvent(timestamp, "", "WETH-DAI", trade_type, None, price, amount,
+                                                        None))
+
+    def test_fills(self):
+        order_book = CompositeOrderBook()
+        order_book.apply_snapshot([OrderBookRow(100 - i, 1, 1) for i in range(5)],
+                                  [OrderBookRow(101 + i, 1, 1) for i in range(5)], 1)
+        self.record_fill(order_book, TradeType.BUY, 101, 0.4, 5)
+        self.record_fill(order_book, TradeType.BUY, 101, 0.8, 6)
+        self.record_fill(order_book, TradeType.BUY, 102, 0.5, 6)
+        self.record_fill(order_book, TradeType.SELL, 100, 0.25, 7)
+        self.record_fill(order_book, TradeType.SELL, 98.5, 0.25, 7)
+
+        self.assertEqual([(102, 0.5, 1), (103, 1, 1)], list(order_book.ask_entries())[:2])
+        self.assertEqual([(100, 0.75, 1), (99, 1, 1)], list(order_book.bid_entries())[:2])
+        self.assertEqual((102, 100), (order_book.get_price(True), order_book.get_price(False)))
+        self.assertEqual(103, order_book.get_price_for_volume(True, 1).result_price)
+        # The exhausted fill is capped to its level, and the fill between two bid levels is dropped.
+        self.assertEqual([(101, 1, 6), (102, 0.5, 6)], list(order_book.traded_order_book.ask_entries()))
+        self.assertEqual([(100, 0.25, 7)], list(order_book.traded_order_book.bid_entries()))
+
+        order_book.apply_diffs([], [OrderBookRow(102, 0, 8)], 8)
+        self.assertEqual([(103, 1, 1)], list(order_book.ask_entries())[:1])
+        self.assertEqual([(101, 1, 6)], list(order_book.traded_order_book.ask_entries()))
+
+
 if __name__ == "__main__":
     unittest.main()
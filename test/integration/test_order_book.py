@@ -4,16 +4,34 @@ from os.path import join, realpath
 import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
 
 import logging
+import random
 import unittest
+from hummingbot.core.data_type.common import OrderBookEngine
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_entries import OrderBookEntries
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType,
+)
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import (
+    OrderBookEvent,
+    OrderBookMetricsEvent,
+    OrderBookTopOfBookEvent,
+    OrderBookTradeEvent,
+    TradeType,
+)
 import numpy as np
 
 
 class OrderBookUnitTest(unittest.TestCase):
+    engine = OrderBookEngine.SET
+
     @classmethod
     def setUpClass(cls):
-        cls.order_book_dex = OrderBook(dex=True)
-        cls.order_book_cex = OrderBook(dex=False)
+        cls.order_book_dex = OrderBook(dex=True, engine=cls.engine)
+        cls.order_book_cex = OrderBook(dex=False, engine=cls.engine)
 
     def test_truncate_overlap_entries_dex(self):
         bids_array = np.array([[1, 1, 1], [2, 1, 2], [3, 1, 3], [50, 0.01, 4]], dtype=np.float64)
@@ -53,6 +71,327 @@ class OrderBookUnitTest(unittest.TestCase):
         self.assertEqual(best_bid, [50., 0.01, 6.])
         self.assertEqual(best_ask, 0)
 
+    def test_depth_queries(self):
+        order_book = OrderBook(engine=self.engine)
+        bids = [OrderBookRow(100 - i, i + 1, 1) for i in range(10)]
+        asks = [OrderBookRow(101 + i, i + 1, 1) for i in range(10)]
+        order_book.apply_snapshot(bids, asks, 1)
+
+        for is_buy, rows in ((True, asks), (False, bids)):
+            for volume in (0, 0.5, 1, 2.5, 3, 20, 55, 100):
+                # Reference values, from walking the levels one by one.
+                cumulative_base = cumulative_quote = 0
+                price = vwap = float("nan")
+                for row in rows:
+                    if cumulative_base + row.amount >= volume:
+                        price = row.price
+                        vwap = (cumulative_quote + (volume - cumulative_base) * row.price) / volume if volume else price
+                        cumulative_quote += (volume - cumulative_base) * row.price
+                        cumulative_base = volume
+                        break
+                    cumulative_base += row.amount
+                    cumulative_quote += row.amount * row.price
+
+                result = order_book.get_price_for_volume(is_buy, volume)
+                self.assertEqual(str(float(price)), str(result.result_price))
+                self.assertEqual(cumulative_base, result.result_volume)
+                if 0 < volume <= cumulative_base:
+                    self.assertAlmostEqual(vwap, order_book.get_vwap_for_volume(is_buy, volume).result_price)
+                self.assertAlmostEqual(cumulative_quote,
+                                       order_book.get_quote_volume_for_base_amount(is_buy, volume).result_volume)
+
+            for limit_price in (50, 95.5, 100, 101, 104, 200):
+                within = [row for row in rows if (row.price <= limit_price if is_buy else row.price >= limit_price)]
+                result = order_book.get_volume_for_price(is_buy, limit_price)
+                self.assertEqual(sum(row.amount for row in within), result.result_volume)
+                self.assertEqual(str(float(within[-1].price) if within else "nan"), str(result.result_price))
+                result = order_book.get_quote_volume_for_price(is_buy, limit_price)
+                self.assertAlmostEqual(sum(row.amount * row.price for row in within), result.result_volume)
+
+            result = order_book.get_price_for_quote_volume(is_buy, rows[0].price * 2)
+            self.assertEqual(rows[1].price, result.result_price)
+
+        # The index must follow the book updates.
+        order_book.apply_diffs([], [OrderBookRow(101, 0, 2), OrderBookRow(101.5, 4, 2)], 2)
+        self.assertEqual(101.5, order_book.get_price_for_volume(True, 4).result_price)
+        self.assertEqual(102, order_book.get_price_for_volume(True, 5).result_price)
+        self.assertEqual(6, order_book.get_volume_for_price(True, 102).result_volume)
+
+    def test_numpy_entries(self):
+        order_book = OrderBook(engine=self.engine)
+        bids = [OrderBookRow(100.0 - i, i + 1.0, i) for i in range(10)]
+        asks = [OrderBookRow(101.0 + i, i + 1.0, i) for i in range(10)]
+        order_book.apply_snapshot(bids, asks, 1)
+
+        bids_array, asks_array = order_book.get_numpy_snapshot()
+        self.assertEqual([list(row) for row in bids], bids_array.tolist())
+        self.assertEqual([list(row) for row in asks], asks_array.tolist())
+        self.assertEqual([list(row) for row in asks[:3]], order_book.ask_entries_numpy(3).tolist())
+        self.assertEqual((0, 3), order_book.bid_entries_numpy(0).shape)
+
+        # Writing into a caller supplied buffer, at most as many levels as the buffer has rows.
+        buffer = np.zeros((5, 3), dtype=np.float64)
+        top_bids = order_book.bid_entries_numpy(out=buffer)
+        self.assertTrue(np.shares_memory(buffer, top_bids))
+        self.assertEqual([list(row) for row in bids[:5]], buffer.tolist())
+        order_book.apply_diffs([OrderBookRow(100.0, 0, 11)], [], 11)
+        top_bids = order_book.bid_entries_numpy(2, out=buffer)
+        self.assertEqual([list(row) for row in bids[1:3]], top_bids.tolist())
+        with self.assertRaises(ValueError):
+            order_book.bid_entries_numpy(out=np.zeros((5, 2)))
+
+        bids_df, asks_df = order_book.snapshot
+        self.assertEqual(list(order_book.bid_entries()), [tuple(row) for row in bids_df.values.tolist()])
+        self.assertEqual(list(order_book.ask_entries()), [tuple(row) for row in asks_df.values.tolist()])
+
+    def test_apply_message_entries(self):
+        snapshot = OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": "ETH-USDT",
+            "update_id": 10,
+            "bids": [["99.5", "1.25"], ["99.0", "2", "ignored"], [98, 3.5]],
+            "asks": [["100.5", "0.5"], ["1.01e2", "4"]],
+        }, timestamp=1.0)
+        diff = OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": "ETH-USDT",
+            "update_id": 11,
+            "bids": [["99.5", "0.00000000"]],
+            "asks": [["100.25", "3.00000000"]],
+        }, timestamp=2.0)
+        self.assertIs(diff.entries, diff.entries)
+        self.assertEqual(diff.asks, diff.entries.asks)
+
+        order_book = OrderBook(engine=self.engine)
+        order_book.apply_snapshot_entries(snapshot.entries)
+        self.assertEqual(snapshot.bids, list(order_book.bid_entries()))
+        self.assertEqual(snapshot.asks, list(order_book.ask_entries()))
+        self.assertEqual(10, order_book.snapshot_uid)
+        order_book.apply_diff_entries(diff.entries)
+        self.assertEqual([(99.0, 2.0, 10), (98.0, 3.5, 10)], list(order_book.bid_entries()))
+        self.assertEqual([(100.25, 3.0, 11), (100.5, 0.5, 10), (101.0, 4.0, 10)], list(order_book.ask_entries()))
+        self.assertEqual(11, order_book.last_diff_uid)
+
+        entries = OrderBookEntries.from_exchange_rows([["1.5", "2000"]], [], 3, amount_multiplier=0.001)
+        self.assertEqual([(1.5, 2.0, 3)], entries.bids)
+        with self.assertRaises(ValueError):
+            OrderBookEntries.from_exchange_rows([["1.5x", "1"]], [], 3)
+
+    def test_merge_entries(self):
+        rng = random.Random(7)
+        diffs = [OrderBookEntries.from_rows([OrderBookRow(100 - rng.randint(0, 20) * 0.5, rng.choice([0, 1, 2]), uid)
+                                             for _ in range(5)],
+                                            [OrderBookRow(101 + rng.randint(0, 20) * 0.5, rng.choice([0, 1, 2]), uid)
+                                             for _ in range(5)],
+                                            uid)
+                 for uid in range(2, 50)]
+        merged = OrderBookEntries.merge(diffs)
+        self.assertEqual(49, merged.update_id)
+        self.assertEqual(len(merged.bids), len(set(row.price for row in merged.bids)))
+
+        snapshot = OrderBookEntries.from_rows([OrderBookRow(100 - i * 0.5, 1, 1) for i in range(20)],
+                                              [OrderBookRow(101 + i * 0.5, 1, 1) for i in range(20)], 1)
+        one_by_one = OrderBook(engine=self.engine)
+        one_by_one.apply_snapshot_entries(snapshot)
+        for diff in diffs:
+            one_by_one.apply_diff_entries(diff)
+        coalesced = OrderBook(engine=self.engine)
+        coalesced.apply_snapshot_entries(snapshot)
+        coalesced.apply_diff_entries(merged)
+        self.assertEqual(list(one_by_one.bid_entries()), list(coalesced.bid_entries()))
+        self.assertEqual(list(one_by_one.ask_entries()), list(coalesced.ask_entries()))
+        self.assertEqual(one_by_one.last_diff_uid, coalesced.last_diff_uid)
+
+    def test_depth_cap(self):
+        order_book = OrderBook(engine=self.engine, depth_cap=3, depth_cap_buffer=2)
+        self.assertEqual(3, order_book.depth_cap)
+        bids = [OrderBookRow(100 - i, 1, 1) for i in range(10)]
+        asks = [OrderBookRow(101 + i, 1, 1) for i in range(10)]
+        order_book.apply_snapshot(bids, asks, 1)
+        self.assertEqual([row.price for row in bids[:5]], [price for price, _, _ in order_book.bid_entries()])
+        self.assertEqual([row.price for row in asks[:5]], [price for price, _, _ in order_book.ask_entries()])
+
+        # Diffs beyond the kept levels are ignored, diffs inside are applied and the book is trimmed again.
+        order_book.apply_diffs([OrderBookRow(90, 5, 2), OrderBookRow(99.5, 2, 2)],
+                               [OrderBookRow(110, 5, 2), OrderBookRow(101.5, 2, 2)], 2)
+        self.assertEqual([100, 99.5, 99, 98, 97], [price for price, _, _ in order_book.bid_entries()])
+        self.assertEqual([101, 101.5, 102, 103, 104], [price for price, _, _ in order_book.ask_entries()])
+        self.assertFalse(order_book.depth_resync_required)
+
+        order_book.apply_diffs([OrderBookRow(price, 0, 3) for price in (100, 99.5, 99)], [], 3)
+        self.assertEqual(2, len(list(order_book.bid_entries())))
+        self.assertTrue(order_book.depth_resync_required)
+
+        order_book.apply_snapshot(bids, asks, 4)
+        self.assertFalse(order_book.depth_resync_required)
+        self.assertEqual(5, len(list(order_book.bid_entries())))
+
+    def test_enable_depth_cap(self):
+        order_book = OrderBook(engine=self.engine)
+        bids = [OrderBookRow(100 - i, 1, 1) for i in range(10)]
+        asks = [OrderBookRow(101 + i, 1, 1) for i in range(10)]
+        order_book.apply_snapshot(bids, asks, 1)
+        order_book.enable_depth_cap(3, 2)
+        self.assertEqual(3, order_book.depth_cap)
+        self.assertEqual([row.price for row in bids[:5]], [price for price, _, _ in order_book.bid_entries()])
+        self.assertEqual([row.price for row in asks[:5]], [price for price, _, _ in order_book.ask_entries()])
+
+        order_book.apply_diffs([], [OrderBookRow(price, 0, 2) for price in (101, 102, 103)], 2)
+        self.assertTrue(order_book.depth_resync_required)
+
+    def test_top_of_book_event(self):
+        order_book = OrderBook(engine=self.engine)
+        event_logger = EventLogger()
+        order_book.add_listener(OrderBookEvent.TopOfBookChangedEvent, event_logger)
+
+        order_book.apply_snapshot([OrderBookRow(99, 1, 1), OrderBookRow(98, 2, 1)],
+                                  [OrderBookRow(101, 3, 1), OrderBookRow(102, 4, 1)], 1)
+        self.assertEqual([OrderBookTopOfBookEvent(1, 99, 1, 101, 3)], event_logger.event_log)
+
+        # Changes below the top of the book are not reported.
+        order_book.apply_diffs([OrderBookRow(98, 5, 2)], [OrderBookRow(103, 1, 2)], 2)
+        self.assertEqual(1, len(event_logger.event_log))
+
+        order_book.apply_diffs([OrderBookRow(99, 1.5, 3)], [], 3)
+        order_book.apply_diffs([], [OrderBookRow(101, 0, 4)], 4)
+        order_book.apply_diffs([OrderBookRow(99, 0, 5), OrderBookRow(98, 0, 5)], [], 5)
+        self.assertEqual([OrderBookTopOfBookEvent(3, 99, 1.5, 101, 3),
+                          OrderBookTopOfBookEvent(4, 99, 1.5, 102, 4)], event_logger.event_log[1:3])
+        last_event = event_logger.event_log[-1]
+        self.assertTrue(np.isnan(last_event.best_bid_price))
+        self.assertEqual((0, 102, 4), (last_event.best_bid_amount, last_event.best_ask_price, last_event.best_ask_amount))
+        self.assertEqual(4, len(event_logger.event_log))
+
+        order_book.apply_diffs([], [OrderBookRow(103, 2, 6)], 6)
+        self.assertEqual(4, len(event_logger.event_log))
+
+    def test_tick_size(self):
+        order_book = OrderBook(engine=self.engine)
+        order_book.apply_snapshot([OrderBookRow(0.30000000000000004, 1, 1), OrderBookRow(0.2, 2, 1)],
+                                  [OrderBookRow(0.4, 3, 1)], 1)
+        # 0.1 + 0.2 is a different level than 0.3 without tick mode.
+        order_book.apply_diffs([OrderBookRow(0.3, 5, 2)], [], 2)
+        self.assertEqual(3, len(list(order_book.bid_entries())))
+
+        order_book.set_tick_size(0.1, 0.001)
+        self.assertEqual((0.1, 0.001), order_book.tick_size)
+        self.assertEqual(1, order_book.snapshot_uid)
+        self.assertEqual([0.3, 0.2], [price for price, _, _ in order_book.bid_entries()])
+
+        order_book.apply_diffs([OrderBookRow(0.1 + 0.2, 1.23456, 3), OrderBookRow(0.19999, 0, 3)],
+                               [OrderBookRow(0.7 - 0.3, 0.0004, 3), OrderBookRow(0.5, 1, 3)], 3)
+        self.assertEqual([(0.3, 1.235, 3)], list(order_book.bid_entries()))
+        self.assertEqual([(0.5, 1, 3)], list(order_book.ask_entries()))
+
+        order_book.set_tick_size(0)
+        self.assertEqual((0, 0), order_book.tick_size)
+        order_book.apply_diffs([OrderBookRow(0.1 + 0.2, 1, 4)], [], 4)
+        self.assertEqual(2, len(list(order_book.bid_entries())))
+
+    def test_trade_tape(self):
+        order_book = OrderBook(engine=self.engine, trade_tape_capacity=4)
+        trade_tape = order_book.trade_tape
+        for timestamp, trade_type, price, amount in [(1, TradeType.BUY, 100, 1),
+                                                     (2, TradeType.SELL, 99, 2),
+                                                     (3, TradeType.BUY, 101, 1),
+                                                     (4, TradeType.BUY, 102, 3),
+                                                     (5, TradeType.SELL, 98, 1)]:
+            order_book.apply_trade(OrderBookTradeEvent("ETH-USDT", timestamp, trade_type, price, amount))
+        self.assertEqual(98, order_book.last_trade_price)
+
+        # The oldest trade has been overwritten.
+        self.assertEqual(4, len(trade_tape))
+        self.assertEqual([2, 3, 4, 5], trade_tape.to_numpy()[:, 0].tolist())
+        self.assertEqual(4, trade_tape.trade_count(10, now=5))
+        self.assertEqual(2, trade_tape.trade_count(2, now=5))
+        self.assertAlmostEqual((102 * 3 + 98) / 4, trade_tape.vwap(2, now=5))
+        self.assertEqual((4, 3), trade_tape.buy_sell_volumes(10, now=5))
+        self.assertAlmostEqual(1 / 7, trade_tape.volume_imbalance(10, now=5))
+        self.assertTrue(np.isnan(trade_tape.vwap(10, now=100)))
+        self.assertTrue(np.isnan(trade_tape.volume_imbalance(10, now=100)))
+
+    def test_metrics(self):
+        order_book = OrderBook(engine=self.engine)
+        self.assertIsNone(order_book.metrics)
+        order_book.apply_snapshot([OrderBookRow(100 - i, i + 1, 1) for i in range(5)],
+                                  [OrderBookRow(101 + i, 1, 1) for i in range(5)], 1)
+        order_book.enable_metrics(depth=2)
+        event_logger = EventLogger()
+        order_book.add_listener(OrderBookEvent.MetricsChangedEvent, event_logger)
+        metrics = order_book.metrics
+        self.assertEqual((100.5, 1, 3, 2), (metrics.mid_price, metrics.spread, metrics.bid_depth, metrics.ask_depth))
+        self.assertAlmostEqual((100 * 1 + 101 * 1) / 2, metrics.microprice)
+        self.assertAlmostEqual(0.2, metrics.depth_imbalance)
+
+        # Changes below the top levels don't touch the metrics.
+        order_book.apply_diffs([OrderBookRow(97, 10, 2)], [OrderBookRow(104, 10, 2)], 2)
+        self.assertEqual([], event_logger.event_log)
+        self.assertEqual(1, metrics.update_id)
+
+        order_book.apply_diffs([OrderBookRow(99, 0, 3)], [OrderBookRow(101, 3, 3)], 3)
+        self.assertEqual((4, 4), (metrics.bid_depth, metrics.ask_depth))
+        self.assertAlmostEqual((100 * 3 + 101 * 1) / 4, metrics.microprice)
+        self.assertEqual([OrderBookMetricsEvent(3, 100.5, metrics.microprice, 1, 0)], event_logger.event_log)
+
+        # A crossing bid removes the best ask levels.
+        order_book.apply_diffs([OrderBookRow(102, 1, 4)], [], 4)
+        self.assertEqual((102, 103), (metrics.best_bid_price, metrics.best_ask_price))
+        self.assertEqual((2, 11), (metrics.bid_depth, metrics.ask_depth))
+
+        order_book.apply_snapshot([], [OrderBookRow(101, 1, 5)], 5)
+        self.assertTrue(np.isnan(metrics.mid_price))
+        self.assertEqual((0, 1), (metrics.bid_depth, metrics.ask_depth))
+        self.assertEqual(-1, metrics.depth_imbalance)
+
+    def test_memory_usage(self):
+        order_book = OrderBook(engine=self.engine)
+        empty_usage = order_book.memory_usage()
+        self.assertEqual((0, 0), (empty_usage["bid_levels"], empty_usage["ask_levels"]))
+
+        order_book.apply_snapshot([OrderBookRow(100 - i, 1, 1) for i in range(50)],
+                                  [OrderBookRow(101 + i, 1, 1) for i in range(20)], 1)
+        usage = order_book.memory_usage()
+        self.assertEqual((50, 20), (usage["bid_levels"], usage["ask_levels"]))
+        self.assertGreater(usage["bid_bytes"], usage["ask_bytes"])
+        self.assertGreater(usage["ask_bytes"], empty_usage["ask_bytes"])
+        self.assertGreaterEqual(usage["depth_index_bytes"], 0)
+        self.assertGreater(usage["trade_tape_bytes"], 0)
+
+
+class FlatOrderBookUnitTest(OrderBookUnitTest):
+    engine = OrderBookEngine.FLAT
+
+    def test_engine(self):
+        self.assertEqual(OrderBookEngine.FLAT, self.order_book_cex.engine)
+        self.assertEqual(OrderBookEngine.SET, OrderBook().engine)
+
+    def test_same_result_as_set_engine(self):
+        rng = random.Random(42)
+        for dex in (False, True):
+            set_book = OrderBook(dex=dex, engine=OrderBookEngine.SET)
+            flat_book = OrderBook(dex=dex, engine=OrderBookEngine.FLAT)
+            bids = [OrderBookRow(100 - i * 0.5, rng.uniform(0.1, 5), 1) for i in range(100)]
+            asks = [OrderBookRow(100.5 + i * 0.5, rng.uniform(0.1, 5), 1) for i in range(100)]
+            # Duplicated price in a snapshot, the first entry wins.
+            bids.append(OrderBookRow(100, 42, 1))
+            for order_book in (set_book, flat_book):
+                order_book.apply_snapshot(bids, asks, 1)
+
+            for update_id in range(2, 500):
+                mid = 100.25 + rng.uniform(-3, 3)
+                diff_bids = [OrderBookRow(round(mid - rng.randint(0, 40) * 0.5, 1),
+                                          rng.choice([0, 0, rng.uniform(0.1, 5)]), update_id)
+                             for _ in range(rng.randint(0, 6))]
+                diff_asks = [OrderBookRow(round(mid + rng.randint(0, 40) * 0.5, 1),
+                                          rng.choice([0, 0, rng.uniform(0.1, 5)]), update_id)
+                             for _ in range(rng.randint(0, 6))]
+                for order_book in (set_book, flat_book):
+                    order_book.apply_diffs(diff_bids, diff_asks, update_id)
+                self.assertEqual(list(set_book.bid_entries()), list(flat_book.bid_entries()))
+                self.assertEqual(list(set_book.ask_entries()), list(flat_book.ask_entries()))
+                self.assertEqual(set_book.get_price(True), flat_book.get_price(True))
+                self.assertEqual(set_book.get_price(False), flat_book.get_price(False))
+                self.assertEqual(set_book.get_vwap_for_volume(True, 10).result_price,
+                                 flat_book.get_vwap_for_volume(True, 10).result_price)
+
 
 def main():
     logging.basicConfig(level=logging.INFO)
@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
+
+import asyncio
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType,
+)
+from hummingbot.core.data_type.order_book_recording import (
+    RECORD_DTYPE,
+    OrderBookRecordingReader,
+    OrderBookRecordingWriter,
+)
+from hummingbot.core.data_type.order_book_replay_data_source import OrderBookReplayDataSource
+from hummingbot.core.event.events import TradeType
+
+
+class OrderBookRecordingUnitTest(unittest.TestCase):
+    trading_pair = "ETH-USDT"
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        writer = OrderBookRecordingWriter(self.directory, self.trading_pair)
+        for message in self.messages():
+            writer.write(message)
+        writer.close()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def messages(self):
+        def snapshot(timestamp, update_id, bid_price):
+            return OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+                "trading_pair": self.trading_pair,
+                "update_id": update_id,
+                "bids": [[bid_price, 1.0], [bid_price - 1, 2.0]],
+                "asks": [[bid_price + 1, 3.0]],
+            }, timestamp=timestamp)
+
+        def diff(timestamp, update_id, bids, asks):
+            return OrderBookMessage(OrderBookMessageType.DIFF, {
+                "trading_pair": self.trading_pair,
+                "first_update_id": update_id,
+                "update_id": update_id,
+                "bids": bids,
+                "asks": asks,
+            }, timestamp=timestamp)
+
+        return [
+            snapshot(100.0, 10, 99.0),
+            diff(101.0, 11, [["99.5", "4"]], []),
+            OrderBookMessage(OrderBookMessageType.TRADE, {
+                "trading_pair": self.trading_pair,
+                "trade_type": float(TradeType.SELL.value),
+                "trade_id": 7,
+                "update_id": 1500,
+                "price": "99.5",
+                "amount": "0.5",
+            }, timestamp=101.5),
+            diff(102.0, 12, [], []),
+            snapshot(200.0, 20, 98.0),
+            diff(201.0, 21, [], [["99", "0"]]),
+        ]
+
+    def test_round_trip(self):
+        reader = OrderBookRecordingReader(self.directory, self.trading_pair)
+        self.assertEqual(56, RECORD_DTYPE.itemsize)
+        self.assertIsInstance(reader.records, np.memmap)
+        self.assertEqual([100.0, 200.0], reader.snapshot_index["timestamp"].tolist())
+
+        replayed = list(reader.iter_messages())
+        self.assertEqual([message.type for message in self.messages()], [message.type for message in replayed])
+        snapshot = replayed[0]
+        self.assertEqual([(99.0, 1.0, 10), (98.0, 2.0, 10)], [tuple(row) for row in snapshot.bids])
+        self.assertEqual(11, replayed[1].first_update_id)
+        self.assertEqual([(99.5, 4.0, 11)], [tuple(row) for row in replayed[1].bids])
+        trade = replayed[2]
+        self.assertEqual((7, 99.5, 0.5, float(TradeType.SELL.value)),
+                         (trade.trade_id, trade.content["price"], trade.content["amount"], trade.content["trade_type"]))
+        self.assertEqual(([], []), (replayed[3].bids, replayed[3].asks))
+
+        # Seeking through the snapshot index.
+        self.assertEqual(0, reader.find_snapshot_offset(0))
+        self.assertEqual(0, reader.find_snapshot_offset(150.0))
+        later_messages = list(reader.iter_messages(reader.find_snapshot_offset(250.0)))
+        self.assertEqual([20, 21], [message.update_id for message in later_messages])
+
+    def test_partial_record_is_ignored(self):
+        with open(join(self.directory, f"{self.trading_pair}.obr"), "ab") as recording_file:
+            recording_file.write(b"\0" * 10)
+        reader = OrderBookRecordingReader(self.directory, self.trading_pair)
+        self.assertEqual(6, len(list(reader.iter_messages())))
+        writer = OrderBookRecordingWriter(self.directory, self.trading_pair)
+        self.assertEqual(len(reader.records), writer.num_records)
+        writer.close()
+
+    def test_replay_data_source(self):
+        async def replay():
+            data_source = OrderBookReplayDataSource([self.trading_pair], self.directory, start_timestamp=150.0)
+            order_book = await data_source.get_new_order_book(self.trading_pair)
+            diffs, snapshots, trades = asyncio.Queue(), asyncio.Queue(), asyncio.Queue()
+            listeners = [
+                asyncio.ensure_future(data_source.listen_for_order_book_diffs(None, diffs)),
+                asyncio.ensure_future(data_source.listen_for_order_book_snapshots(None, snapshots)),
+                asyncio.ensure_future(data_source.listen_for_trades(None, trades)),
+            ]
+            await asyncio.wait_for(data_source.replay_finished.wait(), 1)
+            for listener in listeners:
+                listener.cancel()
+            return order_book, diffs, snapshots, trades
+
+        order_book, diffs, snapshots, trades = asyncio.get_event_loop().run_until_complete(replay())
+        # Starts from the snapshot at 100, the messages up to the next snapshot are replayed after it.
+        self.assertEqual(10, order_book.snapshot_uid)
+        self.assertEqual([11, 12, 21], [diffs.get_nowait().update_id for _ in range(diffs.qsize())])
+        self.assertEqual([20], [snapshots.get_nowait().update_id for _ in range(snapshots.qsize())])
+        self.assertEqual(1, trades.qsize())
+
+
+if __name__ == "__main__":
+    unittest.main()
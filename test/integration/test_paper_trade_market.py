@@ -273,6 +273,27 @@ class PaperTradeExchangeTest(unittest.TestCase):
         self.assertEquals(1500, self.market.get_balance("USDT"),
                           msg="USDT Balance was not updated.")
 
+    def test_limit_order_crossed_by_top_of_book_change(self):
+        self.market.set_balance("ETH", 20)
+        self.market.set_balance("USDT", 100000)
+        order_book = self.market.order_books["ETH-USDT"]
+        bid_price = round(order_book.get_price(True) * 0.9, 2)
+        client_order_id = self.market.buy("ETH-USDT", 1, OrderType.LIMIT, bid_price)
+        self.run_parallel(asyncio.sleep(1.0))
+        self.assertEqual(0, len(TestUtils.filter_events_by_type(self.market_logger.event_log, OrderFilledEvent)))
+
+        # The fill happens as soon as the ask side crosses the order, without waiting for a clock tick.
+        order_book.apply_diffs([], [OrderBookRow(bid_price, 1.0, order_book.last_diff_uid + 1)],
+                               order_book.last_diff_uid + 1)
+        matched_order_fill_events = TestUtils.get_match_events(
+            self.market_logger.event_log, OrderFilledEvent, {
+                "order_type": OrderType.LIMIT,
+                "trade_type": TradeType.BUY,
+                "order_id": client_order_id
+            })
+        self.assertEqual(1, len(matched_order_fill_events))
+        self.assertEquals(21, self.market.get_balance("ETH"), msg="ETH Balance was not updated.")
+
     def test_bid_limit_order_trade_match(self):
         """
         Test bid limit order fill and balance simulation, and market events emission
@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
+
+import asyncio
+import threading
+from typing import (
+    List,
+    Optional,
+)
+import ujson
+import unittest
+import websockets
+
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType,
+)
+from hummingbot.core.data_type.threaded_order_book_message_stream import ThreadedOrderBookMessageStream
+
+
+def parse_message(raw_msg: str) -> Optional[OrderBookMessage]:
+    msg = ujson.loads(raw_msg)
+    if "result" in msg:
+        return None
+    message: OrderBookMessage = OrderBookMessage(OrderBookMessageType.DIFF, {
+        "trading_pair": msg["s"],
+        "first_update_id": msg["u"],
+        "update_id": msg["u"],
+        "bids": msg["b"],
+        "asks": msg["a"],
+        "thread": threading.current_thread().name,
+    }, timestamp=1.0)
+    message.entries
+    return message
+
+
+class ThreadedOrderBookMessageStreamUnitTest(unittest.TestCase):
+    NUM_MESSAGES = 500
+
+    def setUp(self):
+        self.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+        self.received_subscriptions: List[str] = []
+        self.num_messages: int = self.NUM_MESSAGES
+
+    async def serve_messages(self, ws: websockets.WebSocketServerProtocol, path: str):
+        self.received_subscriptions.append(await ws.recv())
+        await ws.send(ujson.dumps({"result": None}))
+        for update_id in range(1, self.num_messages + 1):
+            await ws.send(ujson.dumps({"s": "ETH-USDT", "u": update_id,
+                                       "b": [["100.0", str(update_id)]], "a": [["101.0", "1"]]}))
+
+    async def run_stream(self, parse_function) -> (ThreadedOrderBookMessageStream, asyncio.Queue):
+        server = await websockets.serve(self.serve_messages, "127.0.0.1", 0)
+        port: int = server.sockets[0].getsockname()[1]
+        output: asyncio.Queue = asyncio.Queue()
+        stream: ThreadedOrderBookMessageStream = ThreadedOrderBookMessageStream(f"ws://127.0.0.1:{port}",
+                                                                                parse_function,
+                                                                                subscribe_messages=["subscribe"])
+        try:
+            await asyncio.wait_for(stream.listen(output), timeout=10)
+        finally:
+            server.close()
+            await server.wait_closed()
+        return stream, output
+
+    def test_messages_are_delivered_in_order(self):
+        stream, output = self.ev_loop.run_until_complete(self.run_stream(parse_message))
+        self.assertEqual(["subscribe"], self.received_subscriptions)
+        self.assertEqual(self.NUM_MESSAGES, stream.messages_received)
+        self.assertEqual(self.NUM_MESSAGES, output.qsize())
+        self.assertLessEqual(stream.batches_delivered, self.NUM_MESSAGES)
+
+        messages: List[OrderBookMessage] = [output.get_nowait() for _ in range(self.NUM_MESSAGES)]
+        self.assertEqual(list(range(1, self.NUM_MESSAGES + 1)), [message.update_id for message in messages])
+        self.assertTrue(all(message.content["thread"] != threading.current_thread().name for message in messages))
+        self.assertEqual(100.0, messages[-1].entries.bids[0].price)
+        self.assertEqual(float(self.NUM_MESSAGES), messages[-1].entries.bids[0].amount)
+
+    def test_parse_errors_are_raised(self):
+        def failing_parse_message(raw_msg: str) -> Optional[OrderBookMessage]:
+            raise ValueError("Unexpected message.")
+
+        self.num_messages = 5
+        with self.assertRaises(ValueError):
+            self.ev_loop.run_until_complete(self.run_stream(failing_parse_message))
+
+    def test_cancel_listen(self):
+        async def cancel_stream():
+            server = await websockets.serve(lambda ws, path: ws.wait_closed(), "127.0.0.1", 0)
+            port: int = server.sockets[0].getsockname()[1]
+            stream: ThreadedOrderBookMessageStream = ThreadedOrderBookMessageStream(f"ws://127.0.0.1:{port}",
+                                                                                    parse_message)
+            task: asyncio.Task = self.ev_loop.create_task(stream.listen(asyncio.Queue()))
+            await asyncio.sleep(0.5)
+            task.cancel()
+            try:
+                with self.assertRaises(asyncio.CancelledError):
+                    await task
+            finally:
+                server.close()
+                await server.wait_closed()
+
+        self.ev_loop.run_until_complete(cancel_stream())
+
+
+if __name__ == "__main__":
+    unittest.main()
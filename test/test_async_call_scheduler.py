@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+import time
+import unittest
+from typing import List
+
+from hummingbot.core.utils.async_call_scheduler import (
+    AsyncCallPriority,
+    AsyncCallScheduler,
+)
+
+
+class AsyncCallSchedulerUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+        self.scheduler: AsyncCallScheduler = AsyncCallScheduler(call_interval=0.0)
+
+    def tearDown(self):
+        self.scheduler.stop()
+
+    def test_lane_concurrency(self):
+        self.scheduler.configure_lane("exchange", max_concurrency=3)
+        running: List[int] = [0, 0]
+
+        async def call(value: int) -> int:
+            running[0] += 1
+            running[1] = max(running[1], running[0])
+            await asyncio.sleep(0.1)
+            running[0] -= 1
+            return value
+
+        start_time: float = time.perf_counter()
+        results = self.ev_loop.run_until_complete(asyncio.gather(*[
+            self.scheduler.schedule_async_call(call(i), 1.0, lane="exchange") for i in range(6)
+        ]))
+        self.assertEqual(list(range(6)), results)
+        self.assertEqual(3, running[1])
+        self.assertLess(time.perf_counter() - start_time, 0.3)
+
+        stats = self.scheduler.stats["exchange"]
+        self.assertEqual((6, 0, 0, 3), (stats["calls"], stats["queued"], stats["running"], stats["max_concurrency"]))
+        self.assertGreaterEqual(stats["max_execution_time"], 0.1)
+        self.assertGreaterEqual(stats["max_queue_wait"], 0.1)
+
+    def test_lanes_are_independent(self):
+        blocked: asyncio.Event = asyncio.Event()
+
+        async def blocking_call():
+            await blocked.wait()
+
+        async def fast_call() -> str:
+            return "fast"
+
+        async def run():
+            blocking_task = asyncio.ensure_future(self.scheduler.schedule_async_call(blocking_call(), 5.0, lane="slow"))
+            await asyncio.sleep(0.01)
+            result = await asyncio.wait_for(self.scheduler.schedule_async_call(fast_call(), 1.0, lane="fast"), 0.5)
+            self.assertFalse(blocking_task.done())
+            blocked.set()
+            await blocking_task
+            return result
+
+        self.assertEqual("fast", self.ev_loop.run_until_complete(run()))
+
+    def test_priorities(self):
+        blocked: asyncio.Event = asyncio.Event()
+        call_order: List[str] = []
+
+        async def call(name: str):
+            await blocked.wait()
+            call_order.append(name)
+
+        async def run():
+            tasks = [asyncio.ensure_future(self.scheduler.schedule_async_call(call("first"), 1.0))]
+            await asyncio.sleep(0.01)
+            for name, priority in [("low", AsyncCallPriority.LOW),
+                                   ("normal", AsyncCallPriority.NORMAL),
+                                   ("high_1", AsyncCallPriority.HIGH),
+                                   ("high_2", AsyncCallPriority.HIGH)]:
+                tasks.append(asyncio.ensure_future(self.scheduler.schedule_async_call(call(name), 1.0,
+                                                                                      priority=priority)))
+            await asyncio.sleep(0.01)
+            blocked.set()
+            await asyncio.gather(*tasks)
+
+        self.ev_loop.run_until_complete(run())
+        self.assertEqual(["first", "high_1", "high_2", "normal", "low"], call_order)
+        self.assertEqual({"HIGH", "NORMAL", "LOW"},
+                         set(self.scheduler.stats["default"]["avg_queue_wait_by_priority"].keys()))
+
+    def test_errors_and_timeouts(self):
+        async def failing_call():
+            raise ValueError("API error")
+
+        async def slow_call():
+            await asyncio.sleep(1.0)
+
+        with self.assertRaises(ValueError):
+            self.ev_loop.run_until_complete(self.scheduler.schedule_async_call(failing_call(), 1.0))
+        with self.assertRaises(asyncio.TimeoutError):
+            self.ev_loop.run_until_complete(self.scheduler.schedule_async_call(slow_call(), 0.05))
+        self.assertEqual(2, self.ev_loop.run_until_complete(self.scheduler.call_async(lambda x: x * 2, 1)))
+
+        stats = self.scheduler.stats["default"]
+        self.assertEqual((3, 1, 1), (stats["calls"], stats["errors"], stats["timeouts"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
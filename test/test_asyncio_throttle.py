@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+import time
+import unittest
+from typing import (
+    Dict,
+    List,
+    Optional,
+)
+
+from hummingbot.core.utils.asyncio_throttle import (
+    RateLimit,
+    REQUEST_WEIGHT,
+    Throttler,
+)
+
+
+class ThrottlerUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+        self.start_time: float = time.monotonic()
+        self.acquired: Dict[str, float] = {}
+
+    async def task(self, throttler: Throttler, name: str, request_weight: int = 1, endpoint: Optional[str] = None):
+        async with throttler.weighted_task(request_weight, endpoint=endpoint):
+            self.acquired[name] = time.monotonic() - self.start_time
+
+    def run_tasks(self, *tasks):
+        self.ev_loop.run_until_complete(asyncio.gather(*tasks))
+
+    def test_rate_limit(self):
+        throttler: Throttler = Throttler(rate_limit=(2, 0.2), period_safety_margin=0)
+        self.run_tasks(*[self.task(throttler, str(i)) for i in range(5)])
+        self.assertLess(self.acquired["1"], 0.1)
+        self.assertGreaterEqual(self.acquired["2"], 0.2)
+        self.assertLess(self.acquired["3"], 0.3)
+        self.assertGreaterEqual(self.acquired["4"], 0.4)
+        self.assertEqual([1], throttler.used_weight())
+
+    def test_fifo_waiters(self):
+        throttler: Throttler = Throttler(rate_limit=(4, 0.2), period_safety_margin=0)
+        self.run_tasks(self.task(throttler, "first", 3),
+                       self.task(throttler, "heavy", 4),
+                       self.task(throttler, "light", 1))
+        # The light task fits next to the first one, but waits behind the heavy one.
+        self.assertGreaterEqual(self.acquired["heavy"], 0.2)
+        self.assertLessEqual(self.acquired["heavy"], self.acquired["light"])
+        self.assertGreaterEqual(self.acquired["light"], 0.4)
+
+    def test_multiple_limits_and_endpoint_weights(self):
+        throttler: Throttler = Throttler(rate_limits=[RateLimit(100, 1.0),
+                                                      RateLimit(2, 0.2, "ORDERS"),
+                                                      RateLimit(3, 1.0, "ORDERS")],
+                                         period_safety_margin=0,
+                                         endpoint_weights={"create_order": {REQUEST_WEIGHT: 1, "ORDERS": 1},
+                                                           "account": {REQUEST_WEIGHT: 5}})
+        self.run_tasks(*[self.task(throttler, f"order_{i}", endpoint="create_order") for i in range(4)],
+                       self.task(throttler, "account", endpoint="account"))
+        self.assertLess(self.acquired["order_1"], 0.1)
+        self.assertGreaterEqual(self.acquired["order_2"], 0.2)
+        # The per second order limit holds the fourth order back until the first one expires.
+        self.assertGreaterEqual(self.acquired["order_3"], 1.0)
+        # The account task has no order weight, but waits in line.
+        self.assertGreaterEqual(self.acquired["account"], self.acquired["order_3"])
+        self.assertEqual([1, 2], throttler.used_weight("ORDERS"))
+
+    def test_weight_above_limit(self):
+        throttler: Throttler = Throttler(rate_limit=(2, 1.0))
+        with self.assertRaises(ValueError):
+            self.run_tasks(self.task(throttler, "too_heavy", 3))
+
+    def test_cancelled_waiter(self):
+        throttler: Throttler = Throttler(rate_limit=(2, 0.2), period_safety_margin=0)
+
+        async def run():
+            await self.task(throttler, "first", 2)
+            cancelled = asyncio.ensure_future(self.task(throttler, "cancelled", 2))
+            waiting = asyncio.ensure_future(self.task(throttler, "waiting", 1))
+            await asyncio.sleep(0.05)
+            self.assertEqual(2, throttler.waiting_tasks)
+            cancelled.cancel()
+            await waiting
+            self.assertEqual(0, throttler.waiting_tasks)
+
+        self.ev_loop.run_until_complete(run())
+        self.assertNotIn("cancelled", self.acquired)
+        self.assertGreaterEqual(self.acquired["waiting"], 0.2)
+        self.assertLess(self.acquired["waiting"], 0.3)
+
+    def test_throughput(self):
+        throttler: Throttler = Throttler(rate_limit=(100000, 1.0))
+        tasks: List = [self.task(throttler, str(i)) for i in range(10000)]
+        self.run_tasks(*tasks)
+        self.assertEqual(10000, len(self.acquired))
+        self.assertEqual([10000], throttler.used_weight())
+
+
+if __name__ == "__main__":
+    unittest.main()
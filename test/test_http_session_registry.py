@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+from aiohttp import web
+import aiohttp
+import asyncio
+import threading
+from typing import (
+    List,
+    Set,
+)
+import unittest
+
+from hummingbot.core.utils.http_session_registry import (
+    HTTPSessionRegistry,
+    shared_client,
+)
+
+
+class HTTPSessionRegistryUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+        self.client_ports: Set[int] = set()
+        self.runners: List[web.AppRunner] = []
+
+    def tearDown(self):
+        self.ev_loop.run_until_complete(HTTPSessionRegistry.get_instance().close())
+        for runner in self.runners:
+            self.ev_loop.run_until_complete(runner.cleanup())
+
+    async def handle_request(self, request: web.Request) -> web.Response:
+        self.client_ports.add(request.transport.get_extra_info("peername")[1])
+        return web.json_response({"method": request.method})
+
+    async def start_server(self) -> str:
+        app: web.Application = web.Application()
+        app.router.add_route("*", "/{tail:.*}", self.handle_request)
+        runner: web.AppRunner = web.AppRunner(app)
+        await runner.setup()
+        self.runners.append(runner)
+        site: web.TCPSite = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        return f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+
+    def test_keep_alive_session_per_host(self):
+        async def run():
+            first_url: str = await self.start_server()
+            second_url: str = await self.start_server()
+            for i in range(5):
+                async with shared_client() as client:
+                    async with client.get(f"{first_url}/get/{i}") as response:
+                        self.assertEqual({"method": "GET"}, await response.json())
+            response: aiohttp.ClientResponse = await shared_client().post(f"{second_url}/post")
+            self.assertEqual({"method": "POST"}, await response.json())
+
+        self.ev_loop.run_until_complete(run())
+        registry: HTTPSessionRegistry = HTTPSessionRegistry.get_instance()
+        self.assertEqual(2, len(registry.sessions))
+        self.assertTrue(all(not session.closed for session in registry.sessions.values()))
+        # The five requests to the first host went through one connection.
+        self.assertEqual(2, len(self.client_ports))
+
+    def test_close(self):
+        async def run():
+            url: str = await self.start_server()
+            async with shared_client().get(url) as response:
+                await response.read()
+            session: aiohttp.ClientSession = shared_client().session(url)
+            self.assertIs(session, shared_client().session(url + "/other/path"))
+            await shared_client().close()
+            self.assertTrue(session.closed)
+            self.assertEqual(0, len(shared_client().sessions))
+            # A request after close() opens a new session.
+            async with shared_client().delete(url) as response:
+                self.assertEqual({"method": "DELETE"}, await response.json())
+            self.assertIsNot(session, shared_client().session(url))
+
+        self.ev_loop.run_until_complete(run())
+
+    def test_event_loop_change(self):
+        async def get_session() -> aiohttp.ClientSession:
+            return shared_client().session("http://127.0.0.1:1")
+
+        other_loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+        try:
+            asyncio.set_event_loop(other_loop)
+            other_session: aiohttp.ClientSession = other_loop.run_until_complete(get_session())
+            asyncio.set_event_loop(self.ev_loop)
+            # The session of the other event loop is open, but can't be used on this one.
+            self.assertIsNot(other_session, self.ev_loop.run_until_complete(get_session()))
+            self.assertFalse(other_session.closed)
+            # The replaced session is closed by the next close() on its own event loop.
+            asyncio.set_event_loop(other_loop)
+            other_loop.run_until_complete(shared_client().close())
+            self.assertTrue(other_session.closed)
+        finally:
+            asyncio.set_event_loop(self.ev_loop)
+            other_loop.close()
+
+    def test_running_event_loop_change(self):
+        async def get_session() -> aiohttp.ClientSession:
+            return shared_client().session("http://127.0.0.1:1")
+
+        other_loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+        thread: threading.Thread = threading.Thread(target=other_loop.run_forever)
+        thread.start()
+        try:
+            other_session: aiohttp.ClientSession = asyncio.run_coroutine_threadsafe(get_session(),
+                                                                                    other_loop).result(5)
+
+            async def run():
+                # The session of the other event loop is closed on its thread as soon as it is replaced.
+                self.assertIsNot(other_session, await get_session())
+                for _ in range(500):
+                    if other_session.closed:
+                        break
+                    await asyncio.sleep(0.01)
+                self.assertTrue(other_session.closed)
+
+            self.ev_loop.run_until_complete(run())
+        finally:
+            other_loop.call_soon_threadsafe(other_loop.stop)
+            thread.join()
+            other_loop.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,235 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+import math
+import time
+from typing import (
+    Callable,
+    Dict,
+    List,
+)
+import unittest
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType,
+)
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.event.events import TradeType
+
+
+class MockDataSource(OrderBookTrackerDataSource):
+    def __init__(self, trading_pairs: List[str]):
+        super().__init__(trading_pairs)
+        self.snapshot_times: Dict[str, List[float]] = {trading_pair: [] for trading_pair in trading_pairs}
+        self.diff_messages: asyncio.Queue = asyncio.Queue()
+        self.last_traded_price_requests: List[List[str]] = []
+        self.snapshot_failures: int = 0
+        self.order_book_gates: Dict[str, asyncio.Event] = {}
+        self.trade_messages: asyncio.Queue = asyncio.Queue()
+
+    @staticmethod
+    async def fetch_trading_pairs() -> List[str]:
+        return []
+
+    async def get_last_traded_prices(self, trading_pairs: List[str], **kwargs) -> Dict[str, float]:
+        self.last_traded_price_requests.append(trading_pairs)
+        return {}
+
+    async def get_snapshot_message(self, trading_pair: str) -> OrderBookMessage:
+        self.snapshot_times[trading_pair].append(time.monotonic())
+        if self.snapshot_failures > 0:
+            self.snapshot_failures -= 1
+            raise IOError("Snapshot request failed.")
+        return OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": trading_pair,
+            "update_id": 10 * len(self.snapshot_times[trading_pair]),
+            "bids": [[str(100 - level), "1"] for level in range(1, 6)],
+            "asks": [[str(100 + level), "1"] for level in range(1, 6)],
+        }, timestamp=1.0)
+
+    async def get_new_order_book(self, trading_pair: str) -> OrderBook:
+        if trading_pair in self.order_book_gates:
+            await self.order_book_gates[trading_pair].wait()
+        order_book: OrderBook = self.order_book_create_function()
+        order_book.apply_snapshot_entries((await self.get_snapshot_message(trading_pair)).entries)
+        return order_book
+
+    async def listen_for_order_book_diffs(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        while True:
+            output.put_nowait(await self.diff_messages.get())
+
+    async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        await asyncio.Event().wait()
+
+    async def listen_for_trades(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        while True:
+            output.put_nowait(await self.trade_messages.get())
+
+
+class MockOrderBookTracker(OrderBookTracker):
+    @property
+    def exchange_name(self) -> str:
+        return "mock"
+
+
+class DepthCappedOrderBookTracker(MockOrderBookTracker):
+    SEQUENCE_GAP_DETECTION = True
+    ORDER_BOOK_DEPTH_CAP = 2
+    ORDER_BOOK_DEPTH_CAP_BUFFER = 1
+
+
+class SequenceGapOrderBookTracker(MockOrderBookTracker):
+    SEQUENCE_GAP_DETECTION = True
+    ORDER_BOOK_RESYNC_RETRY_INTERVAL = 0.1
+
+
+class ConcurrentOrderBookTracker(MockOrderBookTracker):
+    ORDER_BOOK_INIT_CONCURRENCY = 10
+    ORDER_BOOK_INIT_RATE_LIMIT = (10, 1.0)
+
+
+class OrderBookTrackerUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+        self.trading_pairs: List[str] = ["AAA-USDT", "BBB-USDT", "CCC-USDT"]
+        self.data_source: MockDataSource = MockDataSource(self.trading_pairs)
+
+    def test_order_book_init_pace(self):
+        tracker: MockOrderBookTracker = MockOrderBookTracker(self.data_source, self.trading_pairs)
+        self.assertEqual((1, 1.0), tracker.ORDER_BOOK_INIT_RATE_LIMIT)
+        self.ev_loop.run_until_complete(tracker._init_order_books())
+
+        self.assertEqual(set(self.trading_pairs), set(tracker.order_books.keys()))
+        init_times: List[float] = sorted(times[0] for times in self.data_source.snapshot_times.values())
+        # One order book per period, plus the Throttler's 0.1 second safety margin.
+        for previous, current in zip(init_times, init_times[1:]):
+            self.assertGreaterEqual(current - previous, 1.0)
+            self.assertLess(current - previous, 1.5)
+
+    async def wait_for(self, condition: Callable[[], bool], timeout: float = 5.0):
+        async def wait():
+            while not condition():
+                await asyncio.sleep(0.01)
+        await asyncio.wait_for(wait(), timeout)
+
+    def test_depth_cap_resync(self):
+        trading_pair: str = self.trading_pairs[0]
+        tracker: DepthCappedOrderBookTracker = DepthCappedOrderBookTracker(self.data_source, [trading_pair],
+                                                                           periodic_snapshots=False)
+
+        async def run():
+            tracker.start()
+            order_book: OrderBook = await tracker.wait_for_order_book(trading_pair)
+            self.assertEqual(2, order_book.depth_cap)
+            self.assertEqual([97.0, 98.0, 99.0], sorted(row.price for row in order_book.bid_entries()))
+
+            # The top bid levels are removed, the one level left is below the cap.
+            self.data_source.diff_messages.put_nowait(OrderBookMessage(OrderBookMessageType.DIFF, {
+                "trading_pair": trading_pair,
+                "first_update_id": 11,
+                "update_id": 11,
+                "bids": [["99", "0"], ["98", "0"]],
+                "asks": [],
+            }, timestamp=2.0))
+            await self.wait_for(lambda: len(self.data_source.snapshot_times[trading_pair]) == 2)
+            await self.wait_for(lambda: order_book.snapshot_uid == 20)
+            self.assertFalse(order_book.depth_resync_required)
+            self.assertEqual([97.0, 98.0, 99.0], sorted(row.price for row in order_book.bid_entries()))
+            self.assertEqual([101.0, 102.0, 103.0], sorted(row.price for row in order_book.ask_entries()))
+
+        try:
+            self.ev_loop.run_until_complete(run())
+        finally:
+            tracker.stop()
+
+    def test_sequence_gap_resync_retry(self):
+        trading_pair: str = self.trading_pairs[0]
+        tracker: SequenceGapOrderBookTracker = SequenceGapOrderBookTracker(self.data_source, [trading_pair],
+                                                                           periodic_snapshots=False)
+
+        async def run():
+            tracker.start()
+            order_book: OrderBook = await tracker.wait_for_order_book(trading_pair)
+            # Update IDs 11 to 14 are missed, and the first two resync snapshot requests fail.
+            self.data_source.snapshot_failures = 2
+            for update_id in (15, 16):
+                self.data_source.diff_messages.put_nowait(OrderBookMessage(OrderBookMessageType.DIFF, {
+                    "trading_pair": trading_pair,
+                    "first_update_id": update_id,
+                    "update_id": update_id,
+                    "bids": [["99", str(update_id)]],
+                    "asks": [],
+                }, timestamp=2.0))
+            await self.wait_for(lambda: order_book.snapshot_uid > 10)
+            self.assertEqual(4, len(self.data_source.snapshot_times[trading_pair]))
+            self.assertEqual(0, len(tracker._order_book_resync_tasks))
+
+        try:
+            self.ev_loop.run_until_complete(run())
+        finally:
+            tracker.stop()
+
+    def test_order_books_ready_per_trading_pair(self):
+        ready_pair, pending_pair = self.trading_pairs[:2]
+        self.data_source.order_book_gates[pending_pair] = asyncio.Event()
+        tracker: ConcurrentOrderBookTracker = ConcurrentOrderBookTracker(self.data_source, [ready_pair, pending_pair],
+                                                                         periodic_snapshots=False)
+
+        async def run():
+            tracker.start()
+            order_book: OrderBook = await tracker.wait_for_order_book(ready_pair)
+            self.assertEqual([ready_pair], tracker.ready_trading_pairs)
+            self.assertFalse(tracker.ready)
+
+            # REST last prices and trades of the ready trading pair don't wait for the other one.
+            await self.wait_for(lambda: len(self.data_source.last_traded_price_requests) > 0)
+            self.assertEqual([ready_pair], self.data_source.last_traded_price_requests[0])
+            for trading_pair in (pending_pair, ready_pair):
+                self.data_source.trade_messages.put_nowait(OrderBookMessage(OrderBookMessageType.TRADE, {
+                    "trading_pair": trading_pair,
+                    "trade_type": float(TradeType.BUY.value),
+                    "trade_id": 1,
+                    "update_id": 1,
+                    "price": "100.5",
+                    "amount": "1",
+                }, timestamp=2.0))
+            await self.wait_for(lambda: order_book.last_trade_price == 100.5)
+
+            self.data_source.order_book_gates[pending_pair].set()
+            await tracker.wait_for_order_book(pending_pair)
+            await self.wait_for(lambda: tracker.ready)
+            # The trade received before its order book was tracked is dropped.
+            self.assertTrue(math.isnan(tracker.order_books[pending_pair].last_trade_price))
+
+        try:
+            self.ev_loop.run_until_complete(run())
+        finally:
+            tracker.stop()
+
+    def test_missing_last_traded_prices(self):
+        trading_pair: str = self.trading_pairs[0]
+        tracker: MockOrderBookTracker = MockOrderBookTracker(self.data_source, [trading_pair],
+                                                             periodic_snapshots=False)
+
+        async def run():
+            tracker.start()
+            await tracker.wait_for_order_book(trading_pair)
+            await self.wait_for(lambda: len(self.data_source.last_traded_price_requests) > 0)
+            await asyncio.sleep(1.5)
+
+        try:
+            self.ev_loop.run_until_complete(run())
+        finally:
+            tracker.stop()
+        # A trading pair without a last traded price isn't requested again before the next REST update interval.
+        self.assertEqual([[trading_pair]], self.data_source.last_traded_price_requests)
+
+
+if __name__ == "__main__":
+    unittest.main()